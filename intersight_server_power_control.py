@@ -9,13 +9,48 @@ GitHub Repository: https://github.com/ugo-emekauwa/intersight-server-power-contr
 
 
 import sys
-import traceback
+import argparse
 import json
 import copy
+import datetime
+import csv
 import intersight
 import re
+import urllib.parse
 import urllib3
 import time
+import threading
+import contextlib
+import contextvars
+import uuid
+import os
+import http.server
+import logging
+import logging.handlers
+import queue
+import atexit
+import asyncio
+import collections
+import base64
+import hashlib
+import hmac
+import concurrent.futures
+import socket
+import sqlite3
+import ast
+import cProfile
+import pstats
+import tracemalloc
+import types
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 ########################
 # MODULE REQUIREMENT 1 #
@@ -64,8 +99,16 @@ values and replace them with your own, where applicable.
 ## Here is an example using the Server name: "Server Identifier": "UCS-IMM-Pod-1-1"
 ## Here is an example using the Server model: "Server Identifier": "UCSX-210C-M7"
 ## Here is an example using the Server PID: "Server Identifier": "UCSX-210C-M7"
+## To target multiple servers by naming convention, the "Server Identifier" key also accepts patterns, which are retrieved with one filtered Intersight API query and expanded into a target server for each match.
+## Ranges and lists go in square brackets, "*" matches any characters, "?" matches one character, and values starting with "re:" are regular expressions.
+## Here is an example using a range: "Server Identifier": "Lab-Blade-[1-240]"
+## Here is an example using a wildcard: "Server Identifier": "Lab-Blade-*"
+## Here is an example using a regular expression: "Server Identifier": "re:^Lab-Blade-[0-9]+$"
 ## For the "Server Form Factor" key, the options are "Blade or "Rack". If the "Server Form Factor" key is not provided, the value will default to "Blade".
 ## For the "Server Connection Type" key, the options are "FI-Attached" or "Standalone". If the "Server Connection Type" key is not provided, the value will default to "FI-Attached".
+## To apply a different power control state to a target server, add the optional "Power Control State" key with one of the power_control_state options below. Target servers without the "Power Control State" key use the power_control_state variable.
+## Here is an example: {"Server Identifier": "Demo-Blade-Server-4", "Power Control State": "Power Cycle"}
+## The target servers are submitted in batches by power control state, in the order each power control state is first listed. Target servers read from the power_control_target_input_file below are submitted in the order they are read, unless the power_control_wave_grouping variable is set.
 ## Here is an example: power_control_target_server_id_dictionary_list = [{"Server Identifier": "Demo-Blade-Server-1"}, {"Server Identifier": "Demo-Blade-Server-2"}, {"Server Identifier": "Demo-Blade-Server-3"},]
 ## To include additional target servers, add more dictionary entries to the power_control_target_server_id_dictionary_list variable below.
 power_control_target_server_id_dictionary_list = [
@@ -77,12 +120,190 @@ power_control_target_server_id_dictionary_list = [
      "Server Connection Type": "Standalone"},
     ]
 
+## To read the target servers from a CSV or JSON Lines file instead, such as a CMDB export, provide a file path for the power_control_target_input_file variable below. The power_control_target_server_id_dictionary_list variable is then ignored.
+## A CSV file needs a header row with the column names "Server Identifier", "Server Form Factor", "Server Connection Type" and "Power Control State". A JSON Lines file needs one JSON object per line with the same keys. Only "Server Identifier" is required.
+## To read the target servers from standard input as JSON Lines, set the power_control_target_input_file variable to "-". The target input file can also be provided with the --targets argument.
+## For the power_control_target_input_format variable, the options are "Auto", "CSV" or "JSON Lines". "Auto" uses "JSON Lines" for ".jsonl" and ".ndjson" files and standard input, and "CSV" otherwise.
+power_control_target_input_file = ""
+power_control_target_input_format = "Auto"
+
 power_control_state = "Reboot CIMC"      # Options: "Power On", "Power Off", "Power Cycle", "Hard Reset", "Shutdown", "Reboot CIMC". "Reboot CIMC" restarts the CIMC only, all other operations are directly on the server.
 
 # Intersight Base URL Setting (Change only if using the Intersight Virtual Appliance)
 intersight_base_url = "https://www.intersight.com/api/v1"
 url_certificate_verification = True
 
+# Tracing Settings (Optional)
+## To record a trace of every Intersight API request and of the resolve, lookup, and post phases for each target server, provide a file path for the trace_output_file variable below.
+## Here is an example: trace_output_file = "C:\\Users\\demouser\\Documents\\power_control_trace.jsonl"
+## For the trace_output_format variable, the options are "JSON Lines" or "OpenTelemetry". The "OpenTelemetry" option writes the spans in the OTLP/JSON format.
+trace_output_file = ""
+trace_output_format = "JSON Lines"
+
+# Profiling Settings (Optional)
+## To profile a run, provide a file path prefix for the profile_output_prefix variable below or run the tool with the --profile argument. The stacks of every thread are sampled every profile_sample_interval seconds and written to a "<prefix>.collapsed" file for flame graph tools, such as flamegraph.pl or speedscope. The memory allocations held at the peak of the traced memory are written to a "<prefix>.allocations.txt" file. Both reports are grouped by phase, such as "resolve", "lookup" or "post".
+## Here is an example: profile_output_prefix = "C:\\Users\\demouser\\Documents\\power_control_profile"
+## Allocations are traced with profile_allocation_traceback_depth frames. Set the profile_allocation_traceback_depth variable to 0 to skip the allocation report, as tracing allocations slows down the run.
+## Set the profile_deterministic_cpu variable to True to also record the CPU time of every function call with cProfile to a "<prefix>.pstats" file, at a higher overhead.
+profile_output_prefix = ""
+profile_sample_interval = 0.005
+profile_allocation_traceback_depth = 25
+profile_deterministic_cpu = False
+
+# Metrics Settings (Optional)
+## To expose Prometheus metrics for request rates, error rates, throttle events, queue depth and power control latency on a local port, provide a port number for the metrics_http_port variable below.
+## Here is an example: metrics_http_port = 9464
+## To write the Prometheus metrics to a node exporter textfile collector directory instead, provide a file path ending in ".prom" for the metrics_textfile_output variable below.
+## Here is an example: metrics_textfile_output = "/var/lib/node_exporter/textfile_collector/intersight_power_control.prom"
+## During a sequential run, the metrics textfile is rewritten at most once every metrics_textfile_write_interval seconds, and again when the run ends.
+metrics_http_port = None
+metrics_http_address = "127.0.0.1"
+metrics_textfile_output = ""
+metrics_textfile_write_interval = 15
+
+# Logging Settings
+## For the log_level variable, the options are "DEBUG", "INFO", "WARNING" or "ERROR".
+## For the log_format variable, the options are "Text" or "JSON". The "JSON" option writes one JSON object per log message for log collectors.
+## Set the quiet_mode variable to True to only write error messages.
+## To write the log messages to a file instead of the console, provide a file path for the log_output_file variable below.
+log_level = "INFO"
+log_format = "Text"
+quiet_mode = False
+log_output_file = ""
+
+# Asynchronous Client Settings (Optional)
+## Set the use_asyncio_client variable to True to submit the power control operations for all target servers concurrently on a single asyncio event loop.
+## This option requires the aiohttp package, which can be installed by running the following command: pip install aiohttp
+## The asyncio_max_requests_in_flight variable sets the maximum number of concurrent Intersight API requests.
+use_asyncio_client = False
+asyncio_max_requests_in_flight = 100
+
+# Staged Rollout Settings (Optional)
+## To submit the power control operations in waves, set the power_control_wave_grouping variable to "Count", "Chassis" or "Domain". The default value of None submits the target servers one at a time in the listed order.
+## With "Count", each wave contains power_control_wave_size target servers. With "Chassis" or "Domain", each wave contains the target servers of power_control_wave_size whole chassis or Intersight Managed Domains.
+## Each wave starts as soon as all operations of the previous wave have completed, followed by the power_control_inter_wave_delay in seconds.
+## The power_control_max_concurrent_operations_per_domain variable limits the in-progress operations for each domain, including the time waiting for completion.
+## If power_control_wait_for_completion is False, an operation is considered complete as soon as it has been submitted.
+## The waves and the coordinator jobs are built from the resolved target servers, so target servers streamed from the power_control_target_input_file are read in full and held in memory first. Without waves, the target servers are streamed.
+power_control_wave_grouping = None
+power_control_wave_size = 100
+power_control_inter_wave_delay = 0
+power_control_max_concurrent_operations_per_domain = 20
+power_control_max_workers = 50
+power_control_wait_for_completion = True
+power_control_completion_timeout = 900
+power_control_completion_poll_interval = 10
+
+# Event-Driven Completion Settings (Optional)
+## By default, the completion of each power control operation is detected by polling the Intersight API. To detect completion from Intersight change events instead, set the power_control_completion_mode variable to "Webhook".
+## In "Webhook" mode, a local receiver listens for Intersight webhook events on the power_control_webhook_port and power_control_webhook_address. An Intersight webhook subscription for the compute.ServerSetting, compute.Blade, compute.RackUnit and workflow.WorkflowInfo object types needs to point at this receiver.
+## If the webhook is configured with a secret, provide it for the power_control_webhook_secret variable so the signature of each event is verified.
+## The receiver only listens on the local loopback address by default. To receive events directly from Intersight on another address, such as "0.0.0.0", a power_control_webhook_secret value is required, so events from other sources are rejected.
+## The Intersight API is still polled every power_control_completion_fallback_poll_interval seconds for operations without a received event.
+power_control_completion_mode = "Polling"      # Options: "Polling", "Webhook".
+power_control_webhook_port = 8080
+power_control_webhook_address = "127.0.0.1"
+power_control_webhook_secret = ""
+power_control_completion_fallback_poll_interval = 60
+
+# Adaptive Concurrency Settings (Optional)
+## To adapt the number of concurrent Intersight API requests to the health of the Intersight API, set the adaptive_concurrency variable to True. This applies to the power control waves and to the Intersight API client shared by the helper functions.
+## The limit starts at adaptive_concurrency_initial_limit and stays between 1 and adaptive_concurrency_max_limit. It grows while responses are healthy and is halved on responses slower than adaptive_concurrency_latency_threshold seconds, HTTP status 429 or 5xx responses, or connection errors.
+## If the error rate of the recent responses reaches circuit_breaker_error_rate_threshold, new requests are paused for circuit_breaker_open_duration seconds, then resumed gradually.
+adaptive_concurrency = False
+adaptive_concurrency_initial_limit = 10
+adaptive_concurrency_max_limit = 50
+adaptive_concurrency_latency_threshold = 2.0
+circuit_breaker_error_rate_threshold = 0.5
+circuit_breaker_open_duration = 30
+
+# Request Coalescing Settings (Optional)
+## To send identical concurrent Intersight API GET requests only once, set the api_request_coalescing variable to True. Requests for a resource already in flight wait for its response instead of being sent.
+## Successful responses are also reused for api_response_cache_ttl seconds. A POST request clears the reused responses for the changed resource type. Keep this value below the power_control_completion_poll_interval value.
+api_request_coalescing = False
+api_response_cache_ttl = 2
+
+# API Key Pool Settings (Optional)
+## Intersight rate limits apply per API key. To spread the Intersight API requests across several API keys of the same Intersight account, provide each additional API key for the api_key_pool variable below. The key_id and key variables above are included in the pool.
+## Here is an example: api_key_pool = [{"Key ID": "5c89885075646127773ec143/5c82fc477577712d3088eb2f/5c8a8e5a7564612777310b10", "Key File": "C:\\Users\\demouser\\Documents\\SecretKey2.txt"},]
+## Each request is sent with the available API key with the fewest in-flight and recent requests. To limit the request rate of each API key, provide a value for the api_key_pool_max_requests_per_second_per_key variable.
+## A throttled API key (HTTP status 429) is paused for the Retry-After time or api_key_pool_throttle_duration seconds. A rejected API key (HTTP status 401 or 403), such as a revoked one, is paused for api_key_pool_revoked_key_duration seconds. The request is sent again with another API key.
+api_key_pool = []
+api_key_pool_max_requests_per_second_per_key = None
+api_key_pool_throttle_duration = 5
+api_key_pool_revoked_key_duration = 300
+
+# Intersight API Transport Settings (Optional)
+## The Intersight SDK sends requests over HTTP/1.1 with urllib3, which opens one connection for each concurrent request. To multiplex concurrent requests over a few HTTP/2 connections instead, set the api_http_transport variable to "HTTP/2". This requires the httpx package with HTTP/2 support, which can be installed by running 'pip install httpx[http2]'.
+## The HTTP/2 transport opens at most api_http2_max_connections connections.
+api_http_transport = "urllib3"     # Options: "urllib3", "HTTP/2".
+api_http2_max_connections = 10
+
+# API Cassette Settings (Optional)
+## To record the Intersight API requests and responses of a run to a cassette file, set the api_cassette_mode variable to "Record" and provide the file path for the api_cassette_file variable. Authentication headers and cookies are not recorded.
+## To replay a cassette file for offline testing, set the api_cassette_mode variable to "Replay". Each request is answered from the cassette file without contacting Intersight, after the recorded latency multiplied by the api_cassette_replay_latency_scale value. Set the api_cassette_replay_latency_scale variable to 0 to replay without delay.
+## Requests are still signed during replay, so the key_id and key variables above must still reference a valid API key file.
+api_cassette_mode = ""     # Options: "", "Record", "Replay".
+api_cassette_file = ""
+api_cassette_replay_latency_scale = 1.0
+
+# Distributed Power Control Settings (Optional)
+## To spread the power control operations over several worker processes, each with its own Intersight API key if needed, run one coordinator with the --coordinator argument and any number of workers with the --worker argument, all with the same job queue file path.
+## The coordinator resolves the target servers once, splits them into shards and adds them to the job queue. The workers run the shards with the Staged Rollout Settings and report the results back to the coordinator, which writes them to the results output file.
+## For the distributed_shard_grouping variable, the options are "Domain" or "Hash". The "Domain" option keeps the servers of each domain together, and the "Hash" option spreads the servers evenly by MOID.
+## Each shard has at most distributed_shard_size target servers. The power control states are run in order, and the power_control_max_concurrent_operations_per_domain limit applies across all workers.
+## Workers on several hosts can share a job queue file on a shared file system with working file locks. A shard of a worker without a heartbeat for distributed_worker_lease_duration seconds is run again by another worker, skipping the target servers already submitted. A shard that has been claimed distributed_shard_max_attempts times without finishing is marked as failed.
+distributed_shard_grouping = "Domain"     # Options: "Domain", "Hash".
+distributed_shard_size = 100
+distributed_hash_shard_count = 16
+distributed_worker_lease_duration = 120
+distributed_shard_max_attempts = 3
+
+# Power Control Policy Scheduler Settings (Optional)
+## To run the tool as a long-running scheduler instead of once, provide a list of power control policies for the power_control_policies variable below and set run_power_control_policy_scheduler to True, or run the tool with the --scheduler argument.
+## Each policy needs a "Schedule" in the five-field cron format (minute, hour, day of month, month, day of week) in local time, a "Power Control State" and a list of "Targets" in the same format as the power_control_target_server_id_dictionary_list variable. A "Policy Name" is optional.
+## Here is an example: {"Policy Name": "Lab Off", "Schedule": "0 20 * * 1-5", "Power Control State": "Power Off", "Targets": [{"Server Identifier": "Lab-Blade-Server-1"}]}
+## The API client and server inventory are kept across triggers. The server inventory is retrieved again when it is older than power_control_policy_inventory_max_age seconds.
+## Policies due at the same time are run together, and a server targeted by more than one of them is only submitted once. The Staged Rollout Settings apply to each trigger.
+power_control_policies = []
+run_power_control_policy_scheduler = False
+power_control_policy_inventory_max_age = 300
+
+# Power State Snapshot Settings (Optional)
+## To save the current power state of the servers before a maintenance window, run the tool with the --snapshot argument and a snapshot file path. To return the servers to the saved power states afterwards, run the tool with the --restore argument and the same snapshot file path.
+## The snapshot is retrieved with one Intersight API query. A restore compares the current power states to the snapshot and only submits power control operations for the servers with a different power state, using the Staged Rollout Settings.
+## To limit the snapshot to some servers, provide a server identifier or server identifier pattern for the power_state_snapshot_scope variable. Here is an example: power_state_snapshot_scope = "Lab-Blade-*"
+## For the power_state_snapshot_format variable, the options are "Auto", "CSV" or "JSON Lines". The "Auto" option determines the format from the file extension.
+power_state_snapshot_scope = ""
+power_state_snapshot_format = "Auto"
+
+# Power Status Report Settings (Optional)
+## To report the number of servers by power state, model, domain and management mode without making any changes, run the tool with the --status argument.
+## The counts are aggregated by Intersight where supported. The power_state_snapshot_scope variable above also limits the servers in the report.
+## To include the names of the servers in each group, set the power_status_report_include_server_lists variable to True.
+## To also save the report as JSON, provide a file path for the power_status_report_output_file variable. Here is an example: power_status_report_output_file = "C:\\Users\\demouser\\Documents\\power_status.json"
+power_status_report_include_server_lists = False
+power_status_report_output_file = ""
+
+# Idempotency Settings (Optional)
+## Target servers whose current power state, as reported by the Intersight server inventory, already matches the provided power_control_state are skipped without submitting a power control operation.
+## This applies to the "Power On", "Power Off" and "Shutdown" power control states. To always submit the power control operation, set the force_power_control variable to True.
+force_power_control = False
+
+# Run Journal Settings (Optional)
+## To record the resolution and submission status of each target server to a local file as the run progresses, provide a file path for the run_journal_file variable (e.g. "power_control_journal.jsonl").
+## If a run is interrupted, set the resume_from_run_journal variable to True or run the tool with the --resume argument to continue with only the target servers that have not yet been submitted, skipped or completed.
+## The run journal file path can also be provided with the --journal-file argument.
+run_journal_file = ""
+resume_from_run_journal = False
+
+# Results Output Settings (Optional)
+## To write the result of each power control operation to a file as soon as it has finished, provide a file path for the power_control_results_output_file variable below. The results output file can also be provided with the --results-file argument.
+## Each result includes the server identifier, MOID and serial, the requested power control state, the result, the HTTP status and latency of the power control request, and the final observed power state when waiting for completion.
+## For the power_control_results_output_format variable, the options are "Auto", "CSV" or "JSON Lines". "Auto" uses "CSV" for ".csv" files and "JSON Lines" otherwise.
+power_control_results_output_file = ""
+power_control_results_output_format = "Auto"
+
 ####### Finish Configuration Settings - The required value entries are complete. #######
 
 
@@ -93,1068 +314,8999 @@ url_certificate_verification = True
 # Suppress InsecureRequestWarning error messages
 urllib3.disable_warnings()
 
-# Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
-## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
-def get_api_client(api_key_id,
-                   api_secret_file,
-                   endpoint="https://intersight.com",
-                   url_certificate_verification=True
-                   ):
-    try:
-        with open(api_secret_file, 'r') as f:
-            api_key = f.read()
-        
-        if re.search('BEGIN RSA PRIVATE KEY', api_key):
-            # API Key v2 format
-            signing_algorithm = intersight.signing.ALGORITHM_RSASSA_PKCS1v15
-            signing_scheme = intersight.signing.SCHEME_RSA_SHA256
-            hash_algorithm = intersight.signing.HASH_SHA256
+# Establish the logger for the Automated Server Power Control Tool
+logger = logging.getLogger("intersight_server_power_control")
 
-        elif re.search('BEGIN EC PRIVATE KEY', api_key):
-            # API Key v3 format
-            signing_algorithm = intersight.signing.ALGORITHM_ECDSA_MODE_DETERMINISTIC_RFC6979
-            signing_scheme = intersight.signing.SCHEME_HS2019
-            hash_algorithm = intersight.signing.HASH_SHA256
+# Establish variable for the active log queue listener
+_log_queue_listener = None
 
-        configuration = intersight.Configuration(
-            host=endpoint,
-            signing_info=intersight.signing.HttpSigningConfiguration(
-                key_id=api_key_id,
-                private_key_path=api_secret_file,
-                signing_scheme=signing_scheme,
-                signing_algorithm=signing_algorithm,
-                hash_algorithm=hash_algorithm,
-                signed_headers=[
-                    intersight.signing.HEADER_REQUEST_TARGET,
-                    intersight.signing.HEADER_HOST,
-                    intersight.signing.HEADER_DATE,
-                    intersight.signing.HEADER_DIGEST,
-                    ]
-                )
-            )
 
-        if not url_certificate_verification:
-            configuration.verify_ssl = False
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API Key.")
-        print("Exiting due to the Intersight API Key being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
-        
-    return intersight.ApiClient(configuration)
+# Establish class to format log records as JSON
+class JsonLogFormatter(logging.Formatter):
+    """This class formats log records as single-line JSON objects. Any
+    additional fields provided through the extra argument of a logging call,
+    such as "server_identifier", are included as keys.
+    """
+    standard_log_record_attributes = frozenset(
+        vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+        ) | {"message", "asctime"}
 
+    def format(self, record):
+        log_entry = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage().strip()
+            }
+        for record_attribute, record_attribute_value in vars(record).items():
+            if record_attribute not in self.standard_log_record_attributes:
+                log_entry[record_attribute] = record_attribute_value
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, default=str)
 
-# Establish function to test for the availability of the Intersight API and Intersight account
-def test_intersight_api_service(intersight_api_key_id,
-                                intersight_api_key,
-                                intersight_base_url="https://www.intersight.com/api/v1",
-                                preconfigured_api_client=None
-                                ):
-    """This is a function to test the availability of the Intersight API and
-    Intersight account. The tested Intersight account contains the user who is
-    the owner of the provided Intersight API Key and Key ID.
+
+# Establish function to configure logging for the Automated Server Power Control Tool
+def configure_logging(log_level="INFO",
+                      log_format="Text",
+                      quiet_mode=False,
+                      log_output_file=""
+                      ):
+    """This is a function to configure the logger of the Automated Server
+    Power Control Tool. Log records are placed on an in-memory queue by the
+    calling thread and written to the console or log file by a background
+    listener thread, so the power control workers never block on output.
 
     Args:
-        intersight_api_key_id (str):
-            The ID of the Intersight API key.
-        intersight_api_key (str):
-            The system file path of the Intersight API key.
-        intersight_base_url (str):
-            Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance. The
-            default value is "https://www.intersight.com/api/v1".
-        preconfigured_api_client ("ApiClient"):
-            Optional; An ApiClient class instance which handles
-            Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
+        log_level (str):
+            Optional; The minimum level of the log messages to be written. The
+            accepted values are "DEBUG", "INFO", "WARNING" or "ERROR". The
+            default value is "INFO".
+        log_format (str):
+            Optional; The format of the log messages. The accepted values are
+            "Text" or "JSON". The default value is "Text".
+        quiet_mode (bool):
+            Optional; A setting to determine whether only error messages are
+            written. The default value is False.
+        log_output_file (str):
+            Optional; The system file path of a log file. The default value is
+            an empty string (""), which writes the log messages to the console.
 
     Returns:
-        A string of the name for the Intersight account tested, verifying the
-        Intersight API service is up and the Intersight account is accessible.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue with the provided API Key
-            and/or API Key ID.
+        The QueueListener class instance writing the log messages.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
+    global _log_queue_listener
+    shutdown_logging()
+    if log_output_file:
+        output_handler = logging.FileHandler(log_output_file)
     else:
-        api_client = preconfigured_api_client
-    try:
-        # Check that Intersight Account is accessible
-        print("Testing access to the Intersight API by verifying the "
-              "Intersight account information...")
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("\nThe Intersight API and Account Availability Test did not "
-                  "pass.")
-            print("The Intersight account information could not be verified.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-            print("The Intersight API and Account Availability Test has "
-                  "passed.\n")
-            print(f"The Intersight account named '{intersight_account_name}' "
-                  "has been found.")
-            return intersight_account_name
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+        output_handler = logging.StreamHandler(sys.stdout)
+    if "".join(str(log_format).lower().split()) == "json":
+        output_handler.setFormatter(JsonLogFormatter())
+    else:
+        output_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.SimpleQueue()
+    for existing_handler in list(logger.handlers):
+        logger.removeHandler(existing_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.ERROR if quiet_mode else str(log_level).upper())
+    logger.propagate = False
+    _log_queue_listener = logging.handlers.QueueListener(log_queue, output_handler)
+    _log_queue_listener.start()
+    return _log_queue_listener
 
 
-# Establish function to retrieve the MOID of a specific Intersight API object by name
-def intersight_object_moid_retriever(intersight_api_key_id,
-                                     intersight_api_key,
-                                     object_name,
-                                     intersight_api_path,
-                                     object_type="object",
-                                     organization="default",
-                                     intersight_base_url="https://www.intersight.com/api/v1",
-                                     preconfigured_api_client=None
-                                     ):
-    """This is a function to retrieve the MOID of Intersight objects
-    using the Intersight API.
+# Establish function to flush and stop the log queue listener
+def shutdown_logging():
+    """This is a function to write any queued log messages and stop the log
+    queue listener. It is also registered to run when the interpreter exits.
+    """
+    global _log_queue_listener
+    log_queue_listener = _log_queue_listener
+    _log_queue_listener = None
+    if log_queue_listener is not None:
+        log_queue_listener.stop()
+        for output_handler in log_queue_listener.handlers:
+            output_handler.flush()
+            output_handler.close()
 
-    Args:
-        intersight_api_key_id (str):
-            The ID of the Intersight API key.
-        intersight_api_key (str):
-            The system file path of the Intersight API key.
-        object_name (str):
-            The name of the Intersight object.
-        intersight_api_path (str):
-            The Intersight API path of the Intersight object.
-        object_type (str):
-            Optional; The type of Intersight object. The default value is
-            "object".
-        organization (str):
-            Optional; The Intersight organization of the Intersight object.
-            The default value is "default".
-        intersight_base_url (str):
-            Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance.
-        preconfigured_api_client ("ApiClient"):
-            Optional; An ApiClient class instance which handles
-            Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
 
-    Returns:
-        A string of the MOID for the provided Intersight object.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue accessing the Intersight API
-            path. The status code or error message will be specified.
+atexit.register(shutdown_logging)
+
+
+# Establish list of observers that are provided a record of every instrumented Intersight API call
+api_call_observers = []
+
+# Establish context variable to track the active trace span of the current thread or task
+_current_trace_span = contextvars.ContextVar("current_trace_span", default=None)
+
+# Establish variable for the active run tracer
+_active_run_tracer = None
+
+
+# Establish class to trace Intersight API calls and power control phases
+class IntersightRunTracer:
+    """This class records spans for the Intersight API calls and power control
+    phases of a run. The recorded spans can be exported as structured JSON
+    lines or as OpenTelemetry-compatible spans in the OTLP/JSON format.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("There was an issue retrieving the "
-              f"{object_type} from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+    def __init__(self,
+                 service_name="intersight-server-power-control"
+                 ):
+        self.service_name = service_name
+        self.trace_id = uuid.uuid4().hex
+        self.spans = []
+        self._lock = threading.Lock()
 
-    if intersight_objects.get("Results"):
-        for intersight_object in intersight_objects.get("Results"):
-            if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
-                if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
-                    if intersight_object.get("Name") == object_name:
-                        intersight_object_moid = intersight_object.get("Moid")
-                        # The provided object and MOID has been identified and retrieved.
-                        return intersight_object_moid
-            else:
-                if intersight_object.get("Name") == object_name:
-                    intersight_object_moid = intersight_object.get("Moid")
-                    # The provided object and MOID has been identified and retrieved.
-                    return intersight_object_moid
-        else:
-            print("\nA configuration error has occurred!\n")
-            print(f"The provided {object_type} named '{object_name}' was not "
-                  "found.")
-            print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
-            print("Verify through the API or GUI that the needed "
-                  f"{object_type} is present.")
-            print(f"If the needed {object_type} is missing, please create it.")
-            print("Once the issue has been resolved, re-attempt execution.\n")
-            sys.exit(0)
-    else:
-        print("\nA configuration error has occurred!\n")
-        print(f"The provided {object_type} named '{object_name}' was not "
-              "found.")
-        print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
-        print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
-        print(f"Verify through the API or GUI that the needed {object_type} "
-              "is present.")
-        print(f"If the needed {object_type} is missing, please create it.")
-        print("Once the issue has been resolved, re-attempt execution.\n")
-        sys.exit(0)
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.service_name}')"
+            )
 
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for trace ID '{self.trace_id}'"
 
-# Establish function to retrieve all instances of a particular Intersight API object type
-def get_intersight_objects(intersight_api_key_id,
-                           intersight_api_key,
-                           intersight_api_path,
-                           object_type="object",
-                           intersight_base_url="https://www.intersight.com/api/v1",
-                           preconfigured_api_client=None
-                           ):
-    """This is a function to perform an HTTP GET on all objects under an
-    available Intersight API type.
+    def _new_span(self,
+                  name,
+                  kind,
+                  attributes
+                  ):
+        """This function creates a new span as a child of the active span.
 
-    Args:
-        intersight_api_key_id (str):
-            The ID of the Intersight API key.
-        intersight_api_key (str):
-            The system file path of the Intersight API key.
-        intersight_api_path (str):
-            The path to the targeted Intersight API object type. For example,
-            to specify the Intersight API type for adapter configuration
-            policies, enter "adapter/ConfigPolicies". More API types can be
-            found in the Intersight API reference library at
-            https://intersight.com/apidocs/introduction/overview/.
-        object_type (str):
-            Optional; The type of Intersight object. The default value is
-            "object".
+        Args:
+            name (str):
+                The name of the span.
+            kind (str):
+                The kind of span. The accepted values are "internal" or
+                "client".
+            attributes (dict):
+                The attributes of the span.
+
+        Returns:
+            A dictionary representing the new span.
+        """
+        parent_span = _current_trace_span.get()
+        return {
+            "trace_id": self.trace_id,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_span_id": parent_span["span_id"] if parent_span else None,
+            "name": name,
+            "kind": kind,
+            "start_time_unix_nano": time.time_ns(),
+            "end_time_unix_nano": None,
+            "duration_seconds": None,
+            "status": "OK",
+            "attributes": dict(attributes)
+            }
+
+    def _finish_span(self,
+                     span,
+                     duration_seconds
+                     ):
+        """This function records the duration of a span and stores it.
+
+        Args:
+            span (dict):
+                The span to be finished.
+            duration_seconds (float):
+                The duration of the span in seconds.
+        """
+        span["duration_seconds"] = duration_seconds
+        span["end_time_unix_nano"] = span["start_time_unix_nano"] + int(duration_seconds * 1e9)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextlib.contextmanager
+    def span(self,
+             name,
+             **attributes
+             ):
+        """This function records a span around a phase of the run. Spans
+        started within the phase, including Intersight API calls, are
+        recorded as children of the phase.
+
+        Args:
+            name (str):
+                The name of the phase, such as "resolve", "lookup" or "post".
+            **attributes:
+                Optional; Additional attributes to record on the span.
+
+        Yields:
+            A dictionary representing the active span.
+        """
+        span = self._new_span(name, "internal", attributes)
+        token = _current_trace_span.set(span)
+        start_time = time.perf_counter()
+        try:
+            yield span
+        except BaseException as exception:
+            span["status"] = "ERROR"
+            span["attributes"]["exception.type"] = type(exception).__name__
+            raise
+        finally:
+            _current_trace_span.reset(token)
+            self._finish_span(span, time.perf_counter() - start_time)
+
+    def record_api_call(self,
+                        api_call_record
+                        ):
+        """This function records an Intersight API call as a client span of
+        the active span.
+
+        Args:
+            api_call_record (dict):
+                The record of the Intersight API call provided by an
+                instrumented ApiClient.
+        """
+        span = self._new_span(
+            f"{api_call_record['method']} {api_call_record['resource']}",
+            "client",
+            {"http.method": api_call_record["method"],
+             "http.target": api_call_record["path"],
+             "http.status_code": api_call_record["status"],
+             "http.request_content_length": api_call_record["request_bytes"],
+             "http.response_content_length": api_call_record["response_bytes"],
+             "http.retry_count": api_call_record["retry_count"]
+             }
+            )
+        span["start_time_unix_nano"] -= int(api_call_record["latency_seconds"] * 1e9)
+        if api_call_record["error"]:
+            span["status"] = "ERROR"
+            span["attributes"]["exception.type"] = api_call_record["error"]
+        self._finish_span(span, api_call_record["latency_seconds"])
+
+    def summarize_phases(self):
+        """This function summarizes the recorded spans by name.
+
+        Returns:
+            A dictionary with the span count, total seconds and maximum
+            seconds for each span name, ordered by total seconds.
+        """
+        phase_summary = {}
+        with self._lock:
+            recorded_spans = list(self.spans)
+        for span in recorded_spans:
+            phase_name = span["name"] if span["kind"] == "internal" else f"api {span['attributes']['http.method']}"
+            phase = phase_summary.setdefault(phase_name,
+                                             {"count": 0,
+                                              "total_seconds": 0.0,
+                                              "max_seconds": 0.0
+                                              })
+            phase["count"] += 1
+            phase["total_seconds"] += span["duration_seconds"]
+            phase["max_seconds"] = max(phase["max_seconds"], span["duration_seconds"])
+        return dict(sorted(phase_summary.items(),
+                           key=lambda phase_item: phase_item[1]["total_seconds"],
+                           reverse=True
+                           ))
+
+    def export_json_lines(self,
+                          output_file
+                          ):
+        """This function writes the recorded spans to a file as JSON lines,
+        one span per line.
+
+        Args:
+            output_file (str):
+                The system file path of the JSON lines output file.
+        """
+        with self._lock:
+            recorded_spans = list(self.spans)
+        with open(output_file, "w") as f:
+            for span in recorded_spans:
+                f.write(json.dumps(span) + "\n")
+
+    def export_opentelemetry_spans(self,
+                                   output_file
+                                   ):
+        """This function writes the recorded spans to a file in the
+        OpenTelemetry OTLP/JSON trace format.
+
+        Args:
+            output_file (str):
+                The system file path of the OTLP/JSON output file.
+        """
+        def otlp_attribute_value(value):
+            if isinstance(value, bool):
+                return {"boolValue": value}
+            if isinstance(value, int):
+                return {"intValue": str(value)}
+            if isinstance(value, float):
+                return {"doubleValue": value}
+            return {"stringValue": str(value)}
+
+        with self._lock:
+            recorded_spans = list(self.spans)
+        otlp_spans = []
+        for span in recorded_spans:
+            otlp_span = {
+                "traceId": span["trace_id"],
+                "spanId": span["span_id"],
+                "name": span["name"],
+                "kind": 3 if span["kind"] == "client" else 1,
+                "startTimeUnixNano": str(span["start_time_unix_nano"]),
+                "endTimeUnixNano": str(span["end_time_unix_nano"]),
+                "attributes": [{"key": attribute_key,
+                                "value": otlp_attribute_value(attribute_value)}
+                               for attribute_key, attribute_value
+                               in span["attributes"].items()
+                               if attribute_value is not None
+                               ],
+                "status": {"code": 2 if span["status"] == "ERROR" else 1}
+                }
+            if span["parent_span_id"]:
+                otlp_span["parentSpanId"] = span["parent_span_id"]
+            otlp_spans.append(otlp_span)
+        otlp_document = {
+            "resourceSpans": [
+                {"resource": {"attributes": [{"key": "service.name",
+                                              "value": {"stringValue": self.service_name}}
+                                             ]},
+                 "scopeSpans": [{"scope": {"name": "intersight_server_power_control"},
+                                 "spans": otlp_spans
+                                 }]
+                 }
+                ]
+            }
+        with open(output_file, "w") as f:
+            json.dump(otlp_document, f)
+
+    def export(self,
+               output_file,
+               output_format="JSON Lines"
+               ):
+        """This function writes the recorded spans to a file in the provided
+        format.
+
+        Args:
+            output_file (str):
+                The system file path of the output file.
+            output_format (str):
+                Optional; The format of the output file. The accepted values
+                are "JSON Lines" or "OpenTelemetry". The default value is
+                "JSON Lines".
+        """
+        if "".join(output_format.lower().split()) in ("opentelemetry", "otel", "otlp"):
+            self.export_opentelemetry_spans(output_file)
+        else:
+            self.export_json_lines(output_file)
+
+
+# Establish function to start tracing the current run
+def enable_run_tracing(run_tracer=None):
+    """This is a function to set the active run tracer. Every instrumented
+    Intersight API call and power control phase is recorded by the active run
+    tracer.
+
+    Args:
+        run_tracer ("IntersightRunTracer"):
+            Optional; The IntersightRunTracer class instance to be set as the
+            active run tracer. The default value is None, which will create a
+            new IntersightRunTracer class instance.
+
+    Returns:
+        The active IntersightRunTracer class instance.
+    """
+    global _active_run_tracer
+    if run_tracer is None:
+        run_tracer = IntersightRunTracer()
+    disable_run_tracing()
+    _active_run_tracer = run_tracer
+    api_call_observers.append(run_tracer.record_api_call)
+    return run_tracer
+
+
+# Establish function to stop tracing the current run
+def disable_run_tracing():
+    """This is a function to remove the active run tracer.
+
+    Returns:
+        The previously active IntersightRunTracer class instance or None.
+    """
+    global _active_run_tracer
+    run_tracer = _active_run_tracer
+    if run_tracer is not None:
+        with contextlib.suppress(ValueError):
+            api_call_observers.remove(run_tracer.record_api_call)
+    _active_run_tracer = None
+    return run_tracer
+
+
+# Establish function to record a span for a phase of the power control pipeline
+def trace_span(name,
+               **attributes
+               ):
+    """This is a function to record a span for a phase of the power control
+    pipeline with the active run tracer. If no run tracer is active, no span
+    is recorded.
+
+    Args:
+        name (str):
+            The name of the phase, such as "resolve", "lookup" or "post".
+        **attributes:
+            Optional; Additional attributes to record on the span.
+
+    Returns:
+        A context manager for the span.
+    """
+    if _active_run_tracer is None:
+        return contextlib.nullcontext()
+    return _active_run_tracer.span(name, **attributes)
+
+
+# Establish variable for the active run profiler
+_active_run_profiler = None
+
+
+# Establish class to profile the CPU time and memory allocations of a run by power control phase
+class IntersightRunProfiler:
+    """This class profiles a run by sampling the stacks of every thread at a
+    fixed interval and tracing the memory allocations with tracemalloc. Each
+    sampled stack and allocation is grouped by the innermost power control
+    phase it was made in, such as "resolve", "lookup" or "post", determined
+    from the trace_span blocks of this tool, so no run tracer is needed.
+
+    The sampled stacks are written in the collapsed stack format used by
+    flame graph tools, and the allocations held at the peak of the traced
+    memory are summarized by phase. The CPU time of every thread can also be
+    recorded with cProfile, at a higher overhead.
+    """
+    no_phase_name = "(no phase)"
+
+    def __init__(self,
+                 sample_interval=0.005,
+                 allocation_traceback_depth=25,
+                 top_allocation_count=10,
+                 deterministic_cpu_profile=False
+                 ):
+        self.sample_interval = sample_interval
+        self.allocation_traceback_depth = allocation_traceback_depth
+        self.top_allocation_count = top_allocation_count
+        self.deterministic_cpu_profile = deterministic_cpu_profile
+        self.sample_count = 0
+        self.collapsed_stack_counts = collections.Counter()
+        self.phase_sample_counts = collections.Counter()
+        self.peak_traced_memory = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler_thread = None
+        self._cpu_profiles = []
+        self._started_tracemalloc = False
+        self._peak_allocation_snapshot = None
+        self._peak_allocation_snapshot_time = 0
+        self._source_code_filename = IntersightRunProfiler.__init__.__code__.co_filename
+        self._phase_names_by_line = self._get_phase_names_by_line()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.sample_interval}, "
+            f"{self.allocation_traceback_depth}, "
+            f"{self.top_allocation_count}, "
+            f"{self.deterministic_cpu_profile})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {self.sample_count} samples"
+
+    def _get_phase_names_by_line(self):
+        """This function maps each source code line of this tool within a
+        trace_span block to the name of the innermost phase.
+
+        Returns:
+            A dictionary of the phase names by line number.
+        """
+        phase_names_by_line = {}
+        try:
+            with open(__file__, encoding="utf-8") as source_code_file:
+                source_code_tree = ast.parse(source_code_file.read())
+        except (OSError, NameError, SyntaxError):
+            logger.warning("The source code of the tool could not be read. "
+                           "The profile will not be grouped by phase.")
+            return phase_names_by_line
+        phase_blocks = []
+        for source_code_node in ast.walk(source_code_tree):
+            if not isinstance(source_code_node, (ast.With, ast.AsyncWith)):
+                continue
+            for with_item in source_code_node.items:
+                context_expression = with_item.context_expr
+                if (isinstance(context_expression, ast.Call)
+                        and isinstance(context_expression.func, ast.Name)
+                        and context_expression.func.id == "trace_span"
+                        and context_expression.args
+                        and isinstance(context_expression.args[0], ast.Constant)
+                        ):
+                    phase_blocks.append((source_code_node.lineno,
+                                         source_code_node.end_lineno,
+                                         context_expression.args[0].value
+                                         ))
+        for first_line, last_line, phase_name in sorted(phase_blocks,
+                                                        key=lambda phase_block: phase_block[0] - phase_block[1]
+                                                        ):
+            for line_number in range(first_line, last_line + 1):
+                phase_names_by_line[line_number] = phase_name
+        return phase_names_by_line
+
+    def _get_phase_name(self,
+                        stack_locations
+                        ):
+        """This function determines the innermost power control phase of a
+        stack.
+
+        Args:
+            stack_locations (list):
+                A list of (file name, line number) tuples, ordered from the
+                innermost to the outermost frame.
+
+        Returns:
+            A string of the phase name.
+        """
+        for filename, line_number in stack_locations:
+            if filename == self._source_code_filename and line_number in self._phase_names_by_line:
+                return self._phase_names_by_line[line_number]
+        return self.no_phase_name
+
+    def _enable_thread_cpu_profile(self, *profile_arguments):
+        """This function starts a cProfile profiler in a new thread. It is
+        set as the profile function of each thread started while profiling,
+        and replaces itself on the first call.
+        """
+        sys.setprofile(None)
+        if self._stop_event.is_set():
+            return
+        thread_cpu_profile = cProfile.Profile()
+        try:
+            thread_cpu_profile.enable()
+        except ValueError:
+            # Python 3.12 and later profile every thread with the first cProfile profiler
+            return
+        with self._lock:
+            self._cpu_profiles.append(thread_cpu_profile)
+
+    def _take_sample(self):
+        """This function samples the stack of every thread other than the
+        sampler thread, and snapshots the traced memory allocations when the
+        traced memory reaches a new peak.
+        """
+        sampler_thread_id = threading.get_ident()
+        for thread_id, thread_frame in sys._current_frames().items():
+            if thread_id == sampler_thread_id:
+                continue
+            stack_locations = []
+            stack_labels = []
+            while thread_frame is not None:
+                frame_code = thread_frame.f_code
+                stack_locations.append((frame_code.co_filename, thread_frame.f_lineno))
+                stack_labels.append(f"{getattr(frame_code, 'co_qualname', frame_code.co_name)} "
+                                    f"({os.path.basename(frame_code.co_filename)}:{frame_code.co_firstlineno})"
+                                    .replace(";", ":")
+                                    )
+                thread_frame = thread_frame.f_back
+            phase_name = self._get_phase_name(stack_locations)
+            with self._lock:
+                self.collapsed_stack_counts[";".join([f"phase:{phase_name}", *reversed(stack_labels)])] += 1
+                self.phase_sample_counts[phase_name] += 1
+        self.sample_count += 1
+        if tracemalloc.is_tracing():
+            traced_memory = tracemalloc.get_traced_memory()[0]
+            if (traced_memory > self.peak_traced_memory * 1.1
+                    and time.monotonic() - self._peak_allocation_snapshot_time >= 1
+                    ):
+                self.peak_traced_memory = traced_memory
+                self._peak_allocation_snapshot = tracemalloc.take_snapshot()
+                self._peak_allocation_snapshot_time = time.monotonic()
+
+    def _run_sampler(self):
+        """This function samples the thread stacks until profiling stops.
+        """
+        while not self._stop_event.wait(self.sample_interval):
+            self._take_sample()
+
+    def start(self):
+        """This function starts profiling.
+        """
+        if self.allocation_traceback_depth and not tracemalloc.is_tracing():
+            tracemalloc.start(self.allocation_traceback_depth)
+            self._started_tracemalloc = True
+        if self.deterministic_cpu_profile:
+            threading.setprofile(self._enable_thread_cpu_profile)
+            main_thread_cpu_profile = cProfile.Profile()
+            self._cpu_profiles.append(main_thread_cpu_profile)
+            main_thread_cpu_profile.enable()
+        self._stop_event.clear()
+        self._sampler_thread = threading.Thread(target=self._run_sampler,
+                                                name="IntersightRunProfiler",
+                                                daemon=True
+                                                )
+        self._sampler_thread.start()
+
+    def stop(self):
+        """This function stops profiling and takes the final allocation
+        snapshot, if the traced memory is at its peak.
+        """
+        self._stop_event.set()
+        if self._sampler_thread is not None:
+            self._sampler_thread.join()
+        if self.deterministic_cpu_profile:
+            threading.setprofile(None)
+            for thread_cpu_profile in self._cpu_profiles:
+                thread_cpu_profile.disable()
+        if tracemalloc.is_tracing():
+            traced_memory = tracemalloc.get_traced_memory()[0]
+            if traced_memory >= self.peak_traced_memory:
+                self.peak_traced_memory = traced_memory
+                self._peak_allocation_snapshot = tracemalloc.take_snapshot()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    def summarize_allocations(self):
+        """This function summarizes the memory allocations held at the peak
+        of the traced memory by phase.
+
+        Returns:
+            A dictionary with the total bytes, allocation count and the top
+            allocating source code lines for each phase, ordered by total
+            bytes.
+        """
+        if self._peak_allocation_snapshot is None:
+            return {}
+        allocation_snapshot = self._peak_allocation_snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+            ))
+        allocation_summary = {}
+        for allocation_trace in allocation_snapshot.traces:
+            allocation_traceback = allocation_trace.traceback
+            phase_name = self._get_phase_name([(allocation_frame.filename, allocation_frame.lineno)
+                                               for allocation_frame in reversed(allocation_traceback)
+                                               ])
+            phase_allocations = allocation_summary.setdefault(phase_name,
+                                                              {"total_bytes": 0,
+                                                               "count": 0,
+                                                               "lines": collections.Counter()
+                                                               })
+            phase_allocations["total_bytes"] += allocation_trace.size
+            phase_allocations["count"] += 1
+            allocating_frame = allocation_traceback[-1]
+            phase_allocations["lines"][f"{allocating_frame.filename}:{allocating_frame.lineno}"] += allocation_trace.size
+        for phase_allocations in allocation_summary.values():
+            phase_allocations["top_lines"] = phase_allocations.pop("lines").most_common(self.top_allocation_count)
+        return dict(sorted(allocation_summary.items(),
+                           key=lambda phase_item: phase_item[1]["total_bytes"],
+                           reverse=True
+                           ))
+
+    def write_reports(self,
+                      output_prefix
+                      ):
+        """This function writes the profile reports. The sampled stacks are
+        written to a ".collapsed" file, the allocation summary to an
+        ".allocations.txt" file and the cProfile statistics, if recorded, to
+        a ".pstats" file.
+
+        Args:
+            output_prefix (str):
+                The system file path prefix of the profile report files.
+
+        Returns:
+            A list of the system file paths of the written report files.
+        """
+        report_files = []
+        with self._lock:
+            collapsed_stack_counts = list(self.collapsed_stack_counts.items())
+        collapsed_stack_file = f"{output_prefix}.collapsed"
+        with open(collapsed_stack_file, "w", encoding="utf-8") as f:
+            for collapsed_stack, collapsed_stack_count in sorted(collapsed_stack_counts):
+                f.write(f"{collapsed_stack} {collapsed_stack_count}\n")
+        report_files.append(collapsed_stack_file)
+        allocation_summary = self.summarize_allocations()
+        if allocation_summary:
+            allocation_summary_file = f"{output_prefix}.allocations.txt"
+            with open(allocation_summary_file, "w", encoding="utf-8") as f:
+                f.write(f"Memory allocations held at the peak of {self.peak_traced_memory / 1024:.1f} KiB traced memory, by phase\n")
+                for phase_name, phase_allocations in allocation_summary.items():
+                    f.write(f"\n{phase_name}: {phase_allocations['total_bytes'] / 1024:.1f} KiB "
+                            f"in {phase_allocations['count']} allocations\n")
+                    for allocating_line, allocated_bytes in phase_allocations["top_lines"]:
+                        f.write(f"  {allocated_bytes / 1024:10.1f} KiB  {allocating_line}\n")
+            report_files.append(allocation_summary_file)
+        with self._lock:
+            cpu_profiles = list(self._cpu_profiles)
+        if cpu_profiles:
+            cpu_profile_file = f"{output_prefix}.pstats"
+            pstats.Stats(*cpu_profiles).dump_stats(cpu_profile_file)
+            report_files.append(cpu_profile_file)
+        return report_files
+
+
+# Establish function to start profiling the current run
+def enable_run_profiling(run_profiler=None):
+    """This is a function to set and start the active run profiler.
+
+    Args:
+        run_profiler ("IntersightRunProfiler"):
+            Optional; The IntersightRunProfiler class instance to be set as
+            the active run profiler. The default value is None, which will
+            create a new IntersightRunProfiler class instance.
+
+    Returns:
+        The active IntersightRunProfiler class instance.
+    """
+    global _active_run_profiler
+    if run_profiler is None:
+        run_profiler = IntersightRunProfiler()
+    disable_run_profiling()
+    _active_run_profiler = run_profiler
+    run_profiler.start()
+    return run_profiler
+
+
+# Establish function to stop profiling the current run
+def disable_run_profiling():
+    """This is a function to stop and remove the active run profiler.
+
+    Returns:
+        The previously active IntersightRunProfiler class instance or None.
+    """
+    global _active_run_profiler
+    run_profiler = _active_run_profiler
+    if run_profiler is not None:
+        run_profiler.stop()
+    _active_run_profiler = None
+    return run_profiler
+
+
+# Establish function to retrieve the number of retries performed for an Intersight API response
+def _get_api_response_retry_count(api_response):
+    """This is a function to retrieve the number of retries urllib3 performed
+    before receiving the provided Intersight API response.
+
+    Args:
+        api_response ("RESTResponse"):
+            The response received from the Intersight API.
+
+    Returns:
+        An integer of the number of retries performed.
+    """
+    retries = getattr(getattr(api_response, "urllib3_response", None), "retries", None)
+    return len(getattr(retries, "history", None) or ())
+
+
+# Establish function to provide the record of an Intersight API call to every observer
+def _notify_api_call_observers(api_call_record):
+    """This is a function to provide the record of an instrumented Intersight
+    API call to every observer in the api_call_observers list.
+
+    Args:
+        api_call_record (dict):
+            The record of the Intersight API call.
+    """
+    for api_call_observer in list(api_call_observers):
+        api_call_observer(api_call_record)
+
+
+# Establish variable for the active adaptive concurrency controller
+_active_concurrency_controller = None
+
+
+# Establish class to adapt the concurrency of Intersight API requests to the health of the endpoint
+class AdaptiveConcurrencyController:
+    """This class limits the number of concurrent Intersight API requests and
+    adapts the limit to the health of the endpoint with additive increase and
+    multiplicative decrease (AIMD). Each healthy response raises the limit by
+    about one request per round of in-flight requests, and each slow or failed
+    response (HTTP status 429 or 5xx, or no response) cuts the limit, at most
+    once per response time. A circuit breaker stops new requests when the
+    error rate of the recent responses is too high, then lets a single
+    request through after a pause and resumes from the minimum limit once it
+    succeeds. The pause doubles for each failed probe, up to a maximum.
+    """
+    def __init__(self,
+                 initial_limit=10,
+                 min_limit=1,
+                 max_limit=50,
+                 latency_threshold=2.0,
+                 decrease_factor=0.5,
+                 error_rate_threshold=0.5,
+                 error_rate_window=20,
+                 circuit_open_duration=30,
+                 max_circuit_open_duration=300
+                 ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_threshold = latency_threshold
+        self.decrease_factor = decrease_factor
+        self.error_rate_threshold = error_rate_threshold
+        self.error_rate_window = error_rate_window
+        self.circuit_open_duration = circuit_open_duration
+        self.max_circuit_open_duration = max_circuit_open_duration
+        self.circuit_state = "Closed"
+        self.in_flight = 0
+        self._recent_results = collections.deque(maxlen=error_rate_window)
+        self._current_circuit_open_duration = circuit_open_duration
+        self._circuit_open_until = 0
+        self._last_decrease_time = 0
+        self._condition = threading.Condition()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({int(self.limit)}, "
+            f"{self.min_limit}, "
+            f"{self.max_limit}, "
+            f"{self.latency_threshold})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with a limit of {int(self.limit)} ({self.circuit_state})"
+
+    def _can_start_request(self):
+        if self.circuit_state == "Open":
+            if time.monotonic() < self._circuit_open_until:
+                return False
+            # Let a single probe request through after the pause
+            self.circuit_state = "Half-Open"
+            self._update_metrics()
+        if self.circuit_state == "Half-Open":
+            return self.in_flight == 0
+        return self.in_flight < int(self.limit)
+
+    def acquire(self):
+        """This function waits until a new request can be started within the
+        current limit and circuit breaker state.
+        """
+        with self._condition:
+            while not self._can_start_request():
+                wait_timeout = None
+                if self.circuit_state == "Open":
+                    wait_timeout = max(self._circuit_open_until - time.monotonic(), 0.01)
+                self._condition.wait(wait_timeout)
+            self.in_flight += 1
+
+    def release(self,
+                status=None,
+                latency_seconds=None,
+                error=None
+                ):
+        """This function records the outcome of a finished request and adapts
+        the limit and circuit breaker state.
+
+        Args:
+            status (int):
+                Optional; The HTTP status of the response. The default value
+                is None.
+            latency_seconds (float):
+                Optional; The latency of the request. The default value is
+                None.
+            error (str):
+                Optional; The type of error raised by the request. The
+                default value is None.
+        """
+        failed = status == 429 or (status or 0) >= 500 or (error is not None and status is None)
+        slow = latency_seconds is not None and latency_seconds > self.latency_threshold
+        with self._condition:
+            self.in_flight = max(self.in_flight - 1, 0)
+            self._recent_results.append(failed)
+            now = time.monotonic()
+            if self.circuit_state == "Half-Open":
+                if failed:
+                    self._open_circuit(now, double_duration=True)
+                else:
+                    self.circuit_state = "Closed"
+                    self._current_circuit_open_duration = self.circuit_open_duration
+                    self._recent_results.clear()
+                    self.limit = float(self.min_limit)
+                    logger.info("The Intersight API has recovered. Resuming "
+                                "requests with a concurrency limit of %d.",
+                                self.min_limit
+                                )
+            elif failed and self._is_error_rate_exceeded():
+                self._open_circuit(now)
+            elif failed or slow:
+                # Decrease at most once per response time, so one burst of slow responses only counts once
+                if now - self._last_decrease_time >= (latency_seconds or 0):
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                    self._last_decrease_time = now
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / max(self.limit, 1))
+            self._update_metrics()
+            self._condition.notify_all()
+
+    def _is_error_rate_exceeded(self):
+        if len(self._recent_results) < max(self.error_rate_window // 2, 1):
+            return False
+        return sum(self._recent_results) / len(self._recent_results) >= self.error_rate_threshold
+
+    def _open_circuit(self,
+                      now,
+                      double_duration=False
+                      ):
+        if double_duration:
+            self._current_circuit_open_duration = min(self._current_circuit_open_duration * 2,
+                                                      self.max_circuit_open_duration
+                                                      )
+        self.circuit_state = "Open"
+        self._circuit_open_until = now + self._current_circuit_open_duration
+        self.limit = float(self.min_limit)
+        logger.warning("The Intersight API error rate is too high. Pausing "
+                       "requests for %s seconds.",
+                       self._current_circuit_open_duration
+                       )
+
+    def _update_metrics(self):
+        metrics_registry = _active_metrics_registry
+        if metrics_registry is not None:
+            metrics_registry.api_concurrency_limit.set(int(self.limit))
+            metrics_registry.api_circuit_breaker_open.set(1 if self.circuit_state == "Open" else 0)
+
+
+# Establish function to start adapting the concurrency of Intersight API requests
+def enable_adaptive_concurrency(concurrency_controller=None):
+    """This is a function to set the active adaptive concurrency controller.
+    Every instrumented Intersight API call waits for the active controller
+    before it is sent.
+
+    Args:
+        concurrency_controller ("AdaptiveConcurrencyController"):
+            Optional; The AdaptiveConcurrencyController class instance to be
+            set as the active controller. The default value is None, which
+            will create a new AdaptiveConcurrencyController class instance.
+
+    Returns:
+        The active AdaptiveConcurrencyController class instance.
+    """
+    global _active_concurrency_controller
+    if concurrency_controller is None:
+        concurrency_controller = AdaptiveConcurrencyController()
+    _active_concurrency_controller = concurrency_controller
+    return concurrency_controller
+
+
+# Establish function to stop adapting the concurrency of Intersight API requests
+def disable_adaptive_concurrency():
+    """This is a function to remove the active adaptive concurrency
+    controller.
+
+    Returns:
+        The previously active AdaptiveConcurrencyController class instance or
+        None.
+    """
+    global _active_concurrency_controller
+    concurrency_controller = _active_concurrency_controller
+    _active_concurrency_controller = None
+    return concurrency_controller
+
+
+# Establish variable for the active Intersight API request coalescer
+_active_request_coalescer = None
+
+
+# Establish class to coalesce identical concurrent Intersight API GET requests
+class SingleFlightRequestCoalescer:
+    """This class coalesces identical Intersight API GET requests. While a GET
+    request for a resource path is in flight, identical requests from other
+    threads wait for its response instead of being sent. Successful responses
+    are also cached for cache_ttl seconds, so a burst of concurrent workers
+    sends one request per unique resource. Any other request method clears
+    the cached responses of the resources it changes.
+    """
+    def __init__(self,
+                 cache_ttl=2,
+                 max_cached_responses=1000
+                 ):
+        self.cache_ttl = cache_ttl
+        self.max_cached_responses = max_cached_responses
+        self.sent_request_count = 0
+        self.coalesced_request_count = 0
+        self.cached_response_count = 0
+        self._lock = threading.Lock()
+        self._in_flight_requests = {}
+        self._cached_responses = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.cache_ttl}, "
+            f"{self.max_cached_responses})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {len(self._cached_responses)} cached responses"
+
+    def call(self,
+             api_client,
+             resource_path,
+             send_request
+             ):
+        """This function sends a GET request, unless an identical request is in
+        flight or its response is cached, and sets the last_response attribute
+        of the ApiClient for the calling thread.
+
+        Args:
+            api_client ("ApiClient"):
+                The ApiClient class instance sending the request.
+            resource_path (str):
+                The resource path of the request, including any query options.
+            send_request (function):
+                The function that sends the request and returns the result of
+                the call_api method.
+
+        Returns:
+            The result of the call_api method for the request.
+
+        Raises:
+            Exception:
+                The exception raised by the request, which is also raised in
+                every thread waiting for it.
+        """
+        request_key = (api_client, resource_path)
+        with self._lock:
+            cached_response = self._cached_responses.get(request_key)
+            if cached_response is not None and cached_response[0] > time.monotonic():
+                self.cached_response_count += 1
+                api_client.last_response = cached_response[1]
+                return cached_response[2]
+            in_flight_request = self._in_flight_requests.get(request_key)
+            leading_request = in_flight_request is None
+            if leading_request:
+                in_flight_request = {"completed": threading.Event()}
+                self._in_flight_requests[request_key] = in_flight_request
+                self.sent_request_count += 1
+            else:
+                self.coalesced_request_count += 1
+        if not leading_request:
+            in_flight_request["completed"].wait()
+            if "exception" in in_flight_request:
+                raise in_flight_request["exception"]
+            api_client.last_response = in_flight_request["response"]
+            return in_flight_request["result"]
+        try:
+            in_flight_request["result"] = send_request()
+            in_flight_request["response"] = api_client.last_response
+        except Exception as exception:
+            in_flight_request["exception"] = exception
+            raise
+        finally:
+            with self._lock:
+                self._in_flight_requests.pop(request_key, None)
+                if (
+                    self.cache_ttl > 0
+                    and "exception" not in in_flight_request
+                    and getattr(in_flight_request.get("response"), "status", None) == 200
+                    ):
+                    current_time = time.monotonic()
+                    if len(self._cached_responses) >= self.max_cached_responses:
+                        self._cached_responses = {cached_request_key: cached_response
+                                                  for cached_request_key, cached_response in self._cached_responses.items()
+                                                  if cached_response[0] > current_time
+                                                  }
+                    if len(self._cached_responses) < self.max_cached_responses:
+                        self._cached_responses[request_key] = (current_time + self.cache_ttl,
+                                                               in_flight_request["response"],
+                                                               in_flight_request["result"]
+                                                               )
+            in_flight_request["completed"].set()
+        return in_flight_request["result"]
+
+    def invalidate(self,
+                   resource_path
+                   ):
+        """This function clears the cached responses for the resource type of
+        a resource path, such as every cached /compute/ServerSettings response
+        for a POST to /compute/ServerSettings/{Moid}.
+
+        Args:
+            resource_path (str):
+                The resource path of the changed resource.
+        """
+        def get_resource_type(request_resource_path):
+            return request_resource_path.split("?", 1)[0].strip("/").split("/")[:2]
+
+        changed_resource_type = get_resource_type(resource_path)
+        with self._lock:
+            self._cached_responses = {cached_request_key: cached_response
+                                      for cached_request_key, cached_response in self._cached_responses.items()
+                                      if get_resource_type(cached_request_key[1]) != changed_resource_type
+                                      }
+
+    def clear(self):
+        """This function clears all cached responses.
+        """
+        with self._lock:
+            self._cached_responses.clear()
+
+
+# Establish function to start coalescing identical Intersight API GET requests
+def enable_request_coalescing(request_coalescer=None):
+    """This is a function to set the active Intersight API request coalescer.
+    Every instrumented Intersight API GET request is sent through the active
+    coalescer.
+
+    Args:
+        request_coalescer ("SingleFlightRequestCoalescer"):
+            Optional; The SingleFlightRequestCoalescer class instance to be
+            set as the active coalescer. The default value is None, which
+            will create a new SingleFlightRequestCoalescer class instance.
+
+    Returns:
+        The active SingleFlightRequestCoalescer class instance.
+    """
+    global _active_request_coalescer
+    if request_coalescer is None:
+        request_coalescer = SingleFlightRequestCoalescer()
+    _active_request_coalescer = request_coalescer
+    return request_coalescer
+
+
+# Establish function to stop coalescing identical Intersight API GET requests
+def disable_request_coalescing():
+    """This is a function to remove the active Intersight API request
+    coalescer.
+
+    Returns:
+        The previously active SingleFlightRequestCoalescer class instance or
+        None.
+    """
+    global _active_request_coalescer
+    request_coalescer = _active_request_coalescer
+    _active_request_coalescer = None
+    return request_coalescer
+
+
+# Establish function to instrument the Intersight API calls of an ApiClient
+def instrument_api_client(api_client):
+    """This is a function to instrument the call_api method of an ApiClient
+    class instance. Each call records the method, path, status, request and
+    response bytes, latency and retry count, then provides the record to every
+    observer in the api_call_observers list. If an adaptive concurrency
+    controller is active, each call waits for it before it is sent and reports
+    its outcome to it. If there are no observers and no controller, the call
+    is passed through without instrumentation. If a request coalescer is
+    active, GET requests are sent through it, so identical concurrent
+    requests are only sent and instrumented once.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        The provided ApiClient class instance with call_api instrumented.
+    """
+    if getattr(api_client, "_call_api_instrumented", False):
+        return api_client
+    uninstrumented_call_api = api_client.call_api
+
+    def instrumented_call_api(resource_path,
+                              method,
+                              *args,
+                              **kwargs
+                              ):
+        request_coalescer = _active_request_coalescer
+        if request_coalescer is None:
+            return send_api_call(resource_path, method, *args, **kwargs)
+        if method == "GET":
+            return request_coalescer.call(api_client,
+                                          resource_path,
+                                          lambda: send_api_call(resource_path, method, *args, **kwargs)
+                                          )
+        try:
+            return send_api_call(resource_path, method, *args, **kwargs)
+        finally:
+            request_coalescer.invalidate(resource_path)
+
+    def send_api_call(resource_path,
+                      method,
+                      *args,
+                      **kwargs
+                      ):
+        concurrency_controller = _active_concurrency_controller
+        if not api_call_observers and concurrency_controller is None:
+            return uninstrumented_call_api(resource_path, method, *args, **kwargs)
+        api_call_record = {
+            "method": method,
+            "path": resource_path,
+            "resource": resource_path.split("?", 1)[0],
+            "status": None,
+            "request_bytes": len(json.dumps(kwargs["body"])) if kwargs.get("body") is not None else 0,
+            "response_bytes": 0,
+            "latency_seconds": None,
+            "retry_count": 0,
+            "error": None
+            }
+        if concurrency_controller is not None:
+            concurrency_controller.acquire()
+        start_time = time.perf_counter()
+        try:
+            api_call_result = uninstrumented_call_api(resource_path, method, *args, **kwargs)
+            api_response = api_client.last_response
+            api_call_record["status"] = getattr(api_response, "status", None)
+            api_call_record["response_bytes"] = len(getattr(api_response, "data", None) or b"")
+            api_call_record["retry_count"] = _get_api_response_retry_count(api_response)
+            return api_call_result
+        except Exception as exception:
+            api_call_record["status"] = getattr(exception, "status", None)
+            api_call_record["response_bytes"] = len(getattr(exception, "body", None) or b"")
+            api_call_record["error"] = type(exception).__name__
+            raise
+        finally:
+            api_call_record["latency_seconds"] = time.perf_counter() - start_time
+            if concurrency_controller is not None:
+                concurrency_controller.release(api_call_record["status"],
+                                               api_call_record["latency_seconds"],
+                                               api_call_record["error"]
+                                               )
+            _notify_api_call_observers(api_call_record)
+
+    api_client.call_api = instrumented_call_api
+    api_client._call_api_instrumented = True
+    return api_client
+
+# Establish variable for the active metrics registry
+_active_metrics_registry = None
+
+
+# Establish classes to collect Prometheus-style metrics for power control operations
+class _PowerControlMetric:
+    """This class is the base class for the metrics collected by the
+    PowerControlMetricsRegistry class.
+    """
+    metric_type = "untyped"
+
+    def __init__(self,
+                 name,
+                 documentation,
+                 label_names=()
+                 ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.name}', "
+            f"'{self.documentation}', "
+            f"{self.label_names})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.name}'"
+
+    def _label_values(self,
+                      labels
+                      ):
+        return tuple(str(labels.get(label_name, "")) for label_name in self.label_names)
+
+    @staticmethod
+    def _format_labels(label_names,
+                       label_values
+                       ):
+        if not label_names:
+            return ""
+        formatted_labels = ",".join(
+            '{}="{}"'.format(label_name,
+                             label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for label_name, label_value in zip(label_names, label_values)
+            )
+        return f"{{{formatted_labels}}}"
+
+    def render_samples(self):
+        """This function renders the samples of the metric in the Prometheus
+        text format.
+
+        Returns:
+            A list of strings, one for each sample line.
+        """
+        with self._lock:
+            metric_values = dict(self._values)
+        return [f"{self.name}{self._format_labels(self.label_names, label_values)} {metric_value}"
+                for label_values, metric_value in sorted(metric_values.items())
+                ]
+
+
+class MetricsCounter(_PowerControlMetric):
+    """This class is a Prometheus counter metric.
+    """
+    metric_type = "counter"
+
+    def inc(self,
+            amount=1,
+            **labels
+            ):
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+
+class MetricsGauge(_PowerControlMetric):
+    """This class is a Prometheus gauge metric.
+    """
+    metric_type = "gauge"
+
+    def set(self,
+            value,
+            **labels
+            ):
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = value
+
+    def inc(self,
+            amount=1,
+            **labels
+            ):
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def dec(self,
+            amount=1,
+            **labels
+            ):
+        self.inc(-amount, **labels)
+
+
+class MetricsHistogram(_PowerControlMetric):
+    """This class is a Prometheus histogram metric.
+    """
+    metric_type = "histogram"
+    default_buckets = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+    def __init__(self,
+                 name,
+                 documentation,
+                 label_names=(),
+                 buckets=None
+                 ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets or self.default_buckets))
+
+    def observe(self,
+                value,
+                **labels
+                ):
+        label_values = self._label_values(labels)
+        with self._lock:
+            histogram_values = self._values.get(label_values)
+            if histogram_values is None:
+                histogram_values = self._values[label_values] = {
+                    "bucket_counts": [0] * len(self.buckets),
+                    "sum": 0.0,
+                    "count": 0
+                    }
+            for bucket_index, bucket_upper_bound in enumerate(self.buckets):
+                if value <= bucket_upper_bound:
+                    histogram_values["bucket_counts"][bucket_index] += 1
+                    break
+            histogram_values["sum"] += value
+            histogram_values["count"] += 1
+
+    def render_samples(self):
+        with self._lock:
+            metric_values = {label_values: copy.deepcopy(histogram_values)
+                             for label_values, histogram_values in self._values.items()
+                             }
+        sample_lines = []
+        bucket_label_names = self.label_names + ("le",)
+        for label_values, histogram_values in sorted(metric_values.items()):
+            cumulative_count = 0
+            for bucket_upper_bound, bucket_count in zip(self.buckets, histogram_values["bucket_counts"]):
+                cumulative_count += bucket_count
+                sample_lines.append(
+                    f"{self.name}_bucket"
+                    f"{self._format_labels(bucket_label_names, label_values + (f'{bucket_upper_bound:g}',))} "
+                    f"{cumulative_count}"
+                    )
+            sample_lines.append(
+                f"{self.name}_bucket"
+                f"{self._format_labels(bucket_label_names, label_values + ('+Inf',))} "
+                f"{histogram_values['count']}"
+                )
+            formatted_labels = self._format_labels(self.label_names, label_values)
+            sample_lines.append(f"{self.name}_sum{formatted_labels} {histogram_values['sum']}")
+            sample_lines.append(f"{self.name}_count{formatted_labels} {histogram_values['count']}")
+        return sample_lines
+
+
+class PowerControlMetricsRegistry:
+    """This class is a registry of the Prometheus-style metrics collected for
+    Intersight API requests and server power control operations. The metrics
+    can be exposed in the Prometheus text format on a local port or written to
+    a textfile collector file.
+    """
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._metrics_http_server = None
+        # Intersight API executor metrics
+        self.api_requests_total = self.counter(
+            "intersight_api_requests_total",
+            "Total Intersight API requests by method and HTTP status.",
+            ("method", "status")
+            )
+        self.api_request_errors_total = self.counter(
+            "intersight_api_request_errors_total",
+            "Total Intersight API requests that raised an error, by method and error type.",
+            ("method", "error")
+            )
+        self.api_throttle_events_total = self.counter(
+            "intersight_api_throttle_events_total",
+            "Total Intersight API requests rejected with HTTP status 429.",
+            ("method",)
+            )
+        self.api_request_duration_seconds = self.histogram(
+            "intersight_api_request_duration_seconds",
+            "Latency of Intersight API requests by method.",
+            ("method",),
+            buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+            )
+        # Power control operation metrics
+        self.power_control_operations_total = self.counter(
+            "intersight_power_control_operations_total",
+            "Total server power control operations by power control state and result.",
+            ("power_control_state", "result")
+            )
+        self.power_control_operation_duration_seconds = self.histogram(
+            "intersight_power_control_operation_duration_seconds",
+            "End-to-end latency of server power control operations by power control state.",
+            ("power_control_state",)
+            )
+        self.power_control_operations_in_progress = self.gauge(
+            "intersight_power_control_operations_in_progress",
+            "Server power control operations currently in progress by power control state.",
+            ("power_control_state",)
+            )
+        self.power_control_queue_depth = self.gauge(
+            "intersight_power_control_queue_depth",
+            "Target servers waiting for a power control operation."
+            )
+        # Adaptive concurrency metrics
+        self.api_concurrency_limit = self.gauge(
+            "intersight_api_concurrency_limit",
+            "Current adaptive limit of concurrent Intersight API requests."
+            )
+        self.api_circuit_breaker_open = self.gauge(
+            "intersight_api_circuit_breaker_open",
+            "Whether the Intersight API circuit breaker is open (1) or not (0)."
+            )
+        # Power control policy scheduler metrics
+        self.power_control_policy_trigger_failures_total = self.counter(
+            "intersight_power_control_policy_trigger_failures_total",
+            "Total power control policy triggers that stopped on an error, by error type.",
+            ("error",)
+            )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {len(self._metrics)} metrics"
+
+    def _register(self,
+                  metric
+                  ):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self,
+                name,
+                documentation,
+                label_names=()
+                ):
+        """This function registers a counter metric.
+
+        Returns:
+            The registered MetricsCounter class instance.
+        """
+        return self._register(MetricsCounter(name, documentation, label_names))
+
+    def gauge(self,
+              name,
+              documentation,
+              label_names=()
+              ):
+        """This function registers a gauge metric.
+
+        Returns:
+            The registered MetricsGauge class instance.
+        """
+        return self._register(MetricsGauge(name, documentation, label_names))
+
+    def histogram(self,
+                  name,
+                  documentation,
+                  label_names=(),
+                  buckets=None
+                  ):
+        """This function registers a histogram metric.
+
+        Returns:
+            The registered MetricsHistogram class instance.
+        """
+        return self._register(MetricsHistogram(name, documentation, label_names, buckets))
+
+    def observe_api_call(self,
+                         api_call_record
+                         ):
+        """This function updates the Intersight API executor metrics from the
+        record of an instrumented Intersight API call.
+
+        Args:
+            api_call_record (dict):
+                The record of the Intersight API call provided by an
+                instrumented ApiClient.
+        """
+        api_call_method = api_call_record["method"]
+        self.api_requests_total.inc(method=api_call_method,
+                                    status=api_call_record["status"] or "none"
+                                    )
+        self.api_request_duration_seconds.observe(api_call_record["latency_seconds"],
+                                                  method=api_call_method
+                                                  )
+        if api_call_record["error"]:
+            self.api_request_errors_total.inc(method=api_call_method,
+                                              error=api_call_record["error"]
+                                              )
+        if api_call_record["status"] == 429:
+            self.api_throttle_events_total.inc(method=api_call_method)
+
+    def render_prometheus_text(self):
+        """This function renders all registered metrics in the Prometheus text
+        exposition format.
+
+        Returns:
+            A string of the registered metrics in the Prometheus text format.
+        """
+        with self._lock:
+            registered_metrics = list(self._metrics.values())
+        exposition_lines = []
+        for metric in registered_metrics:
+            exposition_lines.append(f"# HELP {metric.name} {metric.documentation}")
+            exposition_lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            exposition_lines.extend(metric.render_samples())
+        return "\n".join(exposition_lines) + "\n"
+
+    def write_textfile(self,
+                       output_file
+                       ):
+        """This function writes all registered metrics to a file for the
+        Prometheus node exporter textfile collector. The file is replaced
+        atomically so the collector never reads a partial file.
+
+        Args:
+            output_file (str):
+                The system file path of the metrics file. The textfile
+                collector only reads files ending in ".prom".
+        """
+        temporary_output_file = f"{output_file}.{os.getpid()}.tmp"
+        with open(temporary_output_file, "w") as f:
+            f.write(self.render_prometheus_text())
+        os.replace(temporary_output_file, output_file)
+
+    def start_http_server(self,
+                          port,
+                          address="127.0.0.1"
+                          ):
+        """This function exposes all registered metrics in the Prometheus text
+        format on a local HTTP port. The server runs in a daemon thread.
+
+        Args:
+            port (int):
+                The local port to listen on.
+            address (str):
+                Optional; The local address to listen on. The default value
+                is "127.0.0.1".
+
+        Returns:
+            The running ThreadingHTTPServer class instance.
+        """
+        metrics_registry = self
+
+        class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                metrics_text = metrics_registry.render_prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(metrics_text)))
+                self.end_headers()
+                self.wfile.write(metrics_text)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._metrics_http_server = http.server.ThreadingHTTPServer((address, port), MetricsRequestHandler)
+        threading.Thread(target=self._metrics_http_server.serve_forever,
+                         name="metrics-http-server",
+                         daemon=True
+                         ).start()
+        return self._metrics_http_server
+
+    def stop_http_server(self):
+        """This function stops the local metrics HTTP server, if running.
+        """
+        if self._metrics_http_server is not None:
+            self._metrics_http_server.shutdown()
+            self._metrics_http_server.server_close()
+            self._metrics_http_server = None
+
+
+# Establish function to start collecting metrics for the current run
+def enable_metrics(metrics_registry=None):
+    """This is a function to set the active metrics registry. Every
+    instrumented Intersight API call and power control operation is recorded
+    by the active metrics registry.
+
+    Args:
+        metrics_registry ("PowerControlMetricsRegistry"):
+            Optional; The PowerControlMetricsRegistry class instance to be set
+            as the active metrics registry. The default value is None, which
+            will create a new PowerControlMetricsRegistry class instance.
+
+    Returns:
+        The active PowerControlMetricsRegistry class instance.
+    """
+    global _active_metrics_registry
+    if metrics_registry is None:
+        metrics_registry = PowerControlMetricsRegistry()
+    disable_metrics()
+    _active_metrics_registry = metrics_registry
+    api_call_observers.append(metrics_registry.observe_api_call)
+    return metrics_registry
+
+
+# Establish function to stop collecting metrics for the current run
+def disable_metrics():
+    """This is a function to remove the active metrics registry.
+
+    Returns:
+        The previously active PowerControlMetricsRegistry class instance or
+        None.
+    """
+    global _active_metrics_registry
+    metrics_registry = _active_metrics_registry
+    if metrics_registry is not None:
+        with contextlib.suppress(ValueError):
+            api_call_observers.remove(metrics_registry.observe_api_call)
+    _active_metrics_registry = None
+    return metrics_registry
+
+
+# Establish the active run journal for the current run
+_active_run_journal = None
+
+
+# Establish class to journal the progress of a run to a local file
+class PowerControlRunJournal:
+    """This class records the resolution and submission status of each target
+    server of a run to a local JSON Lines file as the run progresses. Each
+    entry is written and flushed to disk immediately, so the journal of an
+    interrupted run can be used to resume the run with only the remaining
+    target servers.
+    """
+    completed_statuses = ("Submitted", "Skipped", "Completed")
+
+    def __init__(self,
+                 journal_file,
+                 resume=False
+                 ):
+        self.journal_file = journal_file
+        self.resume = resume
+        self.journal_entries = self.load_entries(journal_file) if resume else []
+        self._lock = threading.Lock()
+        self._journal_file_handle = open(journal_file, "a" if resume else "w", encoding="utf-8")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.journal_file}', "
+            f"{self.resume})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.journal_file}'"
+
+    @staticmethod
+    def load_entries(journal_file):
+        """This function loads the entries of an existing journal file. An
+        incomplete final entry, left by an interrupted run, is ignored.
+
+        Args:
+            journal_file (str):
+                The system file path of the journal file.
+
+        Returns:
+            A list of the journal entries.
+        """
+        journal_entries = []
+        if not os.path.isfile(journal_file):
+            return journal_entries
+        with open(journal_file, encoding="utf-8") as journal_file_handle:
+            for journal_line in journal_file_handle:
+                if not journal_line.strip():
+                    continue
+                try:
+                    journal_entries.append(json.loads(journal_line))
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring an incomplete entry in the run journal '%s'.",
+                                   journal_file
+                                   )
+        return journal_entries
+
+    @staticmethod
+    def get_target_key(power_control_target_server_id_dictionary,
+                       power_control_state
+                       ):
+        """This function returns the key identifying a power control operation
+        for a target server in the journal.
+        """
+        return (
+            str(power_control_target_server_id_dictionary.get("Server Identifier")),
+            power_control_target_server_id_dictionary.get("Server Form Factor", "Blade"),
+            power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached"),
+            "".join(str(power_control_target_server_id_dictionary.get("Power Control State", power_control_state)).lower().split())
+            )
+
+    def get_remaining_targets(self,
+                              power_control_target_server_id_dictionary_list,
+                              power_control_state
+                              ):
+        """This function removes the target servers with a power control
+        operation already submitted, skipped or completed for the provided
+        power control state in the loaded journal entries.
+
+        Args:
+            power_control_target_server_id_dictionary_list (list):
+                A list of dictionaries containing the target server data.
+            power_control_state (str):
+                The desired power state of the target UCS servers.
+
+        Returns:
+            A generator of the dictionaries containing the target server data
+            of the remaining target servers.
+        """
+        finished_target_keys = set()
+        for journal_entry in self.journal_entries:
+            if journal_entry.get("Status") in self.completed_statuses:
+                finished_target_keys.add(self.get_target_key(journal_entry, journal_entry.get("Power Control State")))
+        return (power_control_target_server_id_dictionary
+                for power_control_target_server_id_dictionary
+                in power_control_target_server_id_dictionary_list
+                if self.get_target_key(power_control_target_server_id_dictionary, power_control_state)
+                not in finished_target_keys
+                )
+
+    def record(self,
+               power_control_target_server_id_dictionary,
+               power_control_state,
+               status,
+               server_moid=None
+               ):
+        """This function writes a journal entry for a target server.
+
+        Args:
+            power_control_target_server_id_dictionary (dict):
+                A dictionary containing the target server data.
+            power_control_state (str):
+                The desired power state of the target UCS server.
+            status (str):
+                The status of the target server, such as "Resolved",
+                "Submitted", "Skipped", "Failed" or "Completed".
+            server_moid (str):
+                Optional; The MOID of the target server. The default value is
+                None.
+        """
+        journal_entry = {
+            "Server Identifier": power_control_target_server_id_dictionary.get("Server Identifier"),
+            "Server Form Factor": power_control_target_server_id_dictionary.get("Server Form Factor", "Blade"),
+            "Server Connection Type": power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached"),
+            "Power Control State": power_control_state,
+            "Status": status,
+            "Server Moid": server_moid,
+            "Timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            }
+        journal_line = json.dumps(journal_entry, default=str) + "\n"
+        with self._lock:
+            if self._journal_file_handle.closed:
+                return
+            self._journal_file_handle.write(journal_line)
+            self._journal_file_handle.flush()
+            os.fsync(self._journal_file_handle.fileno())
+            self.journal_entries.append(journal_entry)
+
+    def close(self):
+        """This function closes the journal file.
+        """
+        with self._lock:
+            self._journal_file_handle.close()
+
+
+# Establish function to start journaling the current run
+def enable_run_journal(journal_file,
+                       resume=False
+                       ):
+    """This is a function to set the active run journal. The resolution and
+    result of every power control operation is recorded by the active run
+    journal.
+
+    Args:
+        journal_file (str):
+            The system file path of the journal file.
+        resume (bool):
+            Optional; Load the entries of an existing journal file and append
+            to it, instead of starting a new journal file. The default value
+            is False.
+
+    Returns:
+        The active PowerControlRunJournal class instance.
+    """
+    global _active_run_journal
+    disable_run_journal()
+    _active_run_journal = PowerControlRunJournal(journal_file, resume=resume)
+    return _active_run_journal
+
+
+# Establish function to stop journaling the current run
+def disable_run_journal():
+    """This is a function to close and remove the active run journal.
+
+    Returns:
+        The previously active PowerControlRunJournal class instance or None.
+    """
+    global _active_run_journal
+    run_journal = _active_run_journal
+    if run_journal is not None:
+        run_journal.close()
+    _active_run_journal = None
+    return run_journal
+
+
+# Establish function to record a power control status with the active run journal
+def record_run_journal_entry(server_settings_power_state,
+                             status=None
+                             ):
+    """This is a function to record the status of a power control operation
+    with the active run journal. If no run journal is active, nothing is
+    recorded.
+
+    Args:
+        server_settings_power_state ("ServerSettingsPowerState"):
+            The ServerSettingsPowerState class instance of the power control
+            operation.
+        status (str):
+            Optional; The status of the power control operation. The default
+            value is None, which will record "Skipped", "Submitted" or "Failed"
+            based on the result of the POST.
+    """
+    run_journal = _active_run_journal
+    if run_journal is None:
+        return
+    if status is None:
+        if server_settings_power_state.post_skipped:
+            status = "Skipped"
+        elif server_settings_power_state.post_succeeded:
+            status = "Submitted"
+        else:
+            status = "Failed"
+    run_journal.record(server_settings_power_state.power_control_target_server_id_dictionary,
+                       server_settings_power_state.power_control_state,
+                       status,
+                       server_moid=(server_settings_power_state.server_moid_and_data or {}).get("Moid")
+                       )
+
+
+# Establish the active results writer for the current run
+_active_results_writer = None
+
+
+# Establish class to write the result of each power control operation to a local file
+class PowerControlResultsWriter:
+    """This class writes the result of each power control operation to a
+    local JSON Lines or CSV file as soon as the operation has finished. Each
+    record is flushed immediately, so the results can be consumed while the
+    run is still in progress.
+    """
+    result_fields = (
+        "Server Identifier",
+        "Server Moid",
+        "Server Serial",
+        "Power Control State",
+        "Result",
+        "HTTP Status",
+        "Latency Seconds",
+        "Final Oper Power State",
+        "Timestamp"
+        )
+
+    def __init__(self,
+                 output_file,
+                 output_format="Auto"
+                 ):
+        self.output_file = output_file
+        reformatted_output_format = "".join(str(output_format).lower().split())
+        if reformatted_output_format == "auto":
+            reformatted_output_format = "csv" if output_file.lower().endswith(".csv") else "jsonlines"
+        if reformatted_output_format not in ("csv", "jsonlines"):
+            logger.error("\nA configuration error has occurred!\n\n"
+                         "The value provided for the results output format "
+                         f"setting was {output_format}.\n"
+                         "The accepted values are Auto, CSV or JSON Lines.\n"
+                         "Please update the configuration, then re-attempt "
+                         "execution.\n")
+            sys.exit(0)
+        self.output_format = "CSV" if reformatted_output_format == "csv" else "JSON Lines"
+        self.result_counts = {}
+        self._lock = threading.Lock()
+        self._output_file_handle = open(output_file, "w", newline="", encoding="utf-8")
+        if self.output_format == "CSV":
+            self._csv_writer = csv.DictWriter(self._output_file_handle, fieldnames=self.result_fields)
+            self._csv_writer.writeheader()
+            self._output_file_handle.flush()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.output_file}', "
+            f"'{self.output_format}')"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.output_file}'"
+
+    @staticmethod
+    def build_result(server_settings_power_state):
+        """This function builds the result record of a power control
+        operation.
+
+        Args:
+            server_settings_power_state ("ServerSettingsPowerState"):
+                The ServerSettingsPowerState class instance of the power
+                control operation.
+
+        Returns:
+            A dictionary with the result of the power control operation.
+        """
+        server_moid = (server_settings_power_state.server_moid_and_data or {}).get("Moid")
+        intersight_server = {}
+        if server_moid and server_settings_power_state.server_inventory is not None:
+            intersight_server = server_settings_power_state.server_inventory.get_server(server_moid) or {}
+        completion_status = server_settings_power_state.completion_status or {}
+        if server_settings_power_state.post_skipped:
+            power_control_result = "Skipped"
+            final_oper_power_state = intersight_server.get("OperPowerState")
+        elif not server_settings_power_state.post_succeeded:
+            power_control_result = "Failed"
+            final_oper_power_state = None
+        elif completion_status:
+            if completion_status.get("Completed"):
+                power_control_result = "Completed"
+            elif completion_status.get("Failed"):
+                power_control_result = "Failed"
+            else:
+                power_control_result = "Timed Out"
+            final_oper_power_state = completion_status.get("Oper Power State")
+        else:
+            power_control_result = "Submitted"
+            final_oper_power_state = None
+        return {
+            "Server Identifier": server_settings_power_state.power_control_target_server_id_dictionary.get("Server Identifier"),
+            "Server Moid": server_moid,
+            "Server Serial": intersight_server.get("Serial"),
+            "Power Control State": server_settings_power_state.power_control_state,
+            "Result": power_control_result,
+            "HTTP Status": server_settings_power_state.post_http_status,
+            "Latency Seconds": (round(server_settings_power_state.post_latency_seconds, 6)
+                                if server_settings_power_state.post_latency_seconds is not None
+                                else None),
+            "Final Oper Power State": final_oper_power_state,
+            "Timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            }
+
+    def write(self,
+              server_settings_power_state
+              ):
+        """This function writes the result record of a power control
+        operation to the results output file.
+
+        Args:
+            server_settings_power_state ("ServerSettingsPowerState"):
+                The ServerSettingsPowerState class instance of the power
+                control operation.
+        """
+        self.write_result(self.build_result(server_settings_power_state))
+
+    def write_result(self,
+                     power_control_result
+                     ):
+        """This function writes a result record built by the build_result
+        function, such as a result reported by a distributed worker, to the
+        results output file.
+
+        Args:
+            power_control_result (dict):
+                The result record of the power control operation.
+        """
+        with self._lock:
+            if self._output_file_handle.closed:
+                return
+            if self.output_format == "CSV":
+                self._csv_writer.writerow(power_control_result)
+            else:
+                self._output_file_handle.write(json.dumps(power_control_result, default=str) + "\n")
+            self._output_file_handle.flush()
+            self.result_counts[power_control_result["Result"]] = self.result_counts.get(power_control_result["Result"], 0) + 1
+
+    def close(self):
+        """This function closes the results output file.
+        """
+        with self._lock:
+            self._output_file_handle.close()
+
+
+# Establish function to start writing the power control results of the current run
+def enable_results_output(output_file,
+                          output_format="Auto"
+                          ):
+    """This is a function to set the active results writer. The result of
+    every power control operation is written by the active results writer.
+
+    Args:
+        output_file (str):
+            The system file path of the results output file.
+        output_format (str):
+            Optional; The format of the results output file. The options are
+            "Auto", "CSV" or "JSON Lines". The default value of "Auto" uses
+            "CSV" for ".csv" files and "JSON Lines" otherwise.
+
+    Returns:
+        The active PowerControlResultsWriter class instance.
+    """
+    global _active_results_writer
+    disable_results_output()
+    _active_results_writer = PowerControlResultsWriter(output_file, output_format)
+    return _active_results_writer
+
+
+# Establish function to stop writing the power control results of the current run
+def disable_results_output():
+    """This is a function to close and remove the active results writer.
+
+    Returns:
+        The previously active PowerControlResultsWriter class instance or
+        None.
+    """
+    global _active_results_writer
+    results_writer = _active_results_writer
+    if results_writer is not None:
+        results_writer.close()
+    _active_results_writer = None
+    return results_writer
+
+
+# Establish function to record the result of a power control operation with the active results writer
+def record_power_control_result(server_settings_power_state):
+    """This is a function to write the result of a power control operation
+    with the active results writer. If no results writer is active, nothing
+    is written.
+
+    Args:
+        server_settings_power_state ("ServerSettingsPowerState"):
+            The ServerSettingsPowerState class instance of the power control
+            operation.
+    """
+    results_writer = _active_results_writer
+    if results_writer is None:
+        return
+    results_writer.write(server_settings_power_state)
+
+
+# Establish function to record a power control operation with the active metrics registry
+@contextlib.contextmanager
+def record_power_control_operation(server_settings_power_state):
+    """This is a function to record the in-progress count, end-to-end latency
+    and result of a power control operation with the active metrics registry.
+    If no metrics registry is active, nothing is recorded.
+
+    Args:
+        server_settings_power_state ("ServerSettingsPowerState"):
+            The ServerSettingsPowerState class instance of the power control
+            operation.
+
+    Yields:
+        None.
+    """
+    metrics_registry = _active_metrics_registry
+    if metrics_registry is None:
+        yield
+        return
+    power_control_state = server_settings_power_state.power_control_state
+    metrics_registry.power_control_operations_in_progress.inc(power_control_state=power_control_state)
+    operation_start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics_registry.power_control_operations_in_progress.dec(power_control_state=power_control_state)
+        metrics_registry.power_control_operation_duration_seconds.observe(
+            time.perf_counter() - operation_start_time,
+            power_control_state=power_control_state
+            )
+        metrics_registry.power_control_operations_total.inc(
+            power_control_state=power_control_state,
+            result=("skipped" if server_settings_power_state.post_skipped
+                    else "succeeded" if server_settings_power_state.post_succeeded
+                    else "failed")
+            )
+
+
+# Establish Intersight SDK ApiClient subclass that keeps the last response of each thread
+class ThreadSafeApiClient(intersight.ApiClient):
+    """This class is an Intersight SDK ApiClient that stores the
+    last_response attribute per thread. The functions of this module read the
+    response of each call from last_response, so keeping it per thread allows
+    a single client and its connection pool to be shared by concurrent power
+    control workers.
+    """
+    def _thread_local_responses(self):
+        thread_local_responses = self.__dict__.get("_thread_local_responses_storage")
+        if thread_local_responses is None:
+            thread_local_responses = self.__dict__.setdefault("_thread_local_responses_storage",
+                                                              threading.local()
+                                                              )
+        return thread_local_responses
+
+    @property
+    def last_response(self):
+        return getattr(self._thread_local_responses(), "last_response", None)
+
+    @last_response.setter
+    def last_response(self, api_response):
+        self._thread_local_responses().last_response = api_response
+
+
+# Establish class for the responses of the HTTP/2 Intersight API transport
+class Http2RestResponse:
+    """This class provides the attributes and methods of an Intersight SDK
+    RESTResponse for a response received by the Http2RestClient class.
+    """
+    def __init__(self,
+                 httpx_response
+                 ):
+        self.httpx_response = httpx_response
+        self.urllib3_response = None
+        self.status = httpx_response.status_code
+        self.reason = httpx_response.reason_phrase
+        self.data = httpx_response.content
+        self.http_version = httpx_response.http_version
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.httpx_response!r})"
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with HTTP status {self.status}"
+
+    def getheaders(self):
+        return self.httpx_response.headers
+
+    def getheader(self,
+                  name,
+                  default=None
+                  ):
+        return self.httpx_response.headers.get(name, default)
+
+
+# Establish class for an HTTP/2 transport of the Intersight API client
+class Http2RestClient:
+    """This class is a replacement for the urllib3 REST client of an
+    Intersight SDK ApiClient that sends requests with httpx over HTTP/2, so
+    concurrent requests are multiplexed over a few connections instead of
+    opening one connection per concurrent request. The HTTP signature headers
+    are added by the ApiClient before each request reaches the REST client,
+    and request bodies are serialized the same way as the SDK, so the
+    signatures remain valid. Responses with an HTTP status outside of the 2xx
+    range raise an intersight.ApiException, as with the SDK REST client.
+    """
+    def __init__(self,
+                 configuration,
+                 max_connections=10,
+                 http2=True
+                 ):
+        if httpx is None:
+            raise ImportError("The httpx package with HTTP/2 support is required for the "
+                              "HTTP/2 Intersight API transport. It can be installed by "
+                              "running 'pip install httpx[http2]'.")
+        self.configuration = configuration
+        self.max_connections = max_connections
+        self.http2 = http2
+        if configuration.verify_ssl:
+            certificate_verification = getattr(configuration, "ssl_ca_cert", None) or True
+        else:
+            certificate_verification = False
+        self._httpx_client = httpx.Client(http2=http2,
+                                          verify=certificate_verification,
+                                          proxy=getattr(configuration, "proxy", None),
+                                          limits=httpx.Limits(max_connections=max_connections,
+                                                              max_keepalive_connections=max_connections
+                                                              ),
+                                          timeout=None
+                                          )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.configuration}, "
+            f"{self.max_connections}, "
+            f"{self.http2})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.configuration.host}'"
+
+    def request(self,
+                method,
+                url,
+                query_params=None,
+                headers=None,
+                body=None,
+                post_params=None,
+                _preload_content=True,
+                _request_timeout=None
+                ):
+        """This function sends a request with the same arguments as the request
+        method of the Intersight SDK REST client.
+
+        Returns:
+            An Http2RestResponse class instance.
+
+        Raises:
+            ApiException:
+                The response had an HTTP status outside of the 2xx range, or
+                the request could not be sent.
+        """
+        headers = dict(headers or {})
+        request_content = None
+        request_form_data = None
+        if method in ("POST", "PUT", "PATCH", "OPTIONS", "DELETE"):
+            content_type = headers.setdefault("Content-Type", "application/json")
+            if re.search("json", content_type, re.IGNORECASE):
+                if body is not None:
+                    request_content = json.dumps(body)
+            elif content_type == "application/x-www-form-urlencoded":
+                request_form_data = post_params
+            elif isinstance(body, (str, bytes)):
+                request_content = body
+            elif body is not None:
+                raise intersight.ApiException(status=0,
+                                              reason="Cannot prepare a request message for the provided "
+                                                     "arguments. Please check that your arguments match "
+                                                     "declared content type."
+                                              )
+        if isinstance(_request_timeout, (int, float)):
+            request_timeout = httpx.Timeout(_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            request_timeout = httpx.Timeout(_request_timeout[1], connect=_request_timeout[0])
+        else:
+            request_timeout = None
+        try:
+            httpx_response = self._httpx_client.request(method,
+                                                        url,
+                                                        params=query_params or None,
+                                                        headers=headers,
+                                                        content=request_content,
+                                                        data=request_form_data,
+                                                        timeout=request_timeout
+                                                        )
+        except httpx.HTTPError as transport_error:
+            raise intersight.ApiException(status=0,
+                                          reason=f"{type(transport_error).__name__}: {transport_error}"
+                                          ) from transport_error
+        rest_response = Http2RestResponse(httpx_response)
+        if not 200 <= rest_response.status <= 299:
+            raise intersight.ApiException(http_resp=rest_response)
+        return rest_response
+
+    def GET(self, url, headers=None, query_params=None, _preload_content=True, _request_timeout=None):
+        return self.request("GET", url, headers=headers, query_params=query_params,
+                            _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def HEAD(self, url, headers=None, query_params=None, _preload_content=True, _request_timeout=None):
+        return self.request("HEAD", url, headers=headers, query_params=query_params,
+                            _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def OPTIONS(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True, _request_timeout=None):
+        return self.request("OPTIONS", url, headers=headers, query_params=query_params, post_params=post_params,
+                            body=body, _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def DELETE(self, url, headers=None, query_params=None, body=None, _preload_content=True, _request_timeout=None):
+        return self.request("DELETE", url, headers=headers, query_params=query_params, body=body,
+                            _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def POST(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True, _request_timeout=None):
+        return self.request("POST", url, headers=headers, query_params=query_params, post_params=post_params,
+                            body=body, _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def PUT(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True, _request_timeout=None):
+        return self.request("PUT", url, headers=headers, query_params=query_params, post_params=post_params,
+                            body=body, _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def PATCH(self, url, headers=None, query_params=None, post_params=None, body=None, _preload_content=True, _request_timeout=None):
+        return self.request("PATCH", url, headers=headers, query_params=query_params, post_params=post_params,
+                            body=body, _preload_content=_preload_content, _request_timeout=_request_timeout)
+
+    def close(self):
+        """This function closes the connections of the transport.
+        """
+        self._httpx_client.close()
+
+
+# Establish function to create the REST client factory of an Intersight API transport
+def get_rest_client_factory(http_transport="urllib3",
+                            max_connections=10
+                            ):
+    """This is a function to determine the REST client factory used by the
+    get_api_client function for an Intersight API transport.
+
+    Args:
+        http_transport (str):
+            Optional; The Intersight API transport. The options are "urllib3"
+            for the HTTP/1.1 transport of the SDK, or "HTTP/2". The default
+            value is "urllib3".
+        max_connections (int):
+            Optional; The maximum number of connections of the HTTP/2
+            transport. The default value is 10.
+
+    Returns:
+        A function that creates a REST client from an Intersight SDK
+        Configuration class instance, or None for the SDK transport.
+    """
+    reformatted_http_transport = "".join(str(http_transport).lower().split())
+    if reformatted_http_transport == "urllib3":
+        return None
+    if reformatted_http_transport in ("http/2", "http2", "h2"):
+        if httpx is None:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         "The HTTP/2 Intersight API transport requires the httpx "
+                         "package with HTTP/2 support.\n"
+                         "It can be installed by running 'pip install httpx[http2]'.\n"
+                         "Please install the package or update the configuration, "
+                         "then re-attempt execution.\n")
+            sys.exit(0)
+        return lambda configuration: Http2RestClient(configuration, max_connections=max_connections)
+    logger.error("\nA configuration error has occurred!\n\n"
+                 "The value provided for the Intersight API transport setting "
+                 f"was {http_transport}.\n"
+                 "The accepted values are urllib3 or HTTP/2.\n"
+                 "Please update the configuration, then re-attempt "
+                 "execution.\n")
+    sys.exit(0)
+
+
+# Establish class for the responses served by the Intersight API cassette transports
+class CassetteRestResponse:
+    """This class provides the attributes and methods of an Intersight SDK
+    RESTResponse for a response recorded in or replayed from an Intersight
+    API cassette.
+    """
+    def __init__(self,
+                 status,
+                 reason,
+                 data,
+                 headers=None
+                 ):
+        self.urllib3_response = None
+        self.status = status
+        self.reason = reason
+        self.data = data
+        self.headers = dict(headers or {})
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.status}, "
+            f"'{self.reason}', "
+            f"{len(self.data)} bytes)"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with HTTP status {self.status}"
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self,
+                  name,
+                  default=None
+                  ):
+        for header_name, header_value in self.headers.items():
+            if header_name.lower() == name.lower():
+                return header_value
+        return default
+
+
+# Establish class for a cassette file of recorded Intersight API exchanges
+class ApiCassette:
+    """This class records Intersight API request and response pairs to a
+    local JSON Lines cassette file, or loads them from an existing cassette
+    file to be replayed. Only the method, path, query parameters and body of
+    each request are recorded, along with the status, sanitized headers, body
+    and latency of the response. Authentication headers and cookies are never
+    recorded.
+
+    Requests with the same method, path, query parameters and body are
+    replayed in the order they were recorded, with the last recorded response
+    repeated once the others have been replayed.
+    """
+    cassette_modes = ("Record", "Replay")
+    sanitized_header_names = ("authorization", "cookie", "set-cookie", "signature", "digest", "date", "host")
+
+    def __init__(self,
+                 cassette_file,
+                 cassette_mode="Record"
+                 ):
+        if cassette_mode not in self.cassette_modes:
+            raise ValueError(f"The cassette mode must be one of {', '.join(self.cassette_modes)}.")
+        self.cassette_file = cassette_file
+        self.cassette_mode = cassette_mode
+        self.exchange_count = 0
+        self._lock = threading.Lock()
+        self._recorded_exchanges = collections.defaultdict(list)
+        self._replay_positions = collections.Counter()
+        if cassette_mode == "Record":
+            self._cassette_file_handle = open(cassette_file, "w", encoding="utf-8")
+        else:
+            self._cassette_file_handle = None
+            with open(cassette_file, encoding="utf-8") as cassette_file_handle:
+                for cassette_line in cassette_file_handle:
+                    if not cassette_line.strip():
+                        continue
+                    try:
+                        recorded_exchange = json.loads(cassette_line)
+                    except json.JSONDecodeError:
+                        logger.warning("Ignoring an incomplete entry in the API cassette '%s'.",
+                                       cassette_file
+                                       )
+                        continue
+                    self._recorded_exchanges[self.get_request_key(recorded_exchange["Method"],
+                                                                  recorded_exchange["Path"],
+                                                                  recorded_exchange["Query"],
+                                                                  recorded_exchange["Request Body"]
+                                                                  )].append(recorded_exchange)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.cassette_file}', "
+            f"'{self.cassette_mode}')"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.cassette_file}'"
+
+    @staticmethod
+    def get_request_key(method,
+                        path,
+                        query,
+                        request_body
+                        ):
+        """This function determines the key used to match a request to its
+        recorded exchanges.
+
+        Args:
+            method (str):
+                The HTTP method of the request.
+            path (str):
+                The URL path of the request.
+            query (str):
+                The URL encoded query parameters of the request.
+            request_body (object):
+                The deserialized body of the request or None.
+
+        Returns:
+            A tuple of the method, path, query parameters and body of the
+            request.
+        """
+        return (method.upper(), path, query, json.dumps(request_body, sort_keys=True, default=str))
+
+    @staticmethod
+    def split_request_url(url,
+                          query_params=None
+                          ):
+        """This function splits a request URL into the URL path and the URL
+        encoded query parameters recorded in the cassette.
+
+        Args:
+            url (str):
+                The URL of the request.
+            query_params (list):
+                Optional; The query parameters of the request provided
+                separately from the URL. The default value is None.
+
+        Returns:
+            A tuple of the URL path and URL encoded query parameters.
+        """
+        split_url = urllib.parse.urlsplit(url)
+        query = "&".join(query_part
+                         for query_part in (split_url.query, urllib.parse.urlencode(query_params or []))
+                         if query_part
+                         )
+        return split_url.path, query
+
+    @classmethod
+    def sanitize_headers(cls,
+                         headers
+                         ):
+        """This function removes the authentication, cookie and session
+        headers from a set of HTTP headers.
+
+        Args:
+            headers (dict):
+                The HTTP headers.
+
+        Returns:
+            A dictionary of the remaining HTTP headers.
+        """
+        return {str(header_name): str(header_value)
+                for header_name, header_value in dict(headers or {}).items()
+                if str(header_name).lower() not in cls.sanitized_header_names
+                and "token" not in str(header_name).lower()
+                }
+
+    def record_exchange(self,
+                        method,
+                        url,
+                        query_params,
+                        request_body,
+                        status,
+                        reason,
+                        response_headers,
+                        response_data,
+                        latency
+                        ):
+        """This function records a request and its response to the cassette
+        file.
+
+        Args:
+            method (str):
+                The HTTP method of the request.
+            url (str):
+                The URL of the request.
+            query_params (list):
+                The query parameters of the request provided separately from
+                the URL.
+            request_body (object):
+                The deserialized body of the request or None.
+            status (int):
+                The HTTP status of the response.
+            reason (str):
+                The HTTP reason phrase of the response.
+            response_headers (dict):
+                The HTTP headers of the response.
+            response_data (bytes):
+                The body of the response.
+            latency (float):
+                The time in seconds taken to receive the response.
+        """
+        path, query = self.split_request_url(url, query_params)
+        if isinstance(response_data, bytes):
+            response_data = response_data.decode("utf-8", errors="replace")
+        recorded_exchange = {
+            "Method": method.upper(),
+            "Path": path,
+            "Query": query,
+            "Request Body": request_body,
+            "Status": status,
+            "Reason": reason,
+            "Response Headers": self.sanitize_headers(response_headers),
+            "Response Body": response_data or "",
+            "Latency": round(latency, 6)
+            }
+        cassette_line = json.dumps(recorded_exchange, default=str) + "\n"
+        with self._lock:
+            if self._cassette_file_handle is None or self._cassette_file_handle.closed:
+                return
+            self._cassette_file_handle.write(cassette_line)
+            self._cassette_file_handle.flush()
+            self.exchange_count += 1
+
+    def find_exchange(self,
+                      method,
+                      url,
+                      query_params,
+                      request_body
+                      ):
+        """This function finds the next recorded exchange for a request.
+
+        Args:
+            method (str):
+                The HTTP method of the request.
+            url (str):
+                The URL of the request.
+            query_params (list):
+                The query parameters of the request provided separately from
+                the URL.
+            request_body (object):
+                The deserialized body of the request or None.
+
+        Returns:
+            A dictionary of the recorded exchange or None if the request was
+            not recorded.
+        """
+        path, query = self.split_request_url(url, query_params)
+        request_key = self.get_request_key(method, path, query, request_body)
+        with self._lock:
+            recorded_exchanges = self._recorded_exchanges.get(request_key)
+            if not recorded_exchanges:
+                return None
+            replay_position = min(self._replay_positions[request_key], len(recorded_exchanges) - 1)
+            self._replay_positions[request_key] += 1
+            self.exchange_count += 1
+            return recorded_exchanges[replay_position]
+
+    def close(self):
+        """This function closes the cassette file of a recording.
+        """
+        with self._lock:
+            if self._cassette_file_handle is not None:
+                self._cassette_file_handle.close()
+
+
+# Establish class for a transport that records Intersight API exchanges to a cassette
+class CassetteRecordingRestClient:
+    """This class wraps the REST client of an Intersight SDK ApiClient and
+    records each request and its response, including error responses, to an
+    ApiCassette class instance.
+    """
+    def __init__(self,
+                 rest_client,
+                 api_cassette
+                 ):
+        self.rest_client = rest_client
+        self.api_cassette = api_cassette
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.rest_client!r}, "
+            f"{self.api_cassette!r})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.api_cassette.cassette_file}'"
+
+    def request(self,
+                method,
+                url,
+                query_params=None,
+                headers=None,
+                body=None,
+                post_params=None,
+                _preload_content=True,
+                _request_timeout=None
+                ):
+        """This function sends a request with the wrapped REST client and
+        records it with its response.
+
+        Returns:
+            The response of the wrapped REST client.
+
+        Raises:
+            ApiException:
+                The wrapped REST client raised an exception, which is recorded
+                if it has an HTTP status.
+        """
+        request_start_time = time.perf_counter()
+        try:
+            rest_response = self.rest_client.request(method,
+                                                     url,
+                                                     query_params=query_params,
+                                                     headers=headers,
+                                                     body=body,
+                                                     post_params=post_params,
+                                                     _preload_content=_preload_content,
+                                                     _request_timeout=_request_timeout
+                                                     )
+        except intersight.ApiException as exception:
+            if exception.status:
+                self.api_cassette.record_exchange(method, url, query_params, body,
+                                                  exception.status, exception.reason,
+                                                  exception.headers, exception.body,
+                                                  time.perf_counter() - request_start_time
+                                                  )
+            raise
+        self.api_cassette.record_exchange(method, url, query_params, body,
+                                          rest_response.status, rest_response.reason,
+                                          rest_response.getheaders(), rest_response.data,
+                                          time.perf_counter() - request_start_time
+                                          )
+        return rest_response
+
+    def __getattr__(self, name):
+        if name in ("GET", "HEAD", "OPTIONS", "DELETE", "POST", "PUT", "PATCH"):
+            return lambda url, **request_settings: self.request(name, url, **request_settings)
+        return getattr(self.rest_client, name)
+
+
+# Establish class for a transport that replays Intersight API exchanges from a cassette
+class CassetteReplayRestClient:
+    """This class is a replacement for the REST client of an Intersight SDK
+    ApiClient that answers each request with its recorded exchange from an
+    ApiCassette class instance, without contacting Intersight. Each response
+    is delayed by its recorded latency multiplied by the latency scale, so
+    offline runs keep the timing of the recorded run.
+    """
+    def __init__(self,
+                 api_cassette,
+                 latency_scale=1.0
+                 ):
+        self.api_cassette = api_cassette
+        self.latency_scale = latency_scale
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_cassette!r}, "
+            f"{self.latency_scale})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.api_cassette.cassette_file}'"
+
+    def request(self,
+                method,
+                url,
+                query_params=None,
+                headers=None,
+                body=None,
+                post_params=None,
+                _preload_content=True,
+                _request_timeout=None
+                ):
+        """This function answers a request with its recorded exchange.
+
+        Returns:
+            A CassetteRestResponse class instance.
+
+        Raises:
+            ApiException:
+                The recorded response had an HTTP status outside of the 2xx
+                range, or the request was not recorded.
+        """
+        recorded_exchange = self.api_cassette.find_exchange(method, url, query_params, body)
+        if recorded_exchange is None:
+            path, query = ApiCassette.split_request_url(url, query_params)
+            raise intersight.ApiException(status=0,
+                                          reason=f"No recorded response was found in the cassette "
+                                                 f"'{self.api_cassette.cassette_file}' for the request "
+                                                 f"{method} {path}{'?' + query if query else ''}."
+                                          )
+        if self.latency_scale > 0:
+            time.sleep(recorded_exchange["Latency"] * self.latency_scale)
+        rest_response = CassetteRestResponse(recorded_exchange["Status"],
+                                             recorded_exchange["Reason"],
+                                             recorded_exchange["Response Body"].encode("utf-8"),
+                                             recorded_exchange["Response Headers"]
+                                             )
+        if not 200 <= rest_response.status <= 299:
+            raise intersight.ApiException(http_resp=rest_response)
+        return rest_response
+
+    def __getattr__(self, name):
+        if name in ("GET", "HEAD", "OPTIONS", "DELETE", "POST", "PUT", "PATCH"):
+            return lambda url, **request_settings: self.request(name, url, **request_settings)
+        raise AttributeError(name)
+
+
+# Establish function to open the Intersight API cassette of the current run
+def open_api_cassette(cassette_file,
+                      cassette_mode
+                      ):
+    """This is a function to open an Intersight API cassette file for
+    recording or replay.
+
+    Args:
+        cassette_file (str):
+            The system file path of the cassette file.
+        cassette_mode (str):
+            The cassette mode. The options are "Record" or "Replay".
+
+    Returns:
+        An ApiCassette class instance.
+    """
+    reformatted_cassette_mode = str(cassette_mode).strip().title()
+    if reformatted_cassette_mode not in ApiCassette.cassette_modes:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "The value provided for the API cassette mode setting "
+                     f"was {cassette_mode}.\n"
+                     "The accepted values are Record or Replay.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n")
+        sys.exit(0)
+    if not cassette_file:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "No API cassette file was provided for the API cassette "
+                     f"mode of {reformatted_cassette_mode}.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n")
+        sys.exit(0)
+    if reformatted_cassette_mode == "Replay" and not os.path.isfile(cassette_file):
+        logger.error("\nA configuration error has occurred!\n\n"
+                     f"The API cassette file '{cassette_file}' could not be "
+                     "found for replay.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n")
+        sys.exit(0)
+    return ApiCassette(cassette_file, reformatted_cassette_mode)
+
+
+# Establish function to create the REST client factory of an Intersight API cassette
+def get_cassette_rest_client_factory(api_cassette,
+                                     rest_client_factory=None,
+                                     replay_latency_scale=1.0
+                                     ):
+    """This is a function to determine the REST client factory used by the
+    get_api_client function to record to or replay from an Intersight API
+    cassette.
+
+    Args:
+        api_cassette (ApiCassette):
+            The ApiCassette class instance.
+        rest_client_factory (function):
+            Optional; The REST client factory of the transport used to send
+            recorded requests. The default value is None, which uses the REST
+            client of the SDK.
+        replay_latency_scale (float):
+            Optional; The multiplier applied to the recorded latency of each
+            replayed response. A value of 0 replays the responses without
+            delay. The default value is 1.0.
+
+    Returns:
+        A function that creates a REST client from an Intersight SDK
+        Configuration class instance.
+    """
+    if api_cassette.cassette_mode == "Replay":
+        return lambda configuration: CassetteReplayRestClient(api_cassette,
+                                                              latency_scale=replay_latency_scale
+                                                              )
+
+    def create_recording_rest_client(configuration):
+        if rest_client_factory is None:
+            recorded_rest_client = intersight.rest.RESTClientObject(configuration)
+        else:
+            recorded_rest_client = rest_client_factory(configuration)
+        return CassetteRecordingRestClient(recorded_rest_client, api_cassette)
+
+    return create_recording_rest_client
+
+
+# Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
+## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
+def get_api_client(api_key_id,
+                   api_secret_file,
+                   endpoint="https://intersight.com",
+                   url_certificate_verification=True,
+                   connection_pool_maxsize=None,
+                   rest_client_factory=None
+                   ):
+    try:
+        with open(api_secret_file, 'r') as f:
+            api_key = f.read()
+        
+        if re.search('BEGIN RSA PRIVATE KEY', api_key):
+            # API Key v2 format
+            signing_algorithm = intersight.signing.ALGORITHM_RSASSA_PKCS1v15
+            signing_scheme = intersight.signing.SCHEME_RSA_SHA256
+            hash_algorithm = intersight.signing.HASH_SHA256
+
+        elif re.search('BEGIN EC PRIVATE KEY', api_key):
+            # API Key v3 format
+            signing_algorithm = intersight.signing.ALGORITHM_ECDSA_MODE_DETERMINISTIC_RFC6979
+            signing_scheme = intersight.signing.SCHEME_HS2019
+            hash_algorithm = intersight.signing.HASH_SHA256
+
+        configuration = intersight.Configuration(
+            host=endpoint,
+            signing_info=intersight.signing.HttpSigningConfiguration(
+                key_id=api_key_id,
+                private_key_path=api_secret_file,
+                signing_scheme=signing_scheme,
+                signing_algorithm=signing_algorithm,
+                hash_algorithm=hash_algorithm,
+                signed_headers=[
+                    intersight.signing.HEADER_REQUEST_TARGET,
+                    intersight.signing.HEADER_HOST,
+                    intersight.signing.HEADER_DATE,
+                    intersight.signing.HEADER_DIGEST,
+                    ]
+                )
+            )
+
+        if not url_certificate_verification:
+            configuration.verify_ssl = False
+        if connection_pool_maxsize:
+            configuration.connection_pool_maxsize = connection_pool_maxsize
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "Unable to access the Intersight API Key.\n"
+                     "Exiting due to the Intersight API Key being unavailable.\n\n"
+                     "Please verify that the correct API Key ID and API Key have "
+                     "been entered, then re-attempt execution.\n\n"
+                     "Exception Message: ",
+                     exc_info=True
+                     )
+        sys.exit(0)
+        
+    api_client = ThreadSafeApiClient(configuration)
+    if rest_client_factory is not None:
+        api_client.rest_client = rest_client_factory(configuration)
+    return instrument_api_client(api_client)
+
+
+# Establish the process-wide registry of shared Intersight API clients
+_api_client_registry = {}
+_api_client_registry_lock = threading.Lock()
+
+
+# Establish function to retrieve a shared Intersight API client from the process-wide registry
+def get_shared_api_client(api_key_id,
+                          api_secret_file,
+                          endpoint="https://intersight.com",
+                          url_certificate_verification=True,
+                          connection_pool_maxsize=None,
+                          rest_client_factory=None
+                          ):
+    """This is a function to retrieve a shared Intersight API client. A client
+    is created by the get_api_client function on the first request for an API
+    key ID, API key file, endpoint and certificate verification setting, and
+    the same client is returned for every later request with those settings.
+    The client keeps its last response per thread, so it can be shared by
+    concurrent callers and its connection pool is reused.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The Intersight API endpoint. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; A setting to determine whether the certificate of the
+            Intersight API endpoint is verified. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept by the connection
+            pool of a newly created client. The setting of an existing shared
+            client is not changed. The default value is None.
+        rest_client_factory (function):
+            Optional; A function that creates the REST client of a newly
+            created client from its Configuration class instance, such as the
+            function provided by the get_rest_client_factory function. Clients
+            with different factories are not shared. The default value is
+            None, which uses the REST client of the SDK.
+
+    Returns:
+        The shared ApiClient class instance.
+    """
+    api_client_key = (api_key_id,
+                      os.path.abspath(api_secret_file) if api_secret_file else api_secret_file,
+                      endpoint.rstrip("/") if endpoint else endpoint,
+                      bool(url_certificate_verification),
+                      rest_client_factory
+                      )
+    with _api_client_registry_lock:
+        api_client = _api_client_registry.get(api_client_key)
+        if api_client is None:
+            api_client = get_api_client(api_key_id=api_key_id,
+                                        api_secret_file=api_secret_file,
+                                        endpoint=endpoint,
+                                        url_certificate_verification=url_certificate_verification,
+                                        connection_pool_maxsize=connection_pool_maxsize,
+                                        rest_client_factory=rest_client_factory
+                                        )
+            _api_client_registry[api_client_key] = api_client
+    return api_client
+
+
+# Establish function to clear the process-wide registry of shared Intersight API clients
+def clear_shared_api_clients():
+    """This is a function to remove every shared Intersight API client from
+    the process-wide registry, such as after an API key has been rotated.
+    Clients already handed out remain usable.
+    """
+    with _api_client_registry_lock:
+        _api_client_registry.clear()
+
+
+# Establish class to spread Intersight API requests across a pool of API keys
+class PooledApiClient:
+    """This class spreads Intersight API requests across the ApiClient class
+    instances of a pool of API keys for the same Intersight account, since
+    rate limits apply per API key. Each request is sent with the available
+    API key with the fewest in-flight and recent requests. An API key is
+    paused when it is throttled (HTTP status 429), honoring the Retry-After
+    header, and the request is sent again with another API key. An API key
+    rejected as unauthorized or forbidden (HTTP status 401 or 403), such as
+    after it has been revoked, is paused for revoked_key_duration seconds and
+    the request is sent again with another API key. The class provides the
+    call_api method and the per-thread last_response attribute used by the
+    functions of this module, so it can be provided wherever an ApiClient is
+    accepted.
+    """
+    def __init__(self,
+                 api_clients,
+                 max_requests_per_second_per_key=None,
+                 throttle_duration=5,
+                 revoked_key_duration=300,
+                 max_throttled_attempts=10
+                 ):
+        self.api_key_states = [
+            {
+                "Key ID": api_key_id,
+                "Client": api_client,
+                "In Flight": 0,
+                "Request Times": collections.deque(),
+                "Request Count": 0,
+                "Throttled Count": 0,
+                "Rejected Count": 0,
+                "Unavailable Until": 0.0,
+                "Unavailable Reason": None
+                }
+            for api_key_id, api_client in api_clients.items()
+            ]
+        if not self.api_key_states:
+            raise ValueError("The API key pool does not contain any API keys.")
+        self.max_requests_per_second_per_key = max_requests_per_second_per_key
+        self.throttle_duration = throttle_duration
+        self.revoked_key_duration = revoked_key_duration
+        self.max_throttled_attempts = max_throttled_attempts
+        self._key_state_condition = threading.Condition()
+        self._thread_local_responses = threading.local()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({[api_key_state['Key ID'] for api_key_state in self.api_key_states]}, "
+            f"{self.max_requests_per_second_per_key}, "
+            f"{self.throttle_duration}, "
+            f"{self.revoked_key_duration})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {len(self.api_key_states)} API keys"
+
+    @property
+    def last_response(self):
+        return getattr(self._thread_local_responses, "last_response", None)
+
+    @last_response.setter
+    def last_response(self, api_response):
+        self._thread_local_responses.last_response = api_response
+
+    @property
+    def configuration(self):
+        return self.api_key_states[0]["Client"].configuration
+
+    def _acquire_api_key(self,
+                         excluded_api_key_ids
+                         ):
+        with self._key_state_condition:
+            while True:
+                current_time = time.monotonic()
+                candidate_api_key_states = [api_key_state
+                                            for api_key_state in self.api_key_states
+                                            if api_key_state["Key ID"] not in excluded_api_key_ids
+                                            ]
+                if not candidate_api_key_states or all(api_key_state["Unavailable Reason"] == "Rejected"
+                                                       and api_key_state["Unavailable Until"] > current_time
+                                                       for api_key_state in candidate_api_key_states
+                                                       ):
+                    return None
+                available_api_key_states = []
+                next_available_time = None
+                for api_key_state in candidate_api_key_states:
+                    request_times = api_key_state["Request Times"]
+                    while request_times and request_times[0] <= current_time - 60:
+                        request_times.popleft()
+                    api_key_available_time = api_key_state["Unavailable Until"]
+                    if self.max_requests_per_second_per_key:
+                        recent_request_times = [request_time for request_time in request_times
+                                                if request_time > current_time - 1
+                                                ]
+                        if len(recent_request_times) >= self.max_requests_per_second_per_key:
+                            api_key_available_time = max(api_key_available_time, recent_request_times[0] + 1)
+                    if api_key_available_time <= current_time:
+                        available_api_key_states.append(api_key_state)
+                    elif next_available_time is None or api_key_available_time < next_available_time:
+                        next_available_time = api_key_available_time
+                if available_api_key_states:
+                    selected_api_key_state = min(available_api_key_states,
+                                                 key=lambda api_key_state: (api_key_state["In Flight"],
+                                                                            len(api_key_state["Request Times"]))
+                                                 )
+                    selected_api_key_state["In Flight"] += 1
+                    selected_api_key_state["Request Count"] += 1
+                    selected_api_key_state["Request Times"].append(current_time)
+                    selected_api_key_state["Unavailable Reason"] = None
+                    return selected_api_key_state
+                self._key_state_condition.wait(max(next_available_time - current_time, 0.01))
+
+    def _release_api_key(self,
+                         api_key_state,
+                         api_exception=None
+                         ):
+        with self._key_state_condition:
+            api_key_state["In Flight"] -= 1
+            api_exception_status = getattr(api_exception, "status", None)
+            if api_exception_status == 429:
+                api_key_state["Throttled Count"] += 1
+                retry_after = (getattr(api_exception, "headers", None) or {}).get("Retry-After")
+                try:
+                    throttle_duration = float(retry_after)
+                except (TypeError, ValueError):
+                    throttle_duration = self.throttle_duration
+                api_key_state["Unavailable Until"] = max(api_key_state["Unavailable Until"],
+                                                         time.monotonic() + throttle_duration
+                                                         )
+                api_key_state["Unavailable Reason"] = "Throttled"
+                logger.warning("The API key %s has been throttled. Pausing it for %.1f seconds.",
+                               api_key_state["Key ID"],
+                               throttle_duration
+                               )
+            elif api_exception_status in (401, 403):
+                api_key_state["Rejected Count"] += 1
+                api_key_state["Unavailable Until"] = time.monotonic() + self.revoked_key_duration
+                api_key_state["Unavailable Reason"] = "Rejected"
+                logger.warning("The API key %s has been rejected with HTTP status %s. Pausing it for %d seconds.",
+                               api_key_state["Key ID"],
+                               api_exception_status,
+                               self.revoked_key_duration
+                               )
+            self._key_state_condition.notify_all()
+
+    def call_api(self,
+                 resource_path,
+                 method,
+                 *args,
+                 **kwargs
+                 ):
+        """This function sends an Intersight API request with an API key of the
+        pool, sending it again with another API key if the API key is
+        throttled or rejected. The response is available from the
+        last_response attribute for the calling thread.
+
+        Raises:
+            ApiException:
+                The last exception of the request, if no API key of the pool
+                could complete it.
+        """
+        request_coalescer = _active_request_coalescer
+        if request_coalescer is not None and method == "GET":
+            return request_coalescer.call(self,
+                                          resource_path,
+                                          lambda: self._send_api_call(resource_path, method, *args, **kwargs)
+                                          )
+        return self._send_api_call(resource_path, method, *args, **kwargs)
+
+    def _send_api_call(self,
+                       resource_path,
+                       method,
+                       *args,
+                       **kwargs
+                       ):
+        rejected_api_key_ids = set()
+        last_api_exception = None
+        throttled_attempts = 0
+        while True:
+            api_key_state = self._acquire_api_key(rejected_api_key_ids)
+            if api_key_state is None:
+                if last_api_exception is None:
+                    last_api_exception = intersight.ApiException(status=401,
+                                                                 reason="Every API key in the pool has been rejected."
+                                                                 )
+                raise last_api_exception
+            api_client = api_key_state["Client"]
+            try:
+                api_call_result = api_client.call_api(resource_path, method, *args, **kwargs)
+            except intersight.ApiException as api_exception:
+                self._release_api_key(api_key_state, api_exception)
+                last_api_exception = api_exception
+                if api_exception.status == 429:
+                    throttled_attempts += 1
+                    if throttled_attempts < self.max_throttled_attempts:
+                        continue
+                elif api_exception.status in (401, 403):
+                    rejected_api_key_ids.add(api_key_state["Key ID"])
+                    continue
+                raise
+            except BaseException:
+                self._release_api_key(api_key_state)
+                raise
+            self._release_api_key(api_key_state)
+            self.last_response = api_client.last_response
+            return api_call_result
+
+    def get_api_key_statistics(self):
+        """This function returns the request statistics of each API key in the
+        pool.
+
+        Returns:
+            A list of dictionaries with the "Key ID", "Requests", "Requests
+            Last Minute", "Throttled", "Rejected" and "Available" values of
+            each API key.
+        """
+        with self._key_state_condition:
+            current_time = time.monotonic()
+            return [
+                {
+                    "Key ID": api_key_state["Key ID"],
+                    "Requests": api_key_state["Request Count"],
+                    "Requests Last Minute": sum(1 for request_time in api_key_state["Request Times"]
+                                                if request_time > current_time - 60),
+                    "Throttled": api_key_state["Throttled Count"],
+                    "Rejected": api_key_state["Rejected Count"],
+                    "Available": api_key_state["Unavailable Until"] <= current_time
+                    }
+                for api_key_state in self.api_key_states
+                ]
+
+
+# Establish function to create an Intersight API client for a pool of API keys
+def get_pooled_api_client(api_keys,
+                          endpoint="https://intersight.com",
+                          url_certificate_verification=True,
+                          connection_pool_maxsize=None,
+                          rest_client_factory=None,
+                          **pool_settings
+                          ):
+    """This is a function to create a PooledApiClient class instance from the
+    shared Intersight API clients of a pool of API keys for the same
+    Intersight account.
+
+    Args:
+        api_keys (list):
+            A list of dictionaries with the "Key ID" and "Key File" of each
+            API key.
+        endpoint (str):
+            Optional; The Intersight API endpoint. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; A setting to determine whether the certificate of the
+            Intersight API endpoint is verified. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept by the connection
+            pool of each client. The default value is None.
+        rest_client_factory (function):
+            Optional; A function that creates the REST client of each client.
+            The default value is None, which uses the REST client of the SDK.
+        **pool_settings:
+            Optional; The settings of the PooledApiClient class, such as
+            max_requests_per_second_per_key.
+
+    Returns:
+        The PooledApiClient class instance.
+    """
+    pooled_api_clients = {}
+    for api_key in api_keys:
+        if not api_key.get("Key ID") or not api_key.get("Key File"):
+            logger.error("\nA configuration error has occurred!\n\n"
+                         "Each API key in the API key pool needs a \"Key ID\" "
+                         "and a \"Key File\".\n"
+                         "Please update the configuration, then re-attempt "
+                         "execution.\n")
+            sys.exit(0)
+        pooled_api_clients[api_key["Key ID"]] = get_shared_api_client(
+            api_key_id=api_key["Key ID"],
+            api_secret_file=api_key["Key File"],
+            endpoint=endpoint,
+            url_certificate_verification=url_certificate_verification,
+            connection_pool_maxsize=connection_pool_maxsize,
+            rest_client_factory=rest_client_factory
+            )
+    return PooledApiClient(pooled_api_clients, **pool_settings)
+
+
+# Establish function to test for the availability of the Intersight API and Intersight account
+def test_intersight_api_service(intersight_api_key_id,
+                                intersight_api_key,
+                                intersight_base_url="https://www.intersight.com/api/v1",
+                                preconfigured_api_client=None
+                                ):
+    """This is a function to test the availability of the Intersight API and
+    Intersight account. The tested Intersight account contains the user who is
+    the owner of the provided Intersight API Key and Key ID.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance. The
+            default value is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the name for the Intersight account tested, verifying the
+        Intersight API service is up and the Intersight account is accessible.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the provided API Key
+            and/or API Key ID.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                           api_secret_file=intersight_api_key,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    try:
+        # Check that Intersight Account is accessible
+        logger.info("Testing access to the Intersight API by verifying the "
+                    "Intersight account information..."
+                    )
+        api_client.call_api(resource_path="/iam/Accounts",
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        response = api_client.last_response.data
+        iam_account = json.loads(response)
+        if api_client.last_response.status != 200:
+            logger.error("\nThe Intersight API and Account Availability Test did not "
+                         "pass.\n"
+                         "The Intersight account information could not be verified.\n"
+                         "Exiting due to the Intersight account being unavailable.\n\n"
+                         "Please verify that the correct API Key ID and API Key have "
+                         "been entered, then re-attempt execution.\n"
+                         )
+            sys.exit(0)
+        else:
+            intersight_account_name = iam_account["Results"][0]["Name"]
+            logger.info("The Intersight API and Account Availability Test has "
+                        "passed.\n\n"
+                        "The Intersight account named '%s' has been found.",
+                        intersight_account_name
+                        )
+            return intersight_account_name
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "Unable to access the Intersight API.\n"
+                     "Exiting due to the Intersight API being unavailable.\n\n"
+                     "Please verify that the correct API Key ID and API Key have "
+                     "been entered, then re-attempt execution.\n\n"
+                     "Exception Message: ",
+                     exc_info=True
+                     )
+        sys.exit(0)
+
+
+# Establish function to retrieve the MOID of a specific Intersight API object by name
+def intersight_object_moid_retriever(intersight_api_key_id,
+                                     intersight_api_key,
+                                     object_name,
+                                     intersight_api_path,
+                                     object_type="object",
+                                     organization="default",
+                                     intersight_base_url="https://www.intersight.com/api/v1",
+                                     preconfigured_api_client=None
+                                     ):
+    """This is a function to retrieve the MOID of Intersight objects
+    using the Intersight API.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        object_name (str):
+            The name of the Intersight object.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        organization (str):
+            Optional; The Intersight organization of the Intersight object.
+            The default value is "default".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the MOID for the provided Intersight object.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                           api_secret_file=intersight_api_key,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    try:
+        # Retrieve the Intersight Account name
+        api_client.call_api(resource_path="/iam/Accounts",
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        response = api_client.last_response.data
+        iam_account = json.loads(response)
+        if api_client.last_response.status != 200:
+            logger.error("The provided Intersight account information could not be "
+                         "accessed.\n"
+                         "Exiting due to the Intersight account being unavailable.\n\n"
+                         "Please verify that the correct API Key ID and API Key have "
+                         "been entered, then re-attempt execution.\n"
+                         )
+            sys.exit(0)
+        else:
+            intersight_account_name = iam_account["Results"][0]["Name"]
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "Unable to access the Intersight API.\n"
+                     "Exiting due to the Intersight API being unavailable.\n\n"
+                     "Please verify that the correct API Key ID and API Key have "
+                     "been entered, then re-attempt execution.\n"
+                     )
+        sys.exit(0)
+    # Retrieving the provided object from Intersight...
+    full_intersight_api_path = f"/{intersight_api_path}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path,
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        response = api_client.last_response.data
+        intersight_objects = json.loads(response)
+        # The Intersight API resource path has been accessed successfully.
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "There was an issue retrieving the "
+                     f"{object_type} from Intersight.\n"
+                     "Unable to access the provided Intersight API resource path "
+                     f"'{intersight_api_path}'.\n"
+                     "Please review and resolve any error messages, then re-attempt "
+                     "execution.\n\n"
+                     "Exception Message: ",
+                     exc_info=True
+                     )
+        sys.exit(0)
+
+    if intersight_objects.get("Results"):
+        for intersight_object in intersight_objects.get("Results"):
+            if intersight_object.get("Organization"):
+                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                              intersight_api_key=None,
+                                                                              object_name=organization,
+                                                                              intersight_api_path="organization/Organizations?$top=1000",
+                                                                              object_type="Organization",
+                                                                              preconfigured_api_client=api_client
+                                                                              )
+                if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
+                    if intersight_object.get("Name") == object_name:
+                        intersight_object_moid = intersight_object.get("Moid")
+                        # The provided object and MOID has been identified and retrieved.
+                        return intersight_object_moid
+            else:
+                if intersight_object.get("Name") == object_name:
+                    intersight_object_moid = intersight_object.get("Moid")
+                    # The provided object and MOID has been identified and retrieved.
+                    return intersight_object_moid
+        else:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"The provided {object_type} named '{object_name}' was not "
+                         "found.\n"
+                         "Please check the Intersight Account named "
+                         f"{intersight_account_name}.\n"
+                         "Verify through the API or GUI that the needed "
+                         f"{object_type} is present.\n"
+                         f"If the needed {object_type} is missing, please create it.\n"
+                         "Once the issue has been resolved, re-attempt execution.\n"
+                         )
+            sys.exit(0)
+    else:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     f"The provided {object_type} named '{object_name}' was not "
+                     "found.\n"
+                     f"No requested {object_type} instance is currently available in "
+                     f"the Intersight account named {intersight_account_name}.\n"
+                     "Please check the Intersight Account named "
+                     f"{intersight_account_name}.\n"
+                     f"Verify through the API or GUI that the needed {object_type} "
+                     "is present.\n"
+                     f"If the needed {object_type} is missing, please create it.\n"
+                     "Once the issue has been resolved, re-attempt execution.\n"
+                     )
+        sys.exit(0)
+
+
+# Establish function to retrieve all instances of a particular Intersight API object type
+def get_intersight_objects(intersight_api_key_id,
+                           intersight_api_key,
+                           intersight_api_path,
+                           object_type="object",
+                           intersight_base_url="https://www.intersight.com/api/v1",
+                           preconfigured_api_client=None
+                           ):
+    """This is a function to perform an HTTP GET on all objects under an
+    available Intersight API type.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type. For example,
+            to specify the Intersight API type for adapter configuration
+            policies, enter "adapter/ConfigPolicies". More API types can be
+            found in the Intersight API reference library at
+            https://intersight.com/apidocs/introduction/overview/.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A dictionary containing all objects of the specified API type. If the
+        API type is inaccessible, an implicit value of None will be returned.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                           api_secret_file=intersight_api_key,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    # Retrieving the provided object from Intersight...
+    full_intersight_api_path = f"/{intersight_api_path}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path,
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        response = api_client.last_response.data
+        intersight_objects = json.loads(response)
+        # The Intersight API resource path has been accessed successfully.
+        return intersight_objects
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     f"There was an issue retrieving the requested {object_type} "
+                     "instances from Intersight.\n"
+                     "Unable to access the provided Intersight API resource path "
+                     f"'{intersight_api_path}'.\n"
+                     "Please review and resolve any error messages, then re-attempt "
+                     "execution.\n\n"
+                     "Exception Message: ",
+                     exc_info=True
+                     )
+        sys.exit(0)
+
+
+# Establish advanced function to retrieve Intersight API objects
+def advanced_intersight_object_moid_retriever(intersight_api_key_id,
+                                              intersight_api_key,
+                                              object_attributes,
+                                              intersight_api_path,
+                                              object_type="object",
+                                              organization="default",
+                                              intersight_base_url="https://www.intersight.com/api/v1",
+                                              preconfigured_api_client=None
+                                              ):
+    """This is a function to retrieve the MOID of Intersight objects based on
+    various provided attributes using the Intersight API.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        object_attributes (dict):
+            A dictionary containing the identifying attribute keys and values
+            of the Intersight object to be found.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        organization (str):
+            Optional; The Intersight organization of the Intersight object.
+            The default value is "default".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the MOID for the provided Intersight object.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                           api_secret_file=intersight_api_key,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    try:
+        # Retrieve the Intersight Account name
+        api_client.call_api(resource_path="/iam/Accounts",
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        response = api_client.last_response.data
+        iam_account = json.loads(response)
+        if api_client.last_response.status != 200:
+            logger.error("The provided Intersight account information could not be "
+                         "accessed.\n"
+                         "Exiting due to the Intersight account being unavailable.\n\n"
+                         "Please verify that the correct API Key ID and API Key have "
+                         "been entered, then re-attempt execution.\n"
+                         )
+            sys.exit(0)
+        else:
+            intersight_account_name = iam_account["Results"][0]["Name"]
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "Unable to access the Intersight API.\n"
+                     "Exiting due to the Intersight API being unavailable.\n\n"
+                     "Please verify that the correct API Key ID and API Key have "
+                     "been entered, then re-attempt execution.\n"
+                     )
+        sys.exit(0)
+    # Retrieving the provided object from Intersight...
+    full_intersight_api_path = f"/{intersight_api_path}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path,
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        response = api_client.last_response.data
+        intersight_objects = json.loads(response)
+        # The Intersight API resource path has been accessed successfully.
+    except Exception:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "There was an issue retrieving the "
+                     f"{object_type} from Intersight.\n"
+                     "Unable to access the provided Intersight API resource path "
+                     f"'{intersight_api_path}'.\n"
+                     "Please review and resolve any error messages, then re-attempt "
+                     "execution.\n\n"
+                     "Exception Message: ",
+                     exc_info=True
+                     )
+        sys.exit(0)
+
+    if intersight_objects.get("Results"):
+        for intersight_object in intersight_objects.get("Results"):
+            if intersight_object.get("Organization"):
+                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                              intersight_api_key=None,
+                                                                              object_name=organization,
+                                                                              intersight_api_path="organization/Organizations?$top=1000",
+                                                                              object_type="Organization",
+                                                                              preconfigured_api_client=api_client
+                                                                              )
+                if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
+                    for object_attribute in object_attributes:
+                        try:
+                            intersight_object[object_attribute]
+                        except KeyError:
+                            break
+                        if intersight_object.get(object_attribute) != object_attributes.get(object_attribute):
+                            break
+                    else:
+                        intersight_object_moid = intersight_object.get("Moid")
+                        # The provided object and MOID has been identified and retrieved.
+                        return intersight_object_moid
+            else:
+                for object_attribute in object_attributes:
+                    try:
+                        intersight_object[object_attribute]
+                    except KeyError:
+                        break
+                    if intersight_object.get(object_attribute) != object_attributes.get(object_attribute):
+                        break
+                else:
+                    intersight_object_moid = intersight_object.get("Moid")
+                    # The provided object and MOID has been identified and retrieved.
+                    return intersight_object_moid
+        else:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"The provided {object_type} was not found.\n"
+                         "Please check the Intersight Account named "
+                         f"{intersight_account_name}.\n"
+                         "Verify through the API or GUI that the needed "
+                         f"{object_type} is present.\n"
+                         f"If the needed {object_type} is missing, please create it.\n"
+                         "Once the issue has been resolved, re-attempt execution.\n"
+                         )
+            sys.exit(0)
+    else:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     f"The provided {object_type} was not found.\n"
+                     f"No requested {object_type} instance is currently available in "
+                     f"the Intersight account named {intersight_account_name}.\n"
+                     "Please check the Intersight Account named "
+                     f"{intersight_account_name}.\n"
+                     f"Verify through the API or GUI that the needed {object_type} "
+                     "is present.\n"
+                     f"If the needed {object_type} is missing, please create it.\n"
+                     f"Once the issue has been resolved, re-attempt execution.\n"
+                     )
+        sys.exit(0)
+
+
+# Establish function to convert a list of strings in string type format to list type format.
+def string_to_list_maker(string_list,
+                         remove_duplicate_elements_in_list=True
+                         ):
+    """This function converts a list of strings in string type format to list
+    type format. The provided string should contain commas, semicolons, or
+    spaces as the separator between strings. Separators inside square brackets
+    are kept, so server identifier patterns such as "Lab-Blade-[1,3,5-8]"
+    remain a single string. For each string in the list, leading and rear
+    spaces will be removed. Duplicate strings in the list are removed by
+    default, keeping the first occurrence.
+
+    Args:
+        string_list (str):
+            A string containing an element or range of elements.
+
+        remove_duplicate_elements_in_list (bool):
+            Optional; A setting to determine whether duplicate elements are
+            removed from the provided string list. The default value is True.
+
+    Returns:
+        A list of elements.   
+    """
+    def string_to_list_separator(string_list,
+                                 separator
+                                 ):
+        """This function converts a list of elements in string type format to
+        list type format using the provided separator. For each element in the
+        list, leading and rear spaces are removed.
+
+        Args:
+            string_list (str):
+                A string containing an element or range of elements.
+
+            separator (str):
+                The character to identify where elements in the
+                list should be separated (e.g., a space, comma,
+                semicolon, etc.).
+
+        Returns:
+            A list of separated elements that have been stripped of any spaces.   
+        """
+        fully_stripped_list = []
+        # Split string by provided separator and create list of separated elements.
+        split_list = string_list.split(separator)
+        for element in split_list:
+            if element:
+                # Remove leading spaces from elements in list.
+                lstripped_element = element.lstrip()
+                # Remove rear spaces from elements in list.
+                rstripped_element = lstripped_element.rstrip()
+                # Populate new list with fully stripped elements.
+                fully_stripped_list.append(rstripped_element)
+        return fully_stripped_list
+
+    def list_to_list_separator(provided_list,
+                               separator
+                               ):
+        """This function converts a list of elements in list type format to
+        list type format using the provided separator. For each element in the
+        list, leading and rear spaces are removed.
+
+        Args:
+            provided_list (list): A list of elements to be separated.
+
+            separator (str): The character to identify where elements in the
+                list should be separated (e.g., a space, comma,
+                semicolon, etc.).
+
+        Returns:
+            A list of separated elements that have been stripped of any spaces.        
+        """
+        new_list = []
+        # Split list by provided separator and create new list of separated elements.
+        for element in provided_list:
+            if separator in element:
+                split_provided_list = string_to_list_separator(element, separator)
+                new_list.extend(split_provided_list)
+            else:
+                new_list.append(element)
+        return new_list
+    
+    # Protect the separators inside square brackets from splitting.
+    bracket_separators = {" ": "\x00", ",": "\x01", ";": "\x02"}
+    protected_string_list = re.sub(r"\[[^\]]*\]",
+                                   lambda bracket_match: "".join(bracket_separators.get(character, character)
+                                                                 for character in bracket_match.group()
+                                                                 ),
+                                   string_list
+                                   )
+    # Split provided list by spaces.
+    space_split_list = string_to_list_separator(protected_string_list, " ")
+    # Split provided list by commas.
+    post_comma_split_list = list_to_list_separator(space_split_list, ",")
+    # Split provided list by semicolons.
+    post_semicolon_split_list = list_to_list_separator(post_comma_split_list, ";")
+    # Restore the separators inside square brackets.
+    staged_list = []
+    for post_semicolon_split_string_set in post_semicolon_split_list:
+        for separator, placeholder in bracket_separators.items():
+            post_semicolon_split_string_set = post_semicolon_split_string_set.replace(placeholder, separator)
+        staged_list.append(post_semicolon_split_string_set)
+    # Remove duplicates from list if enabled.
+    if remove_duplicate_elements_in_list:
+        return list(dict.fromkeys(staged_list))
+    return staged_list
+
+
+# Establish function to determine the search settings for a target server
+def _get_server_search_settings(server_identifier,
+                                server_form_factor="Blade",
+                                server_connection_type="FI-Attached"
+                                ):
+    """This is a function to determine the Intersight API path, object type
+    and management mode used to search for a target server.
+
+    Args:
+        server_identifier (str):
+            The identifier of the target server.
+        server_form_factor (str):
+            Optional; The form factor of the target server. The accepted values
+            are "Blade" or "Rack". The default value is "Blade".
+        server_connection_type (str):
+            Optional; The connection type of the target server. The accepted
+            values are "FI-Attached" or "Standalone". The default value is
+            "FI-Attached".
+
+    Returns:
+        A dictionary with the "Form Factor Path", "Object Type",
+        "Connection Type" and "Management Mode" of the target server.
+    """
+    # Determine Server Form Factor
+    if server_form_factor == "Blade":
+        provided_server_form_factor = "Blades"
+        provided_server_object_type = "Blade Server"
+    elif server_form_factor == "Rack":
+        provided_server_form_factor = "RackUnits"
+        provided_server_object_type = "Rack Server"
+    else:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "During the retrieval of the data for the server "
+                     f"identifier '{server_identifier}', there was an issue "
+                     "with the value provided for the server form factor "
+                     "setting.\n"
+                     f"The value provided was {server_form_factor}.\n"
+                     "To proceed, the value provided for the server form "
+                     "factor setting should be updated to an accepted string "
+                     "format.\n"
+                     "The accepted values are 'Blade' or 'Rack'.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n",
+                     extra={"server_identifier": server_identifier}
+                     )
+        sys.exit(0)
+    # Determine the Server Type (Target Platform or Management Mode)
+    if server_connection_type == "FI-Attached":
+        provided_server_connection_type = "FI-Attached"
+        provided_server_management_mode = "Intersight"
+    elif server_connection_type == "Standalone":
+        provided_server_connection_type = "Standalone"
+        provided_server_management_mode = "IntersightStandalone"
+    else:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "During the retrieval of the data for the server "
+                     f"identifier '{server_identifier}', there was an issue "
+                     "with the value provided for the server type setting.\n"
+                     f"The value provided was {server_connection_type}.\n"
+                     "To proceed, the value provided for the server type "
+                     "setting should be updated to an accepted string format.\n"
+                     "The accepted values are 'FI-Attached' or 'Standalone'.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n",
+                     extra={"server_identifier": server_identifier}
+                     )
+        sys.exit(0)
+    return {
+        "Form Factor Path": provided_server_form_factor,
+        "Object Type": provided_server_object_type,
+        "Connection Type": provided_server_connection_type,
+        "Management Mode": provided_server_management_mode
+        }
+
+
+# Establish class to compile server identifier patterns
+class ServerIdentifierPattern:
+    """This class compiles a server identifier pattern that selects multiple
+    servers by naming convention. Three pattern forms are accepted:
+
+    - Ranges and lists in brackets, such as "Lab-Blade-[1-240]",
+      "Lab-Blade-[1,3,5-8]" or "Rack-[a-c]". Leading zeros are kept, so
+      "Node-[001-120]" matches "Node-001" to "Node-120".
+    - Wildcards, where "*" matches any characters and "?" matches one
+      character, such as "Lab-Blade-*".
+    - Regular expressions prefixed with "re:", such as "re:^Lab-.*-M7$".
+
+    Each pattern is compiled to an OData filter for the Intersight API, so
+    the matching servers are retrieved with one filtered query. Short
+    expansions are compiled to an "in" filter, and other patterns with a
+    literal prefix are compiled to a "startswith" filter. The retrieved
+    servers are then matched exactly against the pattern.
+    """
+    server_attributes = ("Serial", "Name", "Model", "UserLabel")
+    max_filter_values = 25
+    _pattern_token_regex = re.compile(r"\[([^\]]*)\]|\*|\?")
+
+    def __init__(self,
+                 pattern
+                 ):
+        self.pattern = pattern
+        self.filter_values = None
+        self.filter_prefix = ""
+        if pattern.startswith("re:"):
+            self._compile_regular_expression(pattern[3:])
+        else:
+            self._compile_wildcard_pattern(pattern)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self.pattern}')"
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.pattern}'"
+
+    @classmethod
+    def is_pattern(cls,
+                   server_identifier
+                   ):
+        """This function checks whether a server identifier contains pattern
+        syntax.
+
+        Args:
+            server_identifier (str):
+                The identifier of the target server.
+
+        Returns:
+            A boolean indicating whether the server identifier is a pattern.
+        """
+        server_identifier = str(server_identifier or "").strip()
+        return server_identifier.startswith("re:") or bool(cls._pattern_token_regex.search(server_identifier))
+
+    @staticmethod
+    def _expand_bracket(bracket_contents):
+        expanded_values = []
+        for bracket_part in bracket_contents.split(","):
+            bracket_part = bracket_part.strip()
+            range_start, separator, range_end = bracket_part.partition("-")
+            if not separator:
+                expanded_values.append(bracket_part)
+            elif range_start.isdigit() and range_end.isdigit():
+                if int(range_start) > int(range_end):
+                    raise ValueError(f"The range '{bracket_part}' is reversed.")
+                value_width = len(range_start) if range_start.startswith("0") else 0
+                expanded_values.extend(str(range_value).zfill(value_width)
+                                       for range_value in range(int(range_start), int(range_end) + 1)
+                                       )
+            elif len(range_start) == 1 and len(range_end) == 1:
+                if range_start > range_end:
+                    raise ValueError(f"The range '{bracket_part}' is reversed.")
+                expanded_values.extend(chr(range_value) for range_value in range(ord(range_start), ord(range_end) + 1))
+            else:
+                raise ValueError(f"The range '{bracket_part}' is not valid.")
+        if not all(expanded_values):
+            raise ValueError(f"The brackets '[{bracket_contents}]' contain an empty value.")
+        return expanded_values
+
+    def _compile_wildcard_pattern(self,
+                                  pattern
+                                  ):
+        regular_expression_parts = []
+        expanded_values = [""]
+        has_wildcard = False
+        literal_start = 0
+        for pattern_token in self._pattern_token_regex.finditer(pattern):
+            literal_text = pattern[literal_start:pattern_token.start()]
+            literal_start = pattern_token.end()
+            regular_expression_parts.append(re.escape(literal_text))
+            expanded_values = [expanded_value + literal_text for expanded_value in expanded_values]
+            if not has_wildcard and not regular_expression_parts[1:]:
+                self.filter_prefix = literal_text
+            if pattern_token.group() == "*":
+                has_wildcard = True
+                regular_expression_parts.append(".*")
+            elif pattern_token.group() == "?":
+                has_wildcard = True
+                regular_expression_parts.append(".")
+            else:
+                bracket_values = self._expand_bracket(pattern_token.group(1))
+                regular_expression_parts.append("(?:" + "|".join(re.escape(bracket_value) for bracket_value in bracket_values) + ")")
+                if not has_wildcard and len(expanded_values) * len(bracket_values) <= self.max_filter_values:
+                    expanded_values = [expanded_value + bracket_value
+                                       for expanded_value in expanded_values
+                                       for bracket_value in bracket_values
+                                       ]
+                else:
+                    has_wildcard = True
+        regular_expression_parts.append(re.escape(pattern[literal_start:]))
+        if not has_wildcard:
+            self.filter_values = [expanded_value + pattern[literal_start:] for expanded_value in expanded_values]
+        self.regular_expression = re.compile(r"\A" + "".join(regular_expression_parts) + r"\Z")
+
+    def _compile_regular_expression(self,
+                                    regular_expression
+                                    ):
+        try:
+            self.regular_expression = re.compile(regular_expression)
+        except re.error as regular_expression_error:
+            raise ValueError(f"The regular expression is not valid. {regular_expression_error}") from None
+        # Use the literal text after a leading anchor as the prefix, unless the expression has alternatives
+        if not regular_expression.startswith("^") or "|" in regular_expression:
+            return
+        literal_prefix = []
+        regular_expression_index = 1
+        while regular_expression_index < len(regular_expression):
+            regular_expression_character = regular_expression[regular_expression_index]
+            if regular_expression_character == "\\":
+                escaped_character = regular_expression[regular_expression_index + 1:regular_expression_index + 2]
+                if not escaped_character or escaped_character.isalnum():
+                    break
+                literal_prefix.append(escaped_character)
+                regular_expression_index += 2
+            elif regular_expression_character in ".^$*+?{}[]()":
+                # A quantifier applies to the preceding character, so it cannot be part of the prefix
+                if regular_expression_character in "*+?{" and literal_prefix:
+                    literal_prefix.pop()
+                break
+            else:
+                literal_prefix.append(regular_expression_character)
+                regular_expression_index += 1
+        self.filter_prefix = "".join(literal_prefix)
+
+    def get_odata_filter(self):
+        """This function returns the OData filter expression for the servers
+        that may match the pattern.
+
+        Returns:
+            A string of the OData filter expression, or None if the pattern
+            has no literal prefix and the servers must be matched client-side.
+        """
+        if self.filter_values is not None:
+            quoted_filter_values = ",".join("'" + filter_value.replace("'", "''") + "'"
+                                            for filter_value in self.filter_values
+                                            )
+            return "(" + " or ".join(f"{server_attribute} in ({quoted_filter_values})"
+                                     for server_attribute in self.server_attributes
+                                     ) + ")"
+        if self.filter_prefix:
+            quoted_filter_prefix = "'" + self.filter_prefix.replace("'", "''") + "'"
+            return "(" + " or ".join(f"startswith({server_attribute},{quoted_filter_prefix})"
+                                     for server_attribute in self.server_attributes
+                                     ) + ")"
+        return None
+
+    def matches(self,
+                intersight_server
+                ):
+        """This function checks whether the serial, name, model or user label
+        of an Intersight server matches the pattern.
+
+        Args:
+            intersight_server (dict):
+                The Intersight server object.
+
+        Returns:
+            A boolean indicating whether the server matches the pattern.
+        """
+        return any(self.regular_expression.search(str(intersight_server.get(server_attribute) or ""))
+                   for server_attribute in self.server_attributes
+                   )
+
+
+# Establish function to expand the target servers with server identifier patterns
+def expand_power_control_target_patterns(power_control_target_server_id_dictionary_list,
+                                         server_inventory
+                                         ):
+    """This is a function to expand each target server with a server
+    identifier pattern into a target server for every matching server. A
+    server identifier with several comma, semicolon or space separated
+    alternatives is split, and each pattern alternative is compiled on its
+    own. The matching servers are retrieved with one filtered query per
+    pattern, and each expanded target server keeps the other keys of the
+    pattern target, with the server serial as the "Server Identifier". A
+    pattern that matches no servers is logged as a warning. Target servers
+    without a pattern are passed through unchanged.
+
+    Args:
+        power_control_target_server_id_dictionary_list (iterable):
+            An iterable of dictionaries containing the target server data.
+        server_inventory (IntersightServerInventory):
+            The server inventory used to retrieve the matching servers.
+
+    Yields:
+        A dictionary containing the data for each target server.
+    """
+    for power_control_target_server_id_dictionary in power_control_target_server_id_dictionary_list:
+        server_identifier = str(power_control_target_server_id_dictionary.get("Server Identifier") or "").strip()
+        if not ServerIdentifierPattern.is_pattern(server_identifier):
+            yield power_control_target_server_id_dictionary
+            continue
+        # Regular expressions may contain separators, so only the other patterns are split into alternatives
+        if server_identifier.startswith("re:"):
+            server_identifier_alternatives = [server_identifier]
+        else:
+            server_identifier_alternatives = string_to_list_maker(server_identifier)
+        expanded_server_identifiers = []
+        for server_identifier_alternative in server_identifier_alternatives:
+            if not ServerIdentifierPattern.is_pattern(server_identifier_alternative):
+                expanded_server_identifiers.append(server_identifier_alternative)
+                continue
+            try:
+                server_identifier_pattern = ServerIdentifierPattern(server_identifier_alternative)
+            except ValueError as pattern_error:
+                logger.error("\nA configuration error has occurred!\n\n"
+                             "The server identifier pattern "
+                             f"'{server_identifier_alternative}' is not valid. {pattern_error}\n"
+                             "Please update the configuration, then re-attempt "
+                             "execution.\n",
+                             extra={"server_identifier": server_identifier_alternative}
+                             )
+                sys.exit(0)
+            server_search_settings = _get_server_search_settings(
+                server_identifier_alternative,
+                power_control_target_server_id_dictionary.get("Server Form Factor", "Blade"),
+                power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached")
+                )
+            matching_intersight_servers = server_inventory.find_servers_matching_pattern(server_search_settings,
+                                                                                         server_identifier_pattern
+                                                                                         )
+            if not matching_intersight_servers:
+                logger.warning("The server identifier pattern '%s' did not match any %ss. "
+                               "Please verify the pattern and the server form factor and "
+                               "connection type settings.",
+                               server_identifier_alternative,
+                               server_search_settings["Object Type"],
+                               extra={"server_identifier": server_identifier_alternative}
+                               )
+                continue
+            logger.info("The server identifier pattern '%s' matched %d %ss.",
+                        server_identifier_alternative,
+                        len(matching_intersight_servers),
+                        server_search_settings["Object Type"],
+                        extra={"server_identifier": server_identifier_alternative}
+                        )
+            expanded_server_identifiers.extend(matching_intersight_server.get("Serial") or matching_intersight_server.get("Name")
+                                               for matching_intersight_server in matching_intersight_servers
+                                               )
+        # Servers matched by more than one alternative are only targeted once
+        for expanded_server_identifier in dict.fromkeys(expanded_server_identifiers):
+            yield dict(power_control_target_server_id_dictionary,
+                       **{"Server Identifier": expanded_server_identifier}
+                       )
+
+# Establish function to retrieve the target servers remaining for the power control operations
+def get_remaining_power_control_targets(power_control_targets,
+                                        server_inventory,
+                                        power_control_state,
+                                        run_journal=None
+                                        ):
+    """This is a function to expand the configured target servers with server
+    identifier patterns, then remove the target servers already completed in
+    a resumed run.
+
+    Args:
+        power_control_targets (iterable):
+            An iterable of dictionaries containing the configured target
+            server data.
+        server_inventory (IntersightServerInventory):
+            The server inventory used to retrieve the servers matching the
+            server identifier patterns.
+        power_control_state (str):
+            The power control state for the target servers.
+        run_journal (PowerControlRunJournal):
+            Optional; The run journal of the resumed run. The default value is
+            None, which keeps all of the target servers.
+
+    Returns:
+        An iterable of dictionaries containing the data for each remaining
+        target server. A list is returned when the configured target servers
+        are a list, so the target server count is known in advance.
+    """
+    remaining_power_control_targets = expand_power_control_target_patterns(power_control_targets,
+                                                                           server_inventory
+                                                                           )
+    if run_journal is not None:
+        remaining_power_control_targets = run_journal.get_remaining_targets(remaining_power_control_targets,
+                                                                            power_control_state
+                                                                            )
+    if isinstance(power_control_targets, list):
+        return list(remaining_power_control_targets)
+    return remaining_power_control_targets
+
+
+# Establish function to group the target servers into batches by power control state
+def group_power_control_targets_by_state(power_control_targets,
+                                         power_control_state
+                                         ):
+    """This is a function to group target servers into batches by power
+    control state, so the sequential and asynchronous runs submit each power
+    control state together, like the wave scheduler. Each target server is
+    given its "Power Control State" explicitly.
+
+    Args:
+        power_control_targets (iterable):
+            An iterable of dictionaries containing the target server data.
+        power_control_state (str):
+            The power control state for the target servers without a "Power
+            Control State" key.
+
+    Returns:
+        A list of dictionaries containing the target server data, grouped in
+        the order each power control state is first provided.
+    """
+    power_control_batches = PowerControlWaveScheduler.group_by_power_control_state(
+        dict(power_control_target_server_id_dictionary,
+             **{"Power Control State": power_control_target_server_id_dictionary.get("Power Control State", power_control_state)}
+             )
+        for power_control_target_server_id_dictionary in power_control_targets
+        )
+    return [power_control_target_server_id_dictionary
+            for power_control_batch in power_control_batches.values()
+            for power_control_target_server_id_dictionary in power_control_batch
+            ]
+
+
+# Establish function to find the first Intersight server matching any of the provided identifiers
+def _find_matching_intersight_server(intersight_servers,
+                                     provided_server_identifiers
+                                     ):
+    """This is a function to find the first server in a list of Intersight
+    servers with a serial, name, model or user label matching any of the
+    provided server identifiers.
+
+    Args:
+        intersight_servers (list):
+            A list of Intersight server objects.
+        provided_server_identifiers (list):
+            A list of server identifiers.
+
+    Returns:
+        A dictionary of the matching Intersight server object. If there is no
+        match, None is returned.
+    """
+    for intersight_server in intersight_servers:
+        server_serial = intersight_server.get("Serial", "")
+        server_name = intersight_server.get("Name", "")
+        server_model = intersight_server.get("Model", "")
+        server_user_label = intersight_server.get("UserLabel", "")
+        for provided_server_identifier in provided_server_identifiers:
+            if provided_server_identifier in [server_serial,
+                                              server_name,
+                                              server_model,
+                                              server_user_label
+                                              ]:
+                return intersight_server
+    return None
+
+
+# Establish function to create the reference dictionary for a target server
+def _create_target_server_dictionary(server_identifier,
+                                     provided_server_identifiers,
+                                     intersight_servers,
+                                     server_search_settings,
+                                     intersight_account_name,
+                                     intersight_base_url="https://www.intersight.com/api/v1",
+                                     matching_intersight_server=None
+                                     ):
+    """This is a function to match a target server among the retrieved
+    Intersight servers and create the reference dictionary for it. If no
+    matching server is found, an error message is displayed and execution is
+    exited.
+
+    Args:
+        server_identifier (str):
+            The identifier of the target server.
+        provided_server_identifiers (list):
+            The list of server identifiers parsed from the server_identifier.
+        intersight_servers (list):
+            A list of the retrieved Intersight server objects.
+        server_search_settings (dict):
+            The search settings of the target server provided by the
+            _get_server_search_settings function.
+        intersight_account_name (str):
+            The name of the Intersight account.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        matching_intersight_server (dict):
+            Optional; The matching Intersight server object, if it has already
+            been found. The default value is None, which searches the
+            intersight_servers list.
+
+    Returns:
+        A dictionary with the data for a target server on Cisco Intersight.
+    """
+    provided_server_form_factor = server_search_settings["Form Factor Path"]
+    provided_server_object_type = server_search_settings["Object Type"]
+    provided_server_connection_type = server_search_settings["Connection Type"]
+    if intersight_servers:
+        if matching_intersight_server is None:
+            matching_intersight_server = _find_matching_intersight_server(intersight_servers,
+                                                                          provided_server_identifiers
+                                                                          )
+        if not matching_intersight_server:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         "There was an issue retrieving the server data "
+                         "in Intersight.\n"
+                         f"A {provided_server_object_type} with the provided "
+                         f"identifier of '{server_identifier}' was "
+                         "not found.\n"
+                         "Please check the Intersight Account named "
+                         f"{intersight_account_name}.\n"
+                         "Verify through the API or GUI that the needed "
+                         f"{provided_server_object_type} and matching "
+                         "identifier are present.\n"
+                         "If any associated Intersight Target is missing, such as "
+                         "an Intersight Managed Domain through an attached Fabric "
+                         "Interconnect pair, claiming it first may be required.\n"
+                         "Once the issue has been resolved, re-attempt "
+                         "execution.\n",
+                         extra={"server_identifier": server_identifier}
+                         )
+            sys.exit(0)
+    else:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "There was an issue retrieving the server data "
+                     "in Intersight.\n"
+                     f"The {provided_server_object_type} with the provided "
+                     f"identifier of '{server_identifier}' was not "
+                     "found.\n"
+                     f"No {provided_server_object_type}s could be found in "
+                     "the Intersight account named "
+                     f"{intersight_account_name}.\n"
+                     f"Compatible {provided_server_object_type}s need to be "
+                     f"{provided_server_connection_type}.\n"
+                     "Please check the Intersight Account named "
+                     f"{intersight_account_name}.\n"
+                     "Verify through the API or GUI that the needed "
+                     f"{provided_server_object_type} and matching "
+                     "identifier are present.\n"
+                     "If any associated Intersight Target is missing, such as an "
+                     "Intersight Managed Domain through an attached Fabric "
+                     "Interconnect pair, claiming it first may be required.\n"
+                     "Once the issue has been resolved, re-attempt execution.\n",
+                     extra={"server_identifier": server_identifier}
+                     )
+        sys.exit(0)
+    # Log name of found matching Server
+    matching_intersight_server_name = matching_intersight_server.get("Name")
+    logger.info("A matching %s named %s has been found.",
+                provided_server_object_type,
+                matching_intersight_server_name,
+                extra={"server_identifier": server_identifier,
+                       "server_moid": matching_intersight_server.get("Moid")}
+                )
+    # Create the dictionary for the provided Server Identifier
+    matching_intersight_server_moid = matching_intersight_server.get("Moid")
+    matching_intersight_server_object_type = matching_intersight_server.get("ObjectType")
+    matching_intersight_server_dictionary = {
+        "ClassId": "mo.MoRef",
+        "Moid": matching_intersight_server_moid,
+        "ObjectType": matching_intersight_server_object_type,
+        "link": f"{intersight_base_url}/compute/{provided_server_form_factor}/{matching_intersight_server_moid}"
+        }
+    return matching_intersight_server_dictionary
+
+
+# Establish function to display an error message when no server identifier is provided
+def _exit_for_missing_server_identifier():
+    """This is a function to display an error message and exit execution when
+    no server identifier has been provided for a target server.
+    """
+    logger.error("\nA configuration error has occurred!\n\n"
+                 "There was an issue retrieving the server data in "
+                 "Intersight.\n"
+                 "In order to retrieve the server data, a "
+                 "server identifier must also be provided.\n"
+                 "Please check the value provided for the "
+                 "server identifier.\n"
+                 "Once the issue has been resolved, re-attempt execution.\n")
+    sys.exit(0)
+
+
+# Establish function to retrieve target server data
+def retrieve_target_server_data(
+    intersight_api_key_id,
+    intersight_api_key,
+    server_identifier,
+    server_form_factor="Blade",
+    server_connection_type="FI-Attached",
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None,
+    server_inventory=None
+    ):
+    """
+    This is a function to retrieve data for a target server on Cisco Intersight.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        server_identifier (str):
+            The identifier of the target server.
+        server_form_factor (str):
+            Optional; The form factor of the target server. The accepted values
+            are "Blade" or "Rack". The default value is "Blade".
+        server_connection_type (str):
+            Optional; The connection type of the target server. The accepted
+            values are "FI-Attached" or "Standalone". IMM (Intersight Managed
+            Mode) environments should use "FI-Attached". The default value is
+            "FI-Attached".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        server_inventory ("IntersightServerInventory"):
+            Optional; An IntersightServerInventory class instance. If provided,
+            the target server is resolved from the cached server inventory
+            instead of retrieving the servers from Intersight. The default
+            value is None.
+
+    Returns:
+        A dictionary with the data for a target server on Cisco Intersight.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                           api_secret_file=intersight_api_key,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    if server_inventory is not None:
+        # Retrieve the cached Intersight Account name
+        intersight_account_name = server_inventory.get_account_name()
+    else:
+        try:
+            # Retrieve the Intersight Account name
+            api_client.call_api(resource_path="/iam/Accounts",
+                                method="GET",
+                                auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                )
+            response = api_client.last_response.data
+            iam_account = json.loads(response)
+            if api_client.last_response.status != 200:
+                logger.error("The provided Intersight account information could not be "
+                             "accessed.\n"
+                             "Exiting due to the Intersight account being unavailable.\n\n"
+                             "Please verify that the correct API Key ID and API Key have "
+                             "been entered, then re-attempt execution.\n")
+                sys.exit(0)
+            else:
+                intersight_account_name = iam_account["Results"][0]["Name"]
+        except Exception:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         "Unable to access the Intersight API.\n"
+                         "Exiting due to the Intersight API being unavailable.\n\n"
+                         "Please verify that the correct API Key ID and API Key have "
+                         "been entered, then re-attempt execution.\n")
+            sys.exit(0)
+    # If a Server Identifier has been provided, retrieve the targeted Server data
+    if server_identifier:
+        logger.info("The provided server identifier for retrieval is '%s'.",
+                    server_identifier,
+                    extra={"server_identifier": server_identifier}
+                    )
+        provided_server_identifiers = string_to_list_maker(server_identifier)
+        # Determine Server Form Factor and the Server Type (Target Platform or Management Mode)
+        server_search_settings = _get_server_search_settings(server_identifier,
+                                                             server_form_factor,
+                                                             server_connection_type
+                                                             )
+        # Find provided Server from the cached server inventory, if provided
+        if server_inventory is not None:
+            matching_intersight_server = server_inventory.find_server(server_search_settings,
+                                                                      provided_server_identifiers
+                                                                      )
+            return _create_target_server_dictionary(server_identifier,
+                                                    provided_server_identifiers,
+                                                    ([matching_intersight_server]
+                                                     if matching_intersight_server is not None
+                                                     else server_inventory.get_servers(server_search_settings)),
+                                                    server_search_settings,
+                                                    intersight_account_name,
+                                                    intersight_base_url,
+                                                    matching_intersight_server=matching_intersight_server
+                                                    )
+        # Find provided Server
+        retrieved_intersight_servers = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path=f"compute/{server_search_settings['Form Factor Path']}?$top=1000&$filter=ManagementMode%20eq%20%27{server_search_settings['Management Mode']}%27",
+            object_type=f"{server_search_settings['Object Type']}",
+            preconfigured_api_client=api_client
+            )
+        return _create_target_server_dictionary(server_identifier,
+                                                provided_server_identifiers,
+                                                retrieved_intersight_servers.get("Results"),
+                                                server_search_settings,
+                                                intersight_account_name,
+                                                intersight_base_url
+                                                )
+    # Display error message if no Server Identifier is provided
+    else:
+        _exit_for_missing_server_identifier()
+    
+
+# Establish function to retrieve all instances of a particular Intersight API object type one page at a time
+def iterate_intersight_objects(intersight_api_key_id,
+                               intersight_api_key,
+                               intersight_api_path,
+                               object_type="object",
+                               page_size=1000,
+                               intersight_base_url="https://www.intersight.com/api/v1",
+                               preconfigured_api_client=None
+                               ):
+    """This is a function to retrieve all objects under an available
+    Intersight API type using $top and $skip paging. The objects are yielded
+    as each page is received, so callers can process large inventories without
+    holding every page in memory.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type, optionally
+            including query options such as $filter or $select. The $top and
+            $skip query options are added for paging.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        page_size (int):
+            Optional; The number of objects retrieved per request. The default
+            value is 1000, which is the maximum supported by Intersight.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None.
+
+    Yields:
+        A dictionary for each object of the specified API type.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                           api_secret_file=intersight_api_key,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    query_separator = "&" if "?" in intersight_api_path else "?"
+    objects_skipped = 0
+    while True:
+        intersight_objects_page = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path=f"{intersight_api_path}{query_separator}$top={page_size}&$skip={objects_skipped}",
+            object_type=object_type,
+            preconfigured_api_client=api_client
+            )
+        intersight_objects = intersight_objects_page.get("Results") or []
+        yield from intersight_objects
+        if len(intersight_objects) < page_size:
+            break
+        objects_skipped += page_size
+
+
+# Establish class to cache the Intersight server inventory used to resolve target servers
+class IntersightServerInventory:
+    """This class retrieves and caches the Intersight server and server
+    settings inventory used to resolve power control target servers. Each
+    inventory is retrieved once with paged requests and indexed by server
+    identifier and MOID, so resolving a target server does not require any
+    further Intersight API requests.
+    """
+    server_select_properties = {
+        "Blades": "Moid,ObjectType,Name,Serial,Model,UserLabel,ManagementMode,OperPowerState,EquipmentChassis,RegisteredDevice",
+        "RackUnits": "Moid,ObjectType,Name,Serial,Model,UserLabel,ManagementMode,OperPowerState,RegisteredDevice"
+        }
+
+    def __init__(self,
+                 api_client,
+                 intersight_base_url="https://www.intersight.com/api/v1",
+                 page_size=1000
+                 ):
+        self.api_client = api_client
+        self.intersight_base_url = intersight_base_url
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._intersight_account_name = None
+        self._servers = {}
+        self._server_identifier_indexes = {}
+        self._servers_by_moid = {}
+        self._server_settings_moids = None
+        self._pattern_servers = {}
+        self._partial_server_identifier_indexes = {}
+        self._added_server_settings_moids = {}
+        self._retrieved_time = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client}, "
+            f"'{self.intersight_base_url}', "
+            f"{self.page_size})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {len(self._servers_by_moid)} servers"
+
+    def get_account_name(self):
+        """This function retrieves the Intersight account name once and caches
+        it.
+
+        Returns:
+            A string of the Intersight account name.
+        """
+        with self._lock:
+            if self._intersight_account_name is None:
+                iam_accounts = get_intersight_objects(intersight_api_key_id=None,
+                                                      intersight_api_key=None,
+                                                      intersight_api_path="iam/Accounts",
+                                                      object_type="Intersight Account",
+                                                      preconfigured_api_client=self.api_client
+                                                      )
+                self._intersight_account_name = iam_accounts["Results"][0]["Name"]
+            return self._intersight_account_name
+
+    def get_servers(self,
+                    server_search_settings
+                    ):
+        """This function retrieves the servers of a form factor and
+        management mode once and caches them.
+
+        Args:
+            server_search_settings (dict):
+                The search settings of the target server provided by the
+                _get_server_search_settings function.
+
+        Returns:
+            A list of Intersight server objects.
+        """
+        server_list_key = (server_search_settings["Form Factor Path"],
+                           server_search_settings["Management Mode"]
+                           )
+        with self._lock:
+            if server_list_key not in self._servers:
+                intersight_servers = list(iterate_intersight_objects(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    intersight_api_path=(f"compute/{server_search_settings['Form Factor Path']}"
+                                         f"?$filter=ManagementMode%20eq%20%27{server_search_settings['Management Mode']}%27"
+                                         f"&$select={self.server_select_properties[server_search_settings['Form Factor Path']]}"),
+                    object_type=server_search_settings["Object Type"],
+                    page_size=self.page_size,
+                    preconfigured_api_client=self.api_client
+                    ))
+                # Index the servers by serial, name, model and user label, keeping the first server for each identifier
+                server_identifier_index = {}
+                for intersight_server in intersight_servers:
+                    for server_attribute in ("Serial", "Name", "Model", "UserLabel"):
+                        server_identifier_index.setdefault(intersight_server.get(server_attribute, ""), intersight_server)
+                    self._servers_by_moid[intersight_server.get("Moid")] = intersight_server
+                server_identifier_index.pop("", None)
+                self._servers[server_list_key] = intersight_servers
+                self._server_identifier_indexes[server_list_key] = server_identifier_index
+                if self._retrieved_time is None:
+                    self._retrieved_time = time.monotonic()
+            return self._servers[server_list_key]
+
+    def find_server(self,
+                    server_search_settings,
+                    provided_server_identifiers
+                    ):
+        """This function finds the first cached server with a serial, name,
+        model or user label matching any of the provided server identifiers.
+        The result is the same as the _find_matching_intersight_server
+        function, without scanning the server list.
+
+        Args:
+            server_search_settings (dict):
+                The search settings of the target server provided by the
+                _get_server_search_settings function.
+            provided_server_identifiers (list):
+                A list of server identifiers.
+
+        Returns:
+            A dictionary of the matching Intersight server object. If there is
+            no match, None is returned.
+        """
+        server_list_key = (server_search_settings["Form Factor Path"],
+                           server_search_settings["Management Mode"]
+                           )
+        # Use the servers retrieved for a server identifier pattern or added, if the full server list has not been retrieved
+        with self._lock:
+            if server_list_key not in self._servers:
+                partial_server_identifier_index = self._partial_server_identifier_indexes.get(server_list_key, {})
+                for provided_server_identifier in provided_server_identifiers:
+                    if provided_server_identifier in partial_server_identifier_index:
+                        return partial_server_identifier_index[provided_server_identifier]
+        intersight_servers = self.get_servers(server_search_settings)
+        server_identifier_index = self._server_identifier_indexes[server_list_key]
+        matching_intersight_servers = [server_identifier_index[provided_server_identifier]
+                                       for provided_server_identifier in provided_server_identifiers
+                                       if provided_server_identifier in server_identifier_index
+                                       ]
+        if not matching_intersight_servers:
+            return None
+        if len(matching_intersight_servers) == 1:
+            return matching_intersight_servers[0]
+        # Preserve the inventory order when multiple identifiers match different servers
+        matching_intersight_server_moids = {matching_intersight_server.get("Moid")
+                                            for matching_intersight_server in matching_intersight_servers
+                                            }
+        return next(intersight_server
+                    for intersight_server in intersight_servers
+                    if intersight_server.get("Moid") in matching_intersight_server_moids
+                    )
+
+    def find_servers_matching_pattern(self,
+                                      server_search_settings,
+                                      server_identifier_pattern
+                                      ):
+        """This function finds the servers with a serial, name, model or user
+        label matching a server identifier pattern. If the full server list
+        has not been retrieved, the servers are retrieved with the OData
+        filter of the pattern and cached.
+
+        Args:
+            server_search_settings (dict):
+                The search settings of the target server provided by the
+                _get_server_search_settings function.
+            server_identifier_pattern (ServerIdentifierPattern):
+                The compiled server identifier pattern.
+
+        Returns:
+            A list of the matching Intersight server objects.
+        """
+        server_list_key = (server_search_settings["Form Factor Path"],
+                           server_search_settings["Management Mode"]
+                           )
+        pattern_odata_filter = server_identifier_pattern.get_odata_filter()
+        with self._lock:
+            if server_list_key in self._servers or pattern_odata_filter is None:
+                intersight_servers = self.get_servers(server_search_settings)
+            elif (server_list_key, server_identifier_pattern.pattern) in self._pattern_servers:
+                intersight_servers = self._pattern_servers[(server_list_key, server_identifier_pattern.pattern)]
+            else:
+                server_odata_filter = f"ManagementMode eq '{server_search_settings['Management Mode']}' and {pattern_odata_filter}"
+                intersight_servers = list(iterate_intersight_objects(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    intersight_api_path=(f"compute/{server_search_settings['Form Factor Path']}"
+                                         f"?$filter={urllib.parse.quote(server_odata_filter, safe='(),')}"
+                                         f"&$select={self.server_select_properties[server_search_settings['Form Factor Path']]}"),
+                    object_type=server_search_settings["Object Type"],
+                    page_size=self.page_size,
+                    preconfigured_api_client=self.api_client
+                    ))
+                partial_server_identifier_index = self._partial_server_identifier_indexes.setdefault(server_list_key, {})
+                for intersight_server in intersight_servers:
+                    self._servers_by_moid[intersight_server.get("Moid")] = intersight_server
+                    if intersight_server.get("Serial"):
+                        partial_server_identifier_index[intersight_server["Serial"]] = intersight_server
+                self._pattern_servers[(server_list_key, server_identifier_pattern.pattern)] = intersight_servers
+                if self._retrieved_time is None:
+                    self._retrieved_time = time.monotonic()
+        return [intersight_server
+                for intersight_server in intersight_servers
+                if server_identifier_pattern.matches(intersight_server)
+                ]
+
+    def add_server(self,
+                   server_search_settings,
+                   intersight_server,
+                   server_identifiers=(),
+                   server_settings_moid=None
+                   ):
+        """This function adds a server retrieved elsewhere, such as by the
+        coordinator of a distributed power control job, so it can be found
+        without retrieving the server inventory. The server is found by its
+        serial and by the provided server identifiers until the full server
+        list is retrieved.
+
+        Args:
+            server_search_settings (dict):
+                The search settings of the server provided by the
+                _get_server_search_settings function.
+            intersight_server (dict):
+                The Intersight server object.
+            server_identifiers (iterable):
+                Optional; The server identifiers resolved to the server. The
+                default value is an empty tuple.
+            server_settings_moid (str):
+                Optional; The MOID of the server settings of the server. The
+                default value is None.
+        """
+        server_list_key = (server_search_settings["Form Factor Path"],
+                           server_search_settings["Management Mode"]
+                           )
+        with self._lock:
+            partial_server_identifier_index = self._partial_server_identifier_indexes.setdefault(server_list_key, {})
+            for server_identifier in (intersight_server.get("Serial"), *server_identifiers):
+                if server_identifier:
+                    partial_server_identifier_index[server_identifier] = intersight_server
+            self._servers_by_moid[intersight_server.get("Moid")] = intersight_server
+            if server_settings_moid:
+                self._added_server_settings_moids[intersight_server.get("Moid")] = server_settings_moid
+
+    def set_account_name(self,
+                         intersight_account_name
+                         ):
+        """This function sets the cached Intersight account name, so it is not
+        retrieved.
+        """
+        with self._lock:
+            self._intersight_account_name = intersight_account_name
+
+    def get_server(self,
+                   server_moid
+                   ):
+        """This function retrieves a cached server by MOID.
+
+        Args:
+            server_moid (str):
+                The MOID of the server.
+
+        Returns:
+            A dictionary of the Intersight server object. If the server has
+            not been cached, None is returned.
+        """
+        return self._servers_by_moid.get(server_moid)
+
+    def update_server_power_state(self,
+                                  server_moid,
+                                  oper_power_state
+                                  ):
+        """This function updates the cached power state of a server after a
+        power control operation, so later operations are not skipped based on
+        the power state retrieved before it.
+
+        Args:
+            server_moid (str):
+                The MOID of the server.
+            oper_power_state (str):
+                The resulting OperPowerState of the server. If None is
+                provided, the cached power state is removed, so the server is
+                never considered to be in the desired power state.
+        """
+        with self._lock:
+            intersight_server = self._servers_by_moid.get(server_moid)
+            if intersight_server is None:
+                return
+            if oper_power_state is None:
+                intersight_server.pop("OperPowerState", None)
+            else:
+                intersight_server["OperPowerState"] = oper_power_state
+
+    def get_server_settings_moid(self,
+                                 server_moid
+                                 ):
+        """This function retrieves the MOID of the server settings of a server.
+        The server settings inventory is retrieved once and cached.
+
+        Args:
+            server_moid (str):
+                The MOID of the server.
+
+        Returns:
+            A string of the MOID for the server settings. If no server settings
+            are found for the server, None is returned.
+        """
+        with self._lock:
+            if server_moid in self._added_server_settings_moids:
+                return self._added_server_settings_moids[server_moid]
+            if self._server_settings_moids is None:
+                self._server_settings_moids = {
+                    server_settings.get("Server", {}).get("Moid"): server_settings.get("Moid")
+                    for server_settings in iterate_intersight_objects(
+                        intersight_api_key_id=None,
+                        intersight_api_key=None,
+                        intersight_api_path=f"{ServerSettingsPowerState.intersight_api_path}?$select=Moid,Server",
+                        object_type=ServerSettingsPowerState.object_type,
+                        page_size=self.page_size,
+                        preconfigured_api_client=self.api_client
+                        )
+                    }
+            return self._server_settings_moids.get(server_moid)
+
+    def refresh(self):
+        """This function clears the cached inventory, so it is retrieved again
+        on next use.
+        """
+        with self._lock:
+            self._servers.clear()
+            self._server_identifier_indexes.clear()
+            self._servers_by_moid.clear()
+            self._server_settings_moids = None
+            self._pattern_servers.clear()
+            self._partial_server_identifier_indexes.clear()
+            self._added_server_settings_moids.clear()
+            self._retrieved_time = None
+
+    def get_age_seconds(self):
+        """This function returns the number of seconds since the cached
+        inventory was first retrieved, or None if nothing has been retrieved.
+        """
+        with self._lock:
+            if self._retrieved_time is None:
+                return None
+            return time.monotonic() - self._retrieved_time
+
+
+# Establish function to compile object variable value maps into lookup tables
+def _compile_object_variable_value_maps(object_variable_value_maps):
+    """This is a function to compile object variable value maps into lookup
+    tables. Each frontend and backend value is lowercased and stripped of
+    spaces once, so a provided value only needs to be normalized the same
+    way and looked up.
+
+    Args:
+        object_variable_value_maps (list):
+            A list of object variable value maps, as defined by the
+            object_variable_value_maps attribute of a class.
+
+    Returns:
+        A dictionary with a lookup table for each object variable name. Each
+        lookup table maps the normalized frontend and backend values to the
+        backend value.
+    """
+    object_variable_value_lookups = {}
+    for object_variable in object_variable_value_maps:
+        object_variable_value_lookup = {}
+        for object_variable_value in object_variable["Values"]:
+            for known_frontend_or_backend_value in object_variable_value.values():
+                object_variable_value_lookup.setdefault(
+                    "".join(known_frontend_or_backend_value.lower().split()),
+                    object_variable_value["BackEndValue"]
+                    )
+        object_variable_value_lookups[object_variable["VariableName"]] = object_variable_value_lookup
+    return object_variable_value_lookups
+
+
+# Establish classes and functions to control the power state of UCS servers
+class ServerSettingsPowerState:
+    """This class is used to control the power state of UCS servers in Intersight.
+    """
+    object_type = "Server Settings (Power State Only)"
+    intersight_api_path = "compute/ServerSettings"
+    object_variable_value_maps = [
+        {"VariableName": "power_control_state",
+         "Description": "Power Control State",
+         "AttributeName": "AdminPowerState",
+         "Values": [
+             {"FrontEndValue": "Power On",
+              "BackEndValue": "PowerOn"
+              },
+             {"FrontEndValue": "Power Off",
+              "BackEndValue": "PowerOff"
+              },
+             {"FrontEndValue": "Power Cycle",
+              "BackEndValue": "PowerCycle"
+              },
+             {"FrontEndValue": "Hard Reset",
+              "BackEndValue": "HardReset"
+              },
+             {"FrontEndValue": "Shutdown",
+              "BackEndValue": "Shutdown"
+              },
+             {"FrontEndValue": "Reboot CIMC",
+              "BackEndValue": "Reboot"
+              }
+             ]
+         }
+        ]
+    object_variable_value_lookups = _compile_object_variable_value_maps(object_variable_value_maps)
+    # The API bodies built from the mapped object attributes, keyed by the provided values and stored as read-only mappings copied to each instance
+    _intersight_api_body_cache = {}
+    expected_oper_power_states = {
+        "PowerOn": "on",
+        "PowerOff": "off",
+        "Shutdown": "off"
+        }
+    server_api_paths = {
+        "compute.Blade": "compute/Blades",
+        "compute.RackUnit": "compute/RackUnits"
+        }
+    
+    def __init__(
+        self,
+        intersight_api_key_id,
+        intersight_api_key,
+        power_control_target_server_id_dictionary,
+        power_control_state,
+        intersight_base_url="https://www.intersight.com/api/v1",
+        preconfigured_api_client=None,
+        server_inventory=None,
+        force_power_control=False
+        ):
+        self.intersight_api_key_id = intersight_api_key_id
+        self.intersight_api_key = intersight_api_key
+        self.power_control_target_server_id_dictionary = power_control_target_server_id_dictionary
+        # A power control state provided with the target server overrides the power control state of the run
+        self.power_control_state = power_control_target_server_id_dictionary.get("Power Control State", power_control_state)
+        self.intersight_base_url = intersight_base_url
+        if preconfigured_api_client is None:
+            self.api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                                    api_secret_file=intersight_api_key,
+                                                    endpoint=intersight_base_url
+                                                    )
+        else:
+            self.api_client = preconfigured_api_client
+        self.server_inventory = server_inventory
+        self.force_power_control = force_power_control
+        self.intersight_api_body = {}
+        self.post_succeeded = None
+        self.post_skipped = False
+        self.post_http_status = None
+        self.post_latency_seconds = None
+        self.server_moid_and_data = None
+        self.server_settings_moid = None
+        self.post_submitted_time = None
+        self.completion_status = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.intersight_api_key_id}', "
+            f"'{self.intersight_api_key}', "
+            f"'{self.power_control_target_server_id_dictionary}', "
+            f"'{self.power_control_state}', "
+            f"'{self.intersight_base_url}', "
+            f"{self.api_client})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.power_control_target_server_id_dictionary}'"
+
+    @classmethod
+    def is_in_desired_state(cls,
+                            power_control_state,
+                            intersight_server
+                            ):
+        """This function checks whether a server is already in the power state
+        resulting from a power control state, based on the OperPowerState of
+        the server. Power control states without a known resulting power state,
+        such as "Power Cycle" or "Reboot CIMC", are never considered to be in
+        the desired state.
+
+        Args:
+            power_control_state (str):
+                The frontend or backend value of the power control state.
+            intersight_server (dict):
+                The server object retrieved from Intersight.
+
+        Returns:
+            A boolean indicating whether the server is already in the desired
+            power state.
+        """
+        if not intersight_server or not isinstance(power_control_state, str):
+            return False
+        backend_power_control_state = cls.object_variable_value_lookups["power_control_state"].get(
+            "".join(power_control_state.lower().split())
+            )
+        expected_oper_power_state = cls.expected_oper_power_states.get(backend_power_control_state)
+        return bool(expected_oper_power_state) and intersight_server.get("OperPowerState") == expected_oper_power_state
+
+    def _post_intersight_object(self):
+        """This is a function to configure an Intersight object by
+        performing a POST through the Intersight API.
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+            
+        Raises:
+            Exception:
+                An exception occurred while performing the API call.
+                The status code or error message will be specified.
+        """
+        # Capture Target Server ID info
+        power_control_target_server_id = self.power_control_target_server_id_dictionary.get("Server Identifier")
+        power_control_target_server_form_factor = self.power_control_target_server_id_dictionary.get("Server Form Factor", "Blade")
+        power_control_target_server_connection_type = self.power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached")
+        logger.info("\nConfiguring the %s for the target server ID: %s...",
+                    self.object_type,
+                    power_control_target_server_id,
+                    extra={"server_identifier": power_control_target_server_id,
+                           "power_control_state": self.power_control_state}
+                    )
+        with trace_span("power_control_target",
+                        server_identifier=power_control_target_server_id,
+                        power_control_state=self.power_control_state
+                        ):
+            # Retrieve the provided Target Server MOID and data
+            with trace_span("resolve"):
+                power_control_target_server_moid_and_data = retrieve_target_server_data(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    server_identifier=power_control_target_server_id,
+                    server_form_factor=power_control_target_server_form_factor,
+                    server_connection_type=power_control_target_server_connection_type,
+                    preconfigured_api_client=self.api_client,
+                    server_inventory=self.server_inventory
+                    )
+                self.server_moid_and_data = power_control_target_server_moid_and_data
+                record_run_journal_entry(self, "Resolved")
+            # Skip the target server if the inventory shows it is already in the desired power state
+            if (
+                self.server_inventory is not None
+                and not self.force_power_control
+                and self.is_in_desired_state(self.intersight_api_body.get("AdminPowerState"),
+                                             self.server_inventory.get_server(power_control_target_server_moid_and_data["Moid"])
+                                             )
+                ):
+                logger.info("The target server ID %s is already in the desired power "
+                            "state. Skipping the %s configuration.",
+                            power_control_target_server_id,
+                            self.object_type,
+                            extra={"server_identifier": power_control_target_server_id,
+                                   "power_control_state": self.power_control_state}
+                            )
+                self.post_skipped = True
+                return "The POST method was skipped."
+            # Retrieve the provided Target Server underlying Server Settings MOID
+            with trace_span("lookup"):
+                power_control_target_server_compute_server_settings_moid = None
+                if self.server_inventory is not None:
+                    power_control_target_server_compute_server_settings_moid = self.server_inventory.get_server_settings_moid(
+                        power_control_target_server_moid_and_data["Moid"]
+                        )
+                if power_control_target_server_compute_server_settings_moid is None:
+                    power_control_target_server_compute_server_settings_moid = advanced_intersight_object_moid_retriever(
+                        intersight_api_key_id=None,
+                        intersight_api_key=None,
+                        object_attributes={
+                            "Server": power_control_target_server_moid_and_data
+                            },
+                        intersight_api_path=f"{self.intersight_api_path}?$top=1000",
+                        object_type=self.object_type,
+                        preconfigured_api_client=self.api_client
+                        )
+                self.server_settings_moid = power_control_target_server_compute_server_settings_moid
+            
+            full_intersight_api_path = f"/{self.intersight_api_path}/{power_control_target_server_compute_server_settings_moid}"
+            with trace_span("post") as post_span:
+                post_start_time = time.perf_counter()
+                self.post_submitted_time = datetime.datetime.now(datetime.timezone.utc)
+                try:
+                    self.api_client.call_api(resource_path=full_intersight_api_path,
+                                             method="POST",
+                                             body=self.intersight_api_body,
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    self.post_latency_seconds = time.perf_counter() - post_start_time
+                    self.post_http_status = getattr(self.api_client.last_response, "status", None)
+                    # Prefer the modification time of the server settings, as it uses the clock of Intersight
+                    with contextlib.suppress(Exception):
+                        self.post_submitted_time = (
+                            _parse_intersight_timestamp(json.loads(self.api_client.last_response.data).get("ModTime"))
+                            or self.post_submitted_time
+                            )
+                    logger.info("The configuration of the base %s has completed.",
+                                self.object_type,
+                                extra={"server_identifier": power_control_target_server_id,
+                                       "power_control_state": self.power_control_state}
+                                )
+                    # Update the cached power state of the target server, so a later power control state is not skipped
+                    if self.server_inventory is not None:
+                        self.server_inventory.update_server_power_state(
+                            power_control_target_server_moid_and_data["Moid"],
+                            self.expected_oper_power_states.get(self.intersight_api_body.get("AdminPowerState"))
+                            )
+                    self.post_succeeded = True
+                    return "The POST method was successful."
+                except Exception as post_exception:
+                    self.post_latency_seconds = time.perf_counter() - post_start_time
+                    self.post_http_status = getattr(post_exception, "status", None)
+                    # Mark the span of the failed POST, as the exception is not raised through it
+                    if post_span is not None:
+                        post_span["status"] = "ERROR"
+                        post_span["attributes"]["exception.type"] = type(post_exception).__name__
+                    logger.error("\nA configuration error has occurred!\n\n"
+                                 f"Unable to configure the {self.object_type} under the "
+                                 "Intersight API resource path "
+                                 f"'{full_intersight_api_path}'.\n\n"
+                                 "Exception Message: ",
+                                 exc_info=True,
+                                 extra={"server_identifier": power_control_target_server_id,
+                                        "power_control_state": self.power_control_state}
+                                 )
+                    self.post_succeeded = False
+                    return "The POST method failed."
+
+    async def _async_post_intersight_object(self):
+        """This is the asynchronous counterpart of the _post_intersight_object
+        function. The api_client of the class instance must be an
+        AsyncIntersightApiClient class instance.
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
+        # Capture Target Server ID info
+        power_control_target_server_id = self.power_control_target_server_id_dictionary.get("Server Identifier")
+        power_control_target_server_form_factor = self.power_control_target_server_id_dictionary.get("Server Form Factor", "Blade")
+        power_control_target_server_connection_type = self.power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached")
+        logger.info("\nConfiguring the %s for the target server ID: %s...",
+                    self.object_type,
+                    power_control_target_server_id,
+                    extra={"server_identifier": power_control_target_server_id,
+                           "power_control_state": self.power_control_state}
+                    )
+        with trace_span("power_control_target",
+                        server_identifier=power_control_target_server_id,
+                        power_control_state=self.power_control_state
+                        ):
+            # Retrieve the provided Target Server MOID and data
+            with trace_span("resolve"):
+                power_control_target_server_moid_and_data = await async_retrieve_target_server_data(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    server_identifier=power_control_target_server_id,
+                    server_form_factor=power_control_target_server_form_factor,
+                    server_connection_type=power_control_target_server_connection_type,
+                    intersight_base_url=self.intersight_base_url,
+                    preconfigured_api_client=self.api_client
+                    )
+                self.server_moid_and_data = power_control_target_server_moid_and_data
+                record_run_journal_entry(self, "Resolved")
+            # Skip the target server if the retrieved server shows it is already in the desired power state
+            if (
+                not self.force_power_control
+                and self.is_in_desired_state(self.intersight_api_body.get("AdminPowerState"),
+                                             self.api_client.get_server(power_control_target_server_moid_and_data["Moid"])
+                                             )
+                ):
+                logger.info("The target server ID %s is already in the desired power "
+                            "state. Skipping the %s configuration.",
+                            power_control_target_server_id,
+                            self.object_type,
+                            extra={"server_identifier": power_control_target_server_id,
+                                   "power_control_state": self.power_control_state}
+                            )
+                self.post_skipped = True
+                return "The POST method was skipped."
+            # Retrieve the provided Target Server underlying Server Settings MOID
+            with trace_span("lookup"):
+                power_control_target_server_compute_server_settings_moid = await self.api_client.get_server_settings_moid(
+                    power_control_target_server_moid_and_data["Moid"]
+                    )
+                if power_control_target_server_compute_server_settings_moid is None:
+                    power_control_target_server_compute_server_settings_moid = await async_advanced_intersight_object_moid_retriever(
+                        intersight_api_key_id=None,
+                        intersight_api_key=None,
+                        object_attributes={
+                            "Server": power_control_target_server_moid_and_data
+                            },
+                        intersight_api_path=f"{self.intersight_api_path}?$top=1000",
+                        object_type=self.object_type,
+                        preconfigured_api_client=self.api_client
+                        )
+                self.server_settings_moid = power_control_target_server_compute_server_settings_moid
+
+            full_intersight_api_path = f"/{self.intersight_api_path}/{power_control_target_server_compute_server_settings_moid}"
+            with trace_span("post") as post_span:
+                post_start_time = time.perf_counter()
+                try:
+                    api_response = await self.api_client.call_api(resource_path=full_intersight_api_path,
+                                                                  method="POST",
+                                                                  body=self.intersight_api_body
+                                                                  )
+                    self.post_latency_seconds = time.perf_counter() - post_start_time
+                    self.post_http_status = getattr(api_response, "status", None)
+                    logger.info("The configuration of the base %s has completed.",
+                                self.object_type,
+                                extra={"server_identifier": power_control_target_server_id,
+                                       "power_control_state": self.power_control_state}
+                                )
+                    self.post_succeeded = True
+                    return "The POST method was successful."
+                except Exception as post_exception:
+                    self.post_latency_seconds = time.perf_counter() - post_start_time
+                    self.post_http_status = getattr(post_exception, "status", None)
+                    # Mark the span of the failed POST, as the exception is not raised through it
+                    if post_span is not None:
+                        post_span["status"] = "ERROR"
+                        post_span["attributes"]["exception.type"] = type(post_exception).__name__
+                    logger.error("\nA configuration error has occurred!\n\n"
+                                 f"Unable to configure the {self.object_type} under the "
+                                 "Intersight API resource path "
+                                 f"'{full_intersight_api_path}'.\n\n"
+                                 "Exception Message: ",
+                                 exc_info=True,
+                                 extra={"server_identifier": power_control_target_server_id,
+                                        "power_control_state": self.power_control_state}
+                                 )
+                    self.post_succeeded = False
+                    return "The POST method failed."
+
+    def _update_api_body_mapped_object_attributes(self):
+        """This function updates the Intersight API body with individual
+        attributes that require mapping frontend to backend values for
+        compatibility with the Intersight API. The values are mapped with the
+        lookup tables compiled at class definition, and the resulting API body
+        is built once for each set of provided values. Each instance receives
+        its own copy of the cached API body, so changes to the API body of one
+        instance do not affect the others.
+
+        Raises:
+            Exception:
+                An exception occurred while reformatting a provided value for
+                an attribute. The issue will likely be due to the provided
+                value not being in string format. Changing the value to string
+                format should resolve the exception.
+        """
+        # Check for object variables with value maps that need configuration
+        if not self.object_variable_value_maps:
+            return
+        # Retrieve the user provided object variable values
+        provided_object_variable_values = tuple(getattr(self, object_variable["VariableName"])
+                                                for object_variable
+                                                in self.object_variable_value_maps
+                                                )
+        # Reuse the API body previously built for the same provided object variable values
+        try:
+            cached_intersight_api_body = self._intersight_api_body_cache.get(provided_object_variable_values)
+        except TypeError:
+            cached_intersight_api_body = None
+        if cached_intersight_api_body is not None:
+            self.intersight_api_body = dict(cached_intersight_api_body)
+            return
+        for object_variable, provided_object_variable_value in zip(self.object_variable_value_maps,
+                                                                   provided_object_variable_values
+                                                                   ):
+            # Create list of all known and accepted frontend values
+            all_known_and_accepted_frontend_values = (object_variable_value["FrontEndValue"]
+                                                      for
+                                                      object_variable_value
+                                                      in
+                                                      object_variable["Values"]
+                                                      )
+            # Reformat the user provided object variable value to lowercase and remove spaces to prevent potential format issues
+            try:
+                reformatted_object_variable_value = "".join(provided_object_variable_value.lower().split())
+            except Exception:
+                # Log list of all known and accepted frontend values for user
+                logger.error("\nA configuration error has occurred!\n\n"
+                             f"During the configuration of the {self.object_type} for "
+                             "the target server ID "
+                             f"{self.power_control_target_server_id_dictionary.get('Server Identifier')}, "
+                             "there was an issue with the value provided for the "
+                             f"{object_variable['Description']} setting.\n"
+                             f"The value provided was {provided_object_variable_value}.\n"
+                             "To proceed, the value provided for the "
+                             f"{object_variable['Description']} setting should be updated to "
+                             "an accepted string format.\n"
+                             "The recommended values are the following:\n\n"
+                             f"{', '.join(all_known_and_accepted_frontend_values)}\n\n"
+                             "Please update the configuration, then re-attempt "
+                             "execution.\n")
+                sys.exit(0)
+            # Match provided object variable value to backend value
+            backend_object_variable_value = self.object_variable_value_lookups[object_variable["VariableName"]].get(
+                reformatted_object_variable_value
+                )
+            if backend_object_variable_value is None:
+                # If no backend match is found with the user provided object variable value, pass on the user provided object variable value to Intersight to decide
+                logger.warning("\nWARNING: An unknown %s value of "
+                               "'%s' has been "
+                               "provided for the %s "
+                               "settings!\n"
+                               "An attempt will be made to configure the unknown "
+                               "%s value.\n"
+                               "If there is an error, please use one of the "
+                               "following known values for the "
+                               "%s settings, then "
+                               "re-attempt execution:\n\n"
+                               "%s",
+                               self.object_type,
+                               provided_object_variable_value,
+                               object_variable["Description"],
+                               object_variable["Description"],
+                               object_variable["Description"],
+                               ", ".join(all_known_and_accepted_frontend_values)
+                               )
+                backend_object_variable_value = provided_object_variable_value
+            # Update Intersight API body with the converted object variable value
+            self.intersight_api_body[object_variable["AttributeName"]] = backend_object_variable_value
+        self._intersight_api_body_cache[provided_object_variable_values] = types.MappingProxyType(dict(self.intersight_api_body))
+                
+    def object_maker(self):
+        """This function makes the targeted object.
+        """
+        # Update the API body with individual mapped object attributes
+        self._update_api_body_mapped_object_attributes()
+        # POST the API body to Intersight
+        self._post_intersight_object()
+
+    async def async_object_maker(self):
+        """This is the asynchronous counterpart of the object_maker function.
+        """
+        # Update the API body with individual mapped object attributes
+        self._update_api_body_mapped_object_attributes()
+        # POST the API body to Intersight
+        await self._async_post_intersight_object()
+
+
+def update_power_state(
+    intersight_api_key_id,
+    intersight_api_key,
+    power_control_target_server_id_dictionary,
+    power_control_state,
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None,
+    server_inventory=None,
+    force_power_control=False,
+    wait_for_completion=False,
+    completion_timeout=900,
+    completion_poll_interval=10,
+    completion_event_source=None,
+    on_submitted=None
+    ):
+    """This is a function used to update the power state of a UCS server on
+    Cisco Intersight.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        power_control_target_server_id_dictionary (dict):
+            A dictionary containing the target server data. Required keys
+            include "Server Identifier", "Server Form Factor", and
+            "Server Connection Type". For the "Server Identifier" key, the
+            accepted values are the Server serial, name, model, or PID
+            (product ID). This information can be found in Intersight, if
+            needed. For the "Server Form Factor" key, the options are "Blade or
+            "Rack". For the "Server Connection Type" key, the options are
+            "FI-Attached" or "Standalone". An optional "Power Control State"
+            key overrides the power_control_state argument for the target
+            server.
+        power_control_state (str):
+            The desired power state of the target UCS server. The accepted 
+            values include "Power On", "Power Off", "Power Cycle",
+            "Hard Reset", "Shutdown", and "Reboot CIMC". The "Reboot CIMC"
+            operation restarts the CIMC only, all other operations are directly
+            on the server.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        server_inventory ("IntersightServerInventory"):
+            Optional; An IntersightServerInventory class instance used to
+            resolve the target server and its server settings from a cached
+            inventory. The default value is None.
+        force_power_control (bool):
+            Optional; Submit the power control operation even if the server
+            inventory shows the target server is already in the desired power
+            state. The default value is False.
+        wait_for_completion (bool):
+            Optional; Wait for the submitted power control operation to
+            complete before returning. The default value is False.
+        completion_timeout (int):
+            Optional; The maximum number of seconds to wait for the power
+            control operation to complete. The default value is 900.
+        completion_poll_interval (int):
+            Optional; The number of seconds between completion polls. The
+            default value is 10.
+        completion_event_source ("PowerControlCompletionEvents"):
+            Optional; A PowerControlCompletionEvents class instance providing
+            Intersight change events, used to detect completion without
+            polling. The default value is None.
+        on_submitted (function):
+            Optional; A function called with the ServerSettingsPowerState
+            class instance as soon as the power control operation has been
+            submitted, skipped or has failed, before waiting for completion.
+            The default value is None.
+
+    Returns:
+        The ServerSettingsPowerState class instance of the power control
+        operation.
+    """
+    def builder(target_object):
+        """This is a function used to build the objects that are components of
+        an overarching pool, policy, profile, template or related object on
+        Cisco Intersight.
+
+        Args:
+            target_object (class):
+                The class representing the object to be built on Intersight.
+
+        Raises:
+            Exception:
+                An exception occurred due to an issue accessing the Intersight
+                API path. The status code or error message will be specified.
+        """
+        try:
+            target_object.object_maker()
+        except Exception:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         "The builder function failed to configure the "
+                         f"{target_object.object_type} settings.\n"
+                         "Please check the provided arguments for the "
+                         f"{target_object.object_type} settings.\n\n"
+                         "Exception Message: ",
+                         exc_info=True
+                         )
+
+    # Define the Server Settings object
+    server_settings_power_state = ServerSettingsPowerState(
+        intersight_api_key_id=intersight_api_key_id,
+        intersight_api_key=intersight_api_key,
+        power_control_target_server_id_dictionary=power_control_target_server_id_dictionary,
+        power_control_state=power_control_state,
+        intersight_base_url=intersight_base_url,
+        preconfigured_api_client=preconfigured_api_client,
+        server_inventory=server_inventory,
+        force_power_control=force_power_control
+        )
+
+    # Create the Server Settings object in Intersight
+    with record_power_control_operation(server_settings_power_state):
+        builder(server_settings_power_state)
+    record_run_journal_entry(server_settings_power_state)
+    if on_submitted is not None:
+        on_submitted(server_settings_power_state)
+
+    # Wait for the power control operation to complete, if enabled
+    if wait_for_completion and server_settings_power_state.post_succeeded:
+        power_control_target_server_id = power_control_target_server_id_dictionary.get("Server Identifier")
+        with trace_span("completion", server_identifier=power_control_target_server_id):
+            server_settings_power_state.completion_status = wait_for_power_control_completion(
+                server_settings_power_state,
+                completion_timeout=completion_timeout,
+                poll_interval=completion_poll_interval,
+                completion_event_source=completion_event_source
+                )
+        # Remove the cached power state of a target server whose power control operation did not complete
+        if server_inventory is not None and not server_settings_power_state.completion_status["Completed"]:
+            server_inventory.update_server_power_state(server_settings_power_state.server_moid_and_data["Moid"], None)
+        if server_settings_power_state.completion_status["Completed"]:
+            record_run_journal_entry(server_settings_power_state, "Completed")
+        elif server_settings_power_state.completion_status["Failed"]:
+            record_run_journal_entry(server_settings_power_state, "Failed")
+            logger.error("The power control operation for the target server ID %s "
+                         "failed with the workflow status %s.",
+                         power_control_target_server_id,
+                         server_settings_power_state.completion_status["Workflow Status"]
+                         )
+        else:
+            logger.warning("The power control operation for the target server ID %s "
+                           "did not complete within %s seconds.",
+                           power_control_target_server_id,
+                           completion_timeout
+                           )
+    record_power_control_result(server_settings_power_state)
+    return server_settings_power_state
+
+
+# Establish class to collect Intersight change events for power control completion
+class PowerControlCompletionEvents:
+    """This class collects Intersight change events for the objects touched by
+    power control operations and wakes up the operations waiting for them.
+    Events are keyed by the MOID of the changed object and, for workflow
+    events, by the MOID of the associated server. It can be used directly as a
+    local, in-memory event source by publishing events with the publish
+    function, such as in tests.
+    """
+    event_object_types = ("compute.ServerSetting", "compute.Blade", "compute.RackUnit", "workflow.WorkflowInfo")
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._event_sequence = 0
+        self._latest_events = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {len(self._latest_events)} event keys"
+
+    @property
+    def event_sequence(self):
+        """The sequence number of the latest published event."""
+        with self._condition:
+            return self._event_sequence
+
+    def publish(self,
+                intersight_event
+                ):
+        """This function publishes an Intersight change event. Both an
+        Intersight webhook payload with the changed object under the "Event"
+        key and the changed object itself are accepted. Events for other
+        object types are ignored.
+
+        Args:
+            intersight_event (dict):
+                The Intersight change event.
+
+        Returns:
+            A boolean indicating whether the event was accepted.
+        """
+        intersight_object = intersight_event.get("Event") if isinstance(intersight_event.get("Event"), dict) else intersight_event
+        if intersight_object.get("ObjectType") not in self.event_object_types:
+            return False
+        event_keys = [intersight_object.get("Moid")]
+        if intersight_object.get("ObjectType") == "workflow.WorkflowInfo":
+            event_keys.append((intersight_object.get("AssociatedObject") or {}).get("Moid"))
+        with self._condition:
+            self._event_sequence += 1
+            for event_key in event_keys:
+                if event_key:
+                    self._latest_events[event_key] = (self._event_sequence, intersight_object)
+            self._condition.notify_all()
+        return True
+
+    def wait_for_event(self,
+                       event_keys,
+                       after_sequence,
+                       timeout
+                       ):
+        """This function waits for an event newer than a sequence number for
+        any of the provided MOIDs.
+
+        Args:
+            event_keys (list):
+                The MOIDs of the objects to wait for.
+            after_sequence (int):
+                Only events published after this sequence number are returned.
+            timeout (float):
+                The maximum number of seconds to wait.
+
+        Returns:
+            A tuple of the sequence number and changed object of the newest
+            matching event, or None if no event arrived before the timeout.
+        """
+        def find_newest_event():
+            matching_events = [self._latest_events[event_key]
+                               for event_key in event_keys
+                               if event_key in self._latest_events
+                               and self._latest_events[event_key][0] > after_sequence
+                               ]
+            return max(matching_events, key=lambda matching_event: matching_event[0], default=None)
+
+        with self._condition:
+            self._condition.wait_for(find_newest_event, timeout=max(timeout, 0))
+            return find_newest_event()
+
+
+# Establish class to receive Intersight webhook events for power control completion
+class IntersightWebhookReceiver(PowerControlCompletionEvents):
+    """This class receives Intersight webhook events on a local HTTP port and
+    publishes them for the power control operations waiting for completion.
+    An Intersight webhook subscription for the compute.ServerSetting,
+    compute.Blade, compute.RackUnit and workflow.WorkflowInfo object types
+    needs to point at the address of the receiver. If a webhook secret is
+    provided, the Digest header and the HMAC-SHA256 HTTP signature of each
+    event are verified and unsigned events are rejected.
+    """
+    def __init__(self,
+                 webhook_secret=""
+                 ):
+        super().__init__()
+        self.webhook_secret = webhook_secret
+        self._webhook_http_server = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def verify_signature(self,
+                         request_method,
+                         request_path,
+                         request_headers,
+                         request_body
+                         ):
+        """This function verifies the Digest header and the HMAC-SHA256 HTTP
+        signature of a webhook event with the webhook secret.
+
+        Returns:
+            A boolean indicating whether the webhook event is authentic.
+        """
+        if not self.webhook_secret:
+            return True
+        expected_digest = "SHA-256=" + base64.b64encode(hashlib.sha256(request_body).digest()).decode()
+        if not hmac.compare_digest(request_headers.get("Digest", ""), expected_digest):
+            return False
+        signature_parameters = dict(
+            re.findall(r'(\w+)="([^"]*)"', request_headers.get("Authorization", "") or request_headers.get("Signature", ""))
+            )
+        if not signature_parameters.get("signature"):
+            return False
+        signing_string = "\n".join(
+            f"(request-target): {request_method.lower()} {request_path}"
+            if signed_header == "(request-target)"
+            else f"{signed_header}: {request_headers.get(signed_header, '')}"
+            for signed_header in signature_parameters.get("headers", "date").split()
+            )
+        expected_signature = base64.b64encode(
+            hmac.new(self.webhook_secret.encode(), signing_string.encode(), hashlib.sha256).digest()
+            ).decode()
+        return hmac.compare_digest(signature_parameters["signature"], expected_signature)
+
+    def start(self,
+              port,
+              address="127.0.0.1"
+              ):
+        """This function starts receiving webhook events on a local HTTP
+        port. The server runs in a daemon thread.
+
+        Args:
+            port (int):
+                The local port to listen on.
+            address (str):
+                Optional; The local address to listen on. The default value
+                is "127.0.0.1".
+
+        Returns:
+            The running ThreadingHTTPServer class instance.
+        """
+        webhook_receiver = self
+
+        class WebhookRequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                request_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if not webhook_receiver.verify_signature(self.command, self.path, self.headers, request_body):
+                    logger.warning("Rejected an Intersight webhook event with an invalid signature.")
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+                try:
+                    intersight_event = json.loads(request_body)
+                except ValueError:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                if isinstance(intersight_event, dict):
+                    webhook_receiver.publish(intersight_event)
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self._webhook_http_server = http.server.ThreadingHTTPServer((address, port), WebhookRequestHandler)
+        threading.Thread(target=self._webhook_http_server.serve_forever,
+                         name="intersight-webhook-receiver",
+                         daemon=True
+                         ).start()
+        return self._webhook_http_server
+
+    def stop(self):
+        """This function stops receiving webhook events, if running.
+        """
+        if self._webhook_http_server is not None:
+            self._webhook_http_server.shutdown()
+            self._webhook_http_server.server_close()
+            self._webhook_http_server = None
+
+
+# Establish function to parse an Intersight timestamp
+def _parse_intersight_timestamp(intersight_timestamp):
+    """This is a function to parse a timestamp of an Intersight object, such
+    as "2024-05-01T12:30:45.123Z".
+
+    Args:
+        intersight_timestamp (str):
+            The timestamp of the Intersight object.
+
+    Returns:
+        A timezone-aware datetime in UTC, or None if the timestamp could not
+        be parsed.
+    """
+    if not isinstance(intersight_timestamp, str) or not intersight_timestamp:
+        return None
+    try:
+        parsed_timestamp = datetime.datetime.fromisoformat(intersight_timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        # Python versions before 3.11 only accept 3 or 6 fractional digits
+        try:
+            parsed_timestamp = datetime.datetime.strptime(intersight_timestamp[:19], "%Y-%m-%dT%H:%M:%S")
+        except ValueError:
+            return None
+    if parsed_timestamp.tzinfo is None:
+        parsed_timestamp = parsed_timestamp.replace(tzinfo=datetime.timezone.utc)
+    return parsed_timestamp.astimezone(datetime.timezone.utc)
+
+
+# Establish function to update the completion status of a power control operation from an observed object
+def _update_power_control_completion_status(completion_status,
+                                            observed_object,
+                                            expected_oper_power_state,
+                                            submitted_time=None
+                                            ):
+    """This is a function to update the completion status of a power control
+    operation from an observed server, server settings or workflow object. A
+    workflow completes the operation only if it has the COMPLETED status, and
+    fails it if it has the FAILED, TERMINATED or TIME_OUT status. Workflows
+    started before the power control operation was submitted are ignored.
+    """
+    observed_object_type = observed_object.get("ObjectType")
+    if observed_object_type == "workflow.WorkflowInfo":
+        workflow_start_time = _parse_intersight_timestamp(observed_object.get("StartTime")
+                                                          or observed_object.get("CreateTime")
+                                                          )
+        if submitted_time is not None and (workflow_start_time is None or workflow_start_time < submitted_time):
+            return
+        completion_status["Workflow Status"] = observed_object.get("Status")
+        workflow_status = str(completion_status["Workflow Status"]).upper()
+        if workflow_status == "COMPLETED":
+            completion_status["Completed"] = True
+        elif workflow_status in ("FAILED", "TERMINATED", "TIME_OUT"):
+            completion_status["Failed"] = True
+    elif observed_object_type == "compute.ServerSetting":
+        completion_status["Config State"] = observed_object.get("ConfigState")
+        if not expected_oper_power_state:
+            completion_status["Completed"] = completion_status["Config State"] not in (None, "", "Applying")
+    elif "OperPowerState" in observed_object:
+        completion_status["Oper Power State"] = observed_object.get("OperPowerState")
+        if expected_oper_power_state:
+            completion_status["Completed"] = completion_status["Oper Power State"] == expected_oper_power_state
+
+
+# Establish function to wait for a power control operation to complete
+def wait_for_power_control_completion(server_settings_power_state,
+                                      completion_timeout=900,
+                                      poll_interval=10,
+                                      completion_event_source=None
+                                      ):
+    """This is a function to wait for a submitted power control operation to
+    complete. For power control states with a known resulting power state,
+    such as "Power On", "Power Off" or "Shutdown", the operational power state
+    of the server is checked until it matches. For other power control states,
+    the server settings are checked until the configuration state is no longer
+    "Applying". A workflow of the server started after the operation was
+    submitted also completes the operation, or fails it if the workflow
+    failed, was terminated or timed out.
+
+    If a completion event source is provided, the operation is marked as
+    completed as soon as a matching Intersight change event arrives, and the
+    Intersight API is only polled when no event has arrived within the poll
+    interval.
+
+    Args:
+        server_settings_power_state ("ServerSettingsPowerState"):
+            The ServerSettingsPowerState class instance of a submitted power
+            control operation.
+        completion_timeout (int):
+            Optional; The maximum number of seconds to wait. The default value
+            is 900.
+        poll_interval (int):
+            Optional; The number of seconds between polls. The default value
+            is 10.
+        completion_event_source ("PowerControlCompletionEvents"):
+            Optional; A PowerControlCompletionEvents class instance, such as
+            an IntersightWebhookReceiver class instance, providing Intersight
+            change events. The default value is None.
+
+    Returns:
+        A dictionary with the "Completed" and "Failed" statuses, the last
+        observed "Config State", the last observed "Oper Power State" and the
+        last observed "Workflow Status".
+    """
+    api_client = server_settings_power_state.api_client
+    expected_oper_power_state = ServerSettingsPowerState.expected_oper_power_states.get(
+        server_settings_power_state.intersight_api_body.get("AdminPowerState")
+        )
+    server_moid_and_data = server_settings_power_state.server_moid_and_data or {}
+    server_api_path = ServerSettingsPowerState.server_api_paths.get(server_moid_and_data.get("ObjectType"))
+    completion_status = {"Completed": False,
+                         "Failed": False,
+                         "Config State": None,
+                         "Oper Power State": None,
+                         "Workflow Status": None
+                         }
+    completion_event_keys = [server_moid_and_data.get("Moid"), server_settings_power_state.server_settings_moid]
+    completion_event_sequence = completion_event_source.event_sequence if completion_event_source is not None else 0
+    completion_deadline = time.monotonic() + completion_timeout
+    while time.monotonic() < completion_deadline:
+        # Wait for a change event, if an event source is available, otherwise wait for the next poll
+        if completion_event_source is not None:
+            completion_event = completion_event_source.wait_for_event(
+                completion_event_keys,
+                completion_event_sequence,
+                min(poll_interval, completion_deadline - time.monotonic())
+                )
+            if completion_event is not None:
+                completion_event_sequence, observed_object = completion_event
+                _update_power_control_completion_status(completion_status,
+                                                        observed_object,
+                                                        expected_oper_power_state,
+                                                        submitted_time=server_settings_power_state.post_submitted_time
+                                                        )
+                if completion_status["Completed"] or completion_status["Failed"]:
+                    break
+                continue
+        else:
+            # Never sleep past the completion deadline
+            time.sleep(max(0, min(poll_interval, completion_deadline - time.monotonic())))
+        try:
+            if expected_oper_power_state and server_api_path:
+                api_client.call_api(resource_path=f"/{server_api_path}/{server_moid_and_data['Moid']}",
+                                    method="GET",
+                                    auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                    )
+            else:
+                api_client.call_api(resource_path=f"/{server_settings_power_state.intersight_api_path}/{server_settings_power_state.server_settings_moid}",
+                                    method="GET",
+                                    auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                    )
+            _update_power_control_completion_status(completion_status,
+                                                    json.loads(api_client.last_response.data),
+                                                    expected_oper_power_state if server_api_path else None
+                                                    )
+        except Exception:
+            logger.warning("Unable to retrieve the power control completion status "
+                           "for the target server ID %s. Retrying...",
+                           server_settings_power_state.power_control_target_server_id_dictionary.get("Server Identifier"),
+                           exc_info=True
+                           )
+            continue
+        if completion_status["Completed"]:
+            break
+    return completion_status
+
+
+# Establish class to stage power control operations into waves
+class PowerControlWaveScheduler:
+    """This class stages the power control operations for a list of target
+    servers into waves. Waves are created by a fixed count of servers, or from
+    whole chassis or domains. The operations of each wave are submitted
+    concurrently, limited to a maximum number of in-progress operations per
+    domain, and the next wave starts as soon as every operation of the current
+    wave has completed, followed by an optional inter-wave delay.
+    """
+    wave_grouping_options = ("Count", "Chassis", "Domain")
+
+    def __init__(self,
+                 power_control_state,
+                 wave_grouping="Count",
+                 wave_size=100,
+                 inter_wave_delay=0,
+                 max_concurrent_operations_per_domain=20,
+                 max_workers=50,
+                 wait_for_completion=True,
+                 completion_timeout=900,
+                 completion_poll_interval=10,
+                 intersight_base_url="https://www.intersight.com/api/v1",
+                 preconfigured_api_client=None,
+                 server_inventory=None,
+                 force_power_control=False,
+                 completion_event_source=None
+                 ):
+        self.power_control_state = power_control_state
+        self.wave_grouping = wave_grouping
+        self.wave_size = wave_size
+        self.inter_wave_delay = inter_wave_delay
+        self.max_concurrent_operations_per_domain = max_concurrent_operations_per_domain
+        self.max_workers = max_workers
+        self.wait_for_completion = wait_for_completion
+        self.completion_timeout = completion_timeout
+        self.completion_poll_interval = completion_poll_interval
+        self.intersight_base_url = intersight_base_url
+        self.api_client = preconfigured_api_client
+        if server_inventory is None:
+            server_inventory = IntersightServerInventory(preconfigured_api_client,
+                                                         intersight_base_url=intersight_base_url
+                                                         )
+        self.server_inventory = server_inventory
+        self.force_power_control = force_power_control
+        self.completion_event_source = completion_event_source
+        self._domain_semaphores = {}
+        self._domain_semaphores_lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.power_control_state}', "
+            f"'{self.wave_grouping}', "
+            f"{self.wave_size}, "
+            f"{self.inter_wave_delay}, "
+            f"{self.max_concurrent_operations_per_domain})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.power_control_state}'"
+
+    def _get_domain_semaphore(self,
+                              domain_moid
+                              ):
+        with self._domain_semaphores_lock:
+            if domain_moid not in self._domain_semaphores:
+                self._domain_semaphores[domain_moid] = threading.BoundedSemaphore(self.max_concurrent_operations_per_domain)
+            return self._domain_semaphores[domain_moid]
+
+    def resolve_target(self,
+                       power_control_target_server_id_dictionary
+                       ):
+        """This function resolves a target server from the server inventory and
+        determines its chassis and domain.
+
+        Args:
+            power_control_target_server_id_dictionary (dict):
+                A dictionary containing the target server data.
+
+        Returns:
+            A dictionary with the "Target", the "Power Control State", the
+            "Server" object, the "Chassis Moid" and the "Domain Moid" of the
+            target server.
+        """
+        power_control_target_server_moid_and_data = retrieve_target_server_data(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            server_identifier=power_control_target_server_id_dictionary.get("Server Identifier"),
+            server_form_factor=power_control_target_server_id_dictionary.get("Server Form Factor", "Blade"),
+            server_connection_type=power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached"),
+            preconfigured_api_client=self.api_client,
+            server_inventory=self.server_inventory
+            )
+        server_moid = power_control_target_server_moid_and_data["Moid"]
+        intersight_server = self.server_inventory.get_server(server_moid) or {}
+        return {
+            "Target": power_control_target_server_id_dictionary,
+            "Power Control State": power_control_target_server_id_dictionary.get("Power Control State", self.power_control_state),
+            "Server": intersight_server,
+            "Chassis Moid": (intersight_server.get("EquipmentChassis") or {}).get("Moid") or server_moid,
+            "Domain Moid": (intersight_server.get("RegisteredDevice") or {}).get("Moid") or server_moid
+            }
+
+    def remove_targets_in_desired_state(self,
+                                        resolved_targets
+                                        ):
+        """This function removes the resolved target servers that the server
+        inventory shows are already in the desired power state.
+
+        Args:
+            resolved_targets (list):
+                A list of resolved target servers provided by the
+                resolve_target function.
+
+        Returns:
+            A list of the resolved target servers that require a power control
+            operation.
+        """
+        remaining_resolved_targets = []
+        for resolved_target in resolved_targets:
+            if ServerSettingsPowerState.is_in_desired_state(resolved_target["Power Control State"], resolved_target["Server"]):
+                logger.info("The target server ID %s is already in the desired power "
+                            "state. Skipping the power control operation.",
+                            resolved_target["Target"].get("Server Identifier"),
+                            extra={"server_identifier": resolved_target["Target"].get("Server Identifier"),
+                                   "power_control_state": resolved_target["Power Control State"]}
+                            )
+                if _active_metrics_registry is not None:
+                    _active_metrics_registry.power_control_operations_total.inc(
+                        power_control_state=resolved_target["Power Control State"],
+                        result="skipped"
+                        )
+                if _active_run_journal is not None:
+                    _active_run_journal.record(resolved_target["Target"],
+                                               resolved_target["Power Control State"],
+                                               "Skipped",
+                                               server_moid=resolved_target["Server"].get("Moid")
+                                               )
+                if _active_results_writer is not None:
+                    skipped_server_settings_power_state = ServerSettingsPowerState(
+                        intersight_api_key_id=None,
+                        intersight_api_key=None,
+                        power_control_target_server_id_dictionary=resolved_target["Target"],
+                        power_control_state=resolved_target["Power Control State"],
+                        intersight_base_url=self.intersight_base_url,
+                        preconfigured_api_client=self.api_client,
+                        server_inventory=self.server_inventory
+                        )
+                    skipped_server_settings_power_state.server_moid_and_data = {"Moid": resolved_target["Server"].get("Moid")}
+                    skipped_server_settings_power_state.post_skipped = True
+                    _active_results_writer.write(skipped_server_settings_power_state)
+            else:
+                remaining_resolved_targets.append(resolved_target)
+        if len(remaining_resolved_targets) < len(resolved_targets):
+            logger.info("\n%d of %d target servers are already in the desired power state.",
+                        len(resolved_targets) - len(remaining_resolved_targets),
+                        len(resolved_targets)
+                        )
+        return remaining_resolved_targets
+
+    def build_waves(self,
+                    resolved_targets
+                    ):
+        """This function splits the resolved target servers into waves.
+
+        Args:
+            resolved_targets (list):
+                A list of resolved target servers provided by the
+                resolve_target function.
+
+        Returns:
+            A list of waves, each a list of resolved target servers.
+        """
+        wave_size = max(int(self.wave_size), 1)
+        reformatted_wave_grouping = "".join(str(self.wave_grouping).lower().split())
+        if reformatted_wave_grouping == "count":
+            return [resolved_targets[wave_start:wave_start + wave_size]
+                    for wave_start in range(0, len(resolved_targets), wave_size)
+                    ]
+        if reformatted_wave_grouping not in ("chassis", "domain"):
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"The value provided for the wave grouping setting was {self.wave_grouping}.\n"
+                         "The accepted values are "
+                         f"{', '.join(self.wave_grouping_options)}.\n"
+                         "Please update the configuration, then re-attempt "
+                         "execution.\n")
+            sys.exit(0)
+        # Group the target servers by chassis or domain, preserving the order they were provided
+        wave_group_key = "Chassis Moid" if reformatted_wave_grouping == "chassis" else "Domain Moid"
+        wave_groups = {}
+        for resolved_target in resolved_targets:
+            wave_groups.setdefault(resolved_target[wave_group_key], []).append(resolved_target)
+        wave_group_list = list(wave_groups.values())
+        return [[resolved_target
+                 for wave_group in wave_group_list[wave_start:wave_start + wave_size]
+                 for resolved_target in wave_group
+                 ]
+                for wave_start in range(0, len(wave_group_list), wave_size)
+                ]
+
+    @staticmethod
+    def group_by_power_control_state(resolved_targets):
+        """This function groups the resolved target servers into batches by
+        their power control state, in the order each power control state is
+        first provided. Power control states that only differ in case or
+        spaces, such as "Power Off" and "power off", share a batch.
+
+        Args:
+            resolved_targets (list):
+                A list of resolved target servers provided by the
+                resolve_target function.
+
+        Returns:
+            A dictionary with a list of resolved target servers for each power
+            control state.
+        """
+        power_control_state_lookup = ServerSettingsPowerState.object_variable_value_lookups["power_control_state"]
+        power_control_batch_states = {}
+        power_control_batches = {}
+        for resolved_target in resolved_targets:
+            provided_power_control_state = resolved_target["Power Control State"]
+            reformatted_power_control_state = "".join(str(provided_power_control_state).lower().split())
+            power_control_batch_key = power_control_state_lookup.get(reformatted_power_control_state,
+                                                                     reformatted_power_control_state
+                                                                     )
+            power_control_batch_state = power_control_batch_states.setdefault(power_control_batch_key,
+                                                                              provided_power_control_state
+                                                                              )
+            power_control_batches.setdefault(power_control_batch_state, []).append(resolved_target)
+        return power_control_batches
+
+    @staticmethod
+    def _interleave_by_domain(wave):
+        """This function orders the target servers of a wave round-robin by
+        domain, so concurrent workers are spread across domains instead of
+        waiting on the limit of a single domain.
+        """
+        domain_queues = {}
+        for resolved_target in wave:
+            domain_queues.setdefault(resolved_target["Domain Moid"], []).append(resolved_target)
+        interleaved_wave = []
+        domain_queue_list = list(domain_queues.values())
+        for domain_queue_index in range(max((len(domain_queue) for domain_queue in domain_queue_list), default=0)):
+            for domain_queue in domain_queue_list:
+                if domain_queue_index < len(domain_queue):
+                    interleaved_wave.append(domain_queue[domain_queue_index])
+        return interleaved_wave
+
+    def _run_operation(self,
+                       resolved_target,
+                       queued=False
+                       ):
+        """This function submits the power control operation for a resolved
+        target server and, if enabled, waits for it to complete. The slot of
+        the domain is held until the operation has completed.
+
+        Args:
+            resolved_target (dict):
+                The resolved target server provided by the resolve_target
+                function.
+            queued (bool):
+                Optional; The target server is counted in the queue depth
+                metric set by the run function. The default value is False.
+
+        Returns:
+            The ServerSettingsPowerState class instance of the power control
+            operation.
+        """
+        with self._get_domain_semaphore(resolved_target["Domain Moid"]):
+            if queued and _active_metrics_registry is not None:
+                _active_metrics_registry.power_control_queue_depth.dec()
+            server_settings_power_state = update_power_state(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                power_control_target_server_id_dictionary=resolved_target["Target"],
+                power_control_state=resolved_target["Power Control State"],
+                intersight_base_url=self.intersight_base_url,
+                preconfigured_api_client=self.api_client,
+                server_inventory=self.server_inventory,
+                force_power_control=self.force_power_control,
+                wait_for_completion=self.wait_for_completion,
+                completion_timeout=self.completion_timeout,
+                completion_poll_interval=self.completion_poll_interval,
+                completion_event_source=self.completion_event_source,
+                on_submitted=self._record_submitted_operation
+                )
+            return server_settings_power_state
+
+    def _record_submitted_operation(self,
+                                    server_settings_power_state
+                                    ):
+        """This function is called as soon as the power control operation of
+        a target server has been submitted, skipped or has failed. It does
+        nothing by default.
+        """
+
+    def run(self,
+            power_control_target_server_id_dictionary_list
+            ):
+        """This function resolves the target servers, groups them into
+        batches by power control state, splits each batch into waves and runs
+        the waves in order. All batches share the server inventory of the
+        scheduler.
+
+        Args:
+            power_control_target_server_id_dictionary_list (iterable):
+                A list or other iterable of dictionaries containing the target
+                server data. The target servers are all resolved before the
+                first wave starts, so a streamed iterable is read in full and
+                held in memory.
+
+        Returns:
+            A list of the ServerSettingsPowerState class instances of the
+            power control operations.
+        """
+        with trace_span("resolve_targets"):
+            resolved_targets = [self.resolve_target(power_control_target_server_id_dictionary)
+                                for power_control_target_server_id_dictionary
+                                in power_control_target_server_id_dictionary_list
+                                ]
+        # Remove the target servers that are already in the desired power state
+        if not self.force_power_control:
+            resolved_targets = self.remove_targets_in_desired_state(resolved_targets)
+        power_control_waves = [(power_control_batch_state, power_control_wave)
+                               for power_control_batch_state, power_control_batch
+                               in self.group_by_power_control_state(resolved_targets).items()
+                               for power_control_wave in self.build_waves(power_control_batch)
+                               ]
+        if _active_metrics_registry is not None:
+            _active_metrics_registry.power_control_queue_depth.set(len(resolved_targets))
+        power_control_results = []
+        for wave_index, (power_control_batch_state, power_control_wave) in enumerate(power_control_waves, start=1):
+            logger.info("\nStarting wave %d of %d with %d target servers for the %s power control state.",
+                        wave_index,
+                        len(power_control_waves),
+                        len(power_control_wave),
+                        power_control_batch_state,
+                        extra={"wave": wave_index,
+                               "power_control_state": power_control_batch_state}
+                        )
+            wave_start_time = time.perf_counter()
+            with trace_span("wave",
+                            wave=wave_index,
+                            wave_size=len(power_control_wave),
+                            power_control_state=power_control_batch_state
+                            ):
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(power_control_wave))),
+                                                           thread_name_prefix=f"power-control-wave-{wave_index}"
+                                                           ) as wave_executor:
+                    power_control_futures = [wave_executor.submit(contextvars.copy_context().run,
+                                                                  self._run_operation,
+                                                                  resolved_target,
+                                                                  queued=True
+                                                                  )
+                                             for resolved_target in self._interleave_by_domain(power_control_wave)
+                                             ]
+                    for power_control_future in concurrent.futures.as_completed(power_control_futures):
+                        power_control_results.append(power_control_future.result())
+            logger.info("Wave %d of %d has completed in %.1f seconds.",
+                        wave_index,
+                        len(power_control_waves),
+                        time.perf_counter() - wave_start_time,
+                        extra={"wave": wave_index}
+                        )
+            if self.inter_wave_delay and wave_index < len(power_control_waves):
+                logger.info("Waiting %s seconds before starting the next wave.", self.inter_wave_delay)
+                time.sleep(self.inter_wave_delay)
+        return power_control_results
+
+
+# Establish exception for failed power control operations of an embedded controller
+class PowerControlError(Exception):
+    """This exception is raised by the PowerControlController class for a
+    target server whose power control operation failed, did not complete in
+    time, or stopped on an error that would end a run of the tool.
+    """
+    def __init__(self,
+                 message,
+                 power_control_target_server_id_dictionary=None,
+                 server_settings_power_state=None
+                 ):
+        super().__init__(message)
+        self.power_control_target_server_id_dictionary = power_control_target_server_id_dictionary
+        self.server_settings_power_state = server_settings_power_state
+
+
+# Establish class to capture the error messages logged by each thread of an embedded controller
+class _ThreadErrorMessageHandler(logging.Handler):
+    """This class keeps the last error message logged by each thread, so the
+    error message logged before a configuration error stops an operation can
+    be provided with the PowerControlError exception.
+    """
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self._thread_error_messages = threading.local()
+
+    def emit(self, record):
+        with contextlib.suppress(Exception):
+            self._thread_error_messages.last_error_message = record.getMessage()
+
+    def pop_last_error_message(self):
+        last_error_message = getattr(self._thread_error_messages, "last_error_message", None)
+        self._thread_error_messages.last_error_message = None
+        return last_error_message
+
+
+# Establish class to run power control operations from other Python applications
+class PowerControlController:
+    """This class runs power control operations for other Python
+    applications, such as an orchestrator, without blocking the caller. Target
+    servers are submitted individually or in batches and the results are
+    returned as futures or as an asynchronous iterator. All operations share
+    the API client, the server inventory, the worker threads and the
+    per-domain concurrency limit of the controller.
+
+    Failed operations raise a PowerControlError exception from their future
+    instead of exiting, including the configuration errors that would end a
+    run of the tool.
+    """
+    def __init__(self,
+                 preconfigured_api_client=None,
+                 intersight_api_key_id=None,
+                 intersight_api_key=None,
+                 intersight_base_url="https://www.intersight.com/api/v1",
+                 server_inventory=None,
+                 power_control_state="Power On",
+                 max_workers=50,
+                 max_concurrent_operations_per_domain=20,
+                 force_power_control=False,
+                 wait_for_completion=False,
+                 completion_timeout=900,
+                 completion_poll_interval=10,
+                 completion_event_source=None,
+                 inventory_max_age=300
+                 ):
+        if preconfigured_api_client is None:
+            preconfigured_api_client = get_shared_api_client(api_key_id=intersight_api_key_id,
+                                                             api_secret_file=intersight_api_key,
+                                                             endpoint=intersight_base_url,
+                                                             connection_pool_maxsize=max_workers
+                                                             )
+        self.api_client = preconfigured_api_client
+        self.intersight_base_url = intersight_base_url
+        self.max_workers = max_workers
+        self._wave_scheduler = PowerControlWaveScheduler(
+            power_control_state,
+            max_concurrent_operations_per_domain=max_concurrent_operations_per_domain,
+            max_workers=max_workers,
+            wait_for_completion=wait_for_completion,
+            completion_timeout=completion_timeout,
+            completion_poll_interval=completion_poll_interval,
+            intersight_base_url=intersight_base_url,
+            preconfigured_api_client=preconfigured_api_client,
+            server_inventory=server_inventory,
+            force_power_control=force_power_control,
+            completion_event_source=completion_event_source
+            )
+        self.server_inventory = self._wave_scheduler.server_inventory
+        self.inventory_max_age = inventory_max_age
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, int(max_workers)),
+                                                               thread_name_prefix="power-control-controller"
+                                                               )
+        self._error_message_handler = _ThreadErrorMessageHandler()
+        logger.addHandler(self._error_message_handler)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client}, "
+            f"'{self.intersight_base_url}', "
+            f"{self.max_workers})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.intersight_base_url}'"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def _run_target(self,
+                    power_control_target_server_id_dictionary
+                    ):
+        """This function runs the power control operation for a target server
+        in a worker thread of the controller.
+
+        Returns:
+            The ServerSettingsPowerState class instance of the power control
+            operation.
+
+        Raises:
+            PowerControlError:
+                The power control operation failed, did not complete in time,
+                or stopped on a configuration error.
+        """
+        power_control_target_server_id = power_control_target_server_id_dictionary.get("Server Identifier")
+        self._error_message_handler.pop_last_error_message()
+        # Refresh the server inventory if it is older than the maximum age, so the power states are current
+        inventory_age = self.server_inventory.get_age_seconds()
+        if inventory_age is not None and inventory_age > self.inventory_max_age:
+            self.server_inventory.refresh()
+        try:
+            with trace_span("power_control_target", server_identifier=power_control_target_server_id):
+                resolved_target = self._wave_scheduler.resolve_target(power_control_target_server_id_dictionary)
+                server_settings_power_state = self._wave_scheduler._run_operation(resolved_target)
+        except SystemExit as exception:
+            last_error_message = self._error_message_handler.pop_last_error_message()
+            raise PowerControlError((last_error_message or "").strip()
+                                    or f"The power control operation for the target server ID "
+                                       f"{power_control_target_server_id} was stopped.",
+                                    power_control_target_server_id_dictionary
+                                    ) from exception
+        except Exception as exception:
+            raise PowerControlError(f"The power control operation for the target server ID "
+                                    f"{power_control_target_server_id} failed with "
+                                    f"{type(exception).__name__}: {exception}",
+                                    power_control_target_server_id_dictionary
+                                    ) from exception
+        if not (server_settings_power_state.post_succeeded or server_settings_power_state.post_skipped):
+            last_error_message = self._error_message_handler.pop_last_error_message()
+            raise PowerControlError(f"The power control operation for the target server ID "
+                                    f"{power_control_target_server_id} failed"
+                                    + (f" with HTTP status {server_settings_power_state.post_http_status}."
+                                       if server_settings_power_state.post_http_status else ".")
+                                    + (f"\n{last_error_message.strip()}" if last_error_message else ""),
+                                    power_control_target_server_id_dictionary,
+                                    server_settings_power_state
+                                    )
+        completion_status = server_settings_power_state.completion_status
+        if completion_status is not None and completion_status.get("Failed"):
+            raise PowerControlError(f"The power control operation for the target server ID "
+                                    f"{power_control_target_server_id} failed with the workflow status "
+                                    f"{completion_status.get('Workflow Status')}.",
+                                    power_control_target_server_id_dictionary,
+                                    server_settings_power_state
+                                    )
+        if completion_status is not None and not completion_status.get("Completed"):
+            raise PowerControlError(f"The power control operation for the target server ID "
+                                    f"{power_control_target_server_id} did not complete within "
+                                    f"{self._wave_scheduler.completion_timeout} seconds.",
+                                    power_control_target_server_id_dictionary,
+                                    server_settings_power_state
+                                    )
+        return server_settings_power_state
+
+    def submit(self,
+               power_control_target,
+               power_control_state=None
+               ):
+        """This function submits the power control operation for a target
+        server and returns immediately.
+
+        Args:
+            power_control_target (dict or str):
+                A dictionary containing the target server data, as accepted by
+                the update_power_state function, or a server identifier of a
+                FI-attached blade server.
+            power_control_state (str):
+                Optional; The desired power state of the target server. A
+                "Power Control State" key of the target server data takes
+                precedence. The default value is None, which uses the power
+                control state of the controller.
+
+        Returns:
+            A concurrent.futures.Future instance with the
+            ServerSettingsPowerState class instance of the power control
+            operation, or a PowerControlError exception if it failed.
+        """
+        if isinstance(power_control_target, str):
+            power_control_target = {"Server Identifier": power_control_target}
+        else:
+            power_control_target = dict(power_control_target)
+        if power_control_state is not None:
+            power_control_target.setdefault("Power Control State", power_control_state)
+        return self._executor.submit(contextvars.copy_context().run,
+                                     self._run_target,
+                                     power_control_target
+                                     )
+
+    def submit_batch(self,
+                     power_control_targets,
+                     power_control_state=None
+                     ):
+        """This function submits the power control operations for many target
+        servers and returns immediately.
+
+        Args:
+            power_control_targets (iterable):
+                A list or other iterable of target servers, as accepted by the
+                submit function. Each target server can provide its own
+                "Power Control State" key.
+            power_control_state (str):
+                Optional; The desired power state of the target servers that
+                do not provide one. The default value is None, which uses the
+                power control state of the controller.
+
+        Returns:
+            A list of concurrent.futures.Future instances, in the order the
+            target servers were provided.
+        """
+        return [self.submit(power_control_target, power_control_state)
+                for power_control_target in power_control_targets
+                ]
+
+    async def iterate_batch(self,
+                            power_control_targets,
+                            power_control_state=None,
+                            return_exceptions=False
+                            ):
+        """This function submits the power control operations for many target
+        servers and asynchronously yields the results as they complete.
+
+        Args:
+            power_control_targets (iterable):
+                A list or other iterable of target servers, as accepted by the
+                submit function.
+            power_control_state (str):
+                Optional; The desired power state of the target servers that
+                do not provide one. The default value is None, which uses the
+                power control state of the controller.
+            return_exceptions (bool):
+                Optional; Yield the PowerControlError exception of a failed
+                operation instead of raising it. The default value is False.
+
+        Yields:
+            The ServerSettingsPowerState class instance of each power control
+            operation, in the order they complete.
+
+        Raises:
+            PowerControlError:
+                A power control operation failed and return_exceptions is
+                False.
+        """
+        power_control_futures = [asyncio.wrap_future(power_control_future)
+                                 for power_control_future
+                                 in self.submit_batch(power_control_targets, power_control_state)
+                                 ]
+        for power_control_future in asyncio.as_completed(power_control_futures):
+            try:
+                yield await power_control_future
+            except PowerControlError as exception:
+                if not return_exceptions:
+                    raise
+                yield exception
+
+    def close(self,
+              wait=True
+              ):
+        """This function stops the worker threads of the controller. Operations
+        that have not started are cancelled.
+
+        Args:
+            wait (bool):
+                Optional; Wait for the running operations to finish. The
+                default value is True.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        logger.removeHandler(self._error_message_handler)
+
+
+# Establish class to parse and evaluate cron schedule expressions
+class CronSchedule:
+    """This class parses a five-field cron schedule expression (minute, hour,
+    day of month, month and day of week) and finds the times it matches. Each
+    field accepts "*", single values, ranges such as "1-5", lists such as
+    "1,15" and steps such as "*/15" or "0-30/10". Days of the week are 0 to 6
+    starting on Sunday, and 7 is also accepted for Sunday. As with cron, if
+    both the day of month and the day of week are restricted, a time matches
+    when either of them matches. Times are evaluated in local time.
+    """
+    field_ranges = (
+        ("minute", 0, 59),
+        ("hour", 0, 23),
+        ("day of month", 1, 31),
+        ("month", 1, 12),
+        ("day of week", 0, 7)
+        )
+
+    def __init__(self,
+                 expression
+                 ):
+        self.expression = expression
+        expression_fields = str(expression).split()
+        if len(expression_fields) != 5:
+            raise ValueError(f"The cron schedule '{expression}' does not have 5 fields.")
+        (self.minutes,
+         self.hours,
+         self.days_of_month,
+         self.months,
+         self.days_of_week) = (self._parse_field(expression_field, *field_range)
+                               for expression_field, field_range in zip(expression_fields, self.field_ranges)
+                               )
+        if 7 in self.days_of_week:
+            self.days_of_week = (self.days_of_week - {7}) | {0}
+        self.day_of_month_restricted = expression_fields[2] != "*"
+        self.day_of_week_restricted = expression_fields[4] != "*"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self.expression}')"
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.expression}'"
+
+    @staticmethod
+    def _parse_field(expression_field,
+                     field_name,
+                     minimum_value,
+                     maximum_value
+                     ):
+        field_values = set()
+        for field_part in expression_field.split(","):
+            field_range, _, field_step = field_part.partition("/")
+            try:
+                field_step = int(field_step) if field_step else 1
+                if field_range == "*":
+                    range_start, range_end = minimum_value, maximum_value
+                elif "-" in field_range:
+                    range_start, range_end = (int(range_value) for range_value in field_range.split("-", 1))
+                else:
+                    range_start = int(field_range)
+                    range_end = maximum_value if field_step > 1 else range_start
+            except ValueError:
+                raise ValueError(f"The {field_name} field '{expression_field}' is not valid.") from None
+            if not minimum_value <= range_start <= range_end <= maximum_value or field_step < 1:
+                raise ValueError(f"The {field_name} field '{expression_field}' is out of range.")
+            field_values.update(range(range_start, range_end + 1, field_step))
+        return field_values
+
+    def _matches_day(self,
+                     schedule_time
+                     ):
+        day_of_month_matches = schedule_time.day in self.days_of_month
+        # The weekday function starts on Monday, cron starts on Sunday
+        day_of_week_matches = (schedule_time.weekday() + 1) % 7 in self.days_of_week
+        if self.day_of_month_restricted and self.day_of_week_restricted:
+            return day_of_month_matches or day_of_week_matches
+        return day_of_month_matches and day_of_week_matches
+
+    def matches(self,
+                schedule_time
+                ):
+        """This function checks whether the schedule matches a time, to the
+        minute.
+
+        Args:
+            schedule_time (datetime.datetime):
+                The time to check.
+
+        Returns:
+            A boolean indicating whether the schedule matches the time.
+        """
+        return (schedule_time.minute in self.minutes
+                and schedule_time.hour in self.hours
+                and schedule_time.month in self.months
+                and self._matches_day(schedule_time)
+                )
+
+    def next_run_after(self,
+                       schedule_time
+                       ):
+        """This function finds the first time after the provided time matched
+        by the schedule. Non-matching months, days and hours are skipped
+        whole.
+
+        Args:
+            schedule_time (datetime.datetime):
+                The time to start searching after.
+
+        Returns:
+            The next matching datetime.datetime, or None if there is no
+            matching time within the next five years.
+        """
+        next_run_time = schedule_time.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        search_end_time = next_run_time + datetime.timedelta(days=5 * 366)
+        while next_run_time < search_end_time:
+            if next_run_time.month not in self.months:
+                next_run_time = (next_run_time.replace(day=1, hour=0, minute=0) + datetime.timedelta(days=32)).replace(day=1)
+            elif not self._matches_day(next_run_time):
+                next_run_time = next_run_time.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+            elif next_run_time.hour not in self.hours:
+                next_run_time = next_run_time.replace(minute=0) + datetime.timedelta(hours=1)
+            elif next_run_time.minute not in self.minutes:
+                next_run_time += datetime.timedelta(minutes=1)
+            else:
+                return next_run_time
+        return None
+
+
+# Establish class to run scheduled power control policies
+class PowerPolicyScheduler:
+    """This class runs a set of scheduled power control policies in a single
+    long-running process, like a built-in cron. Each policy has a cron
+    schedule, a power control state and a list of target servers, such as
+    "Power Off at 20:00 and Power On at 07:00 for the lab servers". One API
+    client and server inventory are kept warm across triggers. The policies
+    due at the same time are coalesced, so a server targeted by more than one
+    of them is only submitted once, and all their targets are submitted
+    together through the wave scheduler. Targets already in the desired power
+    state are skipped.
+    """
+    def __init__(self,
+                 power_control_policies,
+                 intersight_base_url="https://www.intersight.com/api/v1",
+                 preconfigured_api_client=None,
+                 server_inventory=None,
+                 inventory_max_age=300,
+                 **wave_scheduler_settings
+                 ):
+        self.power_control_policies = [self._validate_policy(power_control_policy)
+                                       for power_control_policy in power_control_policies
+                                       ]
+        self.intersight_base_url = intersight_base_url
+        self.api_client = preconfigured_api_client
+        if server_inventory is None:
+            server_inventory = IntersightServerInventory(preconfigured_api_client,
+                                                         intersight_base_url=intersight_base_url
+                                                         )
+        self.server_inventory = server_inventory
+        self.inventory_max_age = inventory_max_age
+        self.wave_scheduler_settings = wave_scheduler_settings
+        self.trigger_failure_count = 0
+        self._stop_event = threading.Event()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({len(self.power_control_policies)} policies, "
+            f"'{self.intersight_base_url}')"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with {len(self.power_control_policies)} policies"
+
+    @staticmethod
+    def _validate_policy(power_control_policy):
+        """This function validates a power control policy and compiles its
+        cron schedule.
+
+        Returns:
+            A copy of the power control policy with the compiled "Cron
+            Schedule" added.
+        """
+        power_control_policy_name = power_control_policy.get("Policy Name", power_control_policy.get("Schedule"))
+        try:
+            if not power_control_policy.get("Power Control State"):
+                raise ValueError("No value was provided for the Power Control State.")
+            if not power_control_policy.get("Targets"):
+                raise ValueError("No target servers were provided for the Targets.")
+            validated_power_control_policy = dict(power_control_policy)
+            validated_power_control_policy["Policy Name"] = power_control_policy_name
+            validated_power_control_policy["Cron Schedule"] = CronSchedule(power_control_policy.get("Schedule"))
+        except ValueError as policy_error:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"The power control policy named {power_control_policy_name} "
+                         f"is not valid. {policy_error}\n"
+                         "Each policy needs a \"Schedule\" in the five-field cron "
+                         "format, a \"Power Control State\" and a list of "
+                         "\"Targets\".\n"
+                         "Please update the configuration, then re-attempt "
+                         "execution.\n")
+            sys.exit(0)
+        return validated_power_control_policy
+
+    def get_next_trigger(self,
+                         after_time
+                         ):
+        """This function finds the next time any policy is due and the
+        policies due at that time.
+
+        Args:
+            after_time (datetime.datetime):
+                The time to start searching after.
+
+        Returns:
+            A tuple of the next trigger time and the list of policies due at
+            that time, or (None, []) if no policy is due again.
+        """
+        next_run_times = [(power_control_policy["Cron Schedule"].next_run_after(after_time), power_control_policy)
+                          for power_control_policy in self.power_control_policies
+                          ]
+        next_run_times = [next_run_time for next_run_time in next_run_times if next_run_time[0] is not None]
+        if not next_run_times:
+            return None, []
+        next_trigger_time = min(next_run_time for next_run_time, _ in next_run_times)
+        return next_trigger_time, [power_control_policy
+                                   for next_run_time, power_control_policy in next_run_times
+                                   if next_run_time == next_trigger_time
+                                   ]
+
+    def coalesce_policies(self,
+                          due_power_control_policies
+                          ):
+        """This function merges the targets of the policies due at the same
+        time, so each server is submitted only once. If a server is targeted
+        by policies with different power control states, the policy listed
+        last wins.
+
+        Args:
+            due_power_control_policies (list):
+                The policies due at the same time.
+
+        Returns:
+            A list of dictionaries containing the target server data, each
+            with its "Power Control State".
+        """
+        coalesced_targets = {}
+        for power_control_policy in due_power_control_policies:
+            for power_control_target_server_id_dictionary in expand_power_control_target_patterns(power_control_policy["Targets"],
+                                                                                                  self.server_inventory
+                                                                                                  ):
+                power_control_target = dict(power_control_target_server_id_dictionary,
+                                            **{"Power Control State": power_control_target_server_id_dictionary.get(
+                                                "Power Control State",
+                                                power_control_policy["Power Control State"]
+                                                )}
+                                            )
+                target_key = PowerControlRunJournal.get_target_key(power_control_target, None)[:3]
+                previous_power_control_target = coalesced_targets.get(target_key)
+                if (
+                    previous_power_control_target is not None
+                    and PowerControlRunJournal.get_target_key(previous_power_control_target, None)
+                    != PowerControlRunJournal.get_target_key(power_control_target, None)
+                    ):
+                    logger.warning("The target server ID %s is targeted by overlapping policies with "
+                                   "different power control states. Using %s from the policy named %s.",
+                                   power_control_target.get("Server Identifier"),
+                                   power_control_target["Power Control State"],
+                                   power_control_policy["Policy Name"]
+                                   )
+                coalesced_targets[target_key] = power_control_target
+        return list(coalesced_targets.values())
+
+    def trigger(self,
+                due_power_control_policies
+                ):
+        """This function runs the policies due at the same time as a single
+        coalesced submission with the warm API client and server inventory.
+
+        Args:
+            due_power_control_policies (list):
+                The policies due at the same time.
+
+        Returns:
+            A list of the ServerSettingsPowerState class instances of the
+            power control operations.
+        """
+        # Refresh the server inventory if it is older than the maximum age, so the power states are current
+        inventory_age = self.server_inventory.get_age_seconds()
+        if inventory_age is not None and inventory_age > self.inventory_max_age:
+            self.server_inventory.refresh()
+        power_control_targets = self.coalesce_policies(due_power_control_policies)
+        logger.info("\nRunning the power control policies %s for %d target servers.",
+                    ", ".join(str(power_control_policy["Policy Name"]) for power_control_policy in due_power_control_policies),
+                    len(power_control_targets)
+                    )
+        with trace_span("power_policy_trigger", policy_count=len(due_power_control_policies)):
+            power_control_results = PowerControlWaveScheduler(
+                power_control_state=due_power_control_policies[0]["Power Control State"],
+                intersight_base_url=self.intersight_base_url,
+                preconfigured_api_client=self.api_client,
+                server_inventory=self.server_inventory,
+                **self.wave_scheduler_settings
+                ).run(power_control_targets)
+        # Refresh the server inventory after submitting power control operations, so the next trigger uses the power states reported by Intersight
+        if any(server_settings_power_state.post_succeeded for server_settings_power_state in power_control_results):
+            self.server_inventory.refresh()
+        return power_control_results
+
+    def run_forever(self):
+        """This function runs the policies on their schedules until the stop
+        function is called or the process is interrupted. Policies that became
+        due while a previous trigger was still running are run as soon as it
+        has finished. A trigger that stops on an error, including a
+        configuration error that would end a single run, is logged and counted
+        in the trigger_failure_count attribute, and the schedules continue.
+        """
+        last_trigger_time = datetime.datetime.now().replace(second=0, microsecond=0)
+        while not self._stop_event.is_set():
+            next_trigger_time, due_power_control_policies = self.get_next_trigger(last_trigger_time)
+            if next_trigger_time is None:
+                logger.info("No power control policy is scheduled to run again.")
+                return
+            logger.info("The next power control policy trigger is at %s.",
+                        next_trigger_time.strftime("%Y-%m-%d %H:%M")
+                        )
+            if self._stop_event.wait(max((next_trigger_time - datetime.datetime.now()).total_seconds(), 0)):
+                return
+            # Keep running the schedules if a trigger stops on an error, such as a server that can no longer be found
+            try:
+                self.trigger(due_power_control_policies)
+            except (Exception, SystemExit) as trigger_exception:
+                self.trigger_failure_count += 1
+                logger.error("The power control policy trigger at %s stopped on an error. "
+                             "Continuing with the next trigger.",
+                             next_trigger_time.strftime("%Y-%m-%d %H:%M"),
+                             exc_info=not isinstance(trigger_exception, SystemExit)
+                             )
+                if _active_metrics_registry is not None:
+                    _active_metrics_registry.power_control_policy_trigger_failures_total.inc(
+                        error=type(trigger_exception).__name__
+                        )
+            last_trigger_time = next_trigger_time
+
+    def stop(self):
+        """This function stops the run_forever function after the current
+        trigger.
+        """
+        self._stop_event.set()
+
+
+# Establish the mappings between the Intersight server summaries and the target server data
+_physical_summary_server_form_factors = {
+    "compute.Blade": "Blade",
+    "compute.RackUnit": "Rack"
+    }
+_physical_summary_server_connection_types = {
+    "Intersight": "FI-Attached",
+    "IntersightStandalone": "Standalone"
+    }
+_snapshot_power_control_states = {
+    "on": "Power On",
+    "off": "Power Off"
+    }
+
+
+# Establish function to retrieve the Intersight server summaries one page at a time
+def iterate_server_physical_summaries(server_scope="",
+                                      select_properties="Moid,Serial,Name,Model,UserLabel,SourceObjectType,ManagementMode,OperPowerState",
+                                      page_size=1000,
+                                      intersight_base_url="https://www.intersight.com/api/v1",
+                                      preconfigured_api_client=None
+                                      ):
+    """This is a function to retrieve the summaries of all servers, or of the
+    servers matching a scope, with one paged compute/PhysicalSummaries query.
+    Only the selected properties are retrieved.
+
+    Args:
+        server_scope (str):
+            Optional; A server identifier or server identifier pattern, such
+            as "Lab-Blade-*", limiting the servers retrieved. The default
+            value is "", which retrieves all servers.
+        select_properties (str):
+            Optional; The comma-separated properties retrieved for each
+            server.
+        page_size (int):
+            Optional; The number of servers retrieved per request. The default
+            value is 1000.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None.
+
+    Yields:
+        A dictionary for each server summary.
+    """
+    physical_summaries_api_path = f"compute/PhysicalSummaries?$select={select_properties}"
+    server_scope_pattern = None
+    if server_scope:
+        try:
+            server_scope_pattern = ServerIdentifierPattern(str(server_scope).strip())
+        except ValueError as pattern_error:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"The server scope '{server_scope}' is not valid. "
+                         f"{pattern_error}\n"
+                         "Please update the configuration, then re-attempt "
+                         "execution.\n")
+            sys.exit(0)
+        server_scope_odata_filter = server_scope_pattern.get_odata_filter()
+        if server_scope_odata_filter:
+            physical_summaries_api_path += f"&$filter={urllib.parse.quote(server_scope_odata_filter, safe='(),')}"
+    for physical_summary in iterate_intersight_objects(intersight_api_key_id=None,
+                                                       intersight_api_key=None,
+                                                       intersight_api_path=physical_summaries_api_path,
+                                                       object_type="Server Summary",
+                                                       page_size=page_size,
+                                                       intersight_base_url=intersight_base_url,
+                                                       preconfigured_api_client=preconfigured_api_client
+                                                       ):
+        if server_scope_pattern is None or server_scope_pattern.matches(physical_summary):
+            yield physical_summary
+
+
+# Establish function to convert an Intersight server summary to the target server data
+def _physical_summary_to_power_control_target(physical_summary):
+    """This is a function to convert an Intersight server summary to the
+    target server data with the current power state as the "Power Control
+    State".
+
+    Args:
+        physical_summary (dict):
+            The Intersight server summary.
+
+    Returns:
+        A dictionary containing the target server data, or None if the power
+        state of the server cannot be controlled by the tool.
+    """
+    server_form_factor = _physical_summary_server_form_factors.get(physical_summary.get("SourceObjectType"))
+    server_connection_type = _physical_summary_server_connection_types.get(physical_summary.get("ManagementMode"))
+    power_control_state = _snapshot_power_control_states.get(str(physical_summary.get("OperPowerState")).lower())
+    if not (server_form_factor and server_connection_type and power_control_state and physical_summary.get("Serial")):
+        return None
+    return {
+        "Server Identifier": physical_summary["Serial"],
+        "Server Form Factor": server_form_factor,
+        "Server Connection Type": server_connection_type,
+        "Power Control State": power_control_state,
+        "Server Name": physical_summary.get("Name", "")
+        }
+
+
+# Establish function to save a snapshot of the server power states
+def take_power_state_snapshot(snapshot_file,
+                              snapshot_scope="",
+                              snapshot_format="Auto",
+                              intersight_base_url="https://www.intersight.com/api/v1",
+                              preconfigured_api_client=None
+                              ):
+    """This is a function to save the current power state of every server, or
+    of the servers matching a scope, to a snapshot file. The power states are
+    retrieved with one paged compute/PhysicalSummaries query. The snapshot
+    file has the same columns as a target input file, with the current power
+    state as the "Power Control State", so it can also be provided as
+    target input. Servers with a power state other than on or off, or with a
+    management mode not supported by the tool, are not included.
+
+    Args:
+        snapshot_file (str):
+            The system file path of the snapshot file.
+        snapshot_scope (str):
+            Optional; A server identifier or server identifier pattern
+            limiting the servers in the snapshot. The default value is "",
+            which includes all servers.
+        snapshot_format (str):
+            Optional; The format of the snapshot file. The options are "Auto",
+            "CSV" or "JSON Lines". The default value of "Auto" determines the
+            format from the file extension.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None.
+
+    Returns:
+        A dictionary with the number of servers saved for each power control
+        state.
+    """
+    snapshot_fields = ["Server Identifier", "Server Form Factor", "Server Connection Type", "Power Control State", "Server Name"]
+    reformatted_snapshot_format = "".join(str(snapshot_format).lower().split())
+    if reformatted_snapshot_format == "auto":
+        reformatted_snapshot_format = "jsonlines" if snapshot_file.lower().endswith((".jsonl", ".ndjson")) else "csv"
+    if reformatted_snapshot_format not in ("csv", "jsonlines"):
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "The value provided for the snapshot format setting "
+                     f"was {snapshot_format}.\n"
+                     "The accepted values are Auto, CSV or JSON Lines.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n")
+        sys.exit(0)
+    snapshot_counts = collections.Counter()
+    try:
+        with open(snapshot_file, "w", newline="", encoding="utf-8") as snapshot_output:
+            if reformatted_snapshot_format == "csv":
+                snapshot_writer = csv.DictWriter(snapshot_output, fieldnames=snapshot_fields)
+                snapshot_writer.writeheader()
+                write_snapshot_entry = snapshot_writer.writerow
+            else:
+                def write_snapshot_entry(snapshot_entry):
+                    snapshot_output.write(json.dumps(snapshot_entry, separators=(",", ":")) + "\n")
+            with trace_span("power_state_snapshot"):
+                for physical_summary in iterate_server_physical_summaries(server_scope=snapshot_scope,
+                                                                          intersight_base_url=intersight_base_url,
+                                                                          preconfigured_api_client=preconfigured_api_client
+                                                                          ):
+                    snapshot_entry = _physical_summary_to_power_control_target(physical_summary)
+                    if snapshot_entry is None:
+                        snapshot_counts["Not Included"] += 1
+                        continue
+                    write_snapshot_entry(snapshot_entry)
+                    snapshot_counts[snapshot_entry["Power Control State"]] += 1
+    except OSError:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     f"Unable to write the snapshot file '{snapshot_file}'.\n\n"
+                     "Exception Message: ",
+                     exc_info=True
+                     )
+        sys.exit(0)
+    return dict(snapshot_counts)
+
+
+# Establish function to restore the server power states saved in a snapshot
+def restore_power_state_snapshot(snapshot_file,
+                                 snapshot_format="Auto",
+                                 intersight_base_url="https://www.intersight.com/api/v1",
+                                 preconfigured_api_client=None,
+                                 server_inventory=None,
+                                 **wave_scheduler_settings
+                                 ):
+    """This is a function to return the servers in a snapshot file to their
+    saved power states. The current power states are retrieved with one paged
+    compute/PhysicalSummaries query and compared to the snapshot, and power
+    control operations are only submitted for the servers with a different
+    power state. The operations are grouped into batches by power control
+    state and run in waves.
+
+    Args:
+        snapshot_file (str):
+            The system file path of the snapshot file saved by the
+            take_power_state_snapshot function.
+        snapshot_format (str):
+            Optional; The format of the snapshot file. The options are "Auto",
+            "CSV" or "JSON Lines". The default value is "Auto".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None.
+        server_inventory (IntersightServerInventory):
+            Optional; The server inventory used to resolve the target servers.
+            The default value is None, which creates a new server inventory.
+        **wave_scheduler_settings:
+            Optional; The settings of the PowerControlWaveScheduler class,
+            such as wave_size or wait_for_completion.
+
+    Returns:
+        A list of the ServerSettingsPowerState class instances of the power
+        control operations.
+    """
+    snapshot_targets = list(iterate_power_control_targets(snapshot_file, snapshot_format))
+    with trace_span("power_state_diff", server_count=len(snapshot_targets)):
+        current_power_control_states = {}
+        for physical_summary in iterate_server_physical_summaries(select_properties="Serial,OperPowerState",
+                                                                  intersight_base_url=intersight_base_url,
+                                                                  preconfigured_api_client=preconfigured_api_client
+                                                                  ):
+            if physical_summary.get("Serial"):
+                current_power_control_states[physical_summary["Serial"]] = _snapshot_power_control_states.get(
+                    str(physical_summary.get("OperPowerState")).lower()
+                    )
+        changed_snapshot_targets = []
+        for snapshot_target in snapshot_targets:
+            server_identifier = snapshot_target["Server Identifier"]
+            if server_identifier not in current_power_control_states:
+                logger.warning("The server with the serial %s in the snapshot was not found in Intersight.",
+                               server_identifier,
+                               extra={"server_identifier": server_identifier}
+                               )
+            elif current_power_control_states[server_identifier] != snapshot_target.get("Power Control State"):
+                changed_snapshot_targets.append(snapshot_target)
+    logger.info("%d of the %d servers in the snapshot have a different power state.",
+                len(changed_snapshot_targets),
+                len(snapshot_targets)
+                )
+    if not changed_snapshot_targets:
+        return []
+    if server_inventory is None:
+        server_inventory = IntersightServerInventory(preconfigured_api_client,
+                                                     intersight_base_url=intersight_base_url
+                                                     )
+    wave_scheduler_settings.setdefault("power_control_state", changed_snapshot_targets[0]["Power Control State"])
+    return PowerControlWaveScheduler(intersight_base_url=intersight_base_url,
+                                     preconfigured_api_client=preconfigured_api_client,
+                                     server_inventory=server_inventory,
+                                     **wave_scheduler_settings
+                                     ).run(changed_snapshot_targets)
+
+
+# Establish the dimensions of the power status report with the server summary property of each
+_power_status_report_dimensions = {
+    "Power State": "OperPowerState",
+    "Model": "Model",
+    "Domain": "RegisteredDevice.Moid",
+    "Management Mode": "ManagementMode"
+    }
+
+
+# Establish function to retrieve a nested property of an Intersight object
+def _get_intersight_object_property(intersight_object,
+                                    property_path
+                                    ):
+    """This is a function to retrieve a property of an Intersight object by a
+    dotted property path, such as "RegisteredDevice.Moid".
+
+    Returns:
+        The property value, or an empty string if the property is not present.
+    """
+    for property_name in property_path.split("."):
+        if not isinstance(intersight_object, dict):
+            return ""
+        intersight_object = intersight_object.get(property_name)
+    return "" if intersight_object is None else intersight_object
+
+
+# Establish function to aggregate the server power status on Intersight
+def _aggregate_power_status_server_side(server_scope_odata_filter,
+                                        api_client,
+                                        page_size=1000
+                                        ):
+    """This is a function to count the servers by each power status report
+    dimension with compute/PhysicalSummaries requests using $apply=groupby
+    aggregation. The groups are retrieved in pages with $top and $skip, and
+    the counts are only used if they add up to the number of servers in
+    scope, retrieved with $count.
+
+    Returns:
+        A dictionary with the server counts for each dimension, or None if the
+        aggregation is not supported or the server counts cannot be
+        confirmed.
+    """
+    power_status_group_properties = ",".join(server_summary_property.replace(".", "/")
+                                             for server_summary_property in _power_status_report_dimensions.values()
+                                             )
+    physical_summaries_api_path = ("/compute/PhysicalSummaries?$apply="
+                                   + urllib.parse.quote(f"groupby(({power_status_group_properties}),aggregate($count as Total))",
+                                                        safe="(),$/"
+                                                        ))
+    physical_summaries_count_api_path = "/compute/PhysicalSummaries?$count=true"
+    if server_scope_odata_filter:
+        physical_summaries_api_path += f"&$filter={urllib.parse.quote(server_scope_odata_filter, safe='(),')}"
+        physical_summaries_count_api_path += f"&$filter={urllib.parse.quote(server_scope_odata_filter, safe='(),')}"
+    power_status_groups = []
+    try:
+        api_client.call_api(resource_path=physical_summaries_count_api_path,
+                            method="GET",
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        if api_client.last_response.status != 200:
+            return None
+        server_count = json.loads(api_client.last_response.data).get("Count")
+        if not isinstance(server_count, int):
+            return None
+        while True:
+            api_client.call_api(resource_path=f"{physical_summaries_api_path}&$top={page_size}&$skip={len(power_status_groups)}",
+                                method="GET",
+                                auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                )
+            if api_client.last_response.status != 200:
+                return None
+            power_status_groups_page = json.loads(api_client.last_response.data).get("Results")
+            # Stop if the paging query options are not applied to the groups
+            if not isinstance(power_status_groups_page, list) or len(power_status_groups_page) > page_size:
+                return None
+            power_status_groups.extend(power_status_groups_page)
+            if sum(power_status_group.get("Total", 0) for power_status_group in power_status_groups) > server_count:
+                return None
+            if len(power_status_groups_page) < page_size:
+                break
+    except Exception:
+        logger.debug("The server-side aggregation of the power status is not available.", exc_info=True)
+        return None
+    power_status_counts = {power_status_dimension: collections.Counter()
+                           for power_status_dimension in _power_status_report_dimensions
+                           }
+    for power_status_group in power_status_groups:
+        for power_status_dimension, server_summary_property in _power_status_report_dimensions.items():
+            power_status_counts[power_status_dimension][
+                str(_get_intersight_object_property(power_status_group, server_summary_property))
+                ] += power_status_group.get("Total", 0)
+    # Use the server-side aggregation only if the groups account for every server in scope
+    if sum(power_status_counts["Power State"].values()) != server_count:
+        logger.debug("The server-side aggregation of the power status counted %d of the %d servers in scope.",
+                     sum(power_status_counts["Power State"].values()),
+                     server_count
+                     )
+        return None
+    return power_status_counts
+
+
+# Establish function to create a report of the server power status
+def generate_power_status_report(server_scope="",
+                                 include_server_lists=False,
+                                 intersight_base_url="https://www.intersight.com/api/v1",
+                                 preconfigured_api_client=None
+                                 ):
+    """This is a function to create a read-only report of the number of
+    servers by power state, model, domain and management mode. The counts are
+    aggregated by Intersight with paged $apply=groupby requests where
+    supported. Otherwise, or if the server lists are included, the server
+    summaries are retrieved with one paged compute/PhysicalSummaries query
+    and aggregated as they are received, so memory use does not grow with the
+    number of servers unless the server lists are included.
+
+    Args:
+        server_scope (str):
+            Optional; A server identifier or server identifier pattern
+            limiting the servers in the report. The default value is "",
+            which includes all servers.
+        include_server_lists (bool):
+            Optional; A setting to determine whether the names of the servers
+            in each group are included in the report. The default value is
+            False.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None.
+
+    Returns:
+        A dictionary with the "Total Servers", the "Aggregation" used, the
+        server counts for each dimension and, if enabled, the "Server Lists"
+        for each dimension.
+    """
+    if preconfigured_api_client is None:
+        api_client = get_shared_api_client(api_key_id=None,
+                                           api_secret_file=None,
+                                           endpoint=intersight_base_url
+                                           )
+    else:
+        api_client = preconfigured_api_client
+    power_status_counts = None
+    if not include_server_lists:
+        # Aggregate on Intersight only when the scope filter selects exactly the servers in scope
+        server_scope_odata_filter = None
+        server_scope_filter_is_exact = True
+        if server_scope:
+            try:
+                server_scope_pattern = ServerIdentifierPattern(str(server_scope).strip())
+            except ValueError:
+                server_scope_pattern = None
+            server_scope_filter_is_exact = server_scope_pattern is not None and (
+                server_scope_pattern.filter_values is not None
+                or server_scope_pattern.pattern == server_scope_pattern.filter_prefix + "*"
+                )
+            if server_scope_filter_is_exact:
+                server_scope_odata_filter = server_scope_pattern.get_odata_filter()
+        if server_scope_filter_is_exact:
+            with trace_span("power_status_aggregation", aggregation="Server-Side"):
+                power_status_counts = _aggregate_power_status_server_side(server_scope_odata_filter, api_client)
+    power_status_aggregation = "Server-Side"
+    power_status_server_lists = None
+    if power_status_counts is None:
+        power_status_aggregation = "Client-Side"
+        power_status_counts = {power_status_dimension: collections.Counter()
+                               for power_status_dimension in _power_status_report_dimensions
+                               }
+        if include_server_lists:
+            power_status_server_lists = {power_status_dimension: {}
+                                         for power_status_dimension in _power_status_report_dimensions
+                                         }
+        with trace_span("power_status_aggregation", aggregation="Client-Side"):
+            for physical_summary in iterate_server_physical_summaries(
+                    server_scope=server_scope,
+                    select_properties="Moid,Serial,Name,Model,UserLabel,ManagementMode,OperPowerState,RegisteredDevice",
+                    intersight_base_url=intersight_base_url,
+                    preconfigured_api_client=api_client
+                    ):
+                for power_status_dimension, server_summary_property in _power_status_report_dimensions.items():
+                    power_status_group = str(_get_intersight_object_property(physical_summary, server_summary_property))
+                    power_status_counts[power_status_dimension][power_status_group] += 1
+                    if power_status_server_lists is not None:
+                        power_status_server_lists[power_status_dimension].setdefault(power_status_group, []).append(
+                            physical_summary.get("Name") or physical_summary.get("Serial")
+                            )
+    # Replace the domain MOIDs with the domain names
+    domain_moids = {domain_moid for domain_moid in power_status_counts["Domain"] if domain_moid}
+    if domain_moids:
+        domain_names = {}
+        for device_registration in iterate_intersight_objects(intersight_api_key_id=None,
+                                                              intersight_api_key=None,
+                                                              intersight_api_path="asset/DeviceRegistrations?$select=Moid,DeviceHostname",
+                                                              object_type="Device Registration",
+                                                              intersight_base_url=intersight_base_url,
+                                                              preconfigured_api_client=api_client
+                                                              ):
+            if device_registration.get("Moid") in domain_moids and device_registration.get("DeviceHostname"):
+                domain_names[device_registration["Moid"]] = ", ".join(device_registration["DeviceHostname"])
+        power_status_counts["Domain"] = collections.Counter({domain_names.get(domain_moid, domain_moid): domain_count
+                                                             for domain_moid, domain_count in power_status_counts["Domain"].items()
+                                                             })
+        if power_status_server_lists is not None:
+            power_status_server_lists["Domain"] = {domain_names.get(domain_moid, domain_moid): server_names
+                                                   for domain_moid, server_names in power_status_server_lists["Domain"].items()
+                                                   }
+    power_status_report = {
+        "Total Servers": sum(power_status_counts["Power State"].values()),
+        "Aggregation": power_status_aggregation
+        }
+    for power_status_dimension, power_status_dimension_counts in power_status_counts.items():
+        power_status_report[power_status_dimension] = {power_status_group or "None": power_status_group_count
+                                                       for power_status_group, power_status_group_count
+                                                       in power_status_dimension_counts.most_common()
+                                                       }
+    if power_status_server_lists is not None:
+        power_status_report["Server Lists"] = {
+            power_status_dimension: {power_status_group or "None": sorted(server_names)
+                                     for power_status_group, server_names in power_status_dimension_lists.items()
+                                     }
+            for power_status_dimension, power_status_dimension_lists in power_status_server_lists.items()
+            }
+    return power_status_report
+
+
+# Establish class for the durable queue of distributed power control jobs
+class PowerControlJobQueue:
+    """This class is a durable queue of power control jobs in a local SQLite
+    database, shared by a coordinator and any number of worker processes.
+    The coordinator splits each job into shards of resolved target servers,
+    and each worker claims one shard at a time, runs it and reports the
+    results back. The shards of each power control state batch are only
+    claimed after every shard of the previous batch has finished, and the
+    number of in-progress operations per domain is limited across all
+    workers. A shard claimed by a worker that stops sending heartbeats for
+    lease_duration seconds is claimed again by another worker, which skips
+    the target servers whose results were already recorded. A shard that has
+    been claimed max_attempts times without finishing is marked as failed.
+
+    Workers on several hosts can share the queue when the database file is on
+    a shared file system with working file locks, and the clocks of the hosts
+    are synchronized.
+    """
+    def __init__(self,
+                 queue_file,
+                 lease_duration=120,
+                 max_attempts=3
+                 ):
+        self.queue_file = queue_file
+        self.lease_duration = lease_duration
+        self.max_attempts = max_attempts
+        self._thread_local_connections = threading.local()
+        self._get_connection().executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_time REAL,
+                job_settings TEXT
+                );
+            CREATE TABLE IF NOT EXISTS shards (
+                shard_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id INTEGER,
+                batch_index INTEGER,
+                shard_key TEXT,
+                shard_data TEXT,
+                status TEXT DEFAULT 'Pending',
+                worker_id TEXT,
+                attempts INTEGER DEFAULT 0,
+                results TEXT,
+                error TEXT
+                );
+            CREATE INDEX IF NOT EXISTS shards_by_job ON shards (job_id, status, batch_index);
+            CREATE TABLE IF NOT EXISTS shard_targets (
+                shard_id INTEGER,
+                server_moid TEXT,
+                result TEXT,
+                PRIMARY KEY (shard_id, server_moid)
+                );
+            CREATE TABLE IF NOT EXISTS workers (
+                worker_id TEXT PRIMARY KEY,
+                heartbeat_time REAL
+                );
+            CREATE TABLE IF NOT EXISTS domain_slots (
+                domain_moid TEXT,
+                worker_id TEXT,
+                slot_count INTEGER,
+                PRIMARY KEY (domain_moid, worker_id)
+                );
+            """)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.queue_file}', "
+            f"{self.lease_duration}, "
+            f"{self.max_attempts})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.queue_file}'"
+
+    def _get_connection(self):
+        queue_connection = getattr(self._thread_local_connections, "connection", None)
+        if queue_connection is None:
+            queue_connection = sqlite3.connect(self.queue_file, timeout=60, isolation_level=None)
+            queue_connection.row_factory = sqlite3.Row
+            self._thread_local_connections.connection = queue_connection
+        return queue_connection
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        queue_connection = self._get_connection()
+        queue_connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield queue_connection
+        except BaseException:
+            queue_connection.execute("ROLLBACK")
+            raise
+        queue_connection.execute("COMMIT")
+
+    def submit_job(self,
+                   job_settings,
+                   power_control_batches
+                   ):
+        """This function adds a job to the queue.
+
+        Args:
+            job_settings (dict):
+                The settings shared by every shard of the job, such as the wave
+                scheduler settings.
+            power_control_batches (list):
+                A list of batches in run order, each a list of (shard key,
+                shard data) tuples.
+
+        Returns:
+            The ID of the job.
+        """
+        with self._transaction() as queue_connection:
+            job_id = queue_connection.execute("INSERT INTO jobs (created_time, job_settings) VALUES (?, ?)",
+                                              (time.time(), json.dumps(job_settings))
+                                              ).lastrowid
+            queue_connection.executemany(
+                "INSERT INTO shards (job_id, batch_index, shard_key, shard_data) VALUES (?, ?, ?, ?)",
+                [(job_id, batch_index, shard_key, json.dumps(shard_data))
+                 for batch_index, power_control_batch in enumerate(power_control_batches)
+                 for shard_key, shard_data in power_control_batch
+                 ]
+                )
+        return job_id
+
+    def heartbeat(self,
+                  worker_id
+                  ):
+        """This function records that a worker is alive, which keeps the lease
+        of its claimed shard and domain slots.
+        """
+        with self._transaction() as queue_connection:
+            queue_connection.execute("INSERT INTO workers (worker_id, heartbeat_time) VALUES (?, ?) "
+                                     "ON CONFLICT (worker_id) DO UPDATE SET heartbeat_time = excluded.heartbeat_time",
+                                     (worker_id, time.time())
+                                     )
+
+    def claim_shard(self,
+                    worker_id
+                    ):
+        """This function claims the next shard that can be run for a worker.
+
+        Args:
+            worker_id (str):
+                The ID of the worker.
+
+        Returns:
+            A dictionary with the "Shard ID", "Job ID", "Shard Key", "Shard
+            Data", "Job Settings" and "Target Results" of the claimed shard,
+            or None if no shard can be run now. The "Target Results" are the
+            results recorded by previous attempts, by server MOID.
+        """
+        self.heartbeat(worker_id)
+        lease_expiry_time = time.time() - self.lease_duration
+        with self._transaction() as queue_connection:
+            # Give up on the abandoned shards that have used all their attempts
+            queue_connection.execute(
+                "UPDATE shards SET status = 'Failed', error = ? "
+                "WHERE status = 'Claimed' AND attempts >= ? AND worker_id NOT IN "
+                "(SELECT worker_id FROM workers WHERE heartbeat_time >= ?)",
+                (f"The shard was abandoned by a worker in each of its {self.max_attempts} attempts.",
+                 self.max_attempts,
+                 lease_expiry_time
+                 )
+                )
+            claimable_shard = queue_connection.execute(
+                "SELECT s.shard_id, s.job_id, s.shard_key, s.shard_data, j.job_settings "
+                "FROM shards s JOIN jobs j ON j.job_id = s.job_id "
+                "LEFT JOIN workers w ON w.worker_id = s.worker_id "
+                "WHERE (s.status = 'Pending' "
+                "OR (s.status = 'Claimed' AND (w.heartbeat_time IS NULL OR w.heartbeat_time < ?))) "
+                "AND s.batch_index = (SELECT MIN(b.batch_index) FROM shards b "
+                "WHERE b.job_id = s.job_id AND b.status IN ('Pending', 'Claimed')) "
+                "ORDER BY s.job_id, s.shard_id LIMIT 1",
+                (lease_expiry_time,)
+                ).fetchone()
+            if claimable_shard is None:
+                return None
+            queue_connection.execute("UPDATE shards SET status = 'Claimed', worker_id = ?, attempts = attempts + 1 "
+                                     "WHERE shard_id = ?",
+                                     (worker_id, claimable_shard["shard_id"])
+                                     )
+        return {
+            "Shard ID": claimable_shard["shard_id"],
+            "Job ID": claimable_shard["job_id"],
+            "Shard Key": claimable_shard["shard_key"],
+            "Shard Data": json.loads(claimable_shard["shard_data"]),
+            "Job Settings": json.loads(claimable_shard["job_settings"]),
+            "Target Results": self.get_target_results(claimable_shard["shard_id"])
+            }
+
+    def record_target_result(self,
+                             shard_id,
+                             worker_id,
+                             server_moid,
+                             power_control_result
+                             ):
+        """This function records the result of the power control operation of
+        a target server of a shard as soon as it has been submitted, so the
+        operation is not submitted again if the shard is claimed again. The
+        result is only recorded while the worker holds the shard.
+
+        Args:
+            shard_id (int):
+                The ID of the shard.
+            worker_id (str):
+                The ID of the worker.
+            server_moid (str):
+                The MOID of the target server.
+            power_control_result (dict):
+                The result record of the power control operation.
+        """
+        with self._transaction() as queue_connection:
+            queue_connection.execute("INSERT OR REPLACE INTO shard_targets (shard_id, server_moid, result) "
+                                     "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM shards "
+                                     "WHERE shard_id = ? AND worker_id = ? AND status = 'Claimed')",
+                                     (shard_id,
+                                      server_moid,
+                                      json.dumps(power_control_result, default=str),
+                                      shard_id,
+                                      worker_id
+                                      )
+                                     )
+
+    def get_target_results(self,
+                           shard_id
+                           ):
+        """This function returns the recorded results of the target servers
+        of a shard.
+
+        Returns:
+            A dictionary of the result records by server MOID.
+        """
+        return {shard_target["server_moid"]: json.loads(shard_target["result"])
+                for shard_target in self._get_connection().execute(
+                    "SELECT server_moid, result FROM shard_targets WHERE shard_id = ?",
+                    (shard_id,)
+                    )
+                }
+
+    def complete_shard(self,
+                       shard_id,
+                       worker_id,
+                       power_control_results,
+                       error=None
+                       ):
+        """This function records the results of a shard run by a worker.
+
+        Args:
+            shard_id (int):
+                The ID of the shard.
+            worker_id (str):
+                The ID of the worker.
+            power_control_results (list):
+                The result records of the power control operations of the
+                shard.
+            error (str):
+                Optional; The error that stopped the shard, which marks it as
+                failed. The default value is None.
+        """
+        with self._transaction() as queue_connection:
+            queue_connection.execute("UPDATE shards SET status = ?, results = ?, error = ? "
+                                     "WHERE shard_id = ? AND worker_id = ?",
+                                     ("Failed" if error else "Completed",
+                                      json.dumps(power_control_results, default=str),
+                                      error,
+                                      shard_id,
+                                      worker_id
+                                      )
+                                     )
+
+    def has_unfinished_shards(self):
+        """This function checks whether any shard in the queue is pending or
+        claimed.
+        """
+        return self._get_connection().execute(
+            "SELECT 1 FROM shards WHERE status IN ('Pending', 'Claimed') LIMIT 1"
+            ).fetchone() is not None
+
+    def get_job_progress(self,
+                         job_id
+                         ):
+        """This function returns the number of shards of a job by status.
+        """
+        return {shard_status["status"]: shard_status["shard_count"]
+                for shard_status in self._get_connection().execute(
+                    "SELECT status, COUNT(*) AS shard_count FROM shards WHERE job_id = ? GROUP BY status",
+                    (job_id,)
+                    )
+                }
+
+    def iterate_finished_shards(self,
+                                job_id,
+                                after_shard_ids=()
+                                ):
+        """This function yields the finished shards of a job that are not in
+        the provided shard IDs. For a shard that failed without reporting its
+        results, the results recorded for its target servers are provided.
+
+        Yields:
+            A dictionary with the "Shard ID", "Shard Key", "Status", "Results"
+            and "Error" of each finished shard.
+        """
+        queue_connection = self._get_connection()
+        finished_shard_ids = [finished_shard["shard_id"]
+                              for finished_shard in queue_connection.execute(
+                                  "SELECT shard_id FROM shards "
+                                  "WHERE job_id = ? AND status IN ('Completed', 'Failed') ORDER BY shard_id",
+                                  (job_id,)
+                                  )
+                              if finished_shard["shard_id"] not in after_shard_ids
+                              ]
+        for finished_shard_id in finished_shard_ids:
+            finished_shard = queue_connection.execute(
+                "SELECT shard_id, shard_key, status, results, error FROM shards WHERE shard_id = ?",
+                (finished_shard_id,)
+                ).fetchone()
+            yield {
+                "Shard ID": finished_shard["shard_id"],
+                "Shard Key": finished_shard["shard_key"],
+                "Status": finished_shard["status"],
+                "Results": (json.loads(finished_shard["results"])
+                            if finished_shard["results"] is not None
+                            else list(self.get_target_results(finished_shard_id).values())),
+                "Error": finished_shard["error"]
+                }
+
+    @contextlib.contextmanager
+    def hold_domain_slot(self,
+                         worker_id,
+                         domain_moid,
+                         max_concurrent_operations_per_domain,
+                         poll_interval=0.5
+                         ):
+        """This function waits for a free operation slot of a domain across all
+        workers and holds it until the end of the with statement. The slots of
+        workers without a heartbeat for lease_duration seconds are released.
+        """
+        while True:
+            with self._transaction() as queue_connection:
+                queue_connection.execute("DELETE FROM domain_slots WHERE worker_id IN "
+                                         "(SELECT worker_id FROM workers WHERE heartbeat_time < ?)",
+                                         (time.time() - self.lease_duration,)
+                                         )
+                domain_slots_in_use = queue_connection.execute(
+                    "SELECT COALESCE(SUM(slot_count), 0) FROM domain_slots WHERE domain_moid = ?",
+                    (domain_moid,)
+                    ).fetchone()[0]
+                if domain_slots_in_use < max_concurrent_operations_per_domain:
+                    queue_connection.execute("INSERT INTO domain_slots (domain_moid, worker_id, slot_count) VALUES (?, ?, 1) "
+                                             "ON CONFLICT (domain_moid, worker_id) DO UPDATE SET slot_count = slot_count + 1",
+                                             (domain_moid, worker_id)
+                                             )
+                    break
+            time.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            with self._transaction() as queue_connection:
+                queue_connection.execute("UPDATE domain_slots SET slot_count = slot_count - 1 "
+                                         "WHERE domain_moid = ? AND worker_id = ?",
+                                         (domain_moid, worker_id)
+                                         )
+                queue_connection.execute("DELETE FROM domain_slots WHERE slot_count <= 0")
+
+
+# Establish class to run the power control operations of a shard in waves on a distributed worker
+class DistributedPowerControlWaveScheduler(PowerControlWaveScheduler):
+    """This class is a PowerControlWaveScheduler for the shards of a
+    distributed power control job. Each operation holds an operation slot of
+    its domain in the job queue, so the limit of in-progress operations per
+    domain applies across all workers.
+    """
+    def __init__(self,
+                 job_queue,
+                 worker_id,
+                 shard_id=None,
+                 **wave_scheduler_settings
+                 ):
+        super().__init__(**wave_scheduler_settings)
+        self.job_queue = job_queue
+        self.worker_id = worker_id
+        self.shard_id = shard_id
+
+    def _record_submitted_operation(self,
+                                    server_settings_power_state
+                                    ):
+        server_moid = (server_settings_power_state.server_moid_and_data or {}).get("Moid")
+        if self.shard_id is not None and server_moid:
+            self.job_queue.record_target_result(self.shard_id,
+                                                self.worker_id,
+                                                server_moid,
+                                                PowerControlResultsWriter.build_result(server_settings_power_state)
+                                                )
+
+    def _run_operation(self,
+                       resolved_target,
+                       queued=False
+                       ):
+        with self.job_queue.hold_domain_slot(self.worker_id,
+                                             resolved_target["Domain Moid"],
+                                             self.max_concurrent_operations_per_domain
+                                             ):
+            return super()._run_operation(resolved_target, queued=queued)
+
+
+# Establish function to split power control operations into shards and add them to the job queue
+def submit_power_control_job(job_queue,
+                             power_control_target_server_id_dictionary_list,
+                             power_control_state,
+                             shard_grouping="Domain",
+                             shard_size=100,
+                             hash_shard_count=16,
+                             intersight_base_url="https://www.intersight.com/api/v1",
+                             preconfigured_api_client=None,
+                             server_inventory=None,
+                             **wave_scheduler_settings
+                             ):
+    """This is a function to resolve the target servers once, split them into
+    shards and add them to the job queue as a job. The target servers are
+    grouped into batches by power control state, and each batch is split into
+    shards by domain or by a hash of the server MOID, with at most shard_size
+    servers per shard. Each shard carries the resolved server data, so the
+    workers do not retrieve the server inventory again.
+
+    Args:
+        job_queue (PowerControlJobQueue):
+            The job queue.
+        power_control_target_server_id_dictionary_list (iterable):
+            An iterable of dictionaries containing the target server data. The
+            target servers are all resolved before the job is added, so a
+            streamed iterable is read in full and held in memory.
+        power_control_state (str):
+            The desired power state of the target servers without a "Power
+            Control State" key.
+        shard_grouping (str):
+            Optional; The grouping of the target servers into shards. The
+            options are "Domain" or "Hash". The default value is "Domain".
+        shard_size (int):
+            Optional; The maximum number of target servers per shard. The
+            default value is 100.
+        hash_shard_count (int):
+            Optional; The number of hash groups per batch for the "Hash" shard
+            grouping. The default value is 16.
         intersight_base_url (str):
             Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance.
+            is "https://www.intersight.com/api/v1".
         preconfigured_api_client ("ApiClient"):
             Optional; An ApiClient class instance which handles
             Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
+            The default value is None.
+        server_inventory (IntersightServerInventory):
+            Optional; The server inventory used to resolve the target servers.
+            The default value is None, which creates a new server inventory.
+        **wave_scheduler_settings:
+            Optional; The settings of the PowerControlWaveScheduler class used
+            by the workers, such as wave_size or wait_for_completion.
 
     Returns:
-        A dictionary containing all objects of the specified API type. If the
-        API type is inaccessible, an implicit value of None will be returned.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue accessing the Intersight API
-            path. The status code or error message will be specified.
+        A tuple of the ID of the job and the number of shards.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-        return intersight_objects
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print(f"There was an issue retrieving the requested {object_type} "
-              "instances from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
+    reformatted_shard_grouping = "".join(str(shard_grouping).lower().split())
+    if reformatted_shard_grouping not in ("domain", "hash"):
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "The value provided for the shard grouping setting was "
+                     f"{shard_grouping}.\n"
+                     "The accepted values are Domain or Hash.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n")
         sys.exit(0)
+    power_control_wave_scheduler = PowerControlWaveScheduler(power_control_state=power_control_state,
+                                                             intersight_base_url=intersight_base_url,
+                                                             preconfigured_api_client=preconfigured_api_client,
+                                                             server_inventory=server_inventory,
+                                                             force_power_control=wave_scheduler_settings.get("force_power_control", False)
+                                                             )
+    server_inventory = power_control_wave_scheduler.server_inventory
+    with trace_span("resolve_targets"):
+        resolved_targets = [power_control_wave_scheduler.resolve_target(power_control_target_server_id_dictionary)
+                            for power_control_target_server_id_dictionary
+                            in power_control_target_server_id_dictionary_list
+                            ]
+    if not power_control_wave_scheduler.force_power_control:
+        resolved_targets = power_control_wave_scheduler.remove_targets_in_desired_state(resolved_targets)
+    power_control_batches = []
+    for power_control_batch_state, power_control_batch in power_control_wave_scheduler.group_by_power_control_state(resolved_targets).items():
+        shard_groups = {}
+        for resolved_target in power_control_batch:
+            server_moid = resolved_target["Server"].get("Moid", "")
+            if reformatted_shard_grouping == "domain":
+                shard_group_key = resolved_target["Domain Moid"]
+            else:
+                shard_group_key = f"hash-{int(hashlib.sha256(server_moid.encode()).hexdigest(), 16) % hash_shard_count}"
+            shard_groups.setdefault(shard_group_key, []).append({
+                "Target": dict(resolved_target["Target"], **{"Power Control State": resolved_target["Power Control State"]}),
+                "Server": resolved_target["Server"],
+                "Server Settings Moid": server_inventory.get_server_settings_moid(server_moid)
+                })
+        power_control_batches.append([
+            (f"{power_control_batch_state}/{shard_group_key}/{shard_index // shard_size + 1}",
+             shard_group[shard_index:shard_index + shard_size])
+            for shard_group_key, shard_group in shard_groups.items()
+            for shard_index in range(0, len(shard_group), shard_size)
+            ])
+    job_settings = dict(wave_scheduler_settings,
+                        power_control_state=power_control_state,
+                        intersight_account_name=server_inventory.get_account_name()
+                        )
+    job_id = job_queue.submit_job(job_settings, power_control_batches)
+    return job_id, sum(len(power_control_batch) for power_control_batch in power_control_batches)
 
 
-# Establish advanced function to retrieve Intersight API objects
-def advanced_intersight_object_moid_retriever(intersight_api_key_id,
-                                              intersight_api_key,
-                                              object_attributes,
-                                              intersight_api_path,
-                                              object_type="object",
-                                              organization="default",
-                                              intersight_base_url="https://www.intersight.com/api/v1",
-                                              preconfigured_api_client=None
-                                              ):
-    """This is a function to retrieve the MOID of Intersight objects based on
-    various provided attributes using the Intersight API.
+# Establish function to wait for a distributed power control job and collect its results
+def wait_for_power_control_job(job_queue,
+                               job_id,
+                               poll_interval=5
+                               ):
+    """This is a function to wait for every shard of a job to finish. The
+    results reported by the workers are written by the active results writer
+    as the shards finish.
 
     Args:
-        intersight_api_key_id (str):
-            The ID of the Intersight API key.
-        intersight_api_key (str):
-            The system file path of the Intersight API key.
-        object_attributes (dict):
-            A dictionary containing the identifying attribute keys and values
-            of the Intersight object to be found.
-        intersight_api_path (str):
-            The Intersight API path of the Intersight object.
-        object_type (str):
-            Optional; The type of Intersight object. The default value is
-            "object".
-        organization (str):
-            Optional; The Intersight organization of the Intersight object.
-            The default value is "default".
+        job_queue (PowerControlJobQueue):
+            The job queue.
+        job_id (int):
+            The ID of the job.
+        poll_interval (int):
+            Optional; The number of seconds between checks of the job
+            progress. The default value is 5.
+
+    Returns:
+        A dictionary with the number of power control operations by result,
+        including the "Failed Shards".
+    """
+    finished_shard_ids = set()
+    power_control_result_counts = collections.Counter()
+    while True:
+        job_progress = job_queue.get_job_progress(job_id)
+        for finished_shard in job_queue.iterate_finished_shards(job_id, finished_shard_ids):
+            finished_shard_ids.add(finished_shard["Shard ID"])
+            if finished_shard["Error"]:
+                power_control_result_counts["Failed Shards"] += 1
+                logger.error("The shard %s failed. %s",
+                             finished_shard["Shard Key"],
+                             finished_shard["Error"]
+                             )
+            for power_control_result in finished_shard["Results"]:
+                power_control_result_counts[power_control_result.get("Result")] += 1
+                if _active_results_writer is not None:
+                    _active_results_writer.write_result(power_control_result)
+        if not job_progress.get("Pending") and not job_progress.get("Claimed"):
+            return dict(power_control_result_counts)
+        logger.info("Job %s: %d of %d shards finished.",
+                    job_id,
+                    len(finished_shard_ids),
+                    sum(job_progress.values())
+                    )
+        time.sleep(poll_interval)
+
+
+# Establish function to run the shards of distributed power control jobs as a worker
+def run_power_control_worker(job_queue,
+                             worker_id=None,
+                             max_workers=50,
+                             exit_when_idle=True,
+                             idle_poll_interval=2,
+                             intersight_base_url="https://www.intersight.com/api/v1",
+                             preconfigured_api_client=None
+                             ):
+    """This is a function to claim and run the shards of the job queue until
+    there are no unfinished shards left, or until interrupted. The server
+    inventory of each shard is loaded from the shard data, and the results of
+    the power control operations are reported back to the job queue.
+
+    Args:
+        job_queue (PowerControlJobQueue):
+            The job queue.
+        worker_id (str):
+            Optional; The ID of the worker. The default value is None, which
+            creates an ID from the host name and process ID.
+        max_workers (int):
+            Optional; The maximum number of concurrent operations of the
+            worker. The default value is 50.
+        exit_when_idle (bool):
+            Optional; A setting to determine whether the worker exits when
+            there are no unfinished shards left. The default value is True.
+        idle_poll_interval (int):
+            Optional; The number of seconds between claim attempts when no
+            shard can be run. The default value is 2.
         intersight_base_url (str):
             Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance.
+            is "https://www.intersight.com/api/v1".
         preconfigured_api_client ("ApiClient"):
             Optional; An ApiClient class instance which handles
             Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
+            The default value is None.
 
     Returns:
-        A string of the MOID for the provided Intersight object.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue accessing the Intersight API
-            path. The status code or error message will be specified.
+        The number of shards run by the worker.
     """
-    # Define Intersight SDK ApiClient variable
+    if worker_id is None:
+        worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
     if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+        preconfigured_api_client = get_shared_api_client(api_key_id=None,
+                                                         api_secret_file=None,
+                                                         endpoint=intersight_base_url
+                                                         )
+    shards_run = 0
+    while True:
+        claimed_shard = job_queue.claim_shard(worker_id)
+        if claimed_shard is None:
+            if exit_when_idle and not job_queue.has_unfinished_shards():
+                return shards_run
+            time.sleep(idle_poll_interval)
+            continue
+        logger.info("\nWorker %s is running the shard %s with %d target servers.",
+                    worker_id,
+                    claimed_shard["Shard Key"],
+                    len(claimed_shard["Shard Data"])
+                    )
+        # Keep the lease of the shard while it is running
+        shard_stopped = threading.Event()
+
+        def send_heartbeats():
+            while not shard_stopped.wait(job_queue.lease_duration / 3):
+                try:
+                    job_queue.heartbeat(worker_id)
+                except sqlite3.Error:
+                    logger.warning("Unable to record the heartbeat of worker %s.", worker_id, exc_info=True)
+
+        heartbeat_thread = threading.Thread(target=send_heartbeats, name="power-control-worker-heartbeat", daemon=True)
+        heartbeat_thread.start()
+        power_control_results = list(claimed_shard["Target Results"].values())
+        shard_error = None
+        try:
+            remaining_shard_data = [shard_entry
+                                    for shard_entry in claimed_shard["Shard Data"]
+                                    if shard_entry["Server"].get("Moid") not in claimed_shard["Target Results"]
+                                    ]
+            if len(remaining_shard_data) < len(claimed_shard["Shard Data"]):
+                logger.info("Skipping %d target servers of the shard %s already submitted by a previous attempt.",
+                            len(claimed_shard["Shard Data"]) - len(remaining_shard_data),
+                            claimed_shard["Shard Key"]
                             )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("There was an issue retrieving the "
-              f"{object_type} from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+            job_settings = dict(claimed_shard["Job Settings"])
+            job_settings.pop("max_workers", None)
+            shard_server_inventory = IntersightServerInventory(preconfigured_api_client,
+                                                               intersight_base_url=intersight_base_url
+                                                               )
+            shard_server_inventory.set_account_name(job_settings.pop("intersight_account_name"))
+            for shard_entry in remaining_shard_data:
+                shard_server_inventory.add_server(
+                    _get_server_search_settings(shard_entry["Target"].get("Server Identifier"),
+                                                shard_entry["Target"].get("Server Form Factor", "Blade"),
+                                                shard_entry["Target"].get("Server Connection Type", "FI-Attached")
+                                                ),
+                    shard_entry["Server"],
+                    server_identifiers=string_to_list_maker(str(shard_entry["Target"].get("Server Identifier"))),
+                    server_settings_moid=shard_entry["Server Settings Moid"]
+                    )
+            with trace_span("power_control_shard", shard_key=claimed_shard["Shard Key"]):
+                power_control_results.extend(
+                    PowerControlResultsWriter.build_result(server_settings_power_state)
+                    for server_settings_power_state in DistributedPowerControlWaveScheduler(
+                        job_queue,
+                        worker_id,
+                        shard_id=claimed_shard["Shard ID"],
+                        max_workers=max_workers,
+                        intersight_base_url=intersight_base_url,
+                        preconfigured_api_client=preconfigured_api_client,
+                        server_inventory=shard_server_inventory,
+                        **job_settings
+                        ).run([shard_entry["Target"] for shard_entry in remaining_shard_data])
+                    )
+        except (Exception, SystemExit) as shard_exception:
+            shard_error = f"{type(shard_exception).__name__}: {shard_exception}"
+            power_control_results = list(job_queue.get_target_results(claimed_shard["Shard ID"]).values())
+            logger.error("Worker %s was unable to run the shard %s.",
+                         worker_id,
+                         claimed_shard["Shard Key"],
+                         exc_info=True
+                         )
+        finally:
+            shard_stopped.set()
+            heartbeat_thread.join()
+        job_queue.complete_shard(claimed_shard["Shard ID"], worker_id, power_control_results, error=shard_error)
+        shards_run += 1
 
-    if intersight_objects.get("Results"):
-        for intersight_object in intersight_objects.get("Results"):
-            if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
-                if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
-                    for object_attribute in object_attributes:
-                        try:
-                            intersight_object[object_attribute]
-                        except KeyError:
-                            break
-                        if intersight_object.get(object_attribute) != object_attributes.get(object_attribute):
-                            break
-                    else:
-                        intersight_object_moid = intersight_object.get("Moid")
-                        # The provided object and MOID has been identified and retrieved.
-                        return intersight_object_moid
-            else:
-                for object_attribute in object_attributes:
-                    try:
-                        intersight_object[object_attribute]
-                    except KeyError:
-                        break
-                    if intersight_object.get(object_attribute) != object_attributes.get(object_attribute):
-                        break
-                else:
-                    intersight_object_moid = intersight_object.get("Moid")
-                    # The provided object and MOID has been identified and retrieved.
-                    return intersight_object_moid
-        else:
-            print("\nA configuration error has occurred!\n")
-            print(f"The provided {object_type} was not found.")
-            print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
-            print("Verify through the API or GUI that the needed "
-                  f"{object_type} is present.")
-            print(f"If the needed {object_type} is missing, please create it.")
-            print("Once the issue has been resolved, re-attempt execution.\n")
-            sys.exit(0)
-    else:
-        print("\nA configuration error has occurred!\n")
-        print(f"The provided {object_type} was not found.")
-        print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
-        print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
-        print(f"Verify through the API or GUI that the needed {object_type} "
-              "is present.")
-        print(f"If the needed {object_type} is missing, please create it.")
-        print(f"Once the issue has been resolved, re-attempt execution.\n")
-        sys.exit(0)
 
+# Establish class for the responses of the asynchronous Intersight API client
+class AsyncIntersightApiResponse:
+    """This class holds the status, reason, headers and data of a response
+    received by the AsyncIntersightApiClient class.
+    """
+    def __init__(self,
+                 status,
+                 reason,
+                 headers,
+                 data
+                 ):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
 
-# Establish function to convert a list of strings in string type format to list type format.
-def string_to_list_maker(string_list,
-                         remove_duplicate_elements_in_list=True
-                         ):
-    """This function converts a list of strings in string type format to list
-    type format. The provided string should contain commas, semicolons, or
-    spaces as the separator between strings. For each string in the list,
-    leading and rear spaces will be removed. Duplicate strings in the list are
-    removed by default.
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.status}, "
+            f"'{self.reason}', "
+            f"{self.headers}, "
+            f"{self.data!r})"
+            )
 
-    Args:
-        string_list (str):
-            A string containing an element or range of elements.
+    def __str__(self):
+        return f"{self.__class__.__name__} class object with status {self.status}"
 
-        remove_duplicate_elements_in_list (bool):
-            Optional; A setting to determine whether duplicate elements are
-            removed from the provided string list. The default value is True.
+    def getheader(self,
+                  name,
+                  default=None
+                  ):
+        return self.headers.get(name, default)
 
-    Returns:
-        A list of elements.   
+    def getheaders(self):
+        return self.headers
+
+
+# Establish class for the asynchronous Intersight API client
+class AsyncIntersightApiClient:
+    """This class is an asyncio-native counterpart of the Intersight SDK
+    ApiClient class. Requests are sent with aiohttp on a single event loop and
+    signed with the HTTP signature configuration of an Intersight SDK
+    Configuration, so hundreds of requests can be kept in flight without a
+    thread per request.
     """
-    def string_to_list_separator(string_list,
-                                 separator
-                                 ):
-        """This function converts a list of elements in string type format to
-        list type format using the provided separator. For each element in the
-        list, leading and rear spaces are removed.
+    def __init__(self,
+                 configuration,
+                 max_requests_in_flight=100
+                 ):
+        if aiohttp is None:
+            raise ImportError("The aiohttp package is required for the asynchronous "
+                              "Intersight API client. It can be installed by running "
+                              "'pip install aiohttp'.")
+        self.configuration = configuration
+        self.max_requests_in_flight = max_requests_in_flight
+        self._session = None
+        self._request_semaphore = None
+        self._intersight_account_name = None
+        self._organization_moids = {}
+        self._cache_lock = None
+        self._server_inventories = {}
+        self._servers_by_moid = {}
+        self._server_settings_moids = None
+        self._inventory_lock = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.configuration}, "
+            f"{self.max_requests_in_flight})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for '{self.configuration.host}'"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.close()
+
+    def _get_session(self):
+        """This function creates the aiohttp client session on first use, so
+        that it is bound to the running event loop.
+
+        Returns:
+            The aiohttp ClientSession class instance.
+        """
+        if self._session is None:
+            connector_settings = {"limit": self.max_requests_in_flight}
+            if not self.configuration.verify_ssl:
+                connector_settings["ssl"] = False
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(**connector_settings))
+            self._request_semaphore = asyncio.Semaphore(self.max_requests_in_flight)
+        return self._session
+
+    async def close(self):
+        """This function closes the aiohttp client session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def call_api(self,
+                       resource_path,
+                       method,
+                       body=None,
+                       auth_settings=None
+                       ):
+        """This function performs a signed request to the Intersight API.
 
         Args:
-            string_list (str):
-                A string containing an element or range of elements.
+            resource_path (str):
+                The Intersight API resource path, including any query string.
+            method (str):
+                The HTTP method of the request.
+            body (dict):
+                Optional; The body of the request. The default value is None.
+            auth_settings (list):
+                Optional; Accepted for compatibility with the call_api method
+                of the Intersight SDK ApiClient class. The request is always
+                signed with the HTTP signature configuration.
 
-            separator (str):
-                The character to identify where elements in the
-                list should be separated (e.g., a comma, semicolon,
-                hyphen, etc.).
+        Returns:
+            An AsyncIntersightApiResponse class instance.
+
+        Raises:
+            ApiException:
+                The Intersight API returned a status code outside of the 2xx
+                range.
+        """
+        session = self._get_session()
+        header_params = {"Accept": "application/json",
+                         "Content-Type": "application/json",
+                         "User-Agent": "intersight-server-power-control/asyncio"
+                         }
+        header_params.update(
+            self.configuration.signing_info.get_http_signature_headers(resource_path,
+                                                                       method,
+                                                                       header_params,
+                                                                       body,
+                                                                       None
+                                                                       ))
+        request_body = json.dumps(body).encode("utf-8") if body is not None else None
+        request_url = yarl.URL(f"{self.configuration.host}{resource_path}", encoded=True)
+        api_call_record = {
+            "method": method,
+            "path": resource_path,
+            "resource": resource_path.split("?", 1)[0],
+            "status": None,
+            "request_bytes": len(request_body or b""),
+            "response_bytes": 0,
+            "latency_seconds": None,
+            "retry_count": 0,
+            "error": None
+            }
+        start_time = time.perf_counter()
+        try:
+            async with self._request_semaphore:
+                async with session.request(method,
+                                           request_url,
+                                           data=request_body,
+                                           headers=header_params
+                                           ) as http_response:
+                    api_response = AsyncIntersightApiResponse(http_response.status,
+                                                              http_response.reason,
+                                                              dict(http_response.headers),
+                                                              await http_response.read()
+                                                              )
+            api_call_record["status"] = api_response.status
+            api_call_record["response_bytes"] = len(api_response.data)
+            if not 200 <= api_response.status <= 299:
+                api_exception = intersight.ApiException(status=api_response.status,
+                                                        reason=api_response.reason
+                                                        )
+                api_exception.body = api_response.data
+                api_exception.headers = api_response.headers
+                raise api_exception
+            return api_response
+        except Exception as exception:
+            api_call_record["error"] = type(exception).__name__
+            raise
+        finally:
+            api_call_record["latency_seconds"] = time.perf_counter() - start_time
+            if api_call_observers:
+                _notify_api_call_observers(api_call_record)
+
+    async def get_account_name(self):
+        """This function retrieves the Intersight account name once and caches
+        it for the lifetime of the client. If the Intersight account cannot be
+        accessed, an error message is displayed and execution is exited.
 
         Returns:
-            A list of separated elements that have been stripped of any spaces.   
+            A string of the Intersight account name.
         """
-        fully_stripped_list = []
-        # Split string by provided separator and create list of separated elements.
-        split_list = string_list.split(separator)
-        for element in split_list:
-            if element:
-                # Remove leading spaces from elements in list.
-                lstripped_element = element.lstrip()
-                # Remove rear spaces from elements in list.
-                rstripped_element = lstripped_element.rstrip()
-                # Populate new list with fully stripped elements.
-                fully_stripped_list.append(rstripped_element)
-        return fully_stripped_list
+        if self._cache_lock is None:
+            self._cache_lock = asyncio.Lock()
+        async with self._cache_lock:
+            if self._intersight_account_name is None:
+                try:
+                    api_response = await self.call_api(resource_path="/iam/Accounts",
+                                                       method="GET"
+                                                       )
+                    iam_account = json.loads(api_response.data)
+                    self._intersight_account_name = iam_account["Results"][0]["Name"]
+                except Exception:
+                    logger.error("\nA configuration error has occurred!\n\n"
+                                 "Unable to access the Intersight API.\n"
+                                 "Exiting due to the Intersight API being unavailable.\n\n"
+                                 "Please verify that the correct API Key ID and API Key have "
+                                 "been entered, then re-attempt execution.\n")
+                    sys.exit(0)
+        return self._intersight_account_name
+
+    async def get_organization_moid(self,
+                                    organization="default"
+                                    ):
+        """This function retrieves the MOID of an Intersight organization once
+        and caches it for the lifetime of the client.
+
+        Args:
+            organization (str):
+                Optional; The name of the Intersight organization. The default
+                value is "default".
+
+        Returns:
+            A string of the MOID for the Intersight organization.
+        """
+        if organization not in self._organization_moids:
+            self._organization_moids[organization] = await async_intersight_object_moid_retriever(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                object_name=organization,
+                intersight_api_path="organization/Organizations?$top=1000",
+                object_type="Organization",
+                preconfigured_api_client=self
+                )
+        return self._organization_moids[organization]
+
+    async def find_server(self,
+                          server_search_settings,
+                          provided_server_identifiers
+                          ):
+        """This function finds the first server with a serial, name, model or
+        user label matching any of the provided server identifiers. The
+        servers of each form factor and management mode are retrieved once
+        with paged requests and indexed for the lifetime of the client, so concurrent target
+        servers share a single retrieval.
 
-    def list_to_list_separator(provided_list,
-                               separator
-                               ):
-        """This function converts a list of elements in list type format to
-        list type format using the provided separator. For each element in the
-        list, leading and rear spaces are removed.
+        Args:
+            server_search_settings (dict):
+                The search settings of the target server provided by the
+                _get_server_search_settings function.
+            provided_server_identifiers (list):
+                A list of server identifiers.
+
+        Returns:
+            A tuple of the list of retrieved Intersight server objects and the
+            matching Intersight server object. If there is no match, the
+            matching Intersight server object is None.
+        """
+        server_list_key = (server_search_settings["Form Factor Path"],
+                           server_search_settings["Management Mode"]
+                           )
+        if self._inventory_lock is None:
+            self._inventory_lock = asyncio.Lock()
+        async with self._inventory_lock:
+            if server_list_key not in self._server_inventories:
+                intersight_servers = [intersight_server
+                                      async for intersight_server in async_iterate_intersight_objects(
+                                          intersight_api_key_id=None,
+                                          intersight_api_key=None,
+                                          intersight_api_path=f"compute/{server_search_settings['Form Factor Path']}?$filter=ManagementMode%20eq%20%27{server_search_settings['Management Mode']}%27",
+                                          object_type=f"{server_search_settings['Object Type']}",
+                                          preconfigured_api_client=self
+                                          )
+                                      ]
+                # Index the servers by serial, name, model and user label, keeping the first server for each identifier
+                server_identifier_index = {}
+                for server_position, intersight_server in enumerate(intersight_servers):
+                    for server_attribute in ("Serial", "Name", "Model", "UserLabel"):
+                        server_identifier_index.setdefault(intersight_server.get(server_attribute, ""),
+                                                           (server_position, intersight_server)
+                                                           )
+                server_identifier_index.pop("", None)
+                self._server_inventories[server_list_key] = (intersight_servers, server_identifier_index)
+                self._servers_by_moid.update((intersight_server.get("Moid"), intersight_server)
+                                             for intersight_server in intersight_servers
+                                             )
+        intersight_servers, server_identifier_index = self._server_inventories[server_list_key]
+        # Preserve the inventory order when multiple identifiers match different servers
+        matching_intersight_servers = [server_identifier_index[provided_server_identifier]
+                                       for provided_server_identifier in provided_server_identifiers
+                                       if provided_server_identifier in server_identifier_index
+                                       ]
+        if not matching_intersight_servers:
+            return intersight_servers, None
+        return intersight_servers, min(matching_intersight_servers, key=lambda matching_server: matching_server[0])[1]
+
+    def get_server(self,
+                   server_moid
+                   ):
+        """This function retrieves a server previously found by the
+        find_server function by the MOID of the server.
 
         Args:
-            provided_list (list): A list of elements to be separated.
+            server_moid (str):
+                The MOID of the server.
 
-            separator (str): The character to identify where elements in the
-                list should be separated (e.g., a comma, semicolon,
-                hyphen, etc.).
+        Returns:
+            The Intersight server object. If the server has not been retrieved,
+            None is returned.
+        """
+        return self._servers_by_moid.get(server_moid)
+
+    async def get_server_settings_moid(self,
+                                       server_moid
+                                       ):
+        """This function retrieves the MOID of the server settings of a server.
+        The server settings inventory is retrieved once with paged requests and
+        cached for the lifetime of the client.
+
+        Args:
+            server_moid (str):
+                The MOID of the server.
 
         Returns:
-            A list of separated elements that have been stripped of any spaces.        
+            A string of the MOID for the server settings. If no server settings
+            are found for the server, None is returned.
         """
-        new_list = []
-        # Split list by provided separator and create new list of separated elements.
-        for element in provided_list:
-            if separator in element:
-                split_provided_list = string_to_list_separator(element, separator)
-                new_list.extend(split_provided_list)
-            else:
-                new_list.append(element)
-        return new_list
-    
-    staged_list = []
-    # Split provided list by spaces.
-    space_split_list = string_to_list_separator(string_list, " ")
-    # Split provided list by commas.
-    post_comma_split_list = list_to_list_separator(space_split_list, ",")
-    # Split provided list by semicolons.
-    post_semicolon_split_list = list_to_list_separator(post_comma_split_list, ";")
-    # Split provided list by hyphens.
-    for post_semicolon_split_string_set in post_semicolon_split_list:
-        staged_list.append(post_semicolon_split_string_set)
-    # Remove duplicates from list if enabled.
-    if remove_duplicate_elements_in_list:
-        final_list = list(set(staged_list))
-    return final_list
+        if self._inventory_lock is None:
+            self._inventory_lock = asyncio.Lock()
+        async with self._inventory_lock:
+            if self._server_settings_moids is None:
+                self._server_settings_moids = {
+                    server_settings.get("Server", {}).get("Moid"): server_settings.get("Moid")
+                    async for server_settings in async_iterate_intersight_objects(
+                        intersight_api_key_id=None,
+                        intersight_api_key=None,
+                        intersight_api_path=f"{ServerSettingsPowerState.intersight_api_path}?$select=Moid,Server",
+                        object_type=ServerSettingsPowerState.object_type,
+                        preconfigured_api_client=self
+                        )
+                    }
+        return self._server_settings_moids.get(server_moid)
 
 
-# Establish function to retrieve target server data
-def retrieve_target_server_data(
-    intersight_api_key_id,
-    intersight_api_key,
-    server_identifier,
-    server_form_factor="Blade",
-    server_connection_type="FI-Attached",
-    intersight_base_url="https://www.intersight.com/api/v1",
-    preconfigured_api_client=None
-    ):
+# Function to get an asynchronous Intersight API client
+def get_async_api_client(api_key_id,
+                         api_secret_file,
+                         endpoint="https://intersight.com",
+                         url_certificate_verification=True,
+                         max_requests_in_flight=100
+                         ):
+    """This is a function to get an asynchronous Intersight API client with
+    the same key handling and signing configuration as the get_api_client
+    function.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; A setting to determine whether the certificate of the
+            endpoint is verified. The default value is True.
+        max_requests_in_flight (int):
+            Optional; The maximum number of concurrent Intersight API
+            requests. The default value is 100.
+
+    Returns:
+        An AsyncIntersightApiClient class instance.
     """
-    This is a function to retrieve data for a target server on Cisco Intersight.
+    api_client = get_api_client(api_key_id=api_key_id,
+                                api_secret_file=api_secret_file,
+                                endpoint=endpoint,
+                                url_certificate_verification=url_certificate_verification
+                                )
+    return AsyncIntersightApiClient(api_client.configuration,
+                                    max_requests_in_flight=max_requests_in_flight
+                                    )
+
+
+# Establish function to provide an asynchronous Intersight API client for the asynchronous functions
+@contextlib.asynccontextmanager
+async def _async_api_client_context(intersight_api_key_id,
+                                    intersight_api_key,
+                                    intersight_base_url="https://www.intersight.com/api/v1",
+                                    preconfigured_api_client=None
+                                    ):
+    """This is a function to provide the preconfigured asynchronous Intersight
+    API client or, if none is provided, a new client that is closed on exit.
+
+    Yields:
+        An AsyncIntersightApiClient class instance.
+    """
+    if preconfigured_api_client is not None:
+        yield preconfigured_api_client
+        return
+    async with get_async_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    ) as api_client:
+        yield api_client
+
+
+# Establish asynchronous function to retrieve all instances of a particular Intersight API object type
+async def async_get_intersight_objects(intersight_api_key_id,
+                                       intersight_api_key,
+                                       intersight_api_path,
+                                       object_type="object",
+                                       intersight_base_url="https://www.intersight.com/api/v1",
+                                       preconfigured_api_client=None
+                                       ):
+    """This is the asynchronous counterpart of the get_intersight_objects
+    function.
 
     Args:
         intersight_api_key_id (str):
             The ID of the Intersight API key.
         intersight_api_key (str):
             The system file path of the Intersight API key.
-        server_identifier (str):
-            The identifier of the target server.
-        server_form_factor (str):
-            Optional; The form factor of the target server. The accepted values
-            are "Blade" or "Rack". The default value is "Blade".
-        server_connection_type (str):
-            Optional; The connection type of the target server. The accepted
-            values are "FI-Attached" or "Standalone". IMM (Intersight Managed
-            Mode) environments should use "FI-Attached". The default value is
-            "FI-Attached".
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
         intersight_base_url (str):
             Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance.
-        preconfigured_api_client ("ApiClient"):
-            Optional; An ApiClient class instance which handles
-            Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None. If a preconfigured_api_client argument is provided,
+            empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
 
     Returns:
-        A dictionary with the data for a target server on Cisco Intersight.
+        A dictionary containing all objects of the specified API type.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
-    # If a Server Identifier has been provided, retrieve the targeted Server data
-    if server_identifier:
-        print("The provided server identifier for retrieval is "
-              f"'{server_identifier}'.")
-        provided_server_identifiers = string_to_list_maker(server_identifier)
-        # Determine Server Form Factor
-        if server_form_factor == "Blade":
-            provided_server_form_factor = "Blades"
-            provided_server_object_type = "Blade Server"
-        elif server_form_factor == "Rack":
-            provided_server_form_factor = "RackUnits"
-            provided_server_object_type = "Rack Server"
-        else:
-            print("\nA configuration error has occurred!\n")
-            print(f"During the retrieval of the data for the server "
-                  f"identifier '{server_identifier}', there was an issue "
-                  "with the value provided for the server form factor "
-                  "setting.")
-            print(f"The value provided was {server_form_factor}.")
-            print("To proceed, the value provided for the server form "
-                  "factor setting should be updated to an accepted string "
-                  "format.")
-            print("The accepted values are 'Blade' or 'Rack'.")
-            print("Please update the configuration, then re-attempt "
-                  "execution.\n")
-            sys.exit(0)
-        # Determine the Server Type (Target Platform or Management Mode)
-        if server_connection_type == "FI-Attached":
-            provided_server_connection_type = "FI-Attached"
-            provided_server_management_mode = "Intersight"
-        elif server_connection_type == "Standalone":
-            provided_server_connection_type = "Standalone"
-            provided_server_management_mode = "IntersightStandalone"
-        else:
-            print("\nA configuration error has occurred!\n")
-            print(f"During the retrieval of the data for the server "
-                  f"identifier '{server_identifier}', there was an issue "
-                  "with the value provided for the server type setting.")
-            print(f"The value provided was {server_connection_type}.")
-            print("To proceed, the value provided for the server type "
-                  "setting should be updated to an accepted string format.")
-            print("The accepted values are 'FI-Attached' or 'Standalone'.")
-            print("Please update the configuration, then re-attempt "
-                  "execution.\n")
-            sys.exit(0)
-        # Find provided Server
-        retrieved_intersight_servers = get_intersight_objects(
-            intersight_api_key_id=None,
-            intersight_api_key=None,
-            intersight_api_path=f"compute/{provided_server_form_factor}?$top=1000&$filter=ManagementMode%20eq%20%27{provided_server_management_mode}%27",
-            object_type=f"{provided_server_object_type}",
-            preconfigured_api_client=api_client
-            )
-        if retrieved_intersight_servers.get("Results"):
-            matching_intersight_server = None
-            for intersight_server in retrieved_intersight_servers.get("Results"):
-                server_serial = intersight_server.get("Serial", "")
-                server_name = intersight_server.get("Name", "")
-                server_model = intersight_server.get("Model", "")
-                server_user_label = intersight_server.get("UserLabel", "")
-                for server_identifier in provided_server_identifiers:
-                    if server_identifier in [server_serial,
-                                             server_name,
-                                             server_model,
-                                             server_user_label
-                                             ]:
-                        matching_intersight_server = intersight_server
-                        break
-                if matching_intersight_server:
-                    break
-            else:
-                print("\nA configuration error has occurred!\n")
-                print("There was an issue retrieving the server data "
-                      "in Intersight.")
-                print(f"A {provided_server_object_type} with the provided "
-                      f"identifier of '{server_identifier}' was "
-                      "not found.")
-                print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
-                print("Verify through the API or GUI that the needed "
-                      f"{provided_server_object_type} and matching "
-                      "identifier are present.")
-                print("If any associated Intersight Target is missing, such as "
-                      "an Intersight Managed Domain through an attached Fabric "
-                      "Interconnect pair, claiming it first may be required.")
-                print(f"Once the issue has been resolved, re-attempt "
-                      "execution.\n")
-                sys.exit(0)
-        else:
-            print("\nA configuration error has occurred!\n")
-            print("There was an issue retrieving the server data "
-                  "in Intersight.")
-            print(f"The {provided_server_object_type} with the provided "
-                  f"identifier of '{server_identifier}' was not "
-                  "found.")
-            print(f"No {provided_server_object_type}s could be found in "
-                  "the Intersight account named "
-                  f"{intersight_account_name}.")
-            print(f"Compatible {provided_server_object_type}s need to be "
-                  f"{provided_server_connection_type}.")
-            print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
-            print("Verify through the API or GUI that the needed "
-                  f"{provided_server_object_type} and matching "
-                  "identifier are present.")
-            print("If any associated Intersight Target is missing, such as an "
-                  "Intersight Managed Domain through an attached Fabric "
-                  "Interconnect pair, claiming it first may be required.")
-            print("Once the issue has been resolved, re-attempt execution.\n")
+    async with _async_api_client_context(intersight_api_key_id,
+                                         intersight_api_key,
+                                         intersight_base_url,
+                                         preconfigured_api_client
+                                         ) as api_client:
+        # Retrieving the provided object from Intersight...
+        full_intersight_api_path = f"/{intersight_api_path}"
+        try:
+            api_response = await api_client.call_api(resource_path=full_intersight_api_path,
+                                                      method="GET"
+                                                      )
+            # The Intersight API resource path has been accessed successfully.
+            return json.loads(api_response.data)
+        except Exception:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"There was an issue retrieving the requested {object_type} "
+                         "instances from Intersight.\n"
+                         "Unable to access the provided Intersight API resource path "
+                         f"'{intersight_api_path}'.\n"
+                         "Please review and resolve any error messages, then re-attempt "
+                         "execution.\n\n"
+                         "Exception Message: ",
+                         exc_info=True
+                         )
             sys.exit(0)
-        # Log name of found matching Server
-        matching_intersight_server_name = matching_intersight_server.get("Name")
-        print(f"A matching {provided_server_object_type} named "
-              f"{matching_intersight_server_name} has been found.")
-        # Create the dictionary for the provided Server Identifier
-        matching_intersight_server_moid = matching_intersight_server.get("Moid")
-        matching_intersight_server_object_type = matching_intersight_server.get("ObjectType")
-        matching_intersight_server_dictionary = {
-            "ClassId": "mo.MoRef",
-            "Moid": matching_intersight_server_moid,
-            "ObjectType": matching_intersight_server_object_type,
-            "link": f"{intersight_base_url}/compute/{provided_server_form_factor}/{matching_intersight_server_moid}"
-            }
-        return matching_intersight_server_dictionary           
-    # Display error message if no Server Identifier is provided
-    else:
-        print("\nA configuration error has occurred!\n")
-        print("There was an issue retrieving the server data in "
-              "Intersight.")
-        print("In order to retrieve the server data, a "
-              "server identifier must also be provided.")
-        print("Please check the value provided for the "
-              "server identifier.")
-        print("Once the issue has been resolved, re-attempt execution.\n")
-        sys.exit(0)            
-    
 
-# Establish classes and functions to control the power state of UCS servers
-class ServerSettingsPowerState:
-    """This class is used to control the power state of UCS servers in Intersight.
+
+# Establish asynchronous function to retrieve all instances of a particular Intersight API object type with paging
+async def async_iterate_intersight_objects(intersight_api_key_id,
+                                           intersight_api_key,
+                                           intersight_api_path,
+                                           object_type="object",
+                                           page_size=1000,
+                                           intersight_base_url="https://www.intersight.com/api/v1",
+                                           preconfigured_api_client=None
+                                           ):
+    """This is the asynchronous counterpart of the iterate_intersight_objects
+    function.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type, optionally
+            including query options such as $filter or $select. The $top and
+            $skip query options are added for paging.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        page_size (int):
+            Optional; The number of objects retrieved per request. The default
+            value is 1000, which is the maximum supported by Intersight.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None.
+
+    Yields:
+        A dictionary for each object of the specified API type.
     """
-    object_type = "Server Settings (Power State Only)"
-    intersight_api_path = "compute/ServerSettings"
-    object_variable_value_maps = [
-        {"VariableName": "power_control_state",
-         "Description": "Power Control State",
-         "AttributeName": "AdminPowerState",
-         "Values": [
-             {"FrontEndValue": "Power On",
-              "BackEndValue": "PowerOn"
-              },
-             {"FrontEndValue": "Power Off",
-              "BackEndValue": "PowerOff"
-              },
-             {"FrontEndValue": "Power Cycle",
-              "BackEndValue": "PowerCycle"
-              },
-             {"FrontEndValue": "Hard Reset",
-              "BackEndValue": "HardReset"
-              },
-             {"FrontEndValue": "Shutdown",
-              "BackEndValue": "Shutdown"
-              },
-             {"FrontEndValue": "Reboot CIMC",
-              "BackEndValue": "Reboot"
-              }
-             ]
-         }
-        ]
-    
-    def __init__(
-        self,
-        intersight_api_key_id,
-        intersight_api_key,
-        power_control_target_server_id_dictionary,
-        power_control_state,
-        intersight_base_url="https://www.intersight.com/api/v1",
-        preconfigured_api_client=None
-        ):
-        self.intersight_api_key_id = intersight_api_key_id
-        self.intersight_api_key = intersight_api_key
-        self.power_control_target_server_id_dictionary = power_control_target_server_id_dictionary
-        self.power_control_state = power_control_state
-        self.intersight_base_url = intersight_base_url
-        if preconfigured_api_client is None:
-            self.api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                             api_secret_file=intersight_api_key,
-                                             endpoint=intersight_base_url
-                                             )
-        else:
-            self.api_client = preconfigured_api_client
-        self.intersight_api_body = {}
+    async with _async_api_client_context(intersight_api_key_id,
+                                         intersight_api_key,
+                                         intersight_base_url,
+                                         preconfigured_api_client
+                                         ) as api_client:
+        query_separator = "&" if "?" in intersight_api_path else "?"
+        objects_skipped = 0
+        while True:
+            intersight_objects_page = await async_get_intersight_objects(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                intersight_api_path=f"{intersight_api_path}{query_separator}$top={page_size}&$skip={objects_skipped}",
+                object_type=object_type,
+                preconfigured_api_client=api_client
+                )
+            intersight_objects = intersight_objects_page.get("Results") or []
+            for intersight_object in intersight_objects:
+                yield intersight_object
+            if len(intersight_objects) < page_size:
+                break
+            objects_skipped += page_size
 
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}"
-            f"('{self.intersight_api_key_id}', "
-            f"'{self.intersight_api_key}', "
-            f"'{self.power_control_target_server_id_dictionary}', "
-            f"'{self.power_control_state}', "
-            f"'{self.intersight_base_url}', "
-            f"{self.api_client})"
-            )
 
-    def __str__(self):
-        return f"{self.__class__.__name__} class object for '{self.power_control_target_server_id_dictionary}'"
+# Establish function to display an error message when an Intersight object is not found
+def _exit_for_missing_intersight_object(object_type,
+                                        intersight_account_name,
+                                        object_name=None,
+                                        no_instances_available=False
+                                        ):
+    """This is a function to display an error message and exit execution when
+    a provided Intersight object is not found.
+    """
+    object_description = f" named '{object_name}'" if object_name else ""
+    no_instances_message = (f"No requested {object_type} instance is currently available in "
+                            f"the Intersight account named {intersight_account_name}.\n"
+                            if no_instances_available else "")
+    logger.error("\nA configuration error has occurred!\n\n"
+                 f"The provided {object_type}{object_description} was not found.\n"
+                 f"{no_instances_message}"
+                 "Please check the Intersight Account named "
+                 f"{intersight_account_name}.\n"
+                 "Verify through the API or GUI that the needed "
+                 f"{object_type} is present.\n"
+                 f"If the needed {object_type} is missing, please create it.\n"
+                 "Once the issue has been resolved, re-attempt execution.\n")
+    sys.exit(0)
+
+
+# Establish asynchronous function to retrieve the MOID of a specific Intersight API object by name
+async def async_intersight_object_moid_retriever(intersight_api_key_id,
+                                                 intersight_api_key,
+                                                 object_name,
+                                                 intersight_api_path,
+                                                 object_type="object",
+                                                 organization="default",
+                                                 intersight_base_url="https://www.intersight.com/api/v1",
+                                                 preconfigured_api_client=None
+                                                 ):
+    """This is the asynchronous counterpart of the
+    intersight_object_moid_retriever function. The Intersight account name and
+    organization MOID are retrieved once per client.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        object_name (str):
+            The name of the Intersight object.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        organization (str):
+            Optional; The Intersight organization of the Intersight object.
+            The default value is "default".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None.
+
+    Returns:
+        A string of the MOID for the provided Intersight object.
+    """
+    async with _async_api_client_context(intersight_api_key_id,
+                                         intersight_api_key,
+                                         intersight_base_url,
+                                         preconfigured_api_client
+                                         ) as api_client:
+        intersight_account_name = await api_client.get_account_name()
+        intersight_objects = await async_get_intersight_objects(intersight_api_key_id=None,
+                                                                intersight_api_key=None,
+                                                                intersight_api_path=intersight_api_path,
+                                                                object_type=object_type,
+                                                                preconfigured_api_client=api_client
+                                                                )
+        if not intersight_objects.get("Results"):
+            _exit_for_missing_intersight_object(object_type,
+                                                intersight_account_name,
+                                                object_name,
+                                                no_instances_available=True
+                                                )
+        for intersight_object in intersight_objects.get("Results"):
+            if intersight_object.get("Name") != object_name:
+                continue
+            if intersight_object.get("Organization"):
+                provided_organization_moid = await api_client.get_organization_moid(organization)
+                if intersight_object.get("Organization", {}).get("Moid") != provided_organization_moid:
+                    continue
+            # The provided object and MOID has been identified and retrieved.
+            return intersight_object.get("Moid")
+        _exit_for_missing_intersight_object(object_type,
+                                            intersight_account_name,
+                                            object_name
+                                            )
+
+
+# Establish advanced asynchronous function to retrieve Intersight API objects
+async def async_advanced_intersight_object_moid_retriever(intersight_api_key_id,
+                                                          intersight_api_key,
+                                                          object_attributes,
+                                                          intersight_api_path,
+                                                          object_type="object",
+                                                          organization="default",
+                                                          intersight_base_url="https://www.intersight.com/api/v1",
+                                                          preconfigured_api_client=None
+                                                          ):
+    """This is the asynchronous counterpart of the
+    advanced_intersight_object_moid_retriever function.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        object_attributes (dict):
+            A dictionary containing the identifying attribute keys and values
+            of the Intersight object to be found.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        organization (str):
+            Optional; The Intersight organization of the Intersight object.
+            The default value is "default".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None.
+
+    Returns:
+        A string of the MOID for the provided Intersight object.
+    """
+    async with _async_api_client_context(intersight_api_key_id,
+                                         intersight_api_key,
+                                         intersight_base_url,
+                                         preconfigured_api_client
+                                         ) as api_client:
+        intersight_account_name = await api_client.get_account_name()
+        intersight_objects = await async_get_intersight_objects(intersight_api_key_id=None,
+                                                                intersight_api_key=None,
+                                                                intersight_api_path=intersight_api_path,
+                                                                object_type=object_type,
+                                                                preconfigured_api_client=api_client
+                                                                )
+        if not intersight_objects.get("Results"):
+            _exit_for_missing_intersight_object(object_type,
+                                                intersight_account_name,
+                                                no_instances_available=True
+                                                )
+        for intersight_object in intersight_objects.get("Results"):
+            if any(object_attribute not in intersight_object
+                   or intersight_object.get(object_attribute) != object_attribute_value
+                   for object_attribute, object_attribute_value in object_attributes.items()
+                   ):
+                continue
+            if intersight_object.get("Organization"):
+                provided_organization_moid = await api_client.get_organization_moid(organization)
+                if intersight_object.get("Organization", {}).get("Moid") != provided_organization_moid:
+                    continue
+            # The provided object and MOID has been identified and retrieved.
+            return intersight_object.get("Moid")
+        _exit_for_missing_intersight_object(object_type,
+                                            intersight_account_name
+                                            )
 
-    def _post_intersight_object(self):
-        """This is a function to configure an Intersight object by
-        performing a POST through the Intersight API.
 
-        Returns:
-            A string with a statement indicating whether the POST method
-            was successful or failed.
-            
-        Raises:
-            Exception:
-                An exception occurred while performing the API call.
-                The status code or error message will be specified.
-        """
-        # Capture Target Server ID info
-        power_control_target_server_id = self.power_control_target_server_id_dictionary.get("Server Identifier")
-        power_control_target_server_form_factor = self.power_control_target_server_id_dictionary.get("Server Form Factor", "Blade")
-        power_control_target_server_connection_type = self.power_control_target_server_id_dictionary.get("Server Connection Type", "FI-Attached")
-        print(f"\nConfiguring the {self.object_type} for the target server ID: "
-              f"{power_control_target_server_id}...")
-        # Retrieve the provided Target Server MOID and data
-        power_control_target_server_moid_and_data = retrieve_target_server_data(
-            intersight_api_key_id=None,
-            intersight_api_key=None,
-            server_identifier=power_control_target_server_id,
-            server_form_factor=power_control_target_server_form_factor,
-            server_connection_type=power_control_target_server_connection_type,
-            preconfigured_api_client=self.api_client
-            )
-        # Retrieve the provided Target Server underlying Server Settings MOID
-        power_control_target_server_compute_server_settings_moid = advanced_intersight_object_moid_retriever(
-            intersight_api_key_id=None,
-            intersight_api_key=None,
-            object_attributes={
-                "Server": power_control_target_server_moid_and_data
-                },
-            intersight_api_path=f"{self.intersight_api_path}?$top=1000",
-            object_type=self.object_type,
-            preconfigured_api_client=self.api_client
-            )
-        
-        full_intersight_api_path = f"/{self.intersight_api_path}/{power_control_target_server_compute_server_settings_moid}"
-        try:
-            self.api_client.call_api(resource_path=full_intersight_api_path,
-                                     method="POST",
-                                     body=self.intersight_api_body,
-                                     auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                                     )
-            print(f"The configuration of the base {self.object_type} "
-                  "has completed.")
-            return "The POST method was successful."
-        except Exception:
-            print("\nA configuration error has occurred!\n")
-            print(f"Unable to configure the {self.object_type} under the "
-                  "Intersight API resource path "
-                  f"'{full_intersight_api_path}'.\n")
-            print("Exception Message: ")
-            traceback.print_exc()
-            return "The POST method failed."
+# Establish asynchronous function to retrieve target server data
+async def async_retrieve_target_server_data(
+    intersight_api_key_id,
+    intersight_api_key,
+    server_identifier,
+    server_form_factor="Blade",
+    server_connection_type="FI-Attached",
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None
+    ):
+    """This is the asynchronous counterpart of the retrieve_target_server_data
+    function. The servers are retrieved once per client and the target server
+    is looked up in the cached inventory.
 
-    def _update_api_body_mapped_object_attributes(self):
-        """This function updates the Intersight API body with individual
-        attributes that require mapping frontend to backend values for
-        compatibility with the Intersight API.
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        server_identifier (str):
+            The identifier of the target server.
+        server_form_factor (str):
+            Optional; The form factor of the target server. The accepted values
+            are "Blade" or "Rack". The default value is "Blade".
+        server_connection_type (str):
+            Optional; The connection type of the target server. The accepted
+            values are "FI-Attached" or "Standalone". The default value is
+            "FI-Attached".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None.
 
-        Raises:
-            Exception:
-                An exception occurred while reformatting a provided value for
-                an attribute. The issue will likely be due to the provided
-                value not being in string format. Changing the value to string
-                format should resolve the exception.
-        """
-        # Check for object variables with value maps that need configuration
-        if self.object_variable_value_maps:
-            for object_variable in self.object_variable_value_maps:
-                # Create list of all known and accepted frontend values
-                all_known_and_accepted_frontend_values = (object_variable_value["FrontEndValue"]
-                                                          for
-                                                          object_variable_value
-                                                          in
-                                                          object_variable["Values"]
-                                                          )
-                # Retrieve the user provided object variable value
-                provided_object_variable_value = getattr(self,
-                                                         object_variable["VariableName"]
-                                                         )
-                # Reformat the user provided object variable value to lowercase and remove spaces to prevent potential format issues
-                try:
-                    reformatted_object_variable_value = "".join(provided_object_variable_value.lower().split())
-                except Exception:
-                    print("\nA configuration error has occurred!\n")
-                    print(f"During the configuration of the {self.object_type} named "
-                          f"{self.policy_name}, there was an issue with the value "
-                          f"provided for the {object_variable['Description']} setting.")
-                    print(f"The value provided was {provided_object_variable_value}.")
-                    print("To proceed, the value provided for the "
-                          f"{object_variable['Description']} setting should be updated to "
-                          "an accepted string format.")
-                    print("The recommended values are the following:\n")
-                    # Print list of all known and accepted frontend values for user
-                    print(*all_known_and_accepted_frontend_values,
-                          sep=", "
-                          )
-                    print("\nPlease update the configuration, then re-attempt "
-                          "execution.\n")
-                    sys.exit(0)
-                # Cycle through known values and match provided object variable value to backend value
-                for object_variable_value in object_variable["Values"]:
-                    # Create list of all known and accepted frontend and backend values
-                    current_known_frontend_and_backend_value_options = (object_variable_value.values())
-                    # Retrieve the current known backend value
-                    current_known_backend_value = object_variable_value["BackEndValue"]
-                    if (
-                        reformatted_object_variable_value
-                        in
-                        ("".join(current_known_frontend_or_backend_value.lower().split())
-                         for
-                         current_known_frontend_or_backend_value
-                         in
-                         current_known_frontend_and_backend_value_options
-                         )
-                        ):
-                        backend_object_variable_value = current_known_backend_value
-                        break
-                else:
-                    # If no backend match is found with the user provided object variable value, pass on the user provided object variable value to Intersight to decide
-                    print(f"\nWARNING: An unknown {self.object_type} value of "
-                          f"'{provided_object_variable_value}' has been "
-                          f"provided for the {object_variable['Description']} "
-                          "settings!")
-                    print("An attempt will be made to configure the unknown "
-                          f"{object_variable['Description']} value.")
-                    print("If there is an error, please use one of the "
-                          "following known values for the "
-                          f"{object_variable['Description']} settings, then "
-                          "re-attempt execution:\n")
-                    print(*all_known_and_accepted_frontend_values,
-                          sep=", "
-                          )
-                    backend_object_variable_value = provided_object_variable_value
-                # Update Intersight API body with the converted object variable value
-                self.intersight_api_body[object_variable["AttributeName"]] = backend_object_variable_value
-                
-    def object_maker(self):
-        """This function makes the targeted object.
-        """
-        # Update the API body with individual mapped object attributes
-        self._update_api_body_mapped_object_attributes()
-        # POST the API body to Intersight
-        self._post_intersight_object()
+    Returns:
+        A dictionary with the data for a target server on Cisco Intersight.
+    """
+    async with _async_api_client_context(intersight_api_key_id,
+                                         intersight_api_key,
+                                         intersight_base_url,
+                                         preconfigured_api_client
+                                         ) as api_client:
+        intersight_account_name = await api_client.get_account_name()
+        # Display error message if no Server Identifier is provided
+        if not server_identifier:
+            _exit_for_missing_server_identifier()
+        logger.info("The provided server identifier for retrieval is '%s'.",
+                    server_identifier,
+                    extra={"server_identifier": server_identifier}
+                    )
+        provided_server_identifiers = string_to_list_maker(server_identifier)
+        server_search_settings = _get_server_search_settings(server_identifier,
+                                                             server_form_factor,
+                                                             server_connection_type
+                                                             )
+        # Find provided Server
+        intersight_servers, matching_intersight_server = await api_client.find_server(server_search_settings,
+                                                                                      provided_server_identifiers
+                                                                                      )
+        return _create_target_server_dictionary(server_identifier,
+                                                provided_server_identifiers,
+                                                intersight_servers,
+                                                server_search_settings,
+                                                intersight_account_name,
+                                                intersight_base_url,
+                                                matching_intersight_server=matching_intersight_server
+                                                )
 
 
-def update_power_state(
+# Establish asynchronous function to update the power state of a UCS server
+async def async_update_power_state(
     intersight_api_key_id,
     intersight_api_key,
     power_control_target_server_id_dictionary,
     power_control_state,
     intersight_base_url="https://www.intersight.com/api/v1",
-    preconfigured_api_client=None
+    preconfigured_api_client=None,
+    force_power_control=False
     ):
-    """This is a function used to update the power state of a UCS server on
-    Cisco Intersight.
+    """This is the asynchronous counterpart of the update_power_state
+    function.
 
     Args:
         intersight_api_key_id (str):
@@ -1162,108 +9314,855 @@ def update_power_state(
         intersight_api_key (str):
             The system file path of the Intersight API key.
         power_control_target_server_id_dictionary (dict):
-            A dictionary containing the target server data. Required keys
-            include "Server Identifier", "Server Form Factor", and
-            "Server Connection Type". For the "Server Identifier" key, the
-            accepted values are the Server serial, name, model, or PID
-            (product ID). This information can be found in Intersight, if
-            needed. For the "Server Form Factor" key, the options are "Blade or
-            "Rack". For the "Server Connection Type" key, the options are
-            "FI-Attached" or "Standalone".
+            A dictionary containing the target server data.
         power_control_state (str):
-            The desired power state of the target UCS server. The accepted 
-            values include "Power On", "Power Off", "Power Cycle",
-            "Hard Reset", "Shutdown", and "Reboot CIMC". The "Reboot CIMC"
-            operation restarts the CIMC only, all other operations are directly
-            on the server.
+            The desired power state of the target UCS server.
         intersight_base_url (str):
             Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance.
-        preconfigured_api_client ("ApiClient"):
-            Optional; An ApiClient class instance which handles
-            Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
+            is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None.
+        force_power_control (bool):
+            Optional; Submit the power control operation even if the retrieved
+            target server is already in the desired power state. The default
+            value is False.
     """
-    def builder(target_object):
-        """This is a function used to build the objects that are components of
-        an overarching pool, policy, profile, template or related object on
-        Cisco Intersight.
-
-        Args:
-            target_object (class):
-                The class representing the object to be built on Intersight.
-
-        Raises:
-            Exception:
-                An exception occurred due to an issue accessing the Intersight
-                API path. The status code or error message will be specified.
-        """
-        try:
-            target_object.object_maker()
-        except Exception:
-            print("\nA configuration error has occurred!\n")
-            print("The builder function failed to configure the "
-                  f"{target_object.object_type} settings.")
-            print("Please check the provided arguments for the "
-                  f"{target_object.object_type} settings.\n")
-            print("Exception Message: ")
-            traceback.print_exc()
-
-    # Define and create the Server Settings object in Intersight
-    builder(
-        ServerSettingsPowerState(
+    async with _async_api_client_context(intersight_api_key_id,
+                                         intersight_api_key,
+                                         intersight_base_url,
+                                         preconfigured_api_client
+                                         ) as api_client:
+        # Define the Server Settings object
+        server_settings_power_state = ServerSettingsPowerState(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
             power_control_target_server_id_dictionary=power_control_target_server_id_dictionary,
             power_control_state=power_control_state,
             intersight_base_url=intersight_base_url,
-            preconfigured_api_client=preconfigured_api_client
-            ))
+            preconfigured_api_client=api_client,
+            force_power_control=force_power_control
+            )
+        # Create the Server Settings object in Intersight
+        with record_power_control_operation(server_settings_power_state):
+            try:
+                await server_settings_power_state.async_object_maker()
+            except Exception:
+                logger.error("\nA configuration error has occurred!\n\n"
+                             "The builder function failed to configure the "
+                             f"{server_settings_power_state.object_type} settings.\n"
+                             "Please check the provided arguments for the "
+                             f"{server_settings_power_state.object_type} settings.\n\n"
+                             "Exception Message: ",
+                             exc_info=True
+                             )
+        record_run_journal_entry(server_settings_power_state)
+        record_power_control_result(server_settings_power_state)
+
+
+# Establish asynchronous function to update the power state of multiple UCS servers on a single event loop
+async def async_update_power_states(
+    intersight_api_key_id,
+    intersight_api_key,
+    power_control_target_server_id_dictionary_list,
+    power_control_state,
+    intersight_base_url="https://www.intersight.com/api/v1",
+    url_certificate_verification=True,
+    max_requests_in_flight=100,
+    preconfigured_api_client=None,
+    force_power_control=False
+    ):
+    """This is a function used to update the power state of multiple UCS
+    servers on Cisco Intersight concurrently on a single asyncio event loop.
+    The number of concurrent Intersight API requests is limited by the
+    max_requests_in_flight setting of the asynchronous client.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        power_control_target_server_id_dictionary_list (iterable):
+            A list or other iterable of dictionaries containing the target
+            server data. The target servers are consumed as workers become
+            available, so a generator can be provided to stream the target
+            servers.
+        power_control_state (str):
+            The desired power state of the target UCS servers.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1".
+        url_certificate_verification (bool):
+            Optional; A setting to determine whether the certificate of the
+            Intersight API endpoint is verified. The default value is True.
+        max_requests_in_flight (int):
+            Optional; The maximum number of concurrent Intersight API
+            requests. The default value is 100.
+        preconfigured_api_client ("AsyncIntersightApiClient"):
+            Optional; An AsyncIntersightApiClient class instance. The default
+            value is None. If a preconfigured_api_client argument is provided,
+            empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        force_power_control (bool):
+            Optional; Submit the power control operations even if the retrieved
+            target servers are already in the desired power state. The default
+            value is False.
+    """
+    if preconfigured_api_client is None:
+        api_client = get_async_api_client(api_key_id=intersight_api_key_id,
+                                          api_secret_file=intersight_api_key,
+                                          endpoint=intersight_base_url,
+                                          url_certificate_verification=url_certificate_verification,
+                                          max_requests_in_flight=max_requests_in_flight
+                                          )
+    else:
+        api_client = preconfigured_api_client
+    power_control_target_iterator = iter(power_control_target_server_id_dictionary_list)
+
+    async def power_control_worker():
+        # Each worker takes the next target server when it becomes available, so only max_requests_in_flight target servers are held in memory
+        for power_control_target_server_id_dictionary in power_control_target_iterator:
+            await async_update_power_state(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                power_control_target_server_id_dictionary=power_control_target_server_id_dictionary,
+                power_control_state=power_control_target_server_id_dictionary.get("Power Control State", power_control_state),
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=api_client,
+                force_power_control=force_power_control
+                )
+
+    try:
+        await asyncio.gather(*(power_control_worker() for _ in range(max(1, max_requests_in_flight))))
+    finally:
+        if preconfigured_api_client is None:
+            await api_client.close()
+
+
+# Establish the accepted keys and values of the target server records read from a target input file
+_power_control_target_keys = {
+    "serveridentifier": "Server Identifier",
+    "serverformfactor": "Server Form Factor",
+    "serverconnectiontype": "Server Connection Type",
+    "powercontrolstate": "Power Control State"
+    }
+_power_control_target_accepted_values = {
+    "Server Form Factor": ("Blade", "Rack"),
+    "Server Connection Type": ("FI-Attached", "Standalone")
+    }
+
+
+# Establish function to normalize and validate a target server record read from a target input file
+def _validate_power_control_target(power_control_target_record,
+                                   power_control_target_source
+                                   ):
+    """This is a function to normalize the keys of a target server record read
+    from a target input file and to validate its values. Keys are matched
+    regardless of case, spaces and underscores, so "Server Identifier",
+    "server_identifier" and "serveridentifier" are all accepted.
+
+    Args:
+        power_control_target_record (dict):
+            The target server record.
+        power_control_target_source (str):
+            The source of the target server record, such as the file name and
+            line number, used in warning messages.
+
+    Returns:
+        A dictionary containing the target server data, or None if the target
+        server record is not valid.
+    """
+    if not isinstance(power_control_target_record, dict):
+        logger.warning("Skipping the target server record at %s. "
+                       "The record is not a mapping of keys to values.",
+                       power_control_target_source
+                       )
+        return None
+    power_control_target_server_id_dictionary = {}
+    for record_key, record_value in power_control_target_record.items():
+        if record_key is None:
+            continue
+        reformatted_record_key = "".join(str(record_key).lower().replace("_", " ").split())
+        target_key = _power_control_target_keys.get(reformatted_record_key)
+        if target_key and record_value not in (None, ""):
+            power_control_target_server_id_dictionary[target_key] = str(record_value).strip()
+    if not power_control_target_server_id_dictionary.get("Server Identifier"):
+        logger.warning("Skipping the target server record at %s. "
+                       "No value was provided for the Server Identifier.",
+                       power_control_target_source
+                       )
+        return None
+    for target_key, accepted_values in _power_control_target_accepted_values.items():
+        provided_value = power_control_target_server_id_dictionary.get(target_key)
+        if provided_value is None:
+            continue
+        for accepted_value in accepted_values:
+            if "".join(provided_value.lower().split()) == "".join(accepted_value.lower().split()):
+                power_control_target_server_id_dictionary[target_key] = accepted_value
+                break
+        else:
+            logger.warning("Skipping the target server record at %s. "
+                           "The value provided for the %s was %s. "
+                           "The accepted values are %s.",
+                           power_control_target_source,
+                           target_key,
+                           provided_value,
+                           ", ".join(accepted_values)
+                           )
+            return None
+    return power_control_target_server_id_dictionary
+
+
+# Establish function to stream the target servers from a CSV file, JSON Lines file or standard input
+def iterate_power_control_targets(target_input_file,
+                                  target_input_format="Auto"
+                                  ):
+    """This is a function to read the target servers from a CSV or JSON Lines
+    file, or from standard input, one record at a time. Each record is
+    validated as it is read and invalid records are skipped with a warning,
+    so the power control operations can start before the whole input has
+    been read and memory use does not grow with the size of the input.
+
+    Args:
+        target_input_file (str):
+            The system file path of the target input file. A value of "-"
+            reads the target servers from standard input.
+        target_input_format (str):
+            Optional; The format of the target input. The options are "Auto",
+            "CSV" or "JSON Lines". The default value of "Auto" determines the
+            format from the file extension, using "JSON Lines" for ".jsonl"
+            and ".ndjson" files and for standard input, and "CSV" otherwise.
+
+    Yields:
+        A dictionary containing the target server data for each valid target
+        server record.
+    """
+    reformatted_target_input_format = "".join(str(target_input_format).lower().split())
+    if reformatted_target_input_format == "auto":
+        if target_input_file == "-" or target_input_file.lower().endswith((".jsonl", ".ndjson")):
+            reformatted_target_input_format = "jsonlines"
+        else:
+            reformatted_target_input_format = "csv"
+    if reformatted_target_input_format not in ("csv", "jsonlines"):
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "The value provided for the target input format setting "
+                     f"was {target_input_format}.\n"
+                     "The accepted values are Auto, CSV or JSON Lines.\n"
+                     "Please update the configuration, then re-attempt "
+                     "execution.\n")
+        sys.exit(0)
+    target_input_name = "standard input" if target_input_file == "-" else target_input_file
+    if target_input_file == "-":
+        target_input_context = contextlib.nullcontext(sys.stdin)
+    else:
+        try:
+            target_input_context = open(target_input_file, newline="", encoding="utf-8-sig")
+        except OSError:
+            logger.error("\nA configuration error has occurred!\n\n"
+                         f"Unable to open the target input file '{target_input_file}'.\n\n"
+                         "Exception Message: ",
+                         exc_info=True
+                         )
+            sys.exit(0)
+    with target_input_context as target_input:
+        if reformatted_target_input_format == "csv":
+            target_records = csv.DictReader(target_input)
+            for power_control_target_record in target_records:
+                power_control_target_server_id_dictionary = _validate_power_control_target(
+                    power_control_target_record,
+                    f"{target_input_name} line {target_records.line_num}"
+                    )
+                if power_control_target_server_id_dictionary:
+                    yield power_control_target_server_id_dictionary
+        else:
+            for target_line_number, target_line in enumerate(target_input, start=1):
+                if not target_line.strip():
+                    continue
+                try:
+                    power_control_target_record = json.loads(target_line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping the target server record at %s line %d. "
+                                   "The record is not valid JSON.",
+                                   target_input_name,
+                                   target_line_number
+                                   )
+                    continue
+                power_control_target_server_id_dictionary = _validate_power_control_target(
+                    power_control_target_record,
+                    f"{target_input_name} line {target_line_number}"
+                    )
+                if power_control_target_server_id_dictionary:
+                    yield power_control_target_server_id_dictionary
+
+
+# Establish function to parse the command line arguments
+def parse_command_line_arguments(command_line_arguments=None):
+    """This is a function to parse the command line arguments of the
+    Automated Server Power Control Tool. The command line arguments override
+    the matching configuration settings.
+
+    Args:
+        command_line_arguments (list):
+            Optional; A list of command line arguments. The default value is
+            None, which will parse the arguments provided to the tool.
+
+    Returns:
+        An argparse Namespace with the parsed command line arguments.
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Automated Server Power Control Tool for Cisco Intersight"
+        )
+    argument_parser.add_argument("--targets",
+                                 default=power_control_target_input_file,
+                                 help="The file path of a CSV or JSON Lines target input file, or - for standard input."
+                                 )
+    argument_parser.add_argument("--results-file",
+                                 default=power_control_results_output_file,
+                                 help="The file path of the power control results output file."
+                                 )
+    argument_parser.add_argument("--status",
+                                 action="store_true",
+                                 help="Report the number of servers by power state, model, domain and management mode, then exit."
+                                 )
+    argument_parser.add_argument("--snapshot",
+                                 metavar="SNAPSHOT_FILE",
+                                 help="Save the current power state of the servers to a snapshot file, then exit."
+                                 )
+    argument_parser.add_argument("--restore",
+                                 metavar="SNAPSHOT_FILE",
+                                 help="Return the servers to the power states saved in a snapshot file."
+                                 )
+    argument_parser.add_argument("--coordinator",
+                                 metavar="QUEUE_FILE",
+                                 help="Split the power control operations into shards in a job queue file and wait for workers to run them."
+                                 )
+    argument_parser.add_argument("--worker",
+                                 metavar="QUEUE_FILE",
+                                 help="Run the shards in a job queue file until no unfinished shards are left."
+                                 )
+    argument_parser.add_argument("--scheduler",
+                                 action="store_true",
+                                 default=run_power_control_policy_scheduler,
+                                 help="Run the power control policies on their schedules until interrupted."
+                                 )
+    argument_parser.add_argument("--resume",
+                                 action="store_true",
+                                 default=resume_from_run_journal,
+                                 help="Resume an interrupted run from the run journal file."
+                                 )
+    argument_parser.add_argument("--journal-file",
+                                 default=run_journal_file,
+                                 help="The file path of the run journal."
+                                 )
+    argument_parser.add_argument("--profile",
+                                 nargs="?",
+                                 const="power_control_profile",
+                                 default=profile_output_prefix,
+                                 metavar="OUTPUT_PREFIX",
+                                 help="Profile the run and write the CPU and memory allocation reports with the provided file path prefix."
+                                 )
+    return argument_parser.parse_args(command_line_arguments)
 
 
 def main():
     # Establish Automated Server Power Control Tool specific variables
     deployment_type = "Automated Server Power Control Tool"
+
+    # Parse the command line arguments
+    command_line_arguments = parse_command_line_arguments()
+
+    # Configure logging for the run
+    configure_logging(log_level=log_level,
+                      log_format=log_format,
+                      quiet_mode=quiet_mode,
+                      log_output_file=log_output_file
+                      )
+
+    # Start profiling the run, if a profile output prefix has been provided
+    if command_line_arguments.profile:
+        enable_run_profiling(IntersightRunProfiler(sample_interval=profile_sample_interval,
+                                                   allocation_traceback_depth=profile_allocation_traceback_depth,
+                                                   deterministic_cpu_profile=profile_deterministic_cpu
+                                                   ))
+
+    # Read the target servers from the target input file, if one has been provided
+    if command_line_arguments.targets:
+        power_control_targets = iterate_power_control_targets(command_line_arguments.targets,
+                                                              power_control_target_input_format
+                                                              )
+    else:
+        power_control_targets = power_control_target_server_id_dictionary_list
+
+    # Start journaling the run, if a run journal file has been provided
+    if command_line_arguments.resume and not command_line_arguments.journal_file:
+        logger.error("\nA configuration error has occurred!\n\n"
+                     "A run can only be resumed when a run journal file "
+                     "has been provided.\n"
+                     "Please provide the run journal file of the interrupted "
+                     "run with the run_journal_file setting or the "
+                     "--journal-file argument, then re-attempt execution.\n")
+        sys.exit(0)
+    if command_line_arguments.journal_file:
+        main_run_journal = enable_run_journal(command_line_arguments.journal_file,
+                                              resume=command_line_arguments.resume
+                                              )
+        if command_line_arguments.resume:
+            logger.info("Resuming from the run journal '%s' with %d "
+                        "previous entries.",
+                        command_line_arguments.journal_file,
+                        len(main_run_journal.journal_entries)
+                        )
+
+    # Start writing the power control results, if a results output file has been provided
+    if command_line_arguments.results_file:
+        enable_results_output(command_line_arguments.results_file,
+                              power_control_results_output_format
+                              )
+
+    # Start tracing the run, if a trace output file has been provided
+    if trace_output_file:
+        main_run_tracer = enable_run_tracing()
+
+    # Start collecting metrics for the run, if a metrics output has been provided
+    if metrics_http_port or metrics_textfile_output:
+        main_metrics_registry = enable_metrics()
+        if metrics_http_port:
+            main_metrics_registry.start_http_server(int(metrics_http_port), metrics_http_address)
+            logger.info("The Prometheus metrics are available at "
+                        "http://%s:%s/metrics.",
+                        metrics_http_address,
+                        metrics_http_port
+                        )
     
-    # Establish Intersight SDK for Python API client instance
-    main_intersight_api_client = get_api_client(api_key_id=key_id,
-                                                api_secret_file=key,
-                                                endpoint=intersight_base_url,
-                                                url_certificate_verification=url_certificate_verification
-                                                )
+    # Start adapting the concurrency of the Intersight API requests, if enabled
+    if adaptive_concurrency:
+        enable_adaptive_concurrency(AdaptiveConcurrencyController(
+            initial_limit=adaptive_concurrency_initial_limit,
+            max_limit=adaptive_concurrency_max_limit,
+            latency_threshold=adaptive_concurrency_latency_threshold,
+            error_rate_threshold=circuit_breaker_error_rate_threshold,
+            circuit_open_duration=circuit_breaker_open_duration
+            ))
+
+    # Start coalescing identical Intersight API GET requests, if enabled
+    if api_request_coalescing:
+        enable_request_coalescing(SingleFlightRequestCoalescer(cache_ttl=api_response_cache_ttl))
+
+    # Establish Intersight SDK for Python API client instance, spreading the requests across the API key pool if provided
+    main_connection_pool_maxsize = (power_control_max_workers
+                                    if (power_control_wave_grouping
+                                        or command_line_arguments.scheduler
+                                        or command_line_arguments.restore
+                                        or command_line_arguments.worker)
+                                    else None)
+    main_rest_client_factory = get_rest_client_factory(api_http_transport,
+                                                       max_connections=api_http2_max_connections
+                                                       )
+    main_api_cassette = None
+    if api_cassette_mode:
+        main_api_cassette = open_api_cassette(api_cassette_file, api_cassette_mode)
+        main_rest_client_factory = get_cassette_rest_client_factory(main_api_cassette,
+                                                                    rest_client_factory=main_rest_client_factory,
+                                                                    replay_latency_scale=api_cassette_replay_latency_scale
+                                                                    )
+    if api_key_pool:
+        main_intersight_api_client = get_pooled_api_client([{"Key ID": key_id, "Key File": key}, *api_key_pool],
+                                                           endpoint=intersight_base_url,
+                                                           url_certificate_verification=url_certificate_verification,
+                                                           connection_pool_maxsize=main_connection_pool_maxsize,
+                                                           rest_client_factory=main_rest_client_factory,
+                                                           max_requests_per_second_per_key=api_key_pool_max_requests_per_second_per_key,
+                                                           throttle_duration=api_key_pool_throttle_duration,
+                                                           revoked_key_duration=api_key_pool_revoked_key_duration
+                                                           )
+    else:
+        main_intersight_api_client = get_shared_api_client(api_key_id=key_id,
+                                                           api_secret_file=key,
+                                                           endpoint=intersight_base_url,
+                                                           url_certificate_verification=url_certificate_verification,
+                                                           connection_pool_maxsize=main_connection_pool_maxsize,
+                                                           rest_client_factory=main_rest_client_factory
+                                                           )
     
     # Starting the Automated Server Power Control Tool for Cisco Intersight
-    print(f"\nStarting the {deployment_type} for Cisco Intersight.\n")
-
-    # Run the Intersight API and Account Availability Test
-    print("Running the Intersight API and Account Availability Test.")
-    test_intersight_api_service(
-        intersight_api_key_id=None,
-        intersight_api_key=None,
-        preconfigured_api_client=main_intersight_api_client
-        )
+    logger.info("\nStarting the %s for Cisco Intersight.\n", deployment_type)
 
-    # Update the power state of the provided UCS servers
-    for power_control_target_server_id_dictionary in power_control_target_server_id_dictionary_list:
-        update_power_state(
-            intersight_api_key_id=None,
-            intersight_api_key=None,
-            power_control_target_server_id_dictionary=power_control_target_server_id_dictionary,
-            power_control_state=power_control_state,
-            intersight_base_url=intersight_base_url,
-            preconfigured_api_client=main_intersight_api_client
-            )
+    with trace_span("run", deployment_type=deployment_type):
+        # Run the Intersight API and Account Availability Test
+        logger.info("Running the Intersight API and Account Availability Test.")
+        with trace_span("api_service_test"):
+            test_intersight_api_service(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                preconfigured_api_client=main_intersight_api_client
+                )
+
+        # Establish the server inventory shared by the power control operations
+        main_server_inventory = IntersightServerInventory(main_intersight_api_client,
+                                                          intersight_base_url=intersight_base_url
+                                                          )
+
+        # Report the power status of the servers, if requested
+        if command_line_arguments.status:
+            main_power_status_report = generate_power_status_report(
+                server_scope=power_state_snapshot_scope,
+                include_server_lists=power_status_report_include_server_lists,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=main_intersight_api_client
+                )
+            logger.info("\nPower Status Report (%s aggregation)", main_power_status_report["Aggregation"])
+            logger.info("Total Servers: %d", main_power_status_report["Total Servers"])
+            for power_status_dimension in _power_status_report_dimensions:
+                logger.info("\n%s:", power_status_dimension)
+                for power_status_group, power_status_group_count in main_power_status_report[power_status_dimension].items():
+                    logger.info("  %s: %d", power_status_group, power_status_group_count)
+                    if "Server Lists" in main_power_status_report:
+                        logger.info("    %s",
+                                    ", ".join(main_power_status_report["Server Lists"][power_status_dimension].get(power_status_group, []))
+                                    )
+            if power_status_report_output_file:
+                try:
+                    with open(power_status_report_output_file, "w", encoding="utf-8") as power_status_report_output:
+                        json.dump(main_power_status_report, power_status_report_output, indent=2)
+                except OSError:
+                    logger.error("\nA configuration error has occurred!\n\n"
+                                 "Unable to write the power status report file "
+                                 f"'{power_status_report_output_file}'.\n\n"
+                                 "Exception Message: ",
+                                 exc_info=True
+                                 )
+                    sys.exit(0)
+                logger.info("\nThe power status report has been written to '%s'.",
+                            power_status_report_output_file
+                            )
+        # Save the current power state of the servers to a snapshot file, if requested
+        elif command_line_arguments.snapshot:
+            main_snapshot_counts = take_power_state_snapshot(command_line_arguments.snapshot,
+                                                             snapshot_scope=power_state_snapshot_scope,
+                                                             snapshot_format=power_state_snapshot_format,
+                                                             intersight_base_url=intersight_base_url,
+                                                             preconfigured_api_client=main_intersight_api_client
+                                                             )
+            logger.info("\nThe power state snapshot has been written to '%s'.",
+                        command_line_arguments.snapshot
+                        )
+            logger.info("Power state snapshot: %s",
+                        ", ".join(f"{snapshot_power_state} {snapshot_power_state_count}"
+                                  for snapshot_power_state, snapshot_power_state_count
+                                  in main_snapshot_counts.items()
+                                  ) or "None"
+                        )
+        # Return the servers to the power states saved in a snapshot file, if requested
+        elif command_line_arguments.restore:
+            restore_power_state_snapshot(
+                command_line_arguments.restore,
+                snapshot_format=power_state_snapshot_format,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=main_intersight_api_client,
+                server_inventory=main_server_inventory,
+                wave_grouping=power_control_wave_grouping or "Count",
+                wave_size=power_control_wave_size,
+                inter_wave_delay=power_control_inter_wave_delay,
+                max_concurrent_operations_per_domain=power_control_max_concurrent_operations_per_domain,
+                max_workers=power_control_max_workers,
+                wait_for_completion=power_control_wait_for_completion,
+                completion_timeout=power_control_completion_timeout,
+                completion_poll_interval=power_control_completion_poll_interval,
+                force_power_control=force_power_control
+                )
+        # Split the power control operations into shards for distributed workers and wait for the results, if requested
+        elif command_line_arguments.coordinator:
+            remaining_power_control_target_server_id_dictionary_list = get_remaining_power_control_targets(
+                power_control_targets,
+                main_server_inventory,
+                power_control_state,
+                run_journal=main_run_journal if command_line_arguments.resume else None
+                )
+            main_job_queue = PowerControlJobQueue(command_line_arguments.coordinator,
+                                                  lease_duration=distributed_worker_lease_duration,
+                                                  max_attempts=distributed_shard_max_attempts
+                                                  )
+            main_job_id, main_shard_count = submit_power_control_job(
+                main_job_queue,
+                remaining_power_control_target_server_id_dictionary_list,
+                power_control_state,
+                shard_grouping=distributed_shard_grouping,
+                shard_size=distributed_shard_size,
+                hash_shard_count=distributed_hash_shard_count,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=main_intersight_api_client,
+                server_inventory=main_server_inventory,
+                wave_grouping=power_control_wave_grouping or "Count",
+                wave_size=power_control_wave_size,
+                inter_wave_delay=power_control_inter_wave_delay,
+                max_concurrent_operations_per_domain=power_control_max_concurrent_operations_per_domain,
+                wait_for_completion=power_control_wait_for_completion,
+                completion_timeout=power_control_completion_timeout,
+                completion_poll_interval=power_control_completion_poll_interval,
+                force_power_control=force_power_control
+                )
+            logger.info("\nJob %s has been added to the job queue '%s' with %d shards.",
+                        main_job_id,
+                        command_line_arguments.coordinator,
+                        main_shard_count
+                        )
+            main_job_result_counts = wait_for_power_control_job(main_job_queue, main_job_id)
+            logger.info("Job %s results: %s",
+                        main_job_id,
+                        ", ".join(f"{power_control_result} {power_control_result_count}"
+                                  for power_control_result, power_control_result_count
+                                  in main_job_result_counts.items()
+                                  ) or "None"
+                        )
+        # Run the shards of the distributed power control jobs, if requested
+        elif command_line_arguments.worker:
+            main_shards_run = run_power_control_worker(
+                PowerControlJobQueue(command_line_arguments.worker,
+                                     lease_duration=distributed_worker_lease_duration,
+                                     max_attempts=distributed_shard_max_attempts
+                                     ),
+                max_workers=power_control_max_workers,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=main_intersight_api_client
+                )
+            logger.info("\nThe worker has run %d shards.", main_shards_run)
+        # Run the scheduled power control policies until interrupted, if enabled
+        elif command_line_arguments.scheduler:
+            main_power_policy_scheduler = PowerPolicyScheduler(
+                power_control_policies,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=main_intersight_api_client,
+                server_inventory=main_server_inventory,
+                inventory_max_age=power_control_policy_inventory_max_age,
+                wave_grouping=power_control_wave_grouping or "Count",
+                wave_size=power_control_wave_size,
+                inter_wave_delay=power_control_inter_wave_delay,
+                max_concurrent_operations_per_domain=power_control_max_concurrent_operations_per_domain,
+                max_workers=power_control_max_workers,
+                wait_for_completion=power_control_wait_for_completion,
+                completion_timeout=power_control_completion_timeout,
+                completion_poll_interval=power_control_completion_poll_interval,
+                force_power_control=force_power_control
+                )
+            logger.info("\nStarting the power control policy scheduler with %d policies.",
+                        len(main_power_policy_scheduler.power_control_policies)
+                        )
+            try:
+                main_power_policy_scheduler.run_forever()
+            except KeyboardInterrupt:
+                logger.info("\nThe power control policy scheduler has been stopped.")
+        # Update the power state of the provided UCS servers concurrently on an asyncio event loop, if enabled
+        elif use_asyncio_client:
+            remaining_power_control_target_server_id_dictionary_list = get_remaining_power_control_targets(
+                power_control_targets,
+                main_server_inventory,
+                power_control_state,
+                run_journal=main_run_journal if command_line_arguments.resume else None
+                )
+            # Group the configured target servers by power control state, as the streamed target servers are submitted in the order they are read
+            if isinstance(remaining_power_control_target_server_id_dictionary_list, list):
+                remaining_power_control_target_server_id_dictionary_list = group_power_control_targets_by_state(
+                    remaining_power_control_target_server_id_dictionary_list,
+                    power_control_state
+                    )
+            if _active_metrics_registry is not None and isinstance(remaining_power_control_target_server_id_dictionary_list, list):
+                _active_metrics_registry.power_control_queue_depth.set(len(remaining_power_control_target_server_id_dictionary_list))
+            asyncio.run(
+                async_update_power_states(
+                    intersight_api_key_id=key_id,
+                    intersight_api_key=key,
+                    power_control_target_server_id_dictionary_list=remaining_power_control_target_server_id_dictionary_list,
+                    power_control_state=power_control_state,
+                    intersight_base_url=intersight_base_url,
+                    url_certificate_verification=url_certificate_verification,
+                    max_requests_in_flight=asyncio_max_requests_in_flight,
+                    force_power_control=force_power_control
+                    ))
+        # Update the power state of the provided UCS servers in waves, if enabled
+        elif power_control_wave_grouping:
+            remaining_power_control_target_server_id_dictionary_list = get_remaining_power_control_targets(
+                power_control_targets,
+                main_server_inventory,
+                power_control_state,
+                run_journal=main_run_journal if command_line_arguments.resume else None
+                )
+            main_completion_event_source = None
+            if "".join(str(power_control_completion_mode).lower().split()) == "webhook":
+                if (not power_control_webhook_secret
+                        and power_control_webhook_address not in ("127.0.0.1", "::1", "localhost")
+                        ):
+                    logger.error("\nA configuration error has occurred!\n\n"
+                                 "The webhook receiver can only listen on the address "
+                                 f"{power_control_webhook_address} when a webhook secret "
+                                 "has been provided, so unsigned events from other "
+                                 "sources are rejected.\n"
+                                 "Please provide the power_control_webhook_secret setting "
+                                 "or listen on 127.0.0.1, then re-attempt execution.\n")
+                    sys.exit(0)
+                main_completion_event_source = IntersightWebhookReceiver(webhook_secret=power_control_webhook_secret)
+                main_completion_event_source.start(int(power_control_webhook_port), power_control_webhook_address)
+                logger.info("Receiving Intersight webhook events at http://%s:%s/.",
+                            power_control_webhook_address,
+                            power_control_webhook_port
+                            )
+            try:
+                PowerControlWaveScheduler(
+                    power_control_state=power_control_state,
+                    wave_grouping=power_control_wave_grouping,
+                    wave_size=power_control_wave_size,
+                    inter_wave_delay=power_control_inter_wave_delay,
+                    max_concurrent_operations_per_domain=power_control_max_concurrent_operations_per_domain,
+                    max_workers=power_control_max_workers,
+                    wait_for_completion=power_control_wait_for_completion,
+                    completion_timeout=power_control_completion_timeout,
+                    completion_poll_interval=(power_control_completion_fallback_poll_interval
+                                              if main_completion_event_source is not None
+                                              else power_control_completion_poll_interval),
+                    intersight_base_url=intersight_base_url,
+                    preconfigured_api_client=main_intersight_api_client,
+                    server_inventory=main_server_inventory,
+                    force_power_control=force_power_control,
+                    completion_event_source=main_completion_event_source
+                    ).run(remaining_power_control_target_server_id_dictionary_list)
+            finally:
+                if main_completion_event_source is not None:
+                    main_completion_event_source.stop()
+        # Update the power state of the provided UCS servers sequentially
+        else:
+            remaining_power_control_target_server_id_dictionary_list = get_remaining_power_control_targets(
+                power_control_targets,
+                main_server_inventory,
+                power_control_state,
+                run_journal=main_run_journal if command_line_arguments.resume else None
+                )
+            # Group the configured target servers by power control state, as the streamed target servers are submitted in the order they are read
+            if isinstance(remaining_power_control_target_server_id_dictionary_list, list):
+                remaining_power_control_target_server_id_dictionary_list = group_power_control_targets_by_state(
+                    remaining_power_control_target_server_id_dictionary_list,
+                    power_control_state
+                    )
+            main_metrics_textfile_written_time = time.monotonic()
+            for power_control_target_server_index, power_control_target_server_id_dictionary in enumerate(remaining_power_control_target_server_id_dictionary_list):
+                if _active_metrics_registry is not None:
+                    if isinstance(remaining_power_control_target_server_id_dictionary_list, list):
+                        _active_metrics_registry.power_control_queue_depth.set(
+                            len(remaining_power_control_target_server_id_dictionary_list) - power_control_target_server_index
+                            )
+                    # Rewrite the metrics textfile on an interval, as the final metrics are written when the run ends
+                    if (metrics_textfile_output
+                            and time.monotonic() - main_metrics_textfile_written_time >= metrics_textfile_write_interval
+                            ):
+                        _active_metrics_registry.write_textfile(metrics_textfile_output)
+                        main_metrics_textfile_written_time = time.monotonic()
+                update_power_state(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    power_control_target_server_id_dictionary=power_control_target_server_id_dictionary,
+                    power_control_state=power_control_target_server_id_dictionary.get("Power Control State", power_control_state),
+                    intersight_base_url=intersight_base_url,
+                    preconfigured_api_client=main_intersight_api_client,
+                    server_inventory=main_server_inventory,
+                    force_power_control=force_power_control
+                    )
+
+    # Stop adapting the concurrency of the Intersight API requests
+    disable_adaptive_concurrency()
+
+    # Display the requests sent with each API key of the API key pool
+    if isinstance(main_intersight_api_client, PooledApiClient):
+        logger.info("\nAPI key pool requests:")
+        for api_key_statistics in main_intersight_api_client.get_api_key_statistics():
+            logger.info("  %s: %d requests, %d throttled, %d rejected",
+                        api_key_statistics["Key ID"],
+                        api_key_statistics["Requests"],
+                        api_key_statistics["Throttled"],
+                        api_key_statistics["Rejected"]
+                        )
+
+    # Stop coalescing Intersight API GET requests and display the requests saved
+    main_request_coalescer = disable_request_coalescing()
+    if main_request_coalescer is not None:
+        logger.info("\nIntersight API GET requests: %d sent, %d coalesced, %d served from the cache.",
+                    main_request_coalescer.sent_request_count,
+                    main_request_coalescer.coalesced_request_count,
+                    main_request_coalescer.cached_response_count
+                    )
+
+    # Close the API cassette and display the exchanges recorded or replayed
+    if main_api_cassette is not None:
+        main_api_cassette.close()
+        logger.info("\n%d Intersight API exchanges have been %s '%s'.",
+                    main_api_cassette.exchange_count,
+                    "recorded to" if main_api_cassette.cassette_mode == "Record" else "replayed from",
+                    main_api_cassette.cassette_file
+                    )
+
+    # Write the final metrics for the run
+    if _active_metrics_registry is not None:
+        _active_metrics_registry.power_control_queue_depth.set(0)
+        if metrics_textfile_output:
+            _active_metrics_registry.write_textfile(metrics_textfile_output)
+            logger.info("\nThe Prometheus metrics have been written to '%s'.",
+                        metrics_textfile_output
+                        )
+        disable_metrics().stop_http_server()
+
+    # Export the run trace and display the time spent in each phase
+    if trace_output_file:
+        disable_run_tracing()
+        main_run_tracer.export(trace_output_file, trace_output_format)
+        logger.info("\nThe run trace has been written to '%s'.", trace_output_file)
+        logger.info("Time spent by phase:")
+        for phase_name, phase in main_run_tracer.summarize_phases().items():
+            logger.info("  %s: %.3fs total, %d spans, %.3fs max",
+                        phase_name,
+                        phase["total_seconds"],
+                        phase["count"],
+                        phase["max_seconds"],
+                        extra={"phase": phase_name}
+                        )
+
+    # Close the results output file and display the results summary
+    if command_line_arguments.results_file:
+        main_results_writer = disable_results_output()
+        logger.info("\nThe power control results have been written to '%s'.",
+                    command_line_arguments.results_file
+                    )
+        logger.info("Power control results: %s",
+                    ", ".join(f"{power_control_result} {power_control_result_count}"
+                              for power_control_result, power_control_result_count
+                              in main_results_writer.result_counts.items()
+                              ) or "None"
+                    )
+
+    # Close the run journal
+    if command_line_arguments.journal_file:
+        disable_run_journal()
+        logger.info("\nThe run journal has been written to '%s'.",
+                    command_line_arguments.journal_file
+                    )
+
+    # Stop profiling the run, then write the profile reports and display the samples taken in each phase
+    if command_line_arguments.profile:
+        main_run_profiler = disable_run_profiling()
+        for profile_report_file in main_run_profiler.write_reports(command_line_arguments.profile):
+            logger.info("\nThe profile report has been written to '%s'.", profile_report_file)
+        logger.info("Profile samples by phase:")
+        for phase_name, phase_sample_count in main_run_profiler.phase_sample_counts.most_common():
+            logger.info("  %s: %d samples",
+                        phase_name,
+                        phase_sample_count,
+                        extra={"phase": phase_name}
+                        )
 
     # Automated Server Power Control Tool completion
-    print(f"\nThe {deployment_type} has completed.\n")
+    logger.info("\nThe %s has completed.\n", deployment_type)
+    shutdown_logging()
 
 
 if __name__ == "__main__":
     main()
 
-# Exiting the Automated Server Power Control Tool for Cisco Intersight
-sys.exit(0)
+    # Exiting the Automated Server Power Control Tool for Cisco Intersight
+    sys.exit(0)
@@ -0,0 +1,14 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def power_control_tool():
+    # The tool imports the Intersight SDK for Python at module level
+    pytest.importorskip("intersight")
+    return importlib.import_module("intersight_server_power_control")
@@ -0,0 +1,99 @@
+import threading
+import time
+
+
+def _release_requests(concurrency_controller, request_count, **release_arguments):
+    for _ in range(request_count):
+        concurrency_controller.acquire()
+        concurrency_controller.release(**release_arguments)
+
+
+def test_healthy_responses_raise_the_limit_additively(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=10, max_limit=50)
+
+    _release_requests(concurrency_controller, 10, status=200, latency_seconds=0.1)
+
+    assert 10.9 < concurrency_controller.limit < 11.1
+
+
+def test_limit_never_exceeds_the_maximum(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=4, max_limit=5)
+
+    _release_requests(concurrency_controller, 100, status=200, latency_seconds=0.1)
+
+    assert concurrency_controller.limit == 5
+
+
+def test_throttled_response_halves_the_limit(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=10, error_rate_window=20)
+
+    _release_requests(concurrency_controller, 1, status=429, latency_seconds=0.1)
+
+    assert concurrency_controller.limit == 5
+    assert concurrency_controller.circuit_state == "Closed"
+
+
+def test_limit_never_drops_below_the_minimum(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=4, min_limit=2, error_rate_window=100)
+
+    _release_requests(concurrency_controller, 5, status=503)
+
+    assert concurrency_controller.limit == 2
+
+
+def test_burst_of_slow_responses_decreases_the_limit_once(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=16, latency_threshold=1.0)
+
+    _release_requests(concurrency_controller, 4, status=200, latency_seconds=60)
+
+    assert concurrency_controller.limit == 8
+
+
+def test_requests_wait_while_the_limit_is_reached(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+    concurrency_controller.acquire()
+    acquired = threading.Event()
+
+    def acquire_second_request():
+        concurrency_controller.acquire()
+        acquired.set()
+
+    waiting_thread = threading.Thread(target=acquire_second_request, daemon=True)
+    waiting_thread.start()
+    assert not acquired.wait(0.1)
+    concurrency_controller.release(status=200, latency_seconds=0.1)
+    assert acquired.wait(5)
+    concurrency_controller.release(status=200, latency_seconds=0.1)
+
+
+def test_circuit_opens_and_recovers_from_the_minimum_limit(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(initial_limit=10,
+                                                                              min_limit=2,
+                                                                              error_rate_window=4,
+                                                                              circuit_open_duration=0.1
+                                                                              )
+
+    _release_requests(concurrency_controller, 2, status=500)
+
+    assert concurrency_controller.circuit_state == "Open"
+    start_time = time.monotonic()
+    concurrency_controller.acquire()
+    assert time.monotonic() - start_time >= 0.05
+    assert concurrency_controller.circuit_state == "Half-Open"
+    concurrency_controller.release(status=200, latency_seconds=0.01)
+    assert concurrency_controller.circuit_state == "Closed"
+    assert concurrency_controller.limit == 2
+
+
+def test_failed_probe_doubles_the_pause(power_control_tool):
+    concurrency_controller = power_control_tool.AdaptiveConcurrencyController(error_rate_window=2,
+                                                                              circuit_open_duration=0.05,
+                                                                              max_circuit_open_duration=0.15
+                                                                              )
+
+    _release_requests(concurrency_controller, 1, status=500)
+    assert concurrency_controller.circuit_state == "Open"
+    _release_requests(concurrency_controller, 1, status=500)
+    assert concurrency_controller._current_circuit_open_duration == 0.1
+    _release_requests(concurrency_controller, 1, status=500)
+    assert concurrency_controller._current_circuit_open_duration == 0.15
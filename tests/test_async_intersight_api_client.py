@@ -0,0 +1,69 @@
+import json
+import types
+import urllib.parse
+
+import pytest
+
+
+class PagedResults:
+    """Serves the $top and $skip pages of fixed Intersight API results for an AsyncIntersightApiClient class instance."""
+    def __init__(self, results_by_path):
+        self.results_by_path = results_by_path
+        self.requested_resource_paths = []
+
+    async def call_api(self, resource_path, method, body=None):
+        self.requested_resource_paths.append(resource_path)
+        split_resource_path = urllib.parse.urlsplit(resource_path)
+        query_options = dict(urllib.parse.parse_qsl(split_resource_path.query))
+        skip = int(query_options.get("$skip", 0))
+        results = self.results_by_path[split_resource_path.path][skip:skip + int(query_options.get("$top", 100))]
+        return types.SimpleNamespace(status=200, data=json.dumps({"Results": results}))
+
+
+@pytest.fixture
+def async_api_client(power_control_tool):
+    pytest.importorskip("aiohttp")
+
+    def make_async_api_client(results_by_path):
+        api_client = power_control_tool.AsyncIntersightApiClient(types.SimpleNamespace(host="https://intersight.com"))
+        api_client.paged_results = PagedResults(results_by_path)
+        api_client.call_api = api_client.paged_results.call_api
+        return api_client
+    return make_async_api_client
+
+
+def test_async_iterate_intersight_objects_retrieves_every_page(power_control_tool, async_api_client):
+    api_client = async_api_client({"/compute/Blades": [{"Moid": f"blade{index}"} for index in range(5)]})
+
+    async def retrieve_intersight_objects():
+        return [intersight_object["Moid"]
+                async for intersight_object in power_control_tool.async_iterate_intersight_objects(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    intersight_api_path="compute/Blades?$select=Moid",
+                    page_size=2,
+                    preconfigured_api_client=api_client
+                    )
+                ]
+
+    assert power_control_tool.asyncio.run(retrieve_intersight_objects()) == [f"blade{index}" for index in range(5)]
+    assert len(api_client.paged_results.requested_resource_paths) == 3
+
+
+def test_async_find_server_and_server_settings_use_every_page(power_control_tool, async_api_client):
+    intersight_servers = [{"Moid": f"blade{index}", "Serial": f"FCH{index:04d}", "OperPowerState": "on"} for index in range(1500)]
+    api_client = async_api_client({
+        "/compute/Blades": intersight_servers,
+        "/compute/ServerSettings": [{"Moid": f"ss-blade{index}", "Server": {"Moid": f"blade{index}"}} for index in range(1500)]
+        })
+    server_search_settings = power_control_tool._get_server_search_settings("FCH1400", "Blade", "FI-Attached")
+
+    async def find_server():
+        _, matching_intersight_server = await api_client.find_server(server_search_settings, ["FCH1400"])
+        return matching_intersight_server, await api_client.get_server_settings_moid(matching_intersight_server["Moid"])
+
+    matching_intersight_server, server_settings_moid = power_control_tool.asyncio.run(find_server())
+
+    assert matching_intersight_server["Moid"] == "blade1400"
+    assert server_settings_moid == "ss-blade1400"
+    assert api_client.get_server("blade1400") is matching_intersight_server
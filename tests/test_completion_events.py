@@ -0,0 +1,121 @@
+import datetime
+import json
+import threading
+import types
+import urllib.error
+import urllib.request
+
+import pytest
+
+
+class PendingApiClient:
+    """Stands in for the Intersight API client while the server settings are still applying."""
+    def call_api(self, **kwargs):
+        self.last_response = types.SimpleNamespace(data='{"ObjectType": "compute.ServerSetting", "ConfigState": "Applying"}')
+
+
+def _submitted_operation(submitted_time):
+    return types.SimpleNamespace(
+        api_client=PendingApiClient(),
+        intersight_api_body={"AdminPowerState": "PowerCycle"},
+        server_moid_and_data={"Moid": "server-moid", "ObjectType": "compute.Blade"},
+        server_settings_moid="server-settings-moid",
+        post_submitted_time=submitted_time,
+        power_control_target_server_id_dictionary={"Server Identifier": "S0"},
+        intersight_api_path="compute/ServerSettings"
+        )
+
+
+def _workflow_event(status, start_time):
+    return {"Event": {"ObjectType": "workflow.WorkflowInfo",
+                      "Moid": f"workflow-{status.lower()}",
+                      "AssociatedObject": {"Moid": "server-moid"},
+                      "Status": status,
+                      "StartTime": start_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+                      }}
+
+
+def _wait_with_event(power_control_tool, intersight_event, submitted_time, completion_timeout=5):
+    completion_events = power_control_tool.PowerControlCompletionEvents()
+    publisher = threading.Timer(0.05, completion_events.publish, args=(intersight_event,))
+    publisher.start()
+    try:
+        return power_control_tool.wait_for_power_control_completion(_submitted_operation(submitted_time),
+                                                                    completion_timeout=completion_timeout,
+                                                                    poll_interval=10,
+                                                                    completion_event_source=completion_events
+                                                                    )
+    finally:
+        publisher.cancel()
+
+
+@pytest.mark.parametrize("workflow_status", ["FAILED", "TERMINATED", "TIME_OUT"])
+def test_unsuccessful_workflows_fail_the_operation(power_control_tool, workflow_status):
+    submitted_time = datetime.datetime.now(datetime.timezone.utc)
+
+    completion_status = _wait_with_event(power_control_tool,
+                                         _workflow_event(workflow_status, submitted_time + datetime.timedelta(seconds=1)),
+                                         submitted_time
+                                         )
+
+    assert completion_status["Failed"]
+    assert not completion_status["Completed"]
+    assert completion_status["Workflow Status"] == workflow_status
+
+
+def test_completed_workflow_completes_the_operation(power_control_tool):
+    submitted_time = datetime.datetime.now(datetime.timezone.utc)
+
+    completion_status = _wait_with_event(power_control_tool,
+                                         _workflow_event("COMPLETED", submitted_time + datetime.timedelta(seconds=1)),
+                                         submitted_time
+                                         )
+
+    assert completion_status["Completed"]
+    assert not completion_status["Failed"]
+
+
+def test_workflows_started_before_the_submission_are_ignored(power_control_tool):
+    submitted_time = datetime.datetime.now(datetime.timezone.utc)
+
+    completion_status = _wait_with_event(power_control_tool,
+                                         _workflow_event("COMPLETED", submitted_time - datetime.timedelta(minutes=5)),
+                                         submitted_time,
+                                         completion_timeout=0.5
+                                         )
+
+    assert not completion_status["Completed"]
+    assert completion_status["Workflow Status"] is None
+
+
+def test_events_for_other_object_types_are_ignored(power_control_tool):
+    completion_events = power_control_tool.PowerControlCompletionEvents()
+
+    assert not completion_events.publish({"ObjectType": "cond.Alarm", "Moid": "alarm-moid"})
+    assert completion_events.event_sequence == 0
+    assert completion_events.wait_for_event(["alarm-moid"], 0, 0) is None
+
+
+def test_webhook_receiver_listens_on_loopback_by_default(power_control_tool):
+    webhook_receiver = power_control_tool.IntersightWebhookReceiver()
+    webhook_http_server = webhook_receiver.start(0)
+    try:
+        assert webhook_http_server.server_address[0] == "127.0.0.1"
+    finally:
+        webhook_receiver.stop()
+
+
+def test_webhook_receiver_rejects_unsigned_events_with_a_secret(power_control_tool):
+    webhook_receiver = power_control_tool.IntersightWebhookReceiver(webhook_secret="webhook-secret")
+    webhook_http_server = webhook_receiver.start(0)
+    try:
+        webhook_request = urllib.request.Request(f"http://127.0.0.1:{webhook_http_server.server_address[1]}/",
+                                                 data=json.dumps(_workflow_event("COMPLETED", datetime.datetime.now())).encode(),
+                                                 method="POST"
+                                                 )
+        with pytest.raises(urllib.error.HTTPError) as http_error:
+            urllib.request.urlopen(webhook_request, timeout=5)
+        assert http_error.value.code == 401
+        assert webhook_receiver.event_sequence == 0
+    finally:
+        webhook_receiver.stop()
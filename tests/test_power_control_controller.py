@@ -0,0 +1,74 @@
+import json
+import types
+
+import pytest
+
+
+class StubApiClient:
+    """Stands in for the Intersight SDK ApiClient class with a single blade server."""
+    def __init__(self, oper_power_state="on"):
+        self.intersight_server = {"Moid": "blade0001", "ObjectType": "compute.Blade", "ClassId": "compute.Blade",
+                                  "Name": "Lab-Blade-1", "Serial": "FCH0001", "Model": "UCSX-210C-M7",
+                                  "UserLabel": "", "ManagementMode": "Intersight", "OperPowerState": oper_power_state,
+                                  "RegisteredDevice": {"Moid": "domain0", "ObjectType": "asset.DeviceRegistration"}
+                                  }
+        self.server_retrieval_count = 0
+        self.posted_bodies = []
+        self.last_response = None
+
+    def call_api(self, resource_path, method, body=None, auth_settings=None):
+        if method == "POST":
+            self.posted_bodies.append(dict(body))
+            response_data = {"Moid": "ss-blade0001"}
+        elif resource_path.startswith("/iam/Accounts"):
+            response_data = {"Results": [{"Name": "Lab"}]}
+        elif resource_path.startswith("/compute/Blades"):
+            self.server_retrieval_count += 1
+            response_data = {"Results": [dict(self.intersight_server)] if "$skip=0" in resource_path else []}
+        elif resource_path.startswith("/compute/ServerSettings"):
+            response_data = {"Results": [{"Moid": "ss-blade0001", "Server": {"Moid": "blade0001"}}] if "$skip=0" in resource_path else []}
+        else:
+            response_data = {"Results": []}
+        self.last_response = types.SimpleNamespace(status=200, data=json.dumps(response_data))
+
+
+@pytest.fixture
+def power_control_controller(power_control_tool):
+    def make_power_control_controller(api_client, **controller_settings):
+        return power_control_tool.PowerControlController(preconfigured_api_client=api_client, max_workers=1, **controller_settings)
+    return make_power_control_controller
+
+
+def test_power_control_state_after_a_submitted_operation_is_not_skipped(power_control_controller):
+    api_client = StubApiClient(oper_power_state="on")
+    with power_control_controller(api_client) as controller:
+        power_off_operation = controller.submit("FCH0001", "Power Off").result()
+        power_on_operation = controller.submit("FCH0001", "Power On").result()
+        repeated_power_on_operation = controller.submit("FCH0001", "Power On").result()
+
+    assert power_off_operation.post_succeeded and power_on_operation.post_succeeded
+    assert repeated_power_on_operation.post_skipped
+    assert api_client.posted_bodies == [{"AdminPowerState": "PowerOff"}, {"AdminPowerState": "PowerOn"}]
+    assert api_client.server_retrieval_count == 1
+
+
+def test_stale_inventory_is_refreshed(power_control_controller):
+    api_client = StubApiClient(oper_power_state="on")
+    with power_control_controller(api_client, inventory_max_age=0) as controller:
+        controller.submit("FCH0001", "Power Off").result()
+        # The server was powered on outside of the controller
+        controller.submit("FCH0001", "Power On").result()
+
+    assert api_client.server_retrieval_count == 2
+    assert api_client.posted_bodies == [{"AdminPowerState": "PowerOff"}]
+
+
+def test_controller_operations_do_not_change_the_queue_depth(power_control_tool, power_control_controller):
+    metrics_registry = power_control_tool.enable_metrics()
+    try:
+        with power_control_controller(StubApiClient()) as controller:
+            controller.submit("FCH0001", "Power Off").result()
+    finally:
+        power_control_tool.disable_metrics()
+
+    assert "intersight_power_control_queue_depth -" not in metrics_registry.render_prometheus_text()
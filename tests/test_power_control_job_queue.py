@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def job_queue_file(tmp_path):
+    return str(tmp_path / "power_control_jobs.sqlite")
+
+
+def _submit_job(job_queue, power_control_batches):
+    return job_queue.submit_job({"Power Control State": "Power Off"},
+                                [[(shard_key, {"Targets": shard_key}) for shard_key in power_control_batch]
+                                 for power_control_batch in power_control_batches
+                                 ]
+                                )
+
+
+def _expire_leases(job_queue):
+    time.sleep(job_queue.lease_duration + 0.05)
+
+
+def test_shards_are_claimed_once_in_batch_order(power_control_tool, job_queue_file):
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file)
+    job_id = _submit_job(job_queue, [["Power Off 1", "Power Off 2"], ["Power On 1"]])
+
+    first_claimed_shard = job_queue.claim_shard("worker-1")
+    second_claimed_shard = job_queue.claim_shard("worker-2")
+
+    assert (first_claimed_shard["Job ID"], first_claimed_shard["Shard Key"]) == (job_id, "Power Off 1")
+    assert first_claimed_shard["Shard Data"] == {"Targets": "Power Off 1"}
+    assert first_claimed_shard["Job Settings"] == {"Power Control State": "Power Off"}
+    assert second_claimed_shard["Shard Key"] == "Power Off 2"
+    # The next batch waits until every shard of the current batch has finished
+    assert job_queue.claim_shard("worker-3") is None
+    job_queue.complete_shard(first_claimed_shard["Shard ID"], "worker-1", [])
+    assert job_queue.claim_shard("worker-3") is None
+    job_queue.complete_shard(second_claimed_shard["Shard ID"], "worker-2", [], error="The shard stopped on an error.")
+    assert job_queue.claim_shard("worker-3")["Shard Key"] == "Power On 1"
+    assert job_queue.get_job_progress(job_id) == {"Completed": 1, "Failed": 1, "Claimed": 1}
+
+
+def test_live_leases_are_kept_and_expired_leases_are_reclaimed(power_control_tool, job_queue_file):
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file, lease_duration=0.2)
+    _submit_job(job_queue, [["Power Off 1"]])
+    claimed_shard = job_queue.claim_shard("worker-1")
+
+    assert job_queue.claim_shard("worker-2") is None
+    _expire_leases(job_queue)
+    reclaimed_shard = job_queue.claim_shard("worker-2")
+
+    assert reclaimed_shard["Shard ID"] == claimed_shard["Shard ID"]
+    # The results of the worker that lost the lease are ignored
+    job_queue.complete_shard(claimed_shard["Shard ID"], "worker-1", [{"Result": "Submitted"}])
+    assert job_queue.has_unfinished_shards()
+
+
+def test_recorded_target_results_are_provided_to_the_next_claim(power_control_tool, job_queue_file):
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file, lease_duration=0.2)
+    _submit_job(job_queue, [["Power Off 1"]])
+    claimed_shard = job_queue.claim_shard("worker-1")
+    job_queue.record_target_result(claimed_shard["Shard ID"], "worker-1", "server-moid-1", {"Result": "Submitted"})
+
+    _expire_leases(job_queue)
+    reclaimed_shard = job_queue.claim_shard("worker-2")
+    # A worker that no longer holds the shard cannot record results
+    job_queue.record_target_result(claimed_shard["Shard ID"], "worker-1", "server-moid-2", {"Result": "Submitted"})
+
+    assert reclaimed_shard["Target Results"] == {"server-moid-1": {"Result": "Submitted"}}
+    assert job_queue.get_target_results(claimed_shard["Shard ID"]) == {"server-moid-1": {"Result": "Submitted"}}
+
+
+def test_shards_abandoned_max_attempts_times_are_failed(power_control_tool, job_queue_file):
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file, lease_duration=0.2, max_attempts=2)
+    job_id = _submit_job(job_queue, [["Power Off 1"]])
+    claimed_shard = job_queue.claim_shard("worker-1")
+    job_queue.record_target_result(claimed_shard["Shard ID"], "worker-1", "server-moid-1", {"Result": "Submitted"})
+    _expire_leases(job_queue)
+    assert job_queue.claim_shard("worker-2") is not None
+    _expire_leases(job_queue)
+
+    assert job_queue.claim_shard("worker-3") is None
+    assert not job_queue.has_unfinished_shards()
+    finished_shards = list(job_queue.iterate_finished_shards(job_id))
+    assert [finished_shard["Status"] for finished_shard in finished_shards] == ["Failed"]
+    assert "2 attempts" in finished_shards[0]["Error"]
+    assert finished_shards[0]["Results"] == [{"Result": "Submitted"}]
+
+
+def test_iterate_finished_shards_skips_the_provided_shard_ids(power_control_tool, job_queue_file):
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file)
+    job_id = _submit_job(job_queue, [["Power Off 1", "Power Off 2"]])
+    for worker_id in ("worker-1", "worker-2"):
+        claimed_shard = job_queue.claim_shard(worker_id)
+        job_queue.complete_shard(claimed_shard["Shard ID"], worker_id, [{"Shard Key": claimed_shard["Shard Key"]}])
+
+    first_finished_shard, second_finished_shard = job_queue.iterate_finished_shards(job_id)
+
+    assert [finished_shard["Shard Key"]
+            for finished_shard in job_queue.iterate_finished_shards(job_id, {first_finished_shard["Shard ID"]})
+            ] == ["Power Off 2"]
+    assert second_finished_shard["Results"] == [{"Shard Key": "Power Off 2"}]
+
+
+def test_domain_slots_are_limited_across_workers(power_control_tool, job_queue_file):
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file)
+    for worker_id in ("worker-1", "worker-2"):
+        job_queue.heartbeat(worker_id)
+    second_slot_held = threading.Event()
+
+    def hold_second_slot():
+        with job_queue.hold_domain_slot("worker-2", "domain-moid", 1, poll_interval=0.02):
+            second_slot_held.set()
+
+    with job_queue.hold_domain_slot("worker-1", "domain-moid", 1, poll_interval=0.02):
+        waiting_thread = threading.Thread(target=hold_second_slot, daemon=True)
+        waiting_thread.start()
+        assert not second_slot_held.wait(0.2)
+    assert second_slot_held.wait(5)
+    waiting_thread.join(5)
+
+
+def test_worker_skips_the_targets_submitted_by_a_previous_attempt(power_control_tool, job_queue_file, monkeypatch):
+    submitted_targets = []
+
+    class RecordingWaveScheduler:
+        def __init__(self, job_queue, worker_id, shard_id=None, **wave_scheduler_settings):
+            pass
+
+        def run(self, power_control_target_server_id_dictionary_list):
+            submitted_targets.extend(power_control_target_server_id_dictionary_list)
+            return []
+
+    monkeypatch.setattr(power_control_tool, "DistributedPowerControlWaveScheduler", RecordingWaveScheduler)
+    job_queue = power_control_tool.PowerControlJobQueue(job_queue_file, lease_duration=0.2)
+    job_id = job_queue.submit_job({"intersight_account_name": "Lab", "power_control_state": "Power Off"},
+                                  [[("Power Off 1", [{"Target": {"Server Identifier": f"FCH000{index}"},
+                                                      "Server": {"Moid": f"server-moid-{index}"},
+                                                      "Server Settings Moid": f"server-settings-moid-{index}"
+                                                      }
+                                                     for index in (1, 2)
+                                                     ])]]
+                                  )
+    abandoned_shard = job_queue.claim_shard("worker-1")
+    job_queue.record_target_result(abandoned_shard["Shard ID"], "worker-1", "server-moid-1", {"Result": "Submitted"})
+    _expire_leases(job_queue)
+
+    shards_run = power_control_tool.run_power_control_worker(job_queue,
+                                                             worker_id="worker-2",
+                                                             preconfigured_api_client=object()
+                                                             )
+
+    assert shards_run == 1
+    assert submitted_targets == [{"Server Identifier": "FCH0002"}]
+    finished_shard, = job_queue.iterate_finished_shards(job_id)
+    assert finished_shard["Status"] == "Completed"
+    assert finished_shard["Results"] == [{"Result": "Submitted"}]
@@ -0,0 +1,144 @@
+import datetime
+import types
+
+import pytest
+
+
+def _power_control_policy(policy_name, schedule, power_control_state, server_identifiers):
+    return {"Policy Name": policy_name,
+            "Schedule": schedule,
+            "Power Control State": power_control_state,
+            "Targets": [{"Server Identifier": server_identifier} for server_identifier in server_identifiers]
+            }
+
+
+def test_cron_fields_accept_steps_ranges_and_lists(power_control_tool):
+    cron_schedule = power_control_tool.CronSchedule("*/15 8-10 1,15 * 1-5")
+
+    assert cron_schedule.minutes == {0, 15, 30, 45}
+    assert cron_schedule.hours == {8, 9, 10}
+    assert cron_schedule.days_of_month == {1, 15}
+    assert cron_schedule.days_of_week == {1, 2, 3, 4, 5}
+
+
+def test_cron_day_of_week_seven_is_sunday(power_control_tool):
+    assert power_control_tool.CronSchedule("0 0 * * 7").days_of_week == {0}
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* 24 * * *", "* * 0 * *", "*/0 * * * *", "a * * * *"])
+def test_cron_rejects_invalid_expressions(power_control_tool, expression):
+    with pytest.raises(ValueError):
+        power_control_tool.CronSchedule(expression)
+
+
+def test_restricted_day_of_month_and_day_of_week_match_either(power_control_tool):
+    # The 15th of the month or any Monday
+    cron_schedule = power_control_tool.CronSchedule("0 9 15 * 1")
+
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 10, 13, 10, 0)) == datetime.datetime(2026, 10, 15, 9, 0)
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 10, 15, 9, 0)) == datetime.datetime(2026, 10, 19, 9, 0)
+    assert cron_schedule.matches(datetime.datetime(2026, 10, 19, 9, 0))
+
+
+def test_unrestricted_day_of_week_only_uses_the_day_of_month(power_control_tool):
+    cron_schedule = power_control_tool.CronSchedule("0 9 15 * *")
+
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 10, 16, 0, 0)) == datetime.datetime(2026, 11, 15, 9, 0)
+    assert not cron_schedule.matches(datetime.datetime(2026, 10, 19, 9, 0))
+
+
+def test_next_run_skips_months_without_the_day(power_control_tool):
+    cron_schedule = power_control_tool.CronSchedule("0 0 31 * *")
+
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 2, 1, 0, 0)) == datetime.datetime(2026, 3, 31, 0, 0)
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 3, 31, 0, 0)) == datetime.datetime(2026, 5, 31, 0, 0)
+
+
+def test_next_run_rolls_over_the_year(power_control_tool):
+    cron_schedule = power_control_tool.CronSchedule("30 23 31 12 *")
+
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 12, 31, 23, 30, 15)) == datetime.datetime(2027, 12, 31, 23, 30)
+
+
+def test_next_run_finds_the_next_leap_day(power_control_tool):
+    cron_schedule = power_control_tool.CronSchedule("0 0 29 2 *")
+
+    assert cron_schedule.next_run_after(datetime.datetime(2026, 3, 1, 0, 0)) == datetime.datetime(2028, 2, 29, 0, 0)
+
+
+def test_next_run_returns_none_for_an_impossible_schedule(power_control_tool):
+    assert power_control_tool.CronSchedule("0 0 31 2 *").next_run_after(datetime.datetime(2026, 1, 1)) is None
+
+
+def test_policies_due_at_the_same_time_are_triggered_together(power_control_tool):
+    power_policy_scheduler = power_control_tool.PowerPolicyScheduler([
+        _power_control_policy("Lab Off", "0 20 * * *", "Power Off", ["S0"]),
+        _power_control_policy("Rack Off", "0 20 * * 1-5", "Power Off", ["S1"]),
+        _power_control_policy("Lab On", "0 7 * * *", "Power On", ["S0"])
+        ])
+
+    next_trigger_time, due_power_control_policies = power_policy_scheduler.get_next_trigger(datetime.datetime(2026, 10, 19, 12, 0))
+
+    assert next_trigger_time == datetime.datetime(2026, 10, 19, 20, 0)
+    assert [power_control_policy["Policy Name"] for power_control_policy in due_power_control_policies] == ["Lab Off", "Rack Off"]
+
+
+def test_overlapping_policies_submit_each_server_once(power_control_tool):
+    power_policy_scheduler = power_control_tool.PowerPolicyScheduler([
+        _power_control_policy("Lab Off", "0 20 * * *", "Power Off", ["S0", "S1"]),
+        _power_control_policy("Lab Shutdown", "0 20 * * *", "Shutdown", ["S1", "S2"])
+        ])
+
+    coalesced_targets = power_policy_scheduler.coalesce_policies(power_policy_scheduler.power_control_policies)
+
+    assert [(power_control_target["Server Identifier"], power_control_target["Power Control State"])
+            for power_control_target in coalesced_targets
+            ] == [("S0", "Power Off"), ("S1", "Shutdown"), ("S2", "Shutdown")]
+
+
+def test_failed_triggers_are_counted_and_the_scheduler_continues(power_control_tool):
+    power_policy_scheduler = power_control_tool.PowerPolicyScheduler([
+        _power_control_policy("Lab Off", "0 20 * * *", "Power Off", ["S0"])
+        ])
+    trigger_errors = [SystemExit(0), RuntimeError("The Intersight API is unavailable.")]
+    triggered_policies = []
+
+    def get_next_trigger(after_time):
+        return datetime.datetime.now(), power_policy_scheduler.power_control_policies
+
+    def trigger(due_power_control_policies):
+        triggered_policies.append(due_power_control_policies)
+        if len(triggered_policies) == len(trigger_errors):
+            power_policy_scheduler.stop()
+        raise trigger_errors[len(triggered_policies) - 1]
+
+    power_policy_scheduler.get_next_trigger = get_next_trigger
+    power_policy_scheduler.trigger = trigger
+    metrics_registry = power_control_tool.enable_metrics()
+    try:
+        power_policy_scheduler.run_forever()
+    finally:
+        power_control_tool.disable_metrics()
+
+    assert len(triggered_policies) == 2
+    assert power_policy_scheduler.trigger_failure_count == 2
+    rendered_metrics = metrics_registry.render_prometheus_text()
+    assert 'intersight_power_control_policy_trigger_failures_total{error="SystemExit"} 1' in rendered_metrics
+    assert 'intersight_power_control_policy_trigger_failures_total{error="RuntimeError"} 1' in rendered_metrics
+
+
+@pytest.mark.parametrize("post_succeeded, expected_refresh_count", [(True, 1), (False, 0)])
+def test_inventory_is_refreshed_after_a_trigger_that_submitted_operations(power_control_tool, monkeypatch, post_succeeded, expected_refresh_count):
+    power_policy_scheduler = power_control_tool.PowerPolicyScheduler([
+        _power_control_policy("Lab Off", "0 20 * * *", "Power Off", ["S0"])
+        ])
+    inventory_refreshes = []
+    monkeypatch.setattr(power_policy_scheduler.server_inventory, "refresh", lambda: inventory_refreshes.append(True))
+    monkeypatch.setattr(power_control_tool.PowerControlWaveScheduler,
+                        "run",
+                        lambda wave_scheduler, power_control_targets: [types.SimpleNamespace(post_succeeded=post_succeeded)]
+                        )
+
+    power_policy_scheduler.trigger(power_policy_scheduler.power_control_policies)
+
+    assert len(inventory_refreshes) == expected_refresh_count
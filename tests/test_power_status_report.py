@@ -0,0 +1,56 @@
+import json
+import types
+import urllib.parse
+
+
+class GroupingApiClient:
+    """Stands in for the Intersight SDK ApiClient class with grouped compute/PhysicalSummaries results."""
+    def __init__(self, power_status_groups, server_count, apply_paging=True):
+        self.power_status_groups = power_status_groups
+        self.server_count = server_count
+        self.apply_paging = apply_paging
+        self.requested_resource_paths = []
+        self.last_response = None
+
+    def call_api(self, resource_path, method, body=None, auth_settings=None):
+        self.requested_resource_paths.append(resource_path)
+        query_options = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(resource_path).query))
+        if query_options.get("$count") == "true":
+            response_data = {"Count": self.server_count}
+        elif self.apply_paging:
+            skip = int(query_options["$skip"])
+            response_data = {"Results": self.power_status_groups[skip:skip + int(query_options["$top"])]}
+        else:
+            response_data = {"Results": self.power_status_groups}
+        self.last_response = types.SimpleNamespace(status=200, data=json.dumps(response_data))
+
+
+def _power_status_groups(group_count):
+    return [{"OperPowerState": "on" if group_index % 2 else "off", "Model": f"UCSX-{group_index}",
+             "RegisteredDevice": {"Moid": "domain0"}, "ManagementMode": "Intersight", "Total": 2}
+            for group_index in range(group_count)
+            ]
+
+
+def test_server_side_aggregation_pages_the_groups(power_control_tool):
+    api_client = GroupingApiClient(_power_status_groups(5), server_count=10)
+
+    power_status_counts = power_control_tool._aggregate_power_status_server_side(None, api_client, page_size=2)
+
+    assert power_status_counts["Power State"] == {"off": 6, "on": 4}
+    assert len(power_status_counts["Model"]) == 5
+    assert [dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(requested_resource_path).query)).get("$skip")
+            for requested_resource_path in api_client.requested_resource_paths
+            ] == [None, "0", "2", "4"]
+
+
+def test_server_side_aggregation_is_not_used_when_paging_is_ignored(power_control_tool):
+    api_client = GroupingApiClient(_power_status_groups(5), server_count=10, apply_paging=False)
+
+    assert power_control_tool._aggregate_power_status_server_side(None, api_client, page_size=2) is None
+
+
+def test_server_side_aggregation_is_not_used_when_servers_are_missing(power_control_tool):
+    api_client = GroupingApiClient(_power_status_groups(5), server_count=12)
+
+    assert power_control_tool._aggregate_power_status_server_side(None, api_client) is None
@@ -0,0 +1,121 @@
+import threading
+import time
+import types
+
+import pytest
+
+
+class RecordingApiClient:
+    """Stands in for the Intersight SDK ApiClient, counting the requests sent."""
+    def __init__(self, status=200):
+        self.status = status
+        self.sent_resource_paths = []
+        self.release_event = threading.Event()
+        self.release_event.set()
+        self.last_response = None
+
+    def send_request(self, resource_path):
+        def send():
+            self.sent_resource_paths.append(resource_path)
+            self.release_event.wait(5)
+            self.last_response = types.SimpleNamespace(status=self.status, data=f"data for {resource_path}")
+            if self.status >= 500:
+                raise RuntimeError(f"The request for {resource_path} failed.")
+            return resource_path
+        return send
+
+
+def _call_concurrently(request_coalescer, api_client, resource_path, thread_count):
+    call_results = []
+    call_errors = []
+
+    def call():
+        try:
+            call_results.append(request_coalescer.call(api_client, resource_path, api_client.send_request(resource_path)))
+        except RuntimeError as call_error:
+            call_errors.append(call_error)
+
+    calling_threads = [threading.Thread(target=call) for _ in range(thread_count)]
+    for calling_thread in calling_threads:
+        calling_thread.start()
+    return calling_threads, call_results, call_errors
+
+
+def test_identical_concurrent_requests_are_sent_once(power_control_tool):
+    request_coalescer = power_control_tool.SingleFlightRequestCoalescer(cache_ttl=0)
+    api_client = RecordingApiClient()
+    api_client.release_event.clear()
+
+    calling_threads, call_results, call_errors = _call_concurrently(request_coalescer, api_client, "/compute/Blades", 8)
+    deadline = time.monotonic() + 5
+    while request_coalescer.coalesced_request_count < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    api_client.release_event.set()
+    for calling_thread in calling_threads:
+        calling_thread.join(5)
+
+    assert api_client.sent_resource_paths == ["/compute/Blades"]
+    assert call_results == ["/compute/Blades"] * 8
+    assert not call_errors
+    assert (request_coalescer.sent_request_count, request_coalescer.coalesced_request_count) == (1, 7)
+
+
+def test_errors_are_raised_in_every_waiting_thread(power_control_tool):
+    request_coalescer = power_control_tool.SingleFlightRequestCoalescer()
+    api_client = RecordingApiClient(status=503)
+    api_client.release_event.clear()
+
+    calling_threads, call_results, call_errors = _call_concurrently(request_coalescer, api_client, "/compute/Blades", 4)
+    deadline = time.monotonic() + 5
+    while request_coalescer.coalesced_request_count < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    api_client.release_event.set()
+    for calling_thread in calling_threads:
+        calling_thread.join(5)
+
+    assert len(call_errors) == 4
+    assert not call_results
+    # Failed responses are not cached
+    with pytest.raises(RuntimeError):
+        request_coalescer.call(api_client, "/compute/Blades", api_client.send_request("/compute/Blades"))
+    assert len(api_client.sent_resource_paths) == 2
+
+
+def test_successful_responses_are_cached_until_the_ttl(power_control_tool):
+    request_coalescer = power_control_tool.SingleFlightRequestCoalescer(cache_ttl=0.2)
+    api_client = RecordingApiClient()
+
+    for _ in range(3):
+        request_coalescer.call(api_client, "/compute/Blades", api_client.send_request("/compute/Blades"))
+    time.sleep(0.3)
+    request_coalescer.call(api_client, "/compute/Blades", api_client.send_request("/compute/Blades"))
+
+    assert len(api_client.sent_resource_paths) == 2
+    assert request_coalescer.cached_response_count == 2
+    assert api_client.last_response.data == "data for /compute/Blades"
+
+
+def test_different_resource_paths_are_not_coalesced(power_control_tool):
+    request_coalescer = power_control_tool.SingleFlightRequestCoalescer()
+    api_client = RecordingApiClient()
+
+    request_coalescer.call(api_client, "/compute/Blades?$top=1", api_client.send_request("/compute/Blades?$top=1"))
+    request_coalescer.call(api_client, "/compute/Blades?$top=2", api_client.send_request("/compute/Blades?$top=2"))
+
+    assert api_client.sent_resource_paths == ["/compute/Blades?$top=1", "/compute/Blades?$top=2"]
+
+
+def test_invalidate_clears_only_the_changed_resource_type(power_control_tool):
+    request_coalescer = power_control_tool.SingleFlightRequestCoalescer(cache_ttl=60)
+    api_client = RecordingApiClient()
+    for resource_path in ("/compute/ServerSettings?$top=1000", "/compute/Blades"):
+        request_coalescer.call(api_client, resource_path, api_client.send_request(resource_path))
+
+    request_coalescer.invalidate("/compute/ServerSettings/server-settings-moid")
+    for resource_path in ("/compute/ServerSettings?$top=1000", "/compute/Blades"):
+        request_coalescer.call(api_client, resource_path, api_client.send_request(resource_path))
+
+    assert api_client.sent_resource_paths == ["/compute/ServerSettings?$top=1000",
+                                              "/compute/Blades",
+                                              "/compute/ServerSettings?$top=1000"
+                                              ]
@@ -0,0 +1,131 @@
+import logging
+
+import pytest
+
+
+class PatternServerInventory:
+    """Stands in for the IntersightServerInventory class with a fixed list of servers."""
+    def __init__(self, intersight_servers):
+        self.intersight_servers = intersight_servers
+        self.searched_patterns = []
+
+    def find_servers_matching_pattern(self, server_search_settings, server_identifier_pattern):
+        self.searched_patterns.append(server_identifier_pattern.pattern)
+        return [intersight_server
+                for intersight_server in self.intersight_servers
+                if server_identifier_pattern.matches(intersight_server)
+                ]
+
+
+@pytest.fixture
+def lab_server_inventory():
+    return PatternServerInventory([{"Serial": f"FCH{index:04d}", "Name": f"Lab-Blade-{index}"} for index in range(1, 9)])
+
+
+@pytest.mark.parametrize("server_identifier, expected_is_pattern", [
+    ("Lab-Blade-[1-4]", True),
+    ("Lab-Blade-*", True),
+    ("Lab-Blade-?", True),
+    ("re:^Lab-.*$", True),
+    ("FCH0001", False),
+    ("FCH0001, Lab-Blade-2", False)
+    ])
+def test_is_pattern(power_control_tool, server_identifier, expected_is_pattern):
+    assert power_control_tool.ServerIdentifierPattern.is_pattern(server_identifier) is expected_is_pattern
+
+
+def test_bracket_ranges_keep_leading_zeros(power_control_tool):
+    server_identifier_pattern = power_control_tool.ServerIdentifierPattern("Node-[008-011]")
+
+    assert server_identifier_pattern.filter_values == ["Node-008", "Node-009", "Node-010", "Node-011"]
+    assert server_identifier_pattern.matches({"Name": "Node-010"})
+    assert not server_identifier_pattern.matches({"Name": "Node-10"})
+
+
+def test_short_expansions_compile_to_an_in_filter(power_control_tool):
+    server_identifier_pattern = power_control_tool.ServerIdentifierPattern("Rack-[a-b]-[1,3]")
+
+    assert server_identifier_pattern.get_odata_filter() == (
+        "(Serial in ('Rack-a-1','Rack-a-3','Rack-b-1','Rack-b-3')"
+        " or Name in ('Rack-a-1','Rack-a-3','Rack-b-1','Rack-b-3')"
+        " or Model in ('Rack-a-1','Rack-a-3','Rack-b-1','Rack-b-3')"
+        " or UserLabel in ('Rack-a-1','Rack-a-3','Rack-b-1','Rack-b-3'))"
+        )
+
+
+def test_long_expansions_and_wildcards_compile_to_a_prefix_filter(power_control_tool):
+    long_expansion_pattern = power_control_tool.ServerIdentifierPattern("Lab-Blade-[1-240]")
+    wildcard_pattern = power_control_tool.ServerIdentifierPattern("O'Lab-*-M7")
+
+    assert long_expansion_pattern.filter_values is None
+    assert long_expansion_pattern.get_odata_filter().startswith("(startswith(Serial,'Lab-Blade-') or ")
+    assert wildcard_pattern.get_odata_filter().startswith("(startswith(Serial,'O''Lab-') or ")
+    assert wildcard_pattern.matches({"UserLabel": "O'Lab-Blade-M7"})
+    assert not wildcard_pattern.matches({"UserLabel": "O'Lab-Blade-M7-2"})
+
+
+def test_regular_expressions_use_the_anchored_literal_prefix(power_control_tool):
+    assert power_control_tool.ServerIdentifierPattern(r"re:^Lab\-Blade-\d+$").filter_prefix == "Lab-Blade-"
+    assert power_control_tool.ServerIdentifierPattern("re:^Lab-Blades?").filter_prefix == "Lab-Blade"
+    assert power_control_tool.ServerIdentifierPattern("re:^Lab|Rack").get_odata_filter() is None
+    assert power_control_tool.ServerIdentifierPattern("re:Blade-[0-9]+").get_odata_filter() is None
+
+
+@pytest.mark.parametrize("pattern", ["Lab-[5-1]", "Rack-[c-a]", "Lab-[1,,2]", "Lab-[ab-cd]", "re:Lab-("])
+def test_invalid_patterns_raise_value_error(power_control_tool, pattern):
+    with pytest.raises(ValueError):
+        power_control_tool.ServerIdentifierPattern(pattern)
+
+
+def test_bracket_separators_are_not_split(power_control_tool):
+    assert power_control_tool.string_to_list_maker("Lab-[1,3], Other; Rack-[1 2]") == ["Lab-[1,3]", "Other", "Rack-[1 2]"]
+
+
+def test_patterns_expand_to_the_matching_servers(power_control_tool, lab_server_inventory):
+    expanded_targets = list(power_control_tool.expand_power_control_target_patterns(
+        [{"Server Identifier": "Lab-Blade-[2-3]", "Power Control State": "Power Off"},
+         {"Server Identifier": "FCH0008"}
+         ],
+        lab_server_inventory
+        ))
+
+    assert expanded_targets == [{"Server Identifier": "FCH0002", "Power Control State": "Power Off"},
+                                {"Server Identifier": "FCH0003", "Power Control State": "Power Off"},
+                                {"Server Identifier": "FCH0008"}
+                                ]
+
+
+def test_separated_alternatives_are_compiled_separately(power_control_tool, lab_server_inventory):
+    expanded_targets = list(power_control_tool.expand_power_control_target_patterns(
+        [{"Server Identifier": "Lab-Blade-[1-3], Other, Lab-Blade-[3-4]"}],
+        lab_server_inventory
+        ))
+
+    assert lab_server_inventory.searched_patterns == ["Lab-Blade-[1-3]", "Lab-Blade-[3-4]"]
+    assert [expanded_target["Server Identifier"] for expanded_target in expanded_targets] == [
+        "FCH0001", "FCH0002", "FCH0003", "Other", "FCH0004"
+        ]
+
+
+def test_regular_expressions_are_not_split(power_control_tool, lab_server_inventory):
+    expanded_targets = list(power_control_tool.expand_power_control_target_patterns(
+        [{"Server Identifier": "re:^Lab-Blade-[1-2]{1,2}$"}],
+        lab_server_inventory
+        ))
+
+    assert [expanded_target["Server Identifier"] for expanded_target in expanded_targets] == ["FCH0001", "FCH0002"]
+
+
+def test_patterns_without_matches_are_logged_as_warnings(power_control_tool, lab_server_inventory, caplog):
+    power_control_tool.logger.propagate = True
+    try:
+        with caplog.at_level(logging.WARNING, logger=power_control_tool.logger.name):
+            expanded_targets = list(power_control_tool.expand_power_control_target_patterns(
+                [{"Server Identifier": "Rack-*"}],
+                lab_server_inventory
+                ))
+    finally:
+        power_control_tool.logger.propagate = False
+
+    assert expanded_targets == []
+    assert "'Rack-*' did not match any" in caplog.text
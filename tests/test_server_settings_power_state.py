@@ -0,0 +1,106 @@
+import pytest
+
+
+def _server_settings_power_state(power_control_tool, power_control_state):
+    return power_control_tool.ServerSettingsPowerState(intersight_api_key_id=None,
+                                                       intersight_api_key=None,
+                                                       power_control_target_server_id_dictionary={"Server Identifier": "FCH0001"},
+                                                       power_control_state=power_control_state,
+                                                       preconfigured_api_client=object()
+                                                       )
+
+
+@pytest.mark.parametrize("power_control_state, expected_admin_power_state", [
+    ("Power Off", "PowerOff"),
+    ("power cycle", "PowerCycle"),
+    ("Shutdown", "Shutdown")
+    ])
+def test_power_control_states_map_to_admin_power_states(power_control_tool, power_control_state, expected_admin_power_state):
+    server_settings_power_state = _server_settings_power_state(power_control_tool, power_control_state)
+
+    server_settings_power_state._update_api_body_mapped_object_attributes()
+
+    assert server_settings_power_state.intersight_api_body["AdminPowerState"] == expected_admin_power_state
+
+
+def test_cached_api_bodies_are_not_shared_between_instances(power_control_tool):
+    first_server_settings_power_state = _server_settings_power_state(power_control_tool, "Power Off")
+    first_server_settings_power_state._update_api_body_mapped_object_attributes()
+    first_server_settings_power_state.intersight_api_body["AdminPowerState"] = "PowerOn"
+
+    second_server_settings_power_state = _server_settings_power_state(power_control_tool, "Power Off")
+    second_server_settings_power_state._update_api_body_mapped_object_attributes()
+
+    assert second_server_settings_power_state.intersight_api_body == {"AdminPowerState": "PowerOff"}
+    assert second_server_settings_power_state.intersight_api_body is not first_server_settings_power_state.intersight_api_body
+    with pytest.raises(TypeError):
+        power_control_tool.ServerSettingsPowerState._intersight_api_body_cache[("Power Off",)]["AdminPowerState"] = "PowerOn"
+
+
+class _StubAsyncApiClient:
+    def __init__(self, intersight_server):
+        self.intersight_server = intersight_server
+        self.posted_resource_paths = []
+
+    async def get_account_name(self):
+        return "Lab"
+
+    async def find_server(self, server_search_settings, provided_server_identifiers):
+        return [self.intersight_server], self.intersight_server
+
+    def get_server(self, server_moid):
+        return self.intersight_server if server_moid == self.intersight_server["Moid"] else None
+
+    async def get_server_settings_moid(self, server_moid):
+        return f"ss-{server_moid}"
+
+    async def call_api(self, resource_path, method, body=None):
+        self.posted_resource_paths.append(resource_path)
+        return type("ApiResponse", (), {"status": 200})()
+
+
+@pytest.mark.parametrize("force_power_control, expected_posted_resource_paths", [
+    (False, []),
+    (True, ["/compute/ServerSettings/ss-blade0001"])
+    ])
+def test_async_power_control_skips_servers_in_desired_state(power_control_tool, force_power_control, expected_posted_resource_paths):
+    api_client = _StubAsyncApiClient({"Moid": "blade0001", "ClassId": "compute.Blade", "ObjectType": "compute.Blade",
+                                      "Serial": "FCH0001", "OperPowerState": "off"})
+    server_settings_power_state = power_control_tool.ServerSettingsPowerState(intersight_api_key_id=None,
+                                                                              intersight_api_key=None,
+                                                                              power_control_target_server_id_dictionary={"Server Identifier": "FCH0001"},
+                                                                              power_control_state="Power Off",
+                                                                              preconfigured_api_client=api_client,
+                                                                              force_power_control=force_power_control
+                                                                              )
+
+    power_control_tool.asyncio.run(server_settings_power_state.async_object_maker())
+
+    assert server_settings_power_state.post_skipped is not force_power_control
+    assert api_client.posted_resource_paths == expected_posted_resource_paths
+
+
+def test_failed_post_marks_the_post_span_as_an_error(power_control_tool):
+    class FailingAsyncApiClient(_StubAsyncApiClient):
+        async def call_api(self, resource_path, method, body=None):
+            raise RuntimeError("The Intersight API is unavailable.")
+
+    server_settings_power_state = power_control_tool.ServerSettingsPowerState(intersight_api_key_id=None,
+                                                                              intersight_api_key=None,
+                                                                              power_control_target_server_id_dictionary={"Server Identifier": "FCH0001"},
+                                                                              power_control_state="Power Cycle",
+                                                                              preconfigured_api_client=FailingAsyncApiClient({"Moid": "blade0001",
+                                                                                                                              "ClassId": "compute.Blade",
+                                                                                                                              "ObjectType": "compute.Blade",
+                                                                                                                              "Serial": "FCH0001"})
+                                                                              )
+    run_tracer = power_control_tool.enable_run_tracing()
+    try:
+        power_control_tool.asyncio.run(server_settings_power_state.async_object_maker())
+    finally:
+        power_control_tool.disable_run_tracing()
+
+    assert server_settings_power_state.post_succeeded is False
+    post_span = next(span for span in run_tracer.spans if span["name"] == "post")
+    assert post_span["status"] == "ERROR"
+    assert post_span["attributes"]["exception.type"] == "RuntimeError"
@@ -0,0 +1,116 @@
+import time
+import types
+
+
+def _resolved_target(server_identifier, chassis_moid, domain_moid, power_control_state="Power Cycle"):
+    return {"Target": {"Server Identifier": server_identifier},
+            "Power Control State": power_control_state,
+            "Server": {},
+            "Chassis Moid": chassis_moid,
+            "Domain Moid": domain_moid
+            }
+
+
+def _server_identifiers(resolved_targets):
+    return [resolved_target["Target"]["Server Identifier"] for resolved_target in resolved_targets]
+
+
+def test_count_waves_split_targets_in_order(power_control_tool):
+    scheduler = power_control_tool.PowerControlWaveScheduler("Power Cycle", wave_grouping="Count", wave_size=2)
+    resolved_targets = [_resolved_target(f"S{index}", "C1", "D1") for index in range(5)]
+
+    waves = scheduler.build_waves(resolved_targets)
+
+    assert [_server_identifiers(wave) for wave in waves] == [["S0", "S1"], ["S2", "S3"], ["S4"]]
+
+
+def test_chassis_waves_keep_whole_chassis_together(power_control_tool):
+    scheduler = power_control_tool.PowerControlWaveScheduler("Power Cycle", wave_grouping="Chassis", wave_size=1)
+    resolved_targets = [_resolved_target("S0", "C1", "D1"),
+                        _resolved_target("S1", "C2", "D1"),
+                        _resolved_target("S2", "C1", "D1"),
+                        _resolved_target("S3", "C3", "D2")
+                        ]
+
+    waves = scheduler.build_waves(resolved_targets)
+
+    assert [_server_identifiers(wave) for wave in waves] == [["S0", "S2"], ["S1"], ["S3"]]
+
+
+def test_domain_waves_group_several_domains_per_wave(power_control_tool):
+    scheduler = power_control_tool.PowerControlWaveScheduler("Power Cycle", wave_grouping="Domain", wave_size=2)
+    resolved_targets = [_resolved_target("S0", "C1", "D1"),
+                        _resolved_target("S1", "C2", "D2"),
+                        _resolved_target("S2", "C3", "D3"),
+                        _resolved_target("S3", "C1", "D1")
+                        ]
+
+    waves = scheduler.build_waves(resolved_targets)
+
+    assert [_server_identifiers(wave) for wave in waves] == [["S0", "S3", "S1"], ["S2"]]
+
+
+def test_interleave_by_domain_is_round_robin(power_control_tool):
+    wave = [_resolved_target("A0", "C1", "DA"),
+            _resolved_target("A1", "C1", "DA"),
+            _resolved_target("A2", "C1", "DA"),
+            _resolved_target("B0", "C2", "DB"),
+            _resolved_target("C0", "C3", "DC"),
+            _resolved_target("C1", "C3", "DC")
+            ]
+
+    interleaved_wave = power_control_tool.PowerControlWaveScheduler._interleave_by_domain(wave)
+
+    assert _server_identifiers(interleaved_wave) == ["A0", "B0", "C0", "A1", "C1", "A2"]
+
+
+def test_group_by_power_control_state_merges_equivalent_states(power_control_tool):
+    resolved_targets = [_resolved_target("S0", "C1", "D1", "Power Off"),
+                        _resolved_target("S1", "C1", "D1", "Power Cycle"),
+                        _resolved_target("S2", "C1", "D1", "power off")
+                        ]
+
+    power_control_batches = power_control_tool.PowerControlWaveScheduler.group_by_power_control_state(resolved_targets)
+
+    assert list(power_control_batches) == ["Power Off", "Power Cycle"]
+    assert _server_identifiers(power_control_batches["Power Off"]) == ["S0", "S2"]
+
+
+def test_sequential_target_servers_are_grouped_by_power_control_state(power_control_tool):
+    power_control_targets = [{"Server Identifier": "S0"},
+                             {"Server Identifier": "S1", "Power Control State": "Power Cycle"},
+                             {"Server Identifier": "S2", "Power Control State": "power off"},
+                             {"Server Identifier": "S3", "Power Control State": "Power Cycle"}
+                             ]
+
+    grouped_power_control_targets = power_control_tool.group_power_control_targets_by_state(power_control_targets, "Power Off")
+
+    assert [(power_control_target["Server Identifier"], power_control_target["Power Control State"])
+            for power_control_target in grouped_power_control_targets
+            ] == [("S0", "Power Off"), ("S2", "power off"), ("S1", "Power Cycle"), ("S3", "Power Cycle")]
+    assert "Power Control State" not in power_control_targets[0]
+
+
+def test_completion_polling_does_not_sleep_past_the_timeout(power_control_tool):
+    class PendingApiClient:
+        def call_api(self, **kwargs):
+            self.last_response = types.SimpleNamespace(data='{"ConfigState": "Applying"}')
+
+    server_settings_power_state = types.SimpleNamespace(
+        api_client=PendingApiClient(),
+        intersight_api_body={"AdminPowerState": "PowerCycle"},
+        server_moid_and_data={},
+        server_settings_moid="server-settings-moid",
+        post_submitted_time=None,
+        power_control_target_server_id_dictionary={"Server Identifier": "S0"},
+        intersight_api_path="compute/ServerSettings"
+        )
+
+    start_time = time.monotonic()
+    completion_status = power_control_tool.wait_for_power_control_completion(server_settings_power_state,
+                                                                             completion_timeout=0.2,
+                                                                             poll_interval=10
+                                                                             )
+
+    assert time.monotonic() - start_time < 2
+    assert not completion_status["Completed"]